@@ -105,6 +105,7 @@ _LEGACY_CLOUD_ENTITY_SUFFIX_ALIASES_BY_DOMAIN: dict[str, tuple[str, ...]] = {
 }
 _STARTUP_MIGRATION_VERSION = 5
 _STARTUP_MIGRATION_VERSION_KEY = "startup_migration_version"
+DEFERRED_FIRST_REFRESH_TIMEOUT_S = 120.0
 
 _TYPE_DEVICE_KEYS_WITH_DIRECT_CHILD_DEVICES: tuple[str, ...] = ("iqevse",)
 
@@ -1139,6 +1140,43 @@ def _complete_startup_migrations_if_ready(
         )
 
 
+def _first_refresh_deferrable(coord) -> bool:
+    """Return True when restored state lets platforms load before first refresh."""
+
+    state_snapshot = getattr(coord, "state_snapshot", None)
+    if getattr(state_snapshot, "stale", False) is not True:
+        return False
+    auth_block_active = getattr(coord, "_auth_block_active", None)
+    if not callable(auth_block_active):
+        return True
+    try:
+        return not auth_block_active()
+    except Exception:  # noqa: BLE001
+        return False
+
+
+async def _async_deferred_first_refresh(coord, site_id: object, startup_warmup) -> None:
+    """Run the first refresh after setup has returned.
+
+    ``async_refresh`` records failures on the coordinator and starts reauth for
+    ``ConfigEntryAuthFailed`` itself, so only the timeout is handled here.
+    """
+
+    try:
+        async with asyncio.timeout(DEFERRED_FIRST_REFRESH_TIMEOUT_S):
+            await coord.async_refresh()
+    except TimeoutError:
+        _LOGGER.warning(
+            "First refresh for site %s did not finish within %.0fs; "
+            "keeping restored state until the next poll",
+            redact_site_id(site_id),
+            DEFERRED_FIRST_REFRESH_TIMEOUT_S,
+        )
+        return
+    if startup_warmup is not None and getattr(coord, "last_update_success", True):
+        await startup_warmup()
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: EnphaseConfigEntry) -> bool:
     migrated_data = _migrate_selected_type_keys(entry)
     if migrated_data is not None:
@@ -1182,11 +1220,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: EnphaseConfigEntry) -> b
     restore_discovery_state = getattr(discovery_snapshot, "async_restore_state", None)
     if callable(restore_discovery_state):
         await restore_discovery_state()
-    await async_prime_label_translations(hass)
-    await coord.async_config_entry_first_refresh()
+    state_snapshot = getattr(coord, "state_snapshot", None)
+    restore_state_snapshot = getattr(state_snapshot, "async_restore_state", None)
+    if callable(restore_state_snapshot):
+        await restore_state_snapshot()
+    await asyncio.gather(
+        async_prime_label_translations(hass),
+        async_prime_integration_version(hass),
+    )
+    # With a restored snapshot the platforms can be forwarded straight away and
+    # the first refresh runs in the background; otherwise setup must block so
+    # credential and availability failures surface as setup errors.
+    defer_first_refresh = _first_refresh_deferrable(coord)
+    if not defer_first_refresh:
+        await coord.async_config_entry_first_refresh()
     battery_schedule_editor.sync_from_coordinator()
     evse_schedule_editor.sync_from_coordinator()
-    await async_prime_integration_version(hass)
 
     site_id = entry.data.get("site_id")
     dev_reg = dr.async_get(hass)
@@ -1257,7 +1306,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: EnphaseConfigEntry) -> b
 
     refresh_runner = getattr(coord, "refresh_runner", None)
     startup_warmup = getattr(refresh_runner, "async_start_startup_warmup", None)
-    if callable(startup_warmup):
+    if defer_first_refresh:
+        _schedule_background_task(
+            _async_deferred_first_refresh(
+                coord,
+                site_id,
+                startup_warmup if callable(startup_warmup) else None,
+            ),
+            f"{DOMAIN}_first_refresh",
+        )
+    elif callable(startup_warmup):
         _schedule_background_task(
             startup_warmup(),
             f"{DOMAIN}_startup_warmup",
@@ -16,13 +16,16 @@ import hashlib
 import json
 import logging
 import re
-from contextlib import asynccontextmanager
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, timezone
 from http import HTTPStatus
 from urllib.parse import unquote
 import uuid
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Iterable
+from typing import Any, Awaitable, Callable, Iterable, Iterator
 
 import aiohttp
 from yarl import URL
@@ -63,6 +66,39 @@ _BATTERY_CONFIG_VARIANT_LEAN = "official_web_lean"
 _BATTERY_CONFIG_VARIANT_COOKIE_EAUTH = "cookie_eauth_compatible"
 _BATTERY_CONFIG_VARIANT_MIXED = "mixed_auth_compatible"
 _ENLIGHTEN_READ_CONCURRENCY_LIMIT = 2
+REQUEST_LANE_CONTROL = "control"
+REQUEST_LANE_EVSE_STATUS = "evse_status"
+REQUEST_LANE_STATE = "state"
+REQUEST_LANE_OPTIONAL = "optional"
+# Lanes are served in strict priority order; sites share each lane fairly.
+REQUEST_LANES = (
+    REQUEST_LANE_CONTROL,
+    REQUEST_LANE_EVSE_STATUS,
+    REQUEST_LANE_STATE,
+    REQUEST_LANE_OPTIONAL,
+)
+_REQUEST_SCHEDULER_QUANTUM = 1.0
+_CONDITIONAL_GET_CACHE_LIMIT = 64
+_SINGLE_FLIGHT_KWARGS = frozenset(
+    {
+        "headers",
+        "params",
+        "mark_payload_success",
+        "log_invalid_payload",
+        "use_cookie_header_only",
+        "allow_reauth",
+        "conditional_family",
+        "debug_auth_source",
+    }
+)
+_CONDITIONAL_GET_AUTH_HEADERS = ("Cookie", "e-auth-token", "Authorization", "username")
+_CACHE_CONTROL_MAX_AGE_RE = re.compile(r"(?i)\bmax-age\s*=\s*(\d+)")
+_REQUEST_SCHEDULER_GLOBAL_SITE = "_global"
+# Observed, non-official Enlighten throttling threshold (api_spec.md section 8).
+REQUEST_BUDGET_PER_HOUR = 600
+_REQUEST_BUDGET_BURST = 120
+_REQUEST_BUDGET_OPTIONAL_RESERVE = 30
+_REQUEST_BUDGET_WINDOW_S = 3600.0
 OCPP_TRIGGER_MESSAGES = frozenset(
     {
         "BootNotification",
@@ -83,9 +119,17 @@ OCPP_TRIGGER_MESSAGES_REQUIRING_CONFIRMATION = frozenset(
 _OCPP_TRIGGER_MESSAGE_MAX_LENGTH = 64
 _OCPP_TRIGGER_MESSAGE_RE = re.compile(r"^[A-Za-z][A-Za-z0-9]{0,63}$")
 # Enlighten web pages and XHR endpoints share service capacity with the mobile
-# app. A module-level limiter keeps parallel refresh helpers from creating a
-# burst of browser-like reads during one Home Assistant update cycle.
-_enlighten_read_semaphore: asyncio.Semaphore | None = None
+# app. A module-level scheduler keeps parallel refresh helpers from creating a
+# burst of browser-like reads during one Home Assistant update cycle, while
+# sharing the read slots fairly between config entries for different sites.
+_enlighten_request_scheduler: EnlightenRequestScheduler | None = None
+_request_lane: ContextVar[str | None] = ContextVar(
+    "enphase_ev_request_lane", default=None
+)
+# Config entries signed in to the same Enlighten account share one request
+# budget, keyed by a hash of the account login. A budget is dropped once the
+# last site holding it releases it on unload.
+_enlighten_request_budgets: dict[str, EnlightenRequestBudget] = {}
 
 
 @dataclass(frozen=True)
@@ -102,6 +146,68 @@ class _BatteryConfigWriteAttempt:
     prefer_existing_xsrf: bool = False
 
 
+@dataclass(slots=True)
+class _InFlightGet:
+    """Shared future for one in-flight GET and the callers waiting on it."""
+
+    future: asyncio.Future[Any]
+    waiters: int = 0
+
+
+@dataclass(slots=True)
+class _ConditionalGetEntry:
+    """Cached decoded payload plus the HTTP validators that produced it."""
+
+    payload: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    fresh_until_mono: float | None = None
+
+    def fresh(self) -> bool:
+        return (
+            self.fresh_until_mono is not None
+            and time.monotonic() < self.fresh_until_mono
+        )
+
+    def validator_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _response_header_text(headers: object, name: str) -> str | None:
+    """Return a response header as stripped text, ignoring non-string values."""
+
+    getter = getattr(headers, "get", None)
+    if not callable(getter):
+        return None
+    try:
+        value = getter(name)
+    except Exception:  # noqa: BLE001 - defensive header access
+        return None
+    if not isinstance(value, str):
+        return None
+    return value.strip() or None
+
+
+def _conditional_get_freshness(headers: object) -> tuple[bool, float | None]:
+    """Return ``(storable, max_age_s)`` from a response Cache-Control header."""
+
+    cache_control = (_response_header_text(headers, "Cache-Control") or "").lower()
+    if "no-store" in cache_control:
+        return False, None
+    if "no-cache" in cache_control:
+        return True, None
+    match = _CACHE_CONTROL_MAX_AGE_RE.search(cache_control)
+    if match is None:
+        return True, None
+    max_age = float(match.group(1))
+    return True, max_age if max_age > 0 else None
+
+
 class Unauthorized(Exception):
     pass
 
@@ -911,23 +1017,395 @@ def _should_limit_enlighten_read_request(method: object, url: object) -> bool:
     return url_text.startswith(f"{BASE_URL}/")
 
 
-def _get_enlighten_read_semaphore() -> asyncio.Semaphore:
-    """Return the shared semaphore used to limit concurrent Enlighten reads."""
+@dataclass(slots=True)
+class _RequestLaneStats:
+    """Queue-wait counters for one site and priority lane."""
+
+    granted: int = 0
+    queued: int = 0
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+    last_wait_s: float | None = None
+
+    def record(self, wait_s: float) -> None:
+        self.granted += 1
+        self.total_wait_s += wait_s
+        self.max_wait_s = max(self.max_wait_s, wait_s)
+        self.last_wait_s = wait_s
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "granted": self.granted,
+            "queued": self.queued,
+            "avg_wait_s": (
+                round(self.total_wait_s / self.granted, 3) if self.granted else None
+            ),
+            "max_wait_s": round(self.max_wait_s, 3),
+            "last_wait_s": (
+                round(self.last_wait_s, 3) if self.last_wait_s is not None else None
+            ),
+        }
+
+
+class EnlightenRequestScheduler:
+    """Share Enlighten request slots across sites and priority lanes.
+
+    Lanes are served in strict priority order. Within a lane, sites with queued
+    requests take turns using deficit round robin so a site with a large fan-out
+    cannot monopolize the shared read slots. Control writes never wait for a
+    slot; they only occupy one so queued reads yield to them.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = _ENLIGHTEN_READ_CONCURRENCY_LIMIT,
+        *,
+        quantum: float = _REQUEST_SCHEDULER_QUANTUM,
+    ) -> None:
+        self._concurrency = max(1, int(concurrency))
+        self._quantum = max(0.01, float(quantum))
+        self._in_flight = 0
+        self._queues: dict[str, dict[str, deque[asyncio.Future[None]]]] = {
+            lane: {} for lane in REQUEST_LANES
+        }
+        self._rings: dict[str, deque[str]] = {lane: deque() for lane in REQUEST_LANES}
+        self._deficits: dict[tuple[str, str], float] = {}
+        self._stats: dict[str, dict[str, _RequestLaneStats]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently holding a slot."""
+
+        return self._in_flight
+
+    @staticmethod
+    def _site_key(site_id: object) -> str:
+        try:
+            key = str(site_id).strip() if site_id is not None else ""
+        except Exception:  # noqa: BLE001 - defensive casting
+            key = ""
+        return key or _REQUEST_SCHEDULER_GLOBAL_SITE
+
+    def _lane_stats(self, site: str, lane: str) -> _RequestLaneStats:
+        site_stats = self._stats.setdefault(site, {})
+        stats = site_stats.get(lane)
+        if stats is None:
+            stats = _RequestLaneStats()
+            site_stats[lane] = stats
+        return stats
+
+    def _has_waiters(self) -> bool:
+        return any(self._rings[lane] for lane in REQUEST_LANES)
+
+    @asynccontextmanager
+    async def slot(self, site_id: object, lane: str):
+        """Hold one request slot for ``site_id`` in ``lane``."""
+
+        await self.acquire(site_id, lane)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, site_id: object, lane: str) -> float:
+        """Wait for a request slot and return the queue wait in seconds."""
+
+        site = self._site_key(site_id)
+        if lane not in self._queues:
+            lane = REQUEST_LANE_STATE
+        stats = self._lane_stats(site, lane)
+        if lane == REQUEST_LANE_CONTROL or (
+            self._in_flight < self._concurrency and not self._has_waiters()
+        ):
+            self._in_flight += 1
+            stats.record(0.0)
+            return 0.0
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        site_queue = self._queues[lane].get(site)
+        if site_queue is None:
+            site_queue = deque()
+            self._queues[lane][site] = site_queue
+            self._rings[lane].append(site)
+        site_queue.append(waiter)
+        stats.queued += 1
+        started = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted while the caller was being cancelled.
+                self.release()
+            else:
+                self._discard_waiter(site, lane, waiter)
+            raise
+        finally:
+            stats.queued -= 1
+        wait_s = time.monotonic() - started
+        stats.record(wait_s)
+        return wait_s
+
+    def release(self) -> None:
+        """Return one slot and hand free capacity to the next queued request."""
+
+        self._in_flight = max(0, self._in_flight - 1)
+        self._dispatch()
+
+    def _discard_waiter(
+        self, site: str, lane: str, waiter: asyncio.Future[None]
+    ) -> None:
+        site_queue = self._queues[lane].get(site)
+        if site_queue is None:
+            return
+        try:
+            site_queue.remove(waiter)
+        except ValueError:
+            return
+        if not site_queue:
+            self._drop_site(site, lane)
+
+    def _drop_site(self, site: str, lane: str) -> None:
+        self._queues[lane].pop(site, None)
+        self._deficits.pop((lane, site), None)
+        try:
+            self._rings[lane].remove(site)
+        except ValueError:
+            pass
+
+    def _next_waiter(self) -> asyncio.Future[None] | None:
+        for lane in REQUEST_LANES:
+            ring = self._rings[lane]
+            while ring:
+                site = ring[0]
+                key = (lane, site)
+                deficit = self._deficits.get(key, 0.0)
+                if deficit < 1.0:
+                    deficit += self._quantum
+                    self._deficits[key] = deficit
+                    if deficit < 1.0:
+                        ring.rotate(-1)
+                        continue
+                site_queue = self._queues[lane][site]
+                waiter = site_queue.popleft()
+                self._deficits[key] = deficit - 1.0
+                if not site_queue:
+                    self._drop_site(site, lane)
+                elif self._deficits[key] < 1.0:
+                    ring.rotate(-1)
+                if waiter.done():
+                    continue
+                return waiter
+        return None
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self._concurrency:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def diagnostics(self, site_id: object | None = None) -> dict[str, object]:
+        """Return queue-wait counters for one site or every known site."""
+
+        if site_id is not None:
+            site = self._site_key(site_id)
+            return {
+                lane: stats.as_dict()
+                for lane, stats in self._stats.get(site, {}).items()
+            }
+        return {
+            "concurrency": self._concurrency,
+            "in_flight": self._in_flight,
+            "queued": {
+                lane: sum(len(queue) for queue in self._queues[lane].values())
+                for lane in REQUEST_LANES
+            },
+            "site_count": len(self._stats),
+        }
+
+
+def _get_enlighten_request_scheduler() -> EnlightenRequestScheduler:
+    """Return the shared scheduler used to limit concurrent Enlighten requests."""
+
+    global _enlighten_request_scheduler
+    if _enlighten_request_scheduler is None:
+        _enlighten_request_scheduler = EnlightenRequestScheduler()
+    return _enlighten_request_scheduler
+
+
+@contextmanager
+def enlighten_request_lane(lane: str | None) -> Iterator[None]:
+    """Assign requests issued inside the block to a scheduler lane."""
+
+    token = _request_lane.set(lane)
+    try:
+        yield
+    finally:
+        _request_lane.reset(token)
+
+
+def _enlighten_request_lane(method: object, url: object) -> str | None:
+    """Return the scheduler lane for an Enlighten request, or None to bypass."""
+
+    if _should_limit_enlighten_read_request(method, url):
+        lane = _request_lane.get()
+        if lane is None and "/ev_chargers/status" in str(url):
+            return REQUEST_LANE_EVSE_STATUS
+        return lane if lane in REQUEST_LANES else REQUEST_LANE_STATE
+    try:
+        url_text = str(url).strip()
+    except Exception:  # noqa: BLE001 - defensive casting
+        return None
+    if url_text.startswith(f"{BASE_URL}/"):
+        return REQUEST_LANE_CONTROL
+    return None
+
+
+class EnlightenRequestBudget:
+    """Token bucket metering Enlighten requests for one account.
+
+    Every request spends a token and tokens refill at the hourly ceiling rate.
+    Requests are never blocked; instead optional endpoint families are skipped
+    while the bucket sits below the optional reserve so state and control
+    requests keep the remaining headroom. A skipped family is not queued; it
+    simply runs on the first refresh cycle after the bucket recovers.
+    """
+
+    def __init__(
+        self,
+        per_hour: int = REQUEST_BUDGET_PER_HOUR,
+        *,
+        burst: int = _REQUEST_BUDGET_BURST,
+        optional_reserve: int = _REQUEST_BUDGET_OPTIONAL_RESERVE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._per_hour = max(1, int(per_hour))
+        self._rate = self._per_hour / _REQUEST_BUDGET_WINDOW_S
+        self._burst = max(1, int(burst))
+        self._reserve = min(self._burst, max(0, int(optional_reserve)))
+        self._clock = clock
+        self._tokens = float(self._burst)
+        self._updated = clock()
+        self._recent: deque[float] = deque()
+        self._consumed = 0
+        self._overdrafts = 0
+        self._skipped: dict[tuple[str, str], dict[str, float | int]] = {}
+        self.holders: set[str] = set()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> float:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate)
+        while self._recent and now - self._recent[0] >= _REQUEST_BUDGET_WINDOW_S:
+            self._recent.popleft()
+        return now
+
+    def consume(self) -> None:
+        """Spend one token for a request that is about to be sent."""
+
+        now = self._refill()
+        self._consumed += 1
+        self._recent.append(now)
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+        else:
+            self._overdrafts += 1
+            self._tokens = 0.0
+
+    def seconds_until(self, tokens: float) -> float:
+        """Return the projected seconds until the bucket holds ``tokens``."""
+
+        missing = min(float(self._burst), float(tokens)) - self.tokens
+        return round(max(0.0, missing / self._rate), 1)
+
+    def should_skip(self, site_id: object, family: str) -> bool:
+        """Return whether an optional endpoint family should skip this cycle."""
+
+        key = (str(site_id), str(family))
+        if self.tokens >= self._reserve:
+            self._skipped.pop(key, None)
+            return False
+        entry = self._skipped.setdefault(key, {"count": 0, "since_mono": self._clock()})
+        entry["count"] = int(entry["count"]) + 1
+        return True
+
+    def diagnostics(self, site_id: object | None = None) -> dict[str, object]:
+        """Return bucket level, skipped families, and recovery projections."""
+
+        tokens = self.tokens
+        now = self._updated
+        skipped = {
+            family: {
+                "count": int(entry["count"]),
+                "skipped_for_s": round(now - float(entry["since_mono"]), 1),
+            }
+            for (site, family), entry in sorted(self._skipped.items())
+            if site_id is None or site == str(site_id)
+        }
+        return {
+            "per_hour": self._per_hour,
+            "burst": self._burst,
+            "optional_reserve": self._reserve,
+            "tokens": round(tokens, 2),
+            "requests_last_hour": len(self._recent),
+            "consumed": self._consumed,
+            "overdrafts": self._overdrafts,
+            "optional_recovery_s": self.seconds_until(self._reserve),
+            "full_recovery_s": self.seconds_until(self._burst),
+            "skipped_families": skipped,
+        }
+
+
+def _request_budget_account_key(account: object) -> str:
+    """Return a stable non-reversible key for an Enlighten account login."""
+
+    normalized = str(account or "").strip().lower()
+    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+
+
+def get_enlighten_request_budget(
+    account: object, holder: object
+) -> EnlightenRequestBudget:
+    """Return the request budget shared by every client for ``account``."""
+
+    key = _request_budget_account_key(account)
+    budget = _enlighten_request_budgets.get(key)
+    if budget is None:
+        budget = _enlighten_request_budgets[key] = EnlightenRequestBudget()
+    budget.holders.add(str(holder))
+    return budget
 
-    global _enlighten_read_semaphore
-    if _enlighten_read_semaphore is None:
-        _enlighten_read_semaphore = asyncio.Semaphore(_ENLIGHTEN_READ_CONCURRENCY_LIMIT)
-    return _enlighten_read_semaphore
+
+def release_enlighten_request_budget(account: object, holder: object) -> None:
+    """Drop ``holder`` from the account budget and forget it once unused."""
+
+    key = _request_budget_account_key(account)
+    budget = _enlighten_request_budgets.get(key)
+    if budget is None:
+        return
+    budget.holders.discard(str(holder))
+    if not budget.holders:
+        _enlighten_request_budgets.pop(key, None)
 
 
 @asynccontextmanager
-async def _enlighten_read_request_guard(method: object, url: object):
-    """Limit concurrent GET/HEAD requests to the Enlighten web host."""
+async def _enlighten_read_request_guard(
+    method: object, url: object, *, site_id: object | None = None
+):
+    """Schedule Enlighten requests through the shared per-site request slots."""
 
-    if not _should_limit_enlighten_read_request(method, url):
+    lane = _enlighten_request_lane(method, url)
+    if lane is None:
         yield
         return
-    async with _get_enlighten_read_semaphore():
+    async with _get_enlighten_request_scheduler().slot(site_id, lane):
         yield
 
 
@@ -1995,6 +2473,8 @@ class EnphaseEVClient:
         cookie: str | None,
         timeout: int = 15,
         reauth_callback: Callable[[], Awaitable[bool]] | None = None,
+        *,
+        request_budget_account: str | None = None,
     ):
         self._timeout = int(timeout)
         self._s = session
@@ -2017,6 +2497,24 @@ class EnphaseEVClient:
         self._reauth_cb: Callable[[], Awaitable[bool]] | None = reauth_callback
         self._last_unauthorized_request: str | None = None
         self._request_count = 0
+        self._conditional_get_cache: dict[
+            tuple[str, str, str], _ConditionalGetEntry
+        ] = {}
+        self._conditional_get_stats: dict[str, dict[str, int]] = {}
+        self._in_flight_gets: dict[tuple[object, ...], _InFlightGet] = {}
+        # Clients without a known login, such as config-flow lookups, keep a
+        # private budget that is not shared or registered.
+        self._request_budget_account = request_budget_account or None
+        self._request_budget = (
+            get_enlighten_request_budget(self._request_budget_account, site_id)
+            if self._request_budget_account is not None
+            else EnlightenRequestBudget()
+        )
+        self._single_flight_stats = {
+            "leaders": 0,
+            "coalesced_waiters": 0,
+            "max_waiters": 0,
+        }
         self._payload_failure_log_state: dict[str, PayloadFailureSignature] = {}
         self._h = {
             "Accept": "application/json, text/plain, */*",
@@ -2026,6 +2524,23 @@ class EnphaseEVClient:
         }
         self.update_credentials(eauth=eauth, cookie=cookie)
 
+    @property
+    def request_budget(self) -> EnlightenRequestBudget:
+        """Return the account-wide request budget used by this client."""
+
+        return self._request_budget
+
+    def release_request_budget(self) -> None:
+        """Release this site's hold on the shared account request budget."""
+
+        if self._request_budget_account is not None:
+            release_enlighten_request_budget(self._request_budget_account, self._site)
+
+    def request_budget_diagnostics(self) -> dict[str, object]:
+        """Return the account request budget with this site's skipped families."""
+
+        return self._request_budget.diagnostics(self._site)
+
     def set_reauth_callback(
         self, callback: Callable[[], Awaitable[bool]] | None
     ) -> None:
@@ -2056,6 +2571,133 @@ class EnphaseEVClient:
 
         return int(getattr(self, "_request_count", 0) or 0)
 
+    def request_scheduler_diagnostics(self) -> dict[str, object]:
+        """Return shared request-slot usage and this site's queue waits."""
+
+        scheduler = _get_enlighten_request_scheduler()
+        return {**scheduler.diagnostics(), "lanes": scheduler.diagnostics(self._site)}
+
+    @staticmethod
+    def _conditional_get_key(
+        method: str, url: str, params: object, headers: dict[str, str]
+    ) -> tuple[str, str, str]:
+        """Return the validator-cache key for a request and its auth scope."""
+
+        request_url = str(url)
+        if isinstance(params, dict) and params:
+            request_url = str(
+                URL(request_url).update_query(
+                    {str(key): str(value) for key, value in sorted(params.items())}
+                )
+            )
+        scope = hashlib.sha256(
+            "\x1f".join(
+                f"{name}={headers.get(name, '')}"
+                for name in _CONDITIONAL_GET_AUTH_HEADERS
+            ).encode()
+        ).hexdigest()
+        return str(method).upper(), request_url, scope
+
+    def _note_conditional_get(self, family: str, outcome: str) -> None:
+        stats = self._conditional_get_stats.setdefault(
+            family, {"hits": 0, "not_modified": 0, "misses": 0}
+        )
+        stats[outcome] = stats.get(outcome, 0) + 1
+
+    def _store_conditional_get(
+        self,
+        family: str,
+        key: tuple[str, str, str],
+        payload: Any,
+        headers: object,
+    ) -> None:
+        """Remember a full GET response when the server supplied validators."""
+
+        self._note_conditional_get(family, "misses")
+        cache = self._conditional_get_cache
+        cache.pop(key, None)
+        storable, max_age = _conditional_get_freshness(headers)
+        etag = _response_header_text(headers, "ETag")
+        last_modified = _response_header_text(headers, "Last-Modified")
+        if not storable or (etag is None and last_modified is None and not max_age):
+            return
+        cache[key] = _ConditionalGetEntry(
+            payload=copy.deepcopy(payload),
+            etag=etag,
+            last_modified=last_modified,
+            fresh_until_mono=(time.monotonic() + max_age) if max_age else None,
+        )
+        while len(cache) > _CONDITIONAL_GET_CACHE_LIMIT:
+            cache.pop(next(iter(cache)))
+
+    def _revalidated_conditional_get(
+        self, family: str, entry: _ConditionalGetEntry, headers: object
+    ) -> Any:
+        """Return the cached payload after the server answered 304."""
+
+        self._note_conditional_get(family, "not_modified")
+        storable, max_age = _conditional_get_freshness(headers)
+        entry.etag = _response_header_text(headers, "ETag") or entry.etag
+        entry.last_modified = (
+            _response_header_text(headers, "Last-Modified") or entry.last_modified
+        )
+        entry.fresh_until_mono = (
+            (time.monotonic() + max_age) if storable and max_age else None
+        )
+        return copy.deepcopy(entry.payload)
+
+    def conditional_get_diagnostics(self) -> dict[str, object]:
+        """Return validator-cache size and hit/304/miss counts per family."""
+
+        return {
+            "entries": len(self._conditional_get_cache),
+            "families": {
+                family: dict(stats)
+                for family, stats in sorted(self._conditional_get_stats.items())
+            },
+        }
+
+    def clear_conditional_get_cache(self) -> None:
+        """Drop cached conditional GET payloads."""
+
+        self._conditional_get_cache.clear()
+
+    def _single_flight_key(
+        self, method: str, url: str, kwargs: dict[str, Any]
+    ) -> tuple[object, ...] | None:
+        """Return the identity of a coalescible GET, or ``None`` to bypass."""
+
+        if str(method).upper() != "GET" or set(kwargs) - _SINGLE_FLIGHT_KWARGS:
+            return None
+        extra_headers = kwargs.get("headers")
+        if callable(extra_headers):
+            extra_headers = extra_headers()
+        headers = dict(self._h)
+        if isinstance(extra_headers, dict):
+            headers = self._merge_request_headers(headers, extra_headers)
+        params = kwargs.get("params")
+        if params is not None and not isinstance(params, dict):
+            return None
+        return (
+            str(url),
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+            tuple(sorted((str(k), str(v)) for k, v in headers.items())),
+            tuple(
+                (name, repr(kwargs[name]))
+                for name in sorted(kwargs)
+                if name not in ("headers", "params")
+            ),
+        )
+
+    def single_flight_diagnostics(self) -> dict[str, int]:
+        """Return in-flight GET coalescing counters."""
+
+        return {
+            "in_flight": len(self._in_flight_gets),
+            "waiting": sum(entry.waiters for entry in self._in_flight_gets.values()),
+            **self._single_flight_stats,
+        }
+
     def update_credentials(
         self,
         *,
@@ -2385,13 +3027,18 @@ class EnphaseEVClient:
         self,
         modern_url: str,
         legacy_url: str,
+        *,
+        conditional_family: str | None = None,
     ) -> dict | None:
         """Fetch a system dashboard payload from the modern route with fallback."""
 
         headers = self._system_dashboard_headers()
+        extra: dict[str, object] = {}
+        if conditional_family is not None:
+            extra["conditional_family"] = conditional_family
         for url in (modern_url, legacy_url):
             try:
-                data = await self._json("GET", url, headers=headers)
+                data = await self._json("GET", url, headers=headers, **extra)
             except Exception as err:  # noqa: BLE001
                 if self._system_dashboard_is_optional_error(err):
                     continue
@@ -3482,6 +4129,7 @@ class EnphaseEVClient:
         endpoint_family: str | None = None,
         bootstrap_xsrf: bool = False,
         cache_on_success: bool = False,
+        conditional_family: str | None = None,
     ) -> dict:
         """Issue a BatteryConfig request using the observed first-party variants."""
 
@@ -3506,6 +4154,7 @@ class EnphaseEVClient:
                         headers=headers,
                         params=params,
                         debug_auth_source=variant,
+                        conditional_family=conditional_family,
                     )
                 except aiohttp.ClientResponseError as err:
                     if err.status == HTTPStatus.UNAUTHORIZED:
@@ -4201,7 +4850,66 @@ class EnphaseEVClient:
         as ``e-auth-token``.
         ``headers`` may also be a zero-argument callable so retries can rebuild
         auth-sensitive headers after a successful reauthentication callback.
+        Concurrent identical GETs share one in-flight request; waiters receive
+        a copy of the leader's decoded payload or the same exception.
         """
+        kwargs["mark_payload_success"] = mark_payload_success
+        kwargs["log_invalid_payload"] = log_invalid_payload
+        key = self._single_flight_key(method, url, kwargs)
+        while key is not None:
+            in_flight = self._in_flight_gets.get(key)
+            if in_flight is None:
+                break
+            in_flight.waiters += 1
+            self._single_flight_stats["coalesced_waiters"] += 1
+            self._single_flight_stats["max_waiters"] = max(
+                self._single_flight_stats["max_waiters"], in_flight.waiters
+            )
+            try:
+                payload = await asyncio.shield(in_flight.future)
+            except asyncio.CancelledError:
+                if not in_flight.future.cancelled():
+                    raise
+                # The leader was cancelled; retry so one waiter takes over.
+                continue
+            finally:
+                in_flight.waiters -= 1
+            return copy.deepcopy(payload)
+        if key is None:
+            return await self._json_request(method, url, **kwargs)
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        leader = self._in_flight_gets[key] = _InFlightGet(future)
+        self._single_flight_stats["leaders"] += 1
+        try:
+            payload = await self._json_request(method, url, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            future.exception()
+            raise
+        else:
+            # Waiters get their own copy of the result, so the leader's caller
+            # may mutate ``payload`` before they wake up.
+            future.set_result(copy.deepcopy(payload) if leader.waiters else payload)
+            return payload
+        finally:
+            if self._in_flight_gets.get(key) is leader:
+                del self._in_flight_gets[key]
+
+    async def _json_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        mark_payload_success: bool = True,
+        log_invalid_payload: bool = True,
+        **kwargs,
+    ):
+        """Issue one ``_json`` request without in-flight GET coalescing."""
+
         extra_headers = kwargs.pop("headers", None)
         use_cookie_header_only = kwargs.pop("use_cookie_header_only", False)
         debug_auth_source = kwargs.pop("debug_auth_source", None)
@@ -4211,6 +4919,9 @@ class EnphaseEVClient:
             None,
         )
         allow_reauth = bool(kwargs.pop("allow_reauth", True))
+        conditional_family = kwargs.pop("conditional_family", None)
+        if str(method).upper() != "GET":
+            conditional_family = None
         attempt = 0
         request_label = _request_label(method, url)
         safe_request_label = redact_text(
@@ -4231,13 +4942,26 @@ class EnphaseEVClient:
                 base_headers = self._merge_request_headers(
                     base_headers, attempt_headers
                 )
-
-            async with _enlighten_read_request_guard(method, url):
+            conditional_key: tuple[str, str, str] | None = None
+            conditional_entry: _ConditionalGetEntry | None = None
+            if conditional_family is not None:
+                conditional_key = self._conditional_get_key(
+                    method, url, kwargs.get("params"), base_headers
+                )
+                conditional_entry = self._conditional_get_cache.get(conditional_key)
+                if conditional_entry is not None:
+                    if conditional_entry.fresh():
+                        self._note_conditional_get(conditional_family, "hits")
+                        return copy.deepcopy(conditional_entry.payload)
+                    base_headers.update(conditional_entry.validator_headers())
+
+            async with _enlighten_read_request_guard(method, url, site_id=self._site):
                 async with asyncio.timeout(self._timeout):
                     async with self._request_session(
                         cookie_header_only=use_cookie_header_only
                     ) as request_session:
                         self._request_count += 1
+                        self._request_budget.consume()
                         async with request_session.request(
                             method, url, headers=base_headers, **kwargs
                         ) as r:
@@ -4279,6 +5003,17 @@ class EnphaseEVClient:
                                 if mark_payload_success:
                                     self._mark_payload_healthy(endpoint or None)
                                 return {}
+                            if (
+                                r.status == HTTPStatus.NOT_MODIFIED
+                                and conditional_entry is not None
+                            ):
+                                if mark_payload_success:
+                                    self._mark_payload_healthy(endpoint or None)
+                                return self._revalidated_conditional_get(
+                                    conditional_family,
+                                    conditional_entry,
+                                    r.headers,
+                                )
                             if r.status >= 400:
                                 body_text: str | None = None
                                 try:
@@ -4433,6 +5168,13 @@ class EnphaseEVClient:
                                     payload=body_text,
                                     log_warning=log_invalid_payload,
                                 ) from err
+                            if conditional_key is not None:
+                                self._store_conditional_get(
+                                    conditional_family,
+                                    conditional_key,
+                                    payload,
+                                    r.headers,
+                                )
                             if mark_payload_success:
                                 self._mark_payload_healthy(endpoint or None)
                             return payload
@@ -4489,8 +5231,9 @@ class EnphaseEVClient:
                     else:
                         base_headers[header_key] = header_value
 
-            async with _enlighten_read_request_guard(method, url):
+            async with _enlighten_read_request_guard(method, url, site_id=self._site):
                 async with asyncio.timeout(self._timeout):
+                    self._request_budget.consume()
                     async with self._s.request(
                         method, url, headers=base_headers, **kwargs
                     ) as r:
@@ -5240,7 +5983,9 @@ class EnphaseEVClient:
 
         url = f"{BASE_URL}/service/batteryConfig/api/v1/siteSettings/{self._site}"
         params = self._battery_config_params()
-        return await self._battery_config_request("GET", url, params=params)
+        return await self._battery_config_request(
+            "GET", url, params=params, conditional_family="battery_site_settings"
+        )
 
     async def site_tariff_billing_details(self) -> dict:
         """Return site tariff billing-cycle details."""
@@ -5286,6 +6031,7 @@ class EnphaseEVClient:
             url,
             params={"include-site-details": "true"},
             headers=self._tariff_headers(),
+            conditional_family="site_tariff",
         )
 
     async def site_tariff_rates(
@@ -6011,6 +6757,26 @@ class EnphaseEVClient:
             raise
         return data if isinstance(data, dict) else None
 
+    async def live_status_authorizer(
+        self, gateway_serial: str, *, live_debug: bool = False
+    ) -> dict[str, object]:
+        """Return the AWS IoT custom-authorizer payload for site live streams.
+
+        GET /pv/aws_sigv4/livestream.json?serial_num=<gateway_sn>
+        ``live_debug=True`` requests the Live Vitals topic instead of Live Status.
+        """
+
+        query = {"serial_num": str(gateway_serial)}
+        if live_debug:
+            query["live_debug"] = "true"
+        url = str(URL(f"{BASE_URL}/pv/aws_sigv4/livestream.json").update_query(query))
+        headers = self._today_headers()
+        headers["X-Requested-With"] = "XMLHttpRequest"
+        data = await self._json("GET", url, headers=headers)
+        if isinstance(data, dict):
+            return data
+        return {}
+
     @staticmethod
     def _normalize_evse_timeseries_serial(value: object) -> str | None:
         return api_parsers.normalize_evse_timeseries_serial(value)
@@ -6573,6 +7339,7 @@ class EnphaseEVClient:
                 url,
                 headers=self._today_headers(),
                 mark_payload_success=False,
+                conditional_family="evse_fw_details",
             )
         except Unauthorized:
             _LOGGER.debug(
@@ -6625,7 +7392,12 @@ class EnphaseEVClient:
             )
         )
         try:
-            data = await self._json("GET", url, headers=self._today_headers())
+            data = await self._json(
+                "GET",
+                url,
+                headers=self._today_headers(),
+                conditional_family="evse_feature_flags",
+            )
         except EnphaseLoginWallUnauthorized:
             raise
         except Unauthorized:
@@ -6651,7 +7423,12 @@ class EnphaseEVClient:
         GET /app-api/<site_id>/devices.json
         """
         url = f"{BASE_URL}/app-api/{self._site}/devices.json"
-        data = await self._json("GET", url, headers=self._history_headers())
+        data = await self._json(
+            "GET",
+            url,
+            headers=self._history_headers(),
+            conditional_family="devices_inventory",
+        )
         if isinstance(data, dict):
             return data
         return {}
@@ -6668,7 +7445,9 @@ class EnphaseEVClient:
             f"{self._site}/devices-tree"
         )
         legacy_url = f"{BASE_URL}/pv/systems/{self._site}/system_dashboard/devices-tree"
-        return await self._system_dashboard_get(modern_url, legacy_url)
+        return await self._system_dashboard_get(
+            modern_url, legacy_url, conditional_family="devices_tree"
+        )
 
     async def system_dashboard_summary(
         self, *, allow_reauth: bool = True
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.core import HomeAssistant, callback
@@ -11,11 +11,14 @@ from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import EnphaseCoordinator
+from .entity import EnphaseBaseEntity
 from .runtime_helpers import (
     inventory_type_available as _type_available,
     inventory_type_device_info as _type_device_info,
 )
 from .runtime_data import EnphaseConfigEntry, get_runtime_data
+from .session_archive import SessionIntervalIndex
+from .session_history import MIN_SESSION_HISTORY_CACHE_TTL
 
 PARALLEL_UPDATES = 0
 
@@ -27,6 +30,27 @@ def _site_has_battery(coord: EnphaseCoordinator, *, strict: bool = False) -> boo
     return has_encharge is not False
 
 
+def _event_summary(entity: CalendarEntity) -> str | None:
+    try:
+        name = entity.name
+    except Exception:  # noqa: BLE001 - platform may not be attached in tests
+        name = None
+    if isinstance(name, str) and name.strip():
+        return name.strip()
+    entity_id = getattr(entity, "entity_id", None)
+    if isinstance(entity_id, str) and entity_id.strip():
+        return entity_id.strip()
+    return None
+
+
+def _local_range(start: datetime, end: datetime) -> tuple[datetime, datetime]:
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return start, end
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: EnphaseConfigEntry,
@@ -34,6 +58,7 @@ async def async_setup_entry(
 ) -> None:
     coord: EnphaseCoordinator = get_runtime_data(entry).coordinator
     site_entity_added = False
+    known_serials: set[str] = set()
 
     @callback
     def _async_sync_site_entities() -> None:
@@ -49,9 +74,24 @@ async def async_setup_entry(
         )
         site_entity_added = True
 
-    unsubscribe = coord.async_add_listener(_async_sync_site_entities)
+    @callback
+    def _async_sync_chargers() -> None:
+        _async_sync_site_entities()
+        if getattr(coord, "session_archive", None) is None:
+            return
+        current_serials = {sn for sn in coord.iter_serials() if sn}
+        serials = [sn for sn in current_serials if sn not in known_serials]
+        if serials:
+            async_add_entities(
+                [ChargingSessionsCalendarEntity(coord, sn) for sn in serials],
+                update_before_add=False,
+            )
+        known_serials.intersection_update(current_serials)
+        known_serials.update(serials)
+
+    unsubscribe = coord.async_add_listener(_async_sync_chargers)
     entry.async_on_unload(unsubscribe)
-    _async_sync_site_entities()
+    _async_sync_chargers()
 
 
 class BackupHistoryCalendarEntity(CoordinatorEntity, CalendarEntity):
@@ -98,19 +138,8 @@ class BackupHistoryCalendarEntity(CoordinatorEntity, CalendarEntity):
         return events
 
     def _to_calendar_event(self, start: datetime, end: datetime) -> CalendarEvent:
-        summary: str | None = None
-        try:
-            name = self.name
-        except Exception:  # noqa: BLE001 - platform may not be attached in tests
-            name = None
-        if isinstance(name, str) and name.strip():
-            summary = name.strip()
-        else:
-            entity_id = getattr(self, "entity_id", None)
-            if isinstance(entity_id, str) and entity_id.strip():
-                summary = entity_id.strip()
         return CalendarEvent(
-            summary=summary or self._attr_unique_id,
+            summary=_event_summary(self) or self._attr_unique_id,
             start=start,
             end=end,
         )
@@ -136,13 +165,80 @@ class BackupHistoryCalendarEntity(CoordinatorEntity, CalendarEntity):
         end_date: datetime,
     ) -> list[CalendarEvent]:
         _ = hass
-        if start_date.tzinfo is None:
-            start_date = start_date.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-        if end_date.tzinfo is None:
-            end_date = end_date.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        start_date, end_date = _local_range(start_date, end_date)
         out: list[CalendarEvent] = []
         for event_start, event_end in self._iter_history_events():
             if event_end <= start_date or event_start >= end_date:
                 continue
             out.append(self._to_calendar_event(event_start, event_end))
         return out
+
+
+class ChargingSessionsCalendarEntity(EnphaseBaseEntity, CalendarEntity):
+    """Charging sessions of one charger, read from the session archive."""
+
+    _attr_translation_key = "charging_sessions"
+
+    def __init__(self, coord: EnphaseCoordinator, sn: str) -> None:
+        super().__init__(coord, sn)
+        self._attr_unique_id = f"{DOMAIN}_{sn}_charging_sessions"
+
+    def _index(self) -> SessionIntervalIndex | None:
+        archive = getattr(self._coord, "session_archive", None)
+        if archive is None:
+            return None
+        return archive.index(self._sn)
+
+    def _to_calendar_event(
+        self, start: datetime, end: datetime, session: dict
+    ) -> CalendarEvent:
+        energy = session.get("energy_kwh_total")
+        return CalendarEvent(
+            summary=_event_summary(self) or self._attr_unique_id,
+            start=start,
+            end=end,
+            description=(
+                f"{energy:.3f} kWh" if isinstance(energy, (int, float)) else None
+            ),
+            uid=str(session.get("session_id") or "") or None,
+        )
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        index = self._index()
+        if index is None:
+            return None
+        now = dt_util.now()
+        current = index.overlapping(now, now + timedelta(seconds=1))
+        if current:
+            return self._to_calendar_event(*current[-1])
+        if self.data.get("charging") is not True:
+            return None
+        # An open session ends at its last fetch; extend it while charging.
+        stale_s = getattr(
+            getattr(self._coord, "session_history", None),
+            "cache_ttl",
+            MIN_SESSION_HISTORY_CACHE_TTL,
+        )
+        latest = index.overlapping(now - timedelta(seconds=2 * stale_s), now)
+        if not latest:
+            return None
+        start, _end, session = latest[-1]
+        return self._to_calendar_event(start, now + timedelta(seconds=1), session)
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        _ = hass
+        archive = getattr(self._coord, "session_archive", None)
+        if archive is None:
+            return []
+        await archive.async_load()
+        start_date, end_date = _local_range(start_date, end_date)
+        return [
+            self._to_calendar_event(*item)
+            for item in archive.index(self._sn).overlapping(start_date, end_date)
+        ]
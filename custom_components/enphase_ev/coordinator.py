@@ -15,7 +15,7 @@ import logging
 import random
 import time
 from dataclasses import dataclass
-from datetime import datetime, time as dt_time, timedelta
+from datetime import date, datetime, time as dt_time, timedelta
 from datetime import timezone as _tz
 from http import HTTPStatus
 from numbers import Real
@@ -106,24 +106,30 @@ from .device_types import (
     parse_type_identifier,
 )
 from .energy import EnergyManager
+from .energy_statistics import EnergyStatisticsImporter
 from .evse_timeseries import EVSETimeseriesManager
+from .evse_fast_lane import EvseFastLane
 from .evse_feature_flags_runtime import EvseFeatureFlagsRuntime
 from .evse_runtime import (
     AMP_RESTART_DELAY_S,
     FAST_TOGGLE_POLL_HOLD_S,
-    SUSPENDED_EVSE_STATUS,
     ChargeModeStartPreferences,
     EvseRuntime,
-    evse_power_is_actively_charging,
+    evse_status_charging_flags,
+    session_energy_kwh,
 )
 from .evse_power import build_evse_power_snapshot
+from .family_scheduler import EndpointFamilyScheduler
 from .heatpump_runtime import HeatpumpRuntime
 from .inventory_runtime import CoordinatorTopologySnapshot, InventoryRuntime
 from .inventory_view import InventoryView
+from .inverter_production import InverterProductionLedger
 from .labels import (
     battery_grid_mode_label,
     battery_profile_label as translated_battery_profile_label,
 )
+from .live_status import LiveStatusStream
+from .live_vitals import LiveVitalsStream
 from .log_redaction import (
     redact_site_id,
     redact_text,
@@ -137,6 +143,7 @@ from .parsing_helpers import (
     parse_inverter_last_report,
 )
 from .runtime_helpers import (
+    coerce_bool as _coerce_boolish,
     coerce_int as helper_coerce_int,
     coerce_optional_int as helper_coerce_optional_int,
     copy_diagnostics_value,
@@ -147,6 +154,7 @@ from .runtime_helpers import (
     resolve_site_local_current_date,
     resolve_site_timezone_name,
 )
+from .session_archive import SessionHistoryArchive
 from .session_history import (
     MIN_SESSION_HISTORY_CACHE_TTL,
     SESSION_HISTORY_CACHE_DAY_RETENTION,
@@ -154,10 +162,14 @@ from .session_history import (
     SESSION_HISTORY_FAILURE_BACKOFF_S,
     SessionHistoryManager,
 )
-from .coordinator_refresh_metrics import record_refresh_performance_sample
+from .coordinator_refresh_metrics import (
+    REFRESH_TOTAL_BUDGET_S,
+    record_refresh_performance_sample,
+)
 from .summary import SummaryStore
 from . import system_dashboard_helpers as sd_helpers
 from .refresh_plan import (
+    RefreshPlan,
     build_followup_plan,
     build_heatpump_followup_plan,
     build_post_session_followup_plan,
@@ -177,6 +189,7 @@ from .state_models import (
     RefreshHealthState,
     install_state_descriptors,
 )
+from .state_snapshot import CoordinatorStateSnapshotManager
 from .voltage import (
     coerce_nominal_voltage,
     preferred_operating_voltage,
@@ -206,8 +219,6 @@ BATTERY_STATUS_SEVERITY = {
     "error": 3,
 }
 
-ACTIVE_CONNECTOR_STATUSES = {"CHARGING", "FINISHING", "SUSPENDED"}
-ACTIVE_SUSPENDED_PREFIXES = ("SUSPENDED_EV",)
 _SERVICE_VALIDATION_ERROR_COMPAT = ServiceValidationError
 
 COORDINATOR_RUNTIME_CLASSES: dict[str, type] = {
@@ -315,16 +326,6 @@ def _extract_error_description(raw: str | None) -> str | None:
     return None
 
 
-def _coerce_boolish(value: object) -> bool:
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return value != 0
-    if isinstance(value, str):
-        return value.strip().lower() in ("true", "1", "yes", "y")
-    return False
-
-
 def _coerce_optional_boolish(value: object) -> bool | None:
     if value is None:
         return None
@@ -461,8 +462,17 @@ class RefreshPipelineContext:
     status_stale_dns_failure: bool = False
     fast_poll: bool = False
 
+    @property
+    def deadline_mono(self) -> float:
+        """Return when optional follow-up work is carried over to the next cycle."""
+
+        return self.started_mono + REFRESH_TOTAL_BUDGET_S
+
 
 class EnphaseCoordinator(DataUpdateCoordinator[dict]):
+    # Site snapshots shared by entity state writes within one listener dispatch.
+    snapshot_memo: dict[str, object] | None = None
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -585,6 +595,7 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
             self._tokens.access_token,
             self._tokens.cookie,
             timeout=timeout,
+            request_budget_account=self._email,
         )
         set_reauth_cb = getattr(self.client, "set_reauth_callback", None)
         if callable(set_reauth_cb):
@@ -743,6 +754,7 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
             **super_kwargs,
         )
         self.config_entry = config_entry
+        self.session_archive = SessionHistoryArchive(self)
         self.session_history = SessionHistoryManager(
             hass,
             lambda: self.client,
@@ -753,6 +765,7 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
             publish_callback=self.async_set_updated_data,
             site_id_getter=lambda: self.site_id,
             logger=_LOGGER,
+            archive=self.session_archive,
         )
         self.evse_runtime = EvseRuntime(self)
         self.battery_runtime = BatteryRuntime(self)
@@ -763,9 +776,16 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         self._ensure_coordinator_runtime("tariff_runtime")
         self.inventory_runtime = InventoryRuntime(self)
         self.discovery_snapshot = DiscoverySnapshotManager(self)
+        self.state_snapshot = CoordinatorStateSnapshotManager(self)
+        self.inverter_production_ledger = InverterProductionLedger(self)
         self.inventory_view = InventoryView(self)
         self.diagnostics = CoordinatorDiagnostics(self)
         self.refresh_runner = RefreshRunner(self)
+        self.family_scheduler = EndpointFamilyScheduler(self)
+        self.evse_fast_lane = EvseFastLane(self)
+        self.energy_statistics = EnergyStatisticsImporter(self)
+        self.live_status = LiveStatusStream(self)
+        self.live_vitals = LiveVitalsStream(self)
         self._endpoint_family_policies = self._build_endpoint_family_policies()
 
     def __setattr__(self, name, value):
@@ -1453,6 +1473,14 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
             max_cache_age=max_cache_age,
         )
 
+    async def async_backfill_session_history(
+        self, start_day: date, end_day: date
+    ) -> dict[str, dict[str, list[dict]]]:
+        """Fetch charging sessions for a date window for every charger."""
+        return await self.session_history.async_backfill(
+            self.iter_serials(), start_day, end_day
+        )
+
     @staticmethod
     def _normalize_serials(serials: Iterable[str] | None) -> set[str]:
         return EvseRuntime.normalize_serials(serials)
@@ -1509,6 +1537,21 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         if self._warmup_task is not None:
             self._warmup_task.cancel()
             self._warmup_task = None
+        family_scheduler = getattr(self, "family_scheduler", None)
+        if family_scheduler is not None:
+            family_scheduler.cancel()
+        evse_fast_lane = getattr(self, "evse_fast_lane", None)
+        if evse_fast_lane is not None:
+            evse_fast_lane.cancel()
+        energy_statistics = getattr(self, "energy_statistics", None)
+        if energy_statistics is not None:
+            energy_statistics.cancel()
+        for live_stream in (
+            getattr(self, "live_status", None),
+            getattr(self, "live_vitals", None),
+        ):
+            if live_stream is not None:
+                live_stream.cancel()
         for task in list(self._amp_restart_tasks.values()):
             if task is not None and not _task_done(task):
                 task.cancel()
@@ -1531,6 +1574,29 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         self._session_history_cache_shim.clear()
         self._prune_runtime_caches(active_serials=(), keep_day_keys=())
         self._topology_listeners.clear()
+        release_request_budget = getattr(
+            getattr(self, "client", None), "release_request_budget", None
+        )
+        if callable(release_request_budget):
+            release_request_budget()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners with a fresh ``snapshot_memo`` for the dispatch.
+
+        Entities write state synchronously from their listeners, so site
+        snapshots derived from coordinator state can be built once and shared
+        by every entity until the dispatch returns.
+        """
+
+        if self.snapshot_memo is not None:
+            super().async_update_listeners()
+            return
+        self.snapshot_memo = {}
+        try:
+            super().async_update_listeners()
+        finally:
+            self.snapshot_memo = None
 
     @callback
     def async_add_topology_listener(
@@ -2691,14 +2757,14 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         if context.first_refresh:
             await self._async_await_first_refresh_followups(context)
         else:
-            followup_plan = build_site_only_followup_plan(
-                self,
+            followup_plan = self._build_family_refresh_plan(
                 force_full=self.endpoint_manual_bypass_active(),
             )
             if followup_plan.stages:
-                await self.refresh_runner.async_run_refresh_plan(
+                await self.family_scheduler.async_run_plan(
                     phase_timings,
                     plan=followup_plan,
+                    deadline_mono=context.deadline_mono,
                 )
         self._clear_auth_refresh_rejection_state_if_unchanged(context)
         self._prune_runtime_caches(active_serials=(), keep_day_keys=())
@@ -2744,17 +2810,22 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         if context.first_refresh:
             await self._async_await_first_refresh_followups(context)
         else:
-            followup_plan = build_followup_plan(
-                self,
+            followup_plan = self._build_family_refresh_plan(
                 force_full=self.endpoint_manual_bypass_active(),
             )
             if followup_plan.stages:
-                await self.refresh_runner.async_run_refresh_plan(
+                await self.family_scheduler.async_run_plan(
                     context.phase_timings,
                     plan=followup_plan,
+                    deadline_mono=context.deadline_mono,
                 )
         self._clear_auth_refresh_rejection_state_if_unchanged(context)
 
+    def _build_family_refresh_plan(self, *, force_full: bool = False) -> RefreshPlan:
+        if self.site_only or not self.serials:
+            return build_site_only_followup_plan(self, force_full=force_full)
+        return build_followup_plan(self, force_full=force_full)
+
     def _first_refresh_followup_calls(
         self,
     ) -> tuple[tuple[str, str, Callable[[], object], str | None], ...]:
@@ -2853,6 +2924,7 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
             await self.refresh_runner.async_run_refresh_plan(
                 context.phase_timings,
                 plan=post_session_plan,
+                deadline_mono=context.deadline_mono,
             )
         try:
             self.evse_timeseries.merge_charger_payloads(
@@ -2871,6 +2943,7 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
             await self.refresh_runner.async_run_refresh_plan(
                 context.phase_timings,
                 plan=heatpump_plan,
+                deadline_mono=context.deadline_mono,
             )
 
     def _apply_refresh_polling_interval(self, polling_state: dict[str, object]) -> None:
@@ -2921,6 +2994,11 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
             self._bootstrap_phase_timings = phase_timings.copy()
         self._refresh_cached_topology()
         self.discovery_snapshot.schedule_save()
+        if not context.status_used_stale:
+            self.state_snapshot.mark_live()
+        self.state_snapshot.schedule_save()
+        self.family_scheduler.async_schedule()
+        self.energy_statistics.async_schedule()
 
     async def _async_update_data(self) -> dict:
         context = self._start_refresh_pipeline()
@@ -3360,36 +3438,15 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
                 "connectorStatusType"
             )
             connector_status_info = conn0.get("connectorStatusInfo")
-            connector_status_norm = None
-            suspended_by_evse = False
-            if isinstance(connector_status, str):
-                connector_status_norm = connector_status.strip().upper()
-            reported_charging_flag = _as_bool(obj.get("charging"))
-            charging_now_flag = reported_charging_flag
-            if connector_status_norm == SUSPENDED_EVSE_STATUS:
-                suspended_by_evse = True
-            if connector_status_norm:
-                if connector_status_norm == SUSPENDED_EVSE_STATUS:
-                    charging_now_flag = False
-                elif connector_status_norm in ACTIVE_CONNECTOR_STATUSES or any(
-                    connector_status_norm.startswith(prefix)
-                    for prefix in ACTIVE_SUSPENDED_PREFIXES
-                ):
-                    charging_now_flag = True
-            actual_charging_flag = evse_power_is_actively_charging(
-                connector_status_norm,
-                reported_charging_flag,
-                suspended_by_evse=suspended_by_evse,
+            charging_now_flag, actual_charging_flag, suspended_by_evse = (
+                evse_status_charging_flags(
+                    connector_status, _as_bool(obj.get("charging"))
+                )
             )
             self._record_actual_charging(sn, actual_charging_flag)
-            pending_expectation = self._pending_charging.get(sn)
-            if pending_expectation:
-                target_state, expires_at = pending_expectation
-                now_mono = time.monotonic()
-                if actual_charging_flag == target_state or now_mono > expires_at:
-                    self._pending_charging.pop(sn, None)
-                else:
-                    charging_now_flag = target_state
+            charging_now_flag = self.evse_runtime.resolve_pending_charging(
+                sn, charging_now_flag, actual_charging_flag
+            )
 
             # Keep preference state stable when scheduler lookups temporarily omit it.
             charge_mode_pref_source = None
@@ -3560,10 +3617,7 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
             ses_kwh = session_energy_wh
             if isinstance(ses_kwh, (int, float)):
                 try:
-                    if ses_kwh > 200:
-                        ses_kwh = round(float(ses_kwh) / 1000.0, 2)
-                    else:
-                        ses_kwh = round(float(ses_kwh), 2)
+                    ses_kwh = session_energy_kwh(ses_kwh)
                 except Exception:
                     ses_kwh = session_energy_wh
             else:
@@ -4187,6 +4241,7 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
             day_local_default,
         )
         self._apply_refresh_polling_interval(polling_state)
+        self.evse_fast_lane.async_update(polling_state)
 
         self._finish_refresh_pipeline(context)
         if _LOGGER.isEnabledFor(logging.DEBUG):
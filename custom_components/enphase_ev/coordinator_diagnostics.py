@@ -32,6 +32,7 @@ from .coordinator_refresh_metrics import (
     refresh_performance_history_summary,
     refresh_performance_summary,
 )
+from .intraday_energy import IntradayEnergyEngine
 from .log_redaction import redact_text
 from .tariff import TARIFF_ENDPOINT_FAMILY
 
@@ -51,6 +52,18 @@ _DEGRADED_SERVICE_REPAIR_ISSUE_IDS = frozenset(
 )
 
 
+def _client_diagnostics(coord: object, method_name: str) -> object | None:
+    """Return a best-effort diagnostics snapshot from the cloud client."""
+
+    method = getattr(getattr(coord, "client", None), method_name, None)
+    if not callable(method):
+        return None
+    try:
+        return method()
+    except Exception:  # noqa: BLE001 - diagnostics must stay best effort
+        return None
+
+
 class CoordinatorDiagnostics:
     """Diagnostics, payload health, and repair-issue helpers for the coordinator."""
 
@@ -358,6 +371,64 @@ class CoordinatorDiagnostics:
             tariff_available = not tariff_degraded
 
         hems_auth_backoff_remaining_s = coord._hems_auth_backoff_remaining_s()
+        request_scheduler = _client_diagnostics(coord, "request_scheduler_diagnostics")
+        conditional_get_cache = _client_diagnostics(
+            coord, "conditional_get_diagnostics"
+        )
+        single_flight = _client_diagnostics(coord, "single_flight_diagnostics")
+        request_budget = _client_diagnostics(coord, "request_budget_diagnostics")
+        critical_path_getter = getattr(
+            getattr(coord, "refresh_runner", None), "critical_path_diagnostics", None
+        )
+        refresh_critical_paths = (
+            critical_path_getter() if callable(critical_path_getter) else {}
+        )
+        carry_over_getter = getattr(
+            getattr(coord, "refresh_runner", None), "carry_over_diagnostics", None
+        )
+        refresh_carry_over = (
+            carry_over_getter() if callable(carry_over_getter) else None
+        )
+        state_snapshot = getattr(coord, "state_snapshot", None)
+        state_snapshot_diagnostics = (
+            state_snapshot.diagnostics() if state_snapshot is not None else None
+        )
+        family_scheduler = getattr(coord, "family_scheduler", None)
+        family_scheduler_diagnostics = (
+            family_scheduler.diagnostics() if family_scheduler is not None else None
+        )
+        inverter_production_ledger = getattr(coord, "inverter_production_ledger", None)
+        inverter_production_diagnostics = (
+            inverter_production_ledger.diagnostics()
+            if inverter_production_ledger is not None
+            else None
+        )
+        session_archive = getattr(coord, "session_archive", None)
+        session_archive_diagnostics = (
+            session_archive.diagnostics() if session_archive is not None else None
+        )
+        energy_statistics = getattr(coord, "energy_statistics", None)
+        energy_statistics_diagnostics = (
+            energy_statistics.diagnostics() if energy_statistics is not None else None
+        )
+        evse_fast_lane = getattr(coord, "evse_fast_lane", None)
+        evse_fast_lane_diagnostics = (
+            evse_fast_lane.diagnostics() if evse_fast_lane is not None else None
+        )
+        evse_runtime = getattr(coord, "evse_runtime", None)
+        evse_command_queue_diagnostics = (
+            evse_runtime.commands.diagnostics()
+            if getattr(evse_runtime, "commands", None) is not None
+            else None
+        )
+        live_status = getattr(coord, "live_status", None)
+        live_status_diagnostics = (
+            live_status.diagnostics() if live_status is not None else None
+        )
+        live_vitals = getattr(coord, "live_vitals", None)
+        live_vitals_diagnostics = (
+            live_vitals.diagnostics() if live_vitals is not None else None
+        )
         metrics: dict[str, object] = {
             "site_id": coord.site_id,
             "site_name": coord.site_name,
@@ -394,6 +465,21 @@ class CoordinatorDiagnostics:
             "refresh_performance_history": refresh_performance_history_summary(
                 getattr(coord, "_refresh_performance_history", [])
             ),
+            "refresh_critical_paths": refresh_critical_paths,
+            "refresh_carry_over": refresh_carry_over,
+            "family_scheduler": family_scheduler_diagnostics,
+            "evse_fast_lane": evse_fast_lane_diagnostics,
+            "evse_command_queue": evse_command_queue_diagnostics,
+            "energy_statistics": energy_statistics_diagnostics,
+            "inverter_production_ledger": inverter_production_diagnostics,
+            "session_archive": session_archive_diagnostics,
+            "live_status": live_status_diagnostics,
+            "live_vitals": live_vitals_diagnostics,
+            "state_snapshot": state_snapshot_diagnostics,
+            "request_scheduler": request_scheduler,
+            "conditional_get_cache": conditional_get_cache,
+            "single_flight": single_flight,
+            "request_budget": request_budget,
             "bootstrap_phase_timings": coord.bootstrap_phase_timings,
             "warmup_phase_timings": coord.warmup_phase_timings,
             "warmup_in_progress": getattr(coord, "_warmup_in_progress", False),
@@ -927,6 +1013,9 @@ class CoordinatorDiagnostics:
             metrics["session_history_backoff_ends_utc"] = _iso(
                 getattr(session_manager, "service_backoff_ends_utc", None)
             )
+            metrics["session_history_normalise"] = getattr(
+                session_manager, "normalise_stats", None
+            )
 
         energy_manager = getattr(coord, "energy", None)
         if energy_manager is not None:
@@ -988,6 +1077,12 @@ class CoordinatorDiagnostics:
                 "update_pending": site_meta.get("update_pending"),
                 "interval_minutes": site_meta.get("interval_minutes"),
             }
+            index_stats = getattr(energy_manager, "site_energy_index_stats", None)
+            if isinstance(index_stats, dict):
+                metrics["site_energy"]["bucket_index"] = index_stats
+            intraday = getattr(energy_manager, "intraday", None)
+            if isinstance(intraday, IntradayEnergyEngine):
+                metrics["site_energy"]["intraday"] = intraday.diagnostics()
 
         if evse_timeseries is not None:
             metrics["evse_timeseries"] = evse_timeseries.diagnostics()
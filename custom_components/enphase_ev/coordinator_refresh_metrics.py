@@ -8,6 +8,9 @@ from math import ceil
 
 REFRESH_TOTAL_BUDGET_S = 30.0
 REFRESH_STAGE_BUDGET_S = 5.0
+# Optional refresh work is not started once less than this remains before the
+# refresh deadline.
+REFRESH_DEADLINE_RESERVE_S = REFRESH_STAGE_BUDGET_S
 REFRESH_PERFORMANCE_HISTORY_LIMIT = 50
 
 
@@ -62,9 +62,15 @@ class CurrentPowerRuntime:
             )
         )
 
+    def _live_status_active(self) -> bool:
+        live_status = getattr(self.coordinator, "live_status", None)
+        return live_status is not None and live_status.active is True
+
     def refresh_due(self) -> bool:
         """Return True when current-power data can be refreshed."""
 
+        if self._live_status_active():
+            return False
         fetcher = getattr(self.coordinator.client, "latest_power", None)
         if callable(fetcher):
             cache_until = self._cache_until_mono
@@ -81,6 +87,9 @@ class CurrentPowerRuntime:
         if not callable(fetcher):
             self.clear()
             return
+        if self._live_status_active():
+            # Live Status frames already push fresher samples.
+            return
         now = time.monotonic()
         cache_until = self._cache_until_mono
         if cache_until is not None and now < cache_until:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
+import math
 import time
+from array import array
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from datetime import timezone as _tz
@@ -11,6 +13,12 @@ from homeassistant.const import UnitOfPower
 from homeassistant.util import dt as dt_util
 
 from .api import SiteEnergyUnavailable
+from .energy_buckets import (
+    bucket_span_key,
+    bucket_sum,
+    compact_lifetime_payload,
+)
+from .intraday_energy import IntradayEnergyEngine
 from .log_redaction import redact_site_id, redact_text
 
 LIFETIME_DROP_JITTER_KWH = 0.02
@@ -24,6 +32,14 @@ SITE_ENERGY_CACHE_TTL = 300.0
 SITE_ENERGY_DEFAULT_INTERVAL_MIN = 5.0
 SITE_ENERGY_FAILURE_BACKOFF_S = 15 * 60
 HEMS_LIFETIME_FAILURE_BACKOFF_S = 60 * 60
+# Recent daily buckets can still be revised by Enlighten, so they are summed on
+# every refresh; only buckets older than this window are folded into the index.
+SITE_ENERGY_INDEX_TAIL_BUCKETS = 35
+SITE_ENERGY_INDEX_VERIFY_BUCKETS = 8
+SITE_ENERGY_INDEX_MAX_AGE_S = 24 * 60 * 60
+# While the site today snapshot keeps the current day's bucket fresh, the
+# lifetime series only has to be re-read this often.
+SITE_ENERGY_INTRADAY_LIFETIME_TTL_S = 60 * 60
 DEVICE_LIFETIME_CHANNELS: tuple[str, ...] = ("evse", "heatpump", "water_heater")
 HEMS_DEVICE_CHANNELS_META_KEY = "_hems_device_channels"
 
@@ -36,6 +52,18 @@ class LifetimeGuardState:
     pending_count: int = 0
 
 
+@dataclass(slots=True)
+class SiteEnergyBucketIndex:
+    """Running total of the settled prefix of one lifetime energy field."""
+
+    start_date: str | None
+    built_mono: float
+    folded_len: int = 0
+    total_wh: float = 0.0
+    count: int = 0
+    boundary: tuple[object, ...] | bytes = ()
+
+
 @dataclass(slots=True)
 class SiteEnergyFlow:
     """Aggregated site-level energy flow."""
@@ -77,6 +105,14 @@ class EnergyManager:
         self._site_energy_guard: dict[str, LifetimeGuardState] = {}
         self._site_energy_last_reset: dict[str, str | None] = {}
         self._site_energy_force_refresh = False
+        self._site_energy_bucket_index: dict[str, SiteEnergyBucketIndex] = {}
+        self._site_energy_field_sums: dict[str, tuple[float, int]] | None = None
+        self._site_energy_index_rebuilds = 0
+        self.intraday = IntradayEnergyEngine()
+        self._site_energy_payload: dict | None = None
+        self._site_energy_overlay: tuple[int, dict[str, float]] | None = None
+        self._intraday_cache_ts: float | None = None
+        self._intraday_backoff_until: float | None = None
         self._lifetime_guard: dict[str, LifetimeGuardState] = {}
         self._service_available = True
         self._service_failures = 0
@@ -106,6 +142,24 @@ class EnergyManager:
 
         return dict(self._site_energy_meta)
 
+    @property
+    def lifetime_payload(self) -> dict | None:
+        """Return the last aggregated lifetime payload."""
+
+        return self._site_energy_payload
+
+    @property
+    def site_energy_index_stats(self) -> dict[str, int]:
+        """Return running-total index size and rebuild count."""
+
+        return {
+            "fields": len(self._site_energy_bucket_index),
+            "folded_buckets": sum(
+                index.folded_len for index in self._site_energy_bucket_index.values()
+            ),
+            "rebuilds": self._site_energy_index_rebuilds,
+        }
+
     def _invalidate_site_energy_cache(self) -> None:
         """Drop the cached site energy payload."""
         self._site_energy_cache_ts = None
@@ -120,13 +174,50 @@ class EnergyManager:
         if (
             not force_refresh
             and self._site_energy_cache_ts is not None
-            and (now_mono - self._site_energy_cache_ts) < self._site_energy_cache_ttl
+            and (now_mono - self._site_energy_cache_ts)
+            < self._site_energy_lifetime_ttl(now_mono)
         ):
-            return False
+            return self._intraday_refresh_due(now_mono)
         client = self._client_provider()
         fetcher = getattr(client, "lifetime_energy", None)
         return callable(fetcher)
 
+    def _site_energy_lifetime_ttl(self, now_mono: float) -> float:
+        """Return how long a lifetime payload stays fresh.
+
+        The lifetime series is only needed for settled days while the today
+        snapshot is being ingested, so it is then re-read hourly.
+        """
+        if (
+            self._intraday_cache_ts is not None
+            and self.intraday.day is not None
+            and not self._intraday_backoff_active(now_mono)
+            and now_mono - self._intraday_cache_ts < SITE_ENERGY_INTRADAY_LIFETIME_TTL_S
+        ):
+            return max(self._site_energy_cache_ttl, SITE_ENERGY_INTRADAY_LIFETIME_TTL_S)
+        return self._site_energy_cache_ttl
+
+    def _intraday_backoff_active(self, now_mono: float) -> bool:
+        return (
+            self._intraday_backoff_until is not None
+            and now_mono < self._intraday_backoff_until
+        )
+
+    def _intraday_refresh_due(self, now_mono: float) -> bool:
+        """Return True when the today snapshot should be fetched."""
+
+        if self._site_energy_payload is None:
+            return False
+        if self._intraday_backoff_active(now_mono):
+            return False
+        if (
+            self._intraday_cache_ts is not None
+            and now_mono - self._intraday_cache_ts < self._site_energy_cache_ttl
+        ):
+            return False
+        client = self._client_provider()
+        return callable(getattr(client, "pv_system_today", None))
+
     @property
     def service_available(self) -> bool:
         """Return True when site energy service is available."""
@@ -226,21 +317,27 @@ class EnergyManager:
 
     @staticmethod
     def _coerce_energy_value(value) -> float | None:
-        """Normalize numeric bucket values into floats."""
+        """Normalize numeric bucket values into floats.
+
+        NaN marks a missing bucket in compact payloads and maps to None.
+        """
+        number: float | None = None
         if isinstance(value, (int, float)):
             try:
-                return float(value)
+                number = float(value)
             except Exception:  # noqa: BLE001
                 return None
-        if isinstance(value, str):
+        elif isinstance(value, str):
             s = value.strip()
             if not s:
                 return None
             try:
-                return float(s)
+                number = float(s)
             except Exception:  # noqa: BLE001
                 return None
-        return None
+        if number is None or math.isnan(number):
+            return None
+        return number
 
     def _site_energy_interval_hours(
         self, payload: dict | None
@@ -268,6 +365,8 @@ class EnergyManager:
         """
         total = 0.0
         count = 0
+        if isinstance(values, array):
+            return bucket_sum(values)
         if not isinstance(values, list):
             return total, count
         for val in values:
@@ -281,6 +380,87 @@ class EnergyManager:
             count += 1
         return total, count
 
+    def _payload_field_sum(
+        self, payload: dict, field: str, interval_hours: float | None
+    ) -> tuple[float, int]:
+        """Return the Wh total and bucket count for one payload field.
+
+        While a payload is being aggregated each field is summed once, through
+        the running-total index and with the intraday total applied; other
+        callers get a plain full sum.
+        """
+        sums = self._site_energy_field_sums
+        if sums is None:
+            return self._sum_energy_buckets(payload.get(field), interval_hours)
+        cached = sums.get(field)
+        if cached is None:
+            start_date = payload.get("start_date")
+            values = payload.get(field)
+            total, count = self._indexed_energy_sum(
+                field,
+                values,
+                str(start_date) if start_date is not None else None,
+            )
+            cached = sums[field] = self._apply_intraday_overlay(
+                field, values, total, count
+            )
+        return cached
+
+    @staticmethod
+    def _bucket_index_boundary(
+        values: list | array, end: int
+    ) -> tuple[object, ...] | bytes:
+        start = max(0, end - SITE_ENERGY_INDEX_VERIFY_BUCKETS)
+        if isinstance(values, array):
+            return bucket_span_key(values, start, end)
+        return tuple(values[start:end])
+
+    def _sum_bucket_span(
+        self, values: list | array, start: int, stop: int
+    ) -> tuple[float, int]:
+        if isinstance(values, array):
+            return bucket_sum(values, start, stop)
+        return self._sum_energy_buckets(values[start:stop], None)
+
+    def _indexed_energy_sum(
+        self, field: str, values: object, start_date: str | None
+    ) -> tuple[float, int]:
+        """Sum a lifetime field, reusing the folded total of settled buckets.
+
+        The index is rebuilt from scratch when the start date changes, the
+        series gets shorter, the buckets just before the folded boundary differ,
+        or the index is older than ``SITE_ENERGY_INDEX_MAX_AGE_S``.
+        """
+        if not isinstance(values, (list, array)):
+            self._site_energy_bucket_index.pop(field, None)
+            return 0.0, 0
+        now_mono = time.monotonic()
+        index = self._site_energy_bucket_index.get(field)
+        if index is not None and (
+            index.start_date != start_date
+            or index.folded_len > len(values)
+            or now_mono - index.built_mono > SITE_ENERGY_INDEX_MAX_AGE_S
+            or self._bucket_index_boundary(values, index.folded_len) != index.boundary
+        ):
+            index = None
+        if index is None:
+            index = SiteEnergyBucketIndex(start_date=start_date, built_mono=now_mono)
+            self._site_energy_bucket_index[field] = index
+            self._site_energy_index_rebuilds += 1
+        settled_len = len(values) - SITE_ENERGY_INDEX_TAIL_BUCKETS
+        if settled_len > index.folded_len:
+            folded_total, folded_count = self._sum_bucket_span(
+                values, index.folded_len, settled_len
+            )
+            index.total_wh += folded_total
+            index.count += folded_count
+            index.folded_len = settled_len
+            index.boundary = self._bucket_index_boundary(values, settled_len)
+        tail_total, tail_count = self._sum_bucket_span(
+            values, index.folded_len, len(values)
+        )
+        return index.total_wh + tail_total, index.count + tail_count
+
     def _sum_energy_fields(
         self, payload: dict, fields: Iterable[str], interval_hours: float | None
     ) -> tuple[float, int, list[str]]:
@@ -289,8 +469,8 @@ class EnergyManager:
         max_count = 0
         used: list[str] = []
         for field in fields:
-            field_total, field_count = self._sum_energy_buckets(
-                payload.get(field), interval_hours
+            field_total, field_count = self._payload_field_sum(
+                payload, field, interval_hours
             )
             if field_count <= 0 or field_total <= 0:
                 continue
@@ -303,11 +483,9 @@ class EnergyManager:
         self, payload: dict, minuend: str, subtrahend: str, interval_hours: float | None
     ) -> tuple[float, int, list[str]]:
         """Derive a flow by subtracting one field from another."""
-        pos_total, pos_count = self._sum_energy_buckets(
-            payload.get(minuend), interval_hours
-        )
-        neg_total, neg_count = self._sum_energy_buckets(
-            payload.get(subtrahend), interval_hours
+        pos_total, pos_count = self._payload_field_sum(payload, minuend, interval_hours)
+        neg_total, neg_count = self._payload_field_sum(
+            payload, subtrahend, interval_hours
         )
         if pos_total <= 0 or pos_count <= 0:
             return 0.0, 0, []
@@ -330,9 +508,7 @@ class EnergyManager:
     ) -> tuple[float, int, list[str]]:
         """Derive a flow by subtracting multiple fields from another."""
 
-        pos_total, pos_count = self._sum_energy_buckets(
-            payload.get(minuend), interval_hours
-        )
+        pos_total, pos_count = self._payload_field_sum(payload, minuend, interval_hours)
         if pos_total <= 0 or pos_count <= 0:
             return 0.0, 0, []
 
@@ -340,8 +516,8 @@ class EnergyManager:
         neg_counts: list[int] = []
         used_fields: list[str] = []
         for field in subtrahends:
-            field_total, field_count = self._sum_energy_buckets(
-                payload.get(field), interval_hours
+            field_total, field_count = self._payload_field_sum(
+                payload, field, interval_hours
             )
             if field_count <= 0:
                 continue
@@ -468,12 +644,72 @@ class EnergyManager:
         """Aggregate lifetime energy payload into kWh totals."""
         if not isinstance(payload, dict):
             return None
+        self._site_energy_field_sums = {}
+        self._site_energy_overlay = self._intraday_overlay(payload)
+        try:
+            return self._aggregate_site_energy_payload(payload)
+        finally:
+            self._site_energy_field_sums = None
+            self._site_energy_overlay = None
+
+    def _intraday_overlay(self, payload: dict) -> tuple[int, dict[str, float]] | None:
+        """Return the intraday day's bucket offset in ``payload`` and its totals."""
+
+        totals = self.intraday.day_totals
+        if self.intraday.day is None or not totals:
+            return None
+        start_raw = payload.get("start_date")
+        try:
+            start = dt_util.parse_date(str(start_raw)) if start_raw else None
+            day = dt_util.parse_date(self.intraday.day)
+        except ValueError:
+            return None
+        if start is None or day is None:
+            return None
+        return (day - start).days, totals
+
+    def _apply_intraday_overlay(
+        self, field: str, values: object, total: float, count: int
+    ) -> tuple[float, int]:
+        """Swap the intraday day total in for the current day's lifetime bucket.
+
+        The lifetime series either already ends with today's bucket, which the
+        quarter-hour total replaces when it is larger, or ends yesterday, in
+        which case the total is appended. Other alignments are left alone.
+        """
+        overlay = self._site_energy_overlay
+        if overlay is None or not isinstance(values, (list, array)):
+            return total, count
+        offset, totals = overlay
+        day_wh = totals.get(field)
+        if day_wh is None:
+            return total, count
+        if offset == len(values):
+            return total + day_wh, count + 1
+        if offset != len(values) - 1:
+            return total, count
+        last_wh = self._coerce_energy_value(values[-1])
+        if last_wh is None or last_wh < 0:
+            return total + day_wh, count + 1
+        if day_wh <= last_wh:
+            return total, count
+        return total - last_wh + day_wh, count
 
+    def _aggregate_site_energy_payload(
+        self, payload: dict
+    ) -> tuple[dict[str, SiteEnergyFlow], dict[str, object]]:
         start_date_raw = payload.get("start_date")
         start_date = str(start_date_raw) if start_date_raw is not None else None
         last_report_date = self._parse_site_energy_timestamp(
             payload.get("last_report_date")
         )
+        intraday_through = self.intraday.data_through_utc
+        if (
+            self._site_energy_overlay is not None
+            and intraday_through is not None
+            and (last_report_date is None or intraday_through > last_report_date)
+        ):
+            last_report_date = intraday_through
         update_pending = payload.get("update_pending")
         prev = self.site_energy or {}
         flows: dict[str, SiteEnergyFlow] = {}
@@ -490,6 +726,8 @@ class EnergyManager:
             else set()
         )
 
+        flow_fields: dict[str, dict[str, int]] = {}
+
         def _store(
             flow: str,
             total_wh: float,
@@ -497,11 +735,16 @@ class EnergyManager:
             bucket_count: int,
             *,
             allow_zero: bool = False,
+            subtracted: Iterable[str] = (),
         ):
             if bucket_count <= 0 or total_wh < 0:
                 return
             if total_wh == 0 and not allow_zero:
                 return
+            negative = set(subtracted)
+            flow_fields[flow] = {
+                field: -1 if field in negative else 1 for field in fields
+            }
             total_kwh = round(total_wh / 1000.0, 3)
             prev_entry = prev.get(flow)
             prev_value = None
@@ -534,20 +777,20 @@ class EnergyManager:
                 self._site_energy_last_reset[flow] = last_reset
 
         # Solar production
-        prod_total, prod_count = self._sum_energy_buckets(
-            payload.get("production"), interval_hours
+        prod_total, prod_count = self._payload_field_sum(
+            payload, "production", interval_hours
         )
         _store("solar_production", prod_total, ["production"], prod_count)
 
         # Site consumption (total energy consumed)
-        cons_total, cons_count = self._sum_energy_buckets(
-            payload.get("consumption"), interval_hours
+        cons_total, cons_count = self._payload_field_sum(
+            payload, "consumption", interval_hours
         )
         _store("consumption", cons_total, ["consumption"], cons_count)
 
         # EVSE lifetime charging energy when the backend provides a dedicated flow.
-        evse_total, evse_count = self._sum_energy_buckets(
-            payload.get("evse"), interval_hours
+        evse_total, evse_count = self._payload_field_sum(
+            payload, "evse", interval_hours
         )
         _store(
             "evse_charging",
@@ -558,8 +801,8 @@ class EnergyManager:
         )
 
         # Heat pump lifetime consumption.
-        heat_pump_total, heat_pump_count = self._sum_energy_buckets(
-            payload.get("heatpump"), interval_hours
+        heat_pump_total, heat_pump_count = self._payload_field_sum(
+            payload, "heatpump", interval_hours
         )
         _store(
             "heat_pump",
@@ -570,8 +813,8 @@ class EnergyManager:
         )
 
         # Water heater lifetime consumption.
-        water_heater_total, water_heater_count = self._sum_energy_buckets(
-            payload.get("water_heater"), interval_hours
+        water_heater_total, water_heater_count = self._payload_field_sum(
+            payload, "water_heater", interval_hours
         )
         _store(
             "water_heater",
@@ -582,11 +825,11 @@ class EnergyManager:
         )
 
         # Grid import (total site import).
-        direct_import_total, direct_import_count = self._sum_energy_buckets(
-            payload.get("import"), interval_hours
+        direct_import_total, direct_import_count = self._payload_field_sum(
+            payload, "import", interval_hours
         )
-        direct_grid_home_total, direct_grid_home_count = self._sum_energy_buckets(
-            payload.get("grid_home"), interval_hours
+        direct_grid_home_total, direct_grid_home_count = self._payload_field_sum(
+            payload, "grid_home", interval_hours
         )
         derived_grid_home_total, derived_grid_home_count, derived_grid_home_fields = (
             self._diff_energy_fields_multi(
@@ -607,8 +850,8 @@ class EnergyManager:
             )
         )
 
-        direct_grid_battery_total, direct_grid_battery_count = self._sum_energy_buckets(
-            payload.get("grid_battery"), interval_hours
+        direct_grid_battery_total, direct_grid_battery_count = self._payload_field_sum(
+            payload, "grid_battery", interval_hours
         )
         (
             derived_grid_battery_total,
@@ -647,23 +890,29 @@ class EnergyManager:
             fallback_fields=import_fields,
         )
         if import_fields and import_count > 0:
+            import_subtracted: list[str] = []
+            if grid_home_fields and grid_home_fields != ["grid_home"]:
+                import_subtracted.extend(grid_home_fields[1:])
+            if grid_battery_fields and grid_battery_fields != ["grid_battery"]:
+                import_subtracted.extend(grid_battery_fields[1:])
             _store(
                 "grid_import",
                 import_total,
                 import_fields,
                 import_count,
                 allow_zero=True,
+                subtracted=import_subtracted,
             )
 
         # Grid export
-        exp_total, exp_count = self._sum_energy_buckets(
-            payload.get("solar_grid"), interval_hours
+        exp_total, exp_count = self._payload_field_sum(
+            payload, "solar_grid", interval_hours
         )
         _store("grid_export", exp_total, ["solar_grid"], exp_count)
 
         # Battery charge (into battery)
-        charge_total, charge_count = self._sum_energy_buckets(
-            payload.get("charge"), interval_hours
+        charge_total, charge_count = self._payload_field_sum(
+            payload, "charge", interval_hours
         )
         if charge_total > 0 and charge_count > 0:
             _store("battery_charge", charge_total, ["charge"], charge_count)
@@ -675,8 +924,8 @@ class EnergyManager:
                 _store("battery_charge", charge_total, charge_fields, charge_count)
 
         # Battery discharge (out of battery)
-        discharge_total, discharge_count = self._sum_energy_buckets(
-            payload.get("discharge"), interval_hours
+        discharge_total, discharge_count = self._payload_field_sum(
+            payload, "discharge", interval_hours
         )
         if discharge_total > 0 and discharge_count > 0:
             _store(
@@ -700,7 +949,9 @@ class EnergyManager:
                 )
 
         raw_bucket_lengths = {
-            key: len(value) for key, value in payload.items() if isinstance(value, list)
+            key: len(value)
+            for key, value in payload.items()
+            if isinstance(value, (list, array))
         }
         bucket_lengths = dict(raw_bucket_lengths)
         for channel in DEVICE_LIFETIME_CHANNELS:
@@ -720,6 +971,9 @@ class EnergyManager:
             "interval_minutes": interval_minutes,
             "bucket_lengths": bucket_lengths,
             "raw_bucket_lengths": raw_bucket_lengths,
+            "flow_fields": {
+                flow: signs for flow, signs in flow_fields.items() if flow in flows
+            },
         }
         return flows, meta
 
@@ -727,7 +981,7 @@ class EnergyManager:
         self, payload: dict[str, object], channel: str
     ) -> bool:
         values = payload.get(channel)
-        if not isinstance(values, list) or len(values) == 0:
+        if not isinstance(values, (list, array)) or len(values) == 0:
             return True
         # Lists containing only None/non-numeric/negative values are treated as missing.
         for value in values:
@@ -742,7 +996,7 @@ class EnergyManager:
         """Treat zero-only device arrays as missing so HEMS can fill them."""
 
         values = payload.get(channel)
-        if not isinstance(values, list) or len(values) == 0:
+        if not isinstance(values, (list, array)) or len(values) == 0:
             return True
         for value in values:
             numeric = self._coerce_energy_value(value)
@@ -756,7 +1010,7 @@ class EnergyManager:
         """Return True when a device channel contains a positive numeric sample."""
 
         values = payload.get(channel)
-        if not isinstance(values, list) or len(values) == 0:
+        if not isinstance(values, (list, array)) or len(values) == 0:
             return False
         for value in values:
             numeric = self._coerce_energy_value(value)
@@ -837,6 +1091,9 @@ class EnergyManager:
     async def _async_refresh_site_energy(self, *, force: bool = False) -> None:
         """Refresh lifetime energy cache with TTL enforcement."""
         force_refresh = force or self._site_energy_force_refresh
+        if self._site_energy_force_refresh:
+            # A suspected reset is confirmed against a full rescan.
+            self._site_energy_bucket_index.clear()
         self._site_energy_force_refresh = False
         now_mono = time.monotonic()
         if self._service_backoff_active():
@@ -844,8 +1101,11 @@ class EnergyManager:
         if (
             not force_refresh
             and self._site_energy_cache_ts is not None
-            and (now_mono - self._site_energy_cache_ts) < self._site_energy_cache_ttl
+            and (now_mono - self._site_energy_cache_ts)
+            < self._site_energy_lifetime_ttl(now_mono)
         ):
+            if self._intraday_refresh_due(now_mono):
+                await self._async_refresh_site_energy_intraday(now_mono)
             return
         try:
             client = self._client_provider()
@@ -913,6 +1173,13 @@ class EnergyManager:
                                 )
                             else:
                                 self._note_hems_lifetime_unavailable(None)
+            # Stored once per fetch; every refresh until the next fetch reads
+            # the compact buckets.
+            payload = compact_lifetime_payload(
+                payload,
+                self._coerce_energy_value,
+                skip=(HEMS_DEVICE_CHANNELS_META_KEY,),
+            )
         parsed = self._aggregate_site_energy(payload)
         if parsed is None:
             return
@@ -920,8 +1187,38 @@ class EnergyManager:
         self._mark_service_available()
         self.site_energy = flows
         self._site_energy_meta = meta
+        self._site_energy_payload = payload
         self._site_energy_cache_ts = time.monotonic()
 
+    async def _async_refresh_site_energy_intraday(self, now_mono: float) -> None:
+        """Ingest the today snapshot and re-apply it to the cached lifetime payload.
+
+        Flows are re-aggregated only when a day total changed; the running-total
+        index keeps that to the recent tail of each lifetime field.
+        """
+        self._intraday_cache_ts = now_mono
+        try:
+            client = self._client_provider()
+            payload = await client.pv_system_today()
+        except Exception as err:  # noqa: BLE001
+            self._logger.debug(
+                "Failed to fetch site today energy for site %s: %s",
+                redact_site_id(self.site_id),
+                redact_text(err, site_ids=(self.site_id,)),
+            )
+            payload = None
+        changed = self.intraday.ingest(payload) if payload is not None else False
+        if payload is None or self.intraday.day is None:
+            self._intraday_backoff_until = now_mono + SITE_ENERGY_FAILURE_BACKOFF_S
+            return
+        self._intraday_backoff_until = None
+        if not changed:
+            return
+        parsed = self._aggregate_site_energy(self._site_energy_payload)
+        if parsed is None:
+            return
+        self.site_energy, self._site_energy_meta = parsed
+
     def _apply_lifetime_guard(
         self,
         sn: str,
@@ -0,0 +1,82 @@
+"""Compact numeric storage and batched sums for lifetime energy buckets."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Collection
+import math
+import sys
+
+MISSING_BUCKET = math.nan
+# NumPy is only worth its call overhead on long spans such as a first fold of a
+# multi-year series; short tails are summed in Python.
+NUMPY_MIN_BUCKETS = 1024
+
+
+def _loaded_numpy():
+    """Return NumPy if something in the process already imported it.
+
+    Importing it here would block the event loop, and it is not a requirement
+    of this integration.
+    """
+
+    return sys.modules.get("numpy")
+
+
+def bucket_array(
+    values: object, coerce: Callable[[object], float | None]
+) -> array | None:
+    """Return lifetime buckets as ``array('d')`` with NaN for missing samples."""
+
+    if isinstance(values, array):
+        return values
+    if not isinstance(values, list):
+        return None
+    out = array("d", bytes(8 * len(values)))
+    for index, value in enumerate(values):
+        number = coerce(value)
+        out[index] = MISSING_BUCKET if number is None else number
+    return out
+
+
+def compact_lifetime_payload(
+    payload: dict[str, object],
+    coerce: Callable[[object], float | None],
+    *,
+    skip: Collection[str] = (),
+) -> dict[str, object]:
+    """Return a copy of ``payload`` with every bucket list stored as an array."""
+
+    compact = dict(payload)
+    for key, values in payload.items():
+        if key not in skip and isinstance(values, list):
+            compact[key] = bucket_array(values, coerce)
+    return compact
+
+
+def bucket_sum(
+    values: array, start: int = 0, stop: int | None = None
+) -> tuple[float, int]:
+    """Return the total and count of non-negative buckets in ``values[start:stop]``.
+
+    NaN compares false against zero, so missing and negative buckets are both
+    skipped by the same test.
+    """
+
+    stop = len(values) if stop is None else min(stop, len(values))
+    start = max(0, start)
+    if stop <= start:
+        return 0.0, 0
+    numpy = _loaded_numpy() if stop - start >= NUMPY_MIN_BUCKETS else None
+    if numpy is not None:
+        window = numpy.frombuffer(values, dtype=numpy.float64)[start:stop]
+        valid = window[window >= 0]
+        return float(valid.sum()), int(valid.size)
+    valid = [value for value in values[start:stop] if value >= 0]
+    return float(sum(valid)), len(valid)
+
+
+def bucket_span_key(values: array, start: int, stop: int) -> bytes:
+    """Return a byte key for ``values[start:stop]`` that treats NaN as equal."""
+
+    return values[max(0, start) : stop].tobytes()
@@ -0,0 +1,397 @@
+"""Backfill Home Assistant long-term statistics from daily energy buckets."""
+
+from __future__ import annotations
+
+from array import array
+import asyncio
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, tzinfo
+import logging
+from typing import TYPE_CHECKING, Any
+from zoneinfo import ZoneInfo
+
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN
+from .log_redaction import redact_site_id, redact_text
+from .runtime_helpers import (
+    resolve_site_local_current_date,
+    resolve_site_timezone_name,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import EnphaseCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rows handed to the recorder per import job. Each job is one short recorder
+# transaction, so a ten-year backfill is spread over a couple of dozen inserts.
+STATISTICS_IMPORT_CHUNK_DAYS = 200
+
+SITE_FLOW_STATISTIC_NAMES: dict[str, str] = {
+    "solar_production": "Site Solar Production",
+    "consumption": "Site Consumption",
+    "grid_import": "Site Grid Import",
+    "grid_export": "Site Grid Export",
+    "battery_charge": "Site Battery Charge",
+    "battery_discharge": "Site Battery Discharge",
+    "evse_charging": "Site EV Charging",
+    "heat_pump": "Site Heat Pump",
+    "water_heater": "Site Water Heater",
+}
+
+
+def _recorder_statistics() -> Any:
+    from homeassistant.components.recorder import statistics
+
+    return statistics
+
+
+def _recorder_instance(hass) -> Any:
+    from homeassistant.components.recorder import get_instance
+
+    return get_instance(hass)
+
+
+def _statistic_metadata(statistic_id: str, name: str) -> dict[str, Any]:
+    from homeassistant.components.recorder.models import StatisticMeanType
+    from homeassistant.util.unit_conversion import EnergyConverter
+
+    return {
+        "has_sum": True,
+        "mean_type": StatisticMeanType.NONE,
+        "name": name,
+        "source": DOMAIN,
+        "statistic_id": statistic_id,
+        "unit_class": EnergyConverter.UNIT_CLASS,
+        "unit_of_measurement": UnitOfEnergy.KILO_WATT_HOUR,
+    }
+
+
+def _day_start_utc(day: date, site_tz: tzinfo) -> datetime:
+    """Return the hour-aligned UTC start of a site-local day."""
+
+    start = dt_util.as_utc(datetime.combine(day, time.min, tzinfo=site_tz))
+    return start.replace(minute=0, second=0, microsecond=0)
+
+
+def _day_from_start_utc(start: datetime, site_tz: tzinfo) -> date:
+    """Return the site-local day that ``_day_start_utc`` mapped to ``start``.
+
+    In half-hour offset zones the hour-aligned start falls before local
+    midnight, so the local date of ``start`` can be the previous day.
+    """
+
+    day = start.astimezone(site_tz).date()
+    following = day + timedelta(days=1)
+    return following if _day_start_utc(following, site_tz) == start else day
+
+
+@dataclass(slots=True, frozen=True)
+class EnergyStatisticSeries:
+    """Daily kWh values for one external statistic."""
+
+    statistic_id: str
+    name: str
+    first_day: date
+    length: int
+    value_kwh: Callable[[int], float | None]
+
+    @property
+    def last_day(self) -> date:
+        return self.first_day + timedelta(days=self.length - 1)
+
+
+def site_flow_series(
+    site_id: object,
+    payload: dict,
+    flow_fields: dict[str, dict[str, int]],
+    coerce: Callable[[object], float | None],
+) -> list[EnergyStatisticSeries]:
+    """Return one series per aggregated site flow.
+
+    ``flow_fields`` carries the payload fields each flow was summed from and
+    their signs, so derived flows such as grid import are rebuilt per day the
+    same way the lifetime totals were.
+    """
+
+    first_day = dt_util.parse_date(str(payload.get("start_date") or ""))
+    if first_day is None:
+        return []
+    site_key = slugify(str(site_id))
+    series: list[EnergyStatisticSeries] = []
+    for flow, signs in flow_fields.items():
+        if not isinstance(signs, dict):
+            continue
+        columns: list[tuple[Sequence[object], int]] = []
+        for field, sign in signs.items():
+            values = payload.get(field)
+            if isinstance(values, (list, array)):
+                columns.append((values, sign))
+        if not columns:
+            continue
+
+        def _value(index: int, columns=columns) -> float | None:
+            total: float | None = None
+            for values, sign in columns:
+                if index >= len(values):
+                    continue
+                number = coerce(values[index])
+                if number is None or number < 0:
+                    continue
+                total = (total or 0.0) + sign * number
+            return None if total is None else max(0.0, total) / 1000.0
+
+        series.append(
+            EnergyStatisticSeries(
+                statistic_id=f"{DOMAIN}:site_{site_key}_{flow}",
+                name=SITE_FLOW_STATISTIC_NAMES.get(
+                    flow, f"Site {flow.replace('_', ' ').title()}"
+                ),
+                first_day=first_day,
+                length=max(len(values) for values, _sign in columns),
+                value_kwh=_value,
+            )
+        )
+    return series
+
+
+def evse_daily_series(
+    history: dict[str, dict[str, float]],
+) -> list[EnergyStatisticSeries]:
+    """Return one charging series per charger serial."""
+
+    series: list[EnergyStatisticSeries] = []
+    for serial, day_values in history.items():
+        by_day: dict[date, float] = {}
+        for key, value in day_values.items():
+            day = dt_util.parse_date(str(key))
+            if day is not None and value >= 0:
+                by_day[day] = float(value)
+        if not by_day:
+            continue
+        first_day = min(by_day)
+
+        def _value(index: int, by_day=by_day, first_day=first_day) -> float | None:
+            return by_day.get(first_day + timedelta(days=index))
+
+        series.append(
+            EnergyStatisticSeries(
+                statistic_id=f"{DOMAIN}:evse_{slugify(str(serial))}_charging",
+                name=f"EV Charger {serial} Charging",
+                first_day=first_day,
+                length=(max(by_day) - first_day).days + 1,
+                value_kwh=_value,
+            )
+        )
+    return series
+
+
+class EnergyStatisticsImporter:
+    """Import completed days of energy into recorder long-term statistics.
+
+    Site flows come from the lifetime payload the energy manager already
+    holds and chargers from the cached EVSE daily timeseries. Each statistic
+    resumes after the last row the recorder has for it, continuing that row's
+    sum, so a re-run inserts only days that are new. Rows are queued in
+    bounded chunks and the recorder writes them on its own thread.
+    """
+
+    def __init__(self, coordinator: EnphaseCoordinator) -> None:
+        self.coordinator = coordinator
+        self._task: asyncio.Task[None] | None = None
+        self._imported: dict[str, tuple[date, float]] = {}
+        self._runs = 0
+        self._rows_imported = 0
+        self._failures = 0
+        self._last_error: str | None = None
+
+    @property
+    def busy(self) -> bool:
+        """Return True while an import is still running."""
+
+        return self._task is not None and not self._task.done()
+
+    def _series(self) -> list[EnergyStatisticSeries]:
+        coord = self.coordinator
+        series: list[EnergyStatisticSeries] = []
+        energy = getattr(coord, "energy", None)
+        payload = getattr(energy, "lifetime_payload", None)
+        flow_fields = (
+            energy.site_energy_meta.get("flow_fields")
+            if energy is not None and isinstance(payload, dict)
+            else None
+        )
+        if isinstance(flow_fields, dict):
+            series.extend(
+                site_flow_series(
+                    coord.site_id,
+                    payload,
+                    flow_fields,
+                    energy._coerce_energy_value,  # noqa: SLF001
+                )
+            )
+        evse_timeseries = getattr(coord, "evse_timeseries", None)
+        if evse_timeseries is not None:
+            series.extend(evse_daily_series(evse_timeseries.daily_history_kwh()))
+        return series
+
+    def _pending(
+        self, series: list[EnergyStatisticSeries], last_day: date
+    ) -> Iterator[tuple[EnergyStatisticSeries, date]]:
+        for item in series:
+            through = min(item.last_day, last_day)
+            if through < item.first_day:
+                continue
+            imported = self._imported.get(item.statistic_id)
+            if imported is not None and imported[0] >= through:
+                continue
+            yield item, through
+
+    def _site_timezone(self) -> tzinfo:
+        return ZoneInfo(
+            resolve_site_timezone_name(
+                getattr(self.coordinator, "_battery_timezone", None)
+            )
+        )
+
+    def _last_complete_day(self) -> date:
+        today = resolve_site_local_current_date(
+            getattr(self.coordinator, "_devices_inventory_payload", None),
+            getattr(self.coordinator, "_battery_timezone", None),
+        )
+        return date.fromisoformat(today) - timedelta(days=1)
+
+    def cancel(self) -> None:
+        """Cancel an import that is still running."""
+
+        if self.busy:
+            self._task.cancel()
+        self._task = None
+
+    @callback
+    def async_schedule(self) -> None:
+        """Start an import when a completed day is not in statistics yet."""
+
+        hass = self.coordinator.hass
+        if self.busy or "recorder" not in hass.config.components:
+            return
+        pending = self._pending(self._series(), self._last_complete_day())
+        if next(pending, None) is None:
+            return
+        self._task = asyncio.create_task(
+            self.async_import(), name=f"{DOMAIN}_energy_statistics"
+        )
+        self._task.add_done_callback(self._import_done)
+
+    @callback
+    def _import_done(self, task: asyncio.Task[None]) -> None:
+        if self._task is task:
+            self._task = None
+        if task.cancelled():
+            return
+        err = task.exception()
+        if err is None:
+            return
+        self._failures += 1
+        self._last_error = redact_text(err, site_ids=(self.coordinator.site_id,))
+        _LOGGER.debug(
+            "Energy statistics import failed for site %s: %s",
+            redact_site_id(self.coordinator.site_id),
+            self._last_error,
+        )
+
+    async def async_import(self) -> None:
+        """Import every series up to the last completed site-local day."""
+
+        last_day = self._last_complete_day()
+        site_tz = self._site_timezone()
+        for series, through in list(self._pending(self._series(), last_day)):
+            await self._async_import_series(series, through, site_tz)
+        self._runs += 1
+        self._last_error = None
+
+    async def _async_last_imported(
+        self, statistic_id: str, site_tz: tzinfo
+    ) -> tuple[date, float] | None:
+        hass = self.coordinator.hass
+        result = await _recorder_instance(hass).async_add_executor_job(
+            _recorder_statistics().get_last_statistics,
+            hass,
+            1,
+            statistic_id,
+            True,
+            {"sum"},
+        )
+        rows = result.get(statistic_id) if isinstance(result, dict) else None
+        if not rows:
+            return None
+        row = rows[-1]
+        start = row.get("start")
+        if isinstance(start, (int, float)):
+            start = dt_util.utc_from_timestamp(start)
+        if not isinstance(start, datetime):
+            return None
+        total = row.get("sum")
+        return _day_from_start_utc(start, site_tz), float(total or 0.0)
+
+    async def _async_import_series(
+        self, series: EnergyStatisticSeries, through: date, site_tz: tzinfo
+    ) -> None:
+        imported = self._imported.get(series.statistic_id)
+        if imported is None:
+            imported = await self._async_last_imported(series.statistic_id, site_tz)
+        if imported is None:
+            first_index, total = 0, 0.0
+        else:
+            if imported[0] >= through:
+                self._imported[series.statistic_id] = imported
+                return
+            first_index = max(0, (imported[0] - series.first_day).days + 1)
+            total = imported[1]
+        last_index = (through - series.first_day).days
+        hass = self.coordinator.hass
+        statistics = _recorder_statistics()
+        metadata = _statistic_metadata(series.statistic_id, series.name)
+        chunk = STATISTICS_IMPORT_CHUNK_DAYS
+        for chunk_start in range(first_index, last_index + 1, chunk):
+            chunk_stop = min(chunk_start + chunk, last_index + 1)
+            rows: list[dict[str, Any]] = []
+            for index in range(chunk_start, chunk_stop):
+                value = series.value_kwh(index)
+                if value is None:
+                    continue
+                total = round(total + value, 3)
+                rows.append(
+                    {
+                        "start": _day_start_utc(
+                            series.first_day + timedelta(days=index), site_tz
+                        ),
+                        "state": total,
+                        "sum": total,
+                    }
+                )
+            if rows:
+                statistics.async_add_external_statistics(hass, metadata, rows)
+                self._rows_imported += len(rows)
+            self._imported[series.statistic_id] = (
+                series.first_day + timedelta(days=chunk_stop - 1),
+                total,
+            )
+            await asyncio.sleep(0)
+
+    def diagnostics(self) -> dict[str, object]:
+        return {
+            "busy": self.busy,
+            "runs": self._runs,
+            "rows_imported": self._rows_imported,
+            "failures": self._failures,
+            "last_error": self._last_error,
+            "imported_through": {
+                statistic_id: day.isoformat()
+                for statistic_id, (day, _total) in sorted(self._imported.items())
+            },
+        }
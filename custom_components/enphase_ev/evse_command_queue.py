@@ -0,0 +1,105 @@
+"""Serialize and coalesce charger control commands per serial."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+# Amp restarts wait this long before stopping the charger so a dragged
+# slider collapses into a single stop/start cycle.
+AMP_RESTART_DEBOUNCE_S = 2.0
+
+# Restart phases in which the charger is stopped or stopping and the start
+# still to come reads the newest setpoint, so a new request adds nothing.
+AMP_RESTART_COLLAPSE_PHASES = frozenset({"stopping", "waiting"})
+
+
+class EvseCommandQueue:
+    """Track in-flight control commands for each charger serial.
+
+    Commands for one serial run one at a time under ``command``. Callers
+    that only care about the latest value take a ticket with ``claim`` and
+    check ``superseded`` once they hold the serial; older tickets are
+    dropped so only the newest amps or mode reaches the cloud. Amp restart
+    tasks record their phase so new setpoints can join a restart that has
+    not started charging again yet.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._depth: dict[str, int] = {}
+        self._tickets: dict[tuple[str, str], int] = {}
+        self._restart_phases: dict[str, str] = {}
+        self._max_depth = 0
+        self._commands = 0
+        self._dropped: dict[str, int] = {}
+
+    @asynccontextmanager
+    async def command(self, sn: str) -> AsyncIterator[bool]:
+        """Hold the serial for one command; yield True if it had to wait."""
+
+        sn_str = str(sn)
+        lock = self._locks.setdefault(sn_str, asyncio.Lock())
+        depth = self._depth.get(sn_str, 0) + 1
+        self._depth[sn_str] = depth
+        self._max_depth = max(self._max_depth, depth)
+        waited = lock.locked()
+        try:
+            async with lock:
+                self._commands += 1
+                yield waited
+        finally:
+            remaining = self._depth.get(sn_str, 1) - 1
+            if remaining > 0:
+                self._depth[sn_str] = remaining
+            else:
+                self._depth.pop(sn_str, None)
+                if not lock.locked():
+                    self._locks.pop(sn_str, None)
+
+    def claim(self, kind: str, sn: str) -> int:
+        """Return a ticket that newer claims of the same kind supersede."""
+
+        key = (kind, str(sn))
+        ticket = self._tickets.get(key, 0) + 1
+        self._tickets[key] = ticket
+        return ticket
+
+    def superseded(self, kind: str, sn: str, ticket: int) -> bool:
+        """Return True, and count a drop, if a newer ticket was claimed."""
+
+        if self._tickets.get((kind, str(sn))) == ticket:
+            return False
+        self.record_dropped(kind)
+        return True
+
+    def record_dropped(self, kind: str) -> None:
+        self._dropped[kind] = self._dropped.get(kind, 0) + 1
+
+    def restart_phase(self, sn: str) -> str | None:
+        return self._restart_phases.get(str(sn))
+
+    def set_restart_phase(self, sn: str, phase: str | None) -> None:
+        if phase is None:
+            self._restart_phases.pop(str(sn), None)
+        else:
+            self._restart_phases[str(sn)] = phase
+
+    def depth(self, sn: str) -> int:
+        """Return the commands running or waiting for a serial."""
+
+        return self._depth.get(str(sn), 0)
+
+    def diagnostics(self) -> dict[str, object]:
+        """Return queue depth and dropped-command counters."""
+
+        return {
+            "queue_depth": sum(self._depth.values()),
+            "busy_serials": len(self._depth),
+            "max_queue_depth": self._max_depth,
+            "pending_amp_restarts": len(self._restart_phases),
+            "commands": self._commands,
+            "dropped_commands": sum(self._dropped.values()),
+            "dropped_by_kind": dict(sorted(self._dropped.items())),
+        }
@@ -0,0 +1,278 @@
+"""Re-poll charger status for charging serials between full refreshes."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone as _tz
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_FAST_POLL_INTERVAL, DOMAIN, MIN_FAST_POLL_INTERVAL
+from .evse_power import (
+    _power_as_float,
+    _power_parse_timestamp,
+    build_evse_power_snapshot,
+)
+from .evse_runtime import evse_status_charging_flags, session_energy_kwh
+from .log_redaction import redact_site_id, redact_text
+from .runtime_helpers import coerce_bool
+
+if TYPE_CHECKING:
+    from .coordinator import EnphaseCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _sample_timestamp(raw: object) -> float | None:
+    if isinstance(raw, str) and raw.strip().isdigit():
+        raw = int(raw.strip())
+    return _power_parse_timestamp(raw)
+
+
+def fast_lane_status_fields(obj: dict, data_ts: object) -> dict[str, object]:
+    """Return the fast-changing entry fields for one charger status record.
+
+    Only fields that move while a car charges are returned; schedule, charge
+    mode, auth and capability fields stay with the full refresh.
+    """
+
+    conn0 = (obj.get("connectors") or [{}])[0]
+    connector_status = obj.get("connectorStatusType") or conn0.get(
+        "connectorStatusType"
+    )
+    charging, actual_charging, suspended_by_evse = evse_status_charging_flags(
+        connector_status, coerce_bool(obj.get("charging"))
+    )
+    fields: dict[str, object] = {
+        "connected": coerce_bool(obj.get("connected")),
+        "plugged": coerce_bool(obj.get("pluggedIn")),
+        "charging": charging,
+        "actual_charging": actual_charging,
+        "faulted": coerce_bool(obj.get("faulted")),
+        "connector_status": connector_status,
+        "connector_reason": conn0.get("connectorStatusReason"),
+        "connector_status_info": conn0.get("connectorStatusInfo"),
+        "suspended_by_evse": suspended_by_evse,
+    }
+    session_energy_wh = _power_as_float((obj.get("session_d") or {}).get("e_c"))
+    if session_energy_wh is not None:
+        fields["session_energy_wh"] = session_energy_wh
+        fields["session_kwh"] = session_energy_kwh(session_energy_wh)
+    last_rpt = (
+        obj.get("lst_rpt_at")
+        or obj.get("lastReportedAt")
+        or obj.get("last_reported_at")
+    )
+    sample_ts = _sample_timestamp(last_rpt if last_rpt else data_ts)
+    if sample_ts is not None:
+        sampled_at_utc = datetime.fromtimestamp(sample_ts, tz=_tz.utc).isoformat()
+        fields["last_reported_at"] = last_rpt or sampled_at_utc
+        fields["sampled_at_utc"] = sampled_at_utc
+        fields["sampled_at_ts"] = sample_ts
+    return fields
+
+
+class EvseFastLane:
+    """Poll charger status at the fast interval for charging serials only.
+
+    When chargers are charging and nothing else asks for fast polling, the
+    coordinator stays on its slow interval and this lane re-polls
+    ``status()`` and the summary lifetime counters on a timer. Each tick
+    updates the status fields and derived power of the lane serials and
+    pushes the data to listeners; session enrichment, charge modes, auth
+    settings, charger config and endpoint families keep their own cadence.
+    A charger that stops charging leaves the lane and requests a full
+    refresh so session end handling runs on the normal path. Errors stop
+    the lane and are left to the next full refresh.
+    """
+
+    def __init__(self, coordinator: EnphaseCoordinator) -> None:
+        self.coordinator = coordinator
+        self._serials: tuple[str, ...] = ()
+        self._interval_s = float(DEFAULT_FAST_POLL_INTERVAL)
+        self._timer_cancel = None
+        self._task: asyncio.Task[None] | None = None
+        self._ticks = 0
+        self._skipped = 0
+        self._failures = 0
+        self._last_error: str | None = None
+        self._last_tick_utc: datetime | None = None
+
+    @property
+    def serials(self) -> tuple[str, ...]:
+        """Return the charger serials currently polled by the lane."""
+
+        return self._serials
+
+    @property
+    def busy(self) -> bool:
+        """Return True while a lane tick is still running."""
+
+        return self._task is not None and not self._task.done()
+
+    def _coordinator_ready(self) -> bool:
+        coord = self.coordinator
+        if not coord._has_successful_refresh or coord._auth_block_active():
+            return False
+        backoff_until = coord._backoff_until
+        return not (backoff_until and time.monotonic() < backoff_until)
+
+    def cancel_timer(self) -> None:
+        if self._timer_cancel is not None:
+            self._timer_cancel()
+            self._timer_cancel = None
+
+    def cancel(self) -> None:
+        """Stop the lane and cancel any tick still running."""
+
+        self._serials = ()
+        self.cancel_timer()
+        if self.busy:
+            self._task.cancel()
+        self._task = None
+
+    @callback
+    def async_update(self, polling_state: dict[str, object]) -> None:
+        """Adopt the lane serials and interval from a full refresh."""
+
+        serials = polling_state.get("fast_lane_serials") or ()
+        self._serials = tuple(str(sn) for sn in serials)
+        try:
+            interval = float(polling_state.get("fast") or DEFAULT_FAST_POLL_INTERVAL)
+        except (TypeError, ValueError):
+            interval = float(DEFAULT_FAST_POLL_INTERVAL)
+        self._interval_s = max(float(MIN_FAST_POLL_INTERVAL), interval)
+        self.async_schedule()
+
+    @callback
+    def async_schedule(self) -> None:
+        """Arm the timer for the next tick while the lane has serials."""
+
+        self.cancel_timer()
+        # Like the coordinator's own timer, only poll while entities listen.
+        if not self._serials or not getattr(self.coordinator, "_listeners", None):
+            return
+        self._timer_cancel = async_call_later(
+            self.coordinator.hass, self._interval_s, self._handle_timer
+        )
+
+    @callback
+    def _handle_timer(self, _now: datetime) -> None:
+        self._timer_cancel = None
+        if self.busy:
+            self.async_schedule()
+            return
+        if not self._coordinator_ready():
+            # Backoff and auth recovery belong to the full refresh, which
+            # re-arms the lane when it succeeds.
+            self._skipped += 1
+            return
+        self._task = asyncio.create_task(
+            self.async_tick(), name=f"{DOMAIN}_evse_fast_lane"
+        )
+
+    async def async_tick(self) -> None:
+        """Refresh status and power for the lane serials once."""
+
+        coord = self.coordinator
+        self._ticks += 1
+        self._last_tick_utc = dt_util.utcnow()
+        try:
+            payload = await coord.client.status()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # noqa: BLE001
+            self._failures += 1
+            self._last_error = redact_text(err, site_ids=(coord.site_id,)) or (
+                err.__class__.__name__
+            )
+            self._serials = ()
+            _LOGGER.debug(
+                "EVSE fast lane status poll failed for site %s: %s",
+                redact_site_id(coord.site_id),
+                self._last_error,
+            )
+            return
+        summary_force = coord.summary.prepare_refresh(
+            want_fast=True, target_interval=self._interval_s
+        )
+        summary = await coord.summary.async_fetch(force=summary_force)
+        self._last_error = None
+        stopped = self._apply(payload, summary)
+        if stopped:
+            await coord.async_request_refresh()
+        self.async_schedule()
+
+    def _apply(self, payload: object, summary: list[dict]) -> list[str]:
+        coord = self.coordinator
+        data = coord.data
+        if not isinstance(payload, dict) or not isinstance(data, dict):
+            return []
+        records = {
+            str(obj.get("sn") or ""): obj
+            for obj in payload.get("evChargerData") or []
+            if isinstance(obj, dict)
+        }
+        lifetimes = {
+            str(item.get("serialNumber") or ""): item.get("lifeTimeConsumption")
+            for item in summary or []
+            if isinstance(item, dict)
+        }
+        fetched_at_utc = dt_util.utcnow().isoformat()
+        updated = dict(data)
+        stopped: list[str] = []
+        for sn in self._serials:
+            obj = records.get(sn)
+            previous = data.get(sn)
+            if obj is None or not isinstance(previous, dict):
+                continue
+            fields = fast_lane_status_fields(obj, payload.get("ts"))
+            coord._record_actual_charging(sn, fields["actual_charging"])
+            fields["charging"] = coord.evse_runtime.resolve_pending_charging(
+                sn, bool(fields["charging"]), bool(fields["actual_charging"])
+            )
+            entry = {**previous, **fields, "fetched_at_utc": fetched_at_utc}
+            if lifetimes.get(sn) is not None:
+                lifetime = coord.energy._apply_lifetime_guard(
+                    sn, lifetimes[sn], previous
+                )
+                if lifetime is not None:
+                    entry["lifetime_kwh"] = lifetime
+            snapshot = build_evse_power_snapshot(
+                entry,
+                previous,
+                coord.evse_state._evse_power_snapshots.get(sn, {}),
+                coord.nominal_voltage,
+            )
+            coord.evse_state._evse_power_snapshots[sn] = snapshot
+            entry.update(snapshot)
+            updated[sn] = entry
+            if not entry["charging"]:
+                stopped.append(sn)
+        if stopped:
+            self._serials = tuple(sn for sn in self._serials if sn not in stopped)
+        coord.data = updated
+        coord.async_update_listeners()
+        return stopped
+
+    def diagnostics(self) -> dict[str, object]:
+        """Return lane state and tick counters."""
+
+        return {
+            "serial_count": len(self._serials),
+            "interval_s": self._interval_s,
+            "running": self.busy,
+            "scheduled": self._timer_cancel is not None,
+            "ticks": self._ticks,
+            "skipped": self._skipped,
+            "failures": self._failures,
+            "last_error": self._last_error,
+            "last_tick_utc": (
+                self._last_tick_utc.isoformat() if self._last_tick_utc else None
+            ),
+        }
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone as _tz
-from typing import TYPE_CHECKING, Awaitable, Iterable
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable
 
 import aiohttp
 
@@ -30,6 +30,11 @@ from .const import (
     OPT_FAST_WHILE_STREAMING,
     OPT_SLOW_POLL_INTERVAL,
 )
+from .evse_command_queue import (
+    AMP_RESTART_COLLAPSE_PHASES,
+    AMP_RESTART_DEBOUNCE_S,
+    EvseCommandQueue,
+)
 from .log_redaction import redact_identifier, redact_text
 from .runtime_helpers import coerce_int, normalize_poll_intervals
 from .session_history import MIN_SESSION_HISTORY_CACHE_TTL
@@ -76,6 +81,9 @@ EVSE_INACTIVE_POWER_STATUSES: frozenset[str] = frozenset(
     {"SUSPENDED", "SUSPENDED_EV", SUSPENDED_EVSE_STATUS}
 )
 EVSE_ACTIVE_POWER_STATUSES: frozenset[str] = frozenset({"CHARGING", "FINISHING"})
+# Connector states that keep a charging session open even while power is paused.
+ACTIVE_CONNECTOR_STATUSES = {"CHARGING", "FINISHING", "SUSPENDED"}
+ACTIVE_SUSPENDED_PREFIXES = ("SUSPENDED_EV",)
 
 
 @dataclass(slots=True)
@@ -124,10 +132,48 @@ def evse_power_is_actively_charging(
     return _coerce_bool_like(charging)
 
 
+def evse_status_charging_flags(
+    connector_status: object, reported_charging: bool
+) -> tuple[bool, bool, bool]:
+    """Return ``(charging, actual_charging, suspended_by_evse)`` for a status row.
+
+    ``charging`` keeps suspended sessions open, while ``actual_charging`` only
+    counts connectors that should be drawing power.
+    """
+
+    status_norm = None
+    if isinstance(connector_status, str):
+        status_norm = connector_status.strip().upper()
+    suspended_by_evse = status_norm == SUSPENDED_EVSE_STATUS
+    charging = reported_charging
+    if status_norm:
+        if suspended_by_evse:
+            charging = False
+        elif status_norm in ACTIVE_CONNECTOR_STATUSES or status_norm.startswith(
+            ACTIVE_SUSPENDED_PREFIXES
+        ):
+            charging = True
+    actual_charging = evse_power_is_actively_charging(
+        status_norm,
+        reported_charging,
+        suspended_by_evse=suspended_by_evse,
+    )
+    return charging, actual_charging, suspended_by_evse
+
+
+def session_energy_kwh(value: float) -> float:
+    """Normalize a session ``e_c`` value; many deployments report Wh."""
+
+    if value > 200:
+        return round(float(value) / 1000.0, 2)
+    return round(float(value), 2)
+
+
 class EvseRuntime:
     def __init__(self, coordinator: EnphaseCoordinator) -> None:
         self.coordinator = coordinator
         self._lookup_semaphore = asyncio.Semaphore(EVSE_LOOKUP_CONCURRENCY)
+        self.commands = EvseCommandQueue()
 
     def _instance_override(self, name: str) -> object | None:
         return self.coordinator.__dict__.get(name)
@@ -539,8 +585,15 @@ class EvseRuntime:
 
     def determine_polling_state(self, data: dict[str, dict]) -> dict[str, object]:
         coord = self.coordinator
-        charging_now = any(v.get("charging") for v in data.values()) if data else False
-        want_fast = charging_now
+        charging_serials = (
+            tuple(sorted(sn for sn, v in data.items() if v.get("charging")))
+            if data
+            else ()
+        )
+        charging_now = bool(charging_serials)
+        # Charging alone only feeds the charger fast lane; the full pipeline
+        # goes fast for explicit kicks and active streaming.
+        want_fast = False
         now_mono = time.monotonic()
         if coord._fast_until and now_mono < coord._fast_until:
             want_fast = True
@@ -593,6 +646,7 @@ class EvseRuntime:
         return {
             "charging_now": charging_now,
             "want_fast": want_fast,
+            "fast_lane_serials": () if want_fast else charging_serials,
             "fast": fast,
             "slow": slow,
             "target": target,
@@ -649,28 +703,32 @@ class EvseRuntime:
                 "Start charging requested for %s but session authentication is required; charging will begin after app/RFID auth completes.",
                 redact_identifier(display),
             )
-        fallback = fallback_amps if fallback_amps is not None else 32
-        amps = coord.pick_start_amps(sn_str, requested_amps, fallback=fallback)
-        prefs = coord._charge_mode_start_preferences(sn_str)
-        result = await self.async_issue_start_charging(
-            sn_str,
-            amps,
-            prefs,
-            connector_id=connector_id,
-            requested_amps=requested_amps,
-        )
-        coord.set_last_set_amps(sn_str, amps)
-        if isinstance(result, dict) and result.get("status") == "not_ready":
-            coord.set_desired_charging(sn_str, False)
-            return result
-        await coord.async_start_streaming(
-            manual=False, serial=sn_str, expected_state=True
-        )
-        coord.set_desired_charging(sn_str, True)
-        coord.set_charging_expectation(sn_str, True, hold_for=hold_seconds)
-        coord.kick_fast(int(hold_seconds))
-        if prefs.enforce_mode:
-            await coord._ensure_charge_mode(sn_str, prefs.enforce_mode)
+        self.cancel_pending_amp_restart(sn_str)
+        async with self.commands.command(sn_str):
+            # Pick amps once the serial is free so a queued start sends the
+            # setpoint stored by the newest number change.
+            fallback = fallback_amps if fallback_amps is not None else 32
+            amps = coord.pick_start_amps(sn_str, requested_amps, fallback=fallback)
+            prefs = coord._charge_mode_start_preferences(sn_str)
+            result = await self.async_issue_start_charging(
+                sn_str,
+                amps,
+                prefs,
+                connector_id=connector_id,
+                requested_amps=requested_amps,
+            )
+            coord.set_last_set_amps(sn_str, amps)
+            if isinstance(result, dict) and result.get("status") == "not_ready":
+                coord.set_desired_charging(sn_str, False)
+                return result
+            await coord.async_start_streaming(
+                manual=False, serial=sn_str, expected_state=True
+            )
+            coord.set_desired_charging(sn_str, True)
+            coord.set_charging_expectation(sn_str, True, hold_for=hold_seconds)
+            coord.kick_fast(int(hold_seconds))
+            if prefs.enforce_mode:
+                await coord._ensure_charge_mode(sn_str, prefs.enforce_mode)
         await coord.async_request_refresh()
         return result
 
@@ -751,43 +809,107 @@ class EvseRuntime:
         prefs = coord._charge_mode_start_preferences(sn_str)
         if not allow_unplugged:
             coord.require_plugged(sn_str)
-        result = await coord.client.stop_charging(sn_str)
-        await coord.async_start_streaming(
-            manual=False, serial=sn_str, expected_state=False
-        )
-        coord.set_desired_charging(sn_str, False)
-        coord.set_charging_expectation(sn_str, False, hold_for=hold_seconds)
-        coord.kick_fast(fast_seconds)
-        if prefs.enforce_mode == "SCHEDULED_CHARGING":
-            await coord._ensure_charge_mode(sn_str, prefs.enforce_mode)
+        self.cancel_pending_amp_restart(sn_str)
+        async with self.commands.command(sn_str):
+            result = await coord.client.stop_charging(sn_str)
+            await coord.async_start_streaming(
+                manual=False, serial=sn_str, expected_state=False
+            )
+            coord.set_desired_charging(sn_str, False)
+            coord.set_charging_expectation(sn_str, False, hold_for=hold_seconds)
+            coord.kick_fast(fast_seconds)
+            if prefs.enforce_mode == "SCHEDULED_CHARGING":
+                await coord._ensure_charge_mode(sn_str, prefs.enforce_mode)
         await coord.async_request_refresh()
         return result
 
+    def _current_amp_restart(self, sn: str) -> bool:
+        tasks = getattr(self.coordinator, "_amp_restart_tasks", None)
+        if not isinstance(tasks, dict) or sn not in tasks:
+            return False
+        try:
+            return tasks[sn] is asyncio.current_task()
+        except RuntimeError:
+            return False
+
+    def _note_amp_restart_phase(self, sn: str, phase: str) -> None:
+        if self._current_amp_restart(sn):
+            self.commands.set_restart_phase(sn, phase)
+
+    def cancel_pending_amp_restart(self, sn: str) -> None:
+        """Drop an amp restart that an explicit start or stop overrides.
+
+        The restart's own stop and start calls are left alone, as is a
+        restart that is already sending its start command; the explicit
+        command then queues behind it.
+        """
+
+        sn_str = str(sn)
+        if self._current_amp_restart(sn_str):
+            return
+        tasks = getattr(self.coordinator, "_amp_restart_tasks", None)
+        task = tasks.get(sn_str) if isinstance(tasks, dict) else None
+        if task is None or task.done():
+            return
+        if self.commands.restart_phase(sn_str) == "starting":
+            return
+        tasks.pop(sn_str, None)
+        self.commands.set_restart_phase(sn_str, None)
+        self.commands.record_dropped("amp_restart")
+        task.cancel()
+
     def schedule_amp_restart(self, sn: str, delay: float = AMP_RESTART_DELAY_S) -> None:
         coord = self.coordinator
         sn_str = str(sn)
-        existing = coord._amp_restart_tasks.pop(sn_str, None)
-        if existing and not existing.done():
-            existing.cancel()
+        existing = coord._amp_restart_tasks.get(sn_str)
+        if existing is not None and not existing.done():
+            phase = self.commands.restart_phase(sn_str)
+            if phase in AMP_RESTART_COLLAPSE_PHASES:
+                # The charger is already stopping for a restart whose start
+                # reads the newest setpoint.
+                self.commands.record_dropped("amp_restart")
+                return
+            if phase in (None, "pending"):
+                existing.cancel()
+                self.commands.record_dropped("amp_restart")
+            # A restart that is already running finishes; this one queues
+            # behind it on the serial.
+        coord._amp_restart_tasks.pop(sn_str, None)
         restart = self._instance_override("_async_restart_after_amp_change")
         if not callable(restart):
             restart = self.async_restart_after_amp_change
         try:
             task = coord.hass.async_create_task(
-                restart(sn_str, delay),
+                self._async_debounced_amp_restart(sn_str, delay, restart),
                 name=f"enphase_ev_amp_restart_{redact_identifier(sn_str)}",
             )
         except TypeError:
-            task = coord.hass.async_create_task(restart(sn_str, delay))
+            task = coord.hass.async_create_task(
+                self._async_debounced_amp_restart(sn_str, delay, restart)
+            )
         coord._amp_restart_tasks[sn_str] = task
+        if not task.done():
+            self.commands.set_restart_phase(sn_str, "pending")
 
         def _cleanup(_: object) -> None:
             stored = coord._amp_restart_tasks.get(sn_str)
             if stored is task:
                 coord._amp_restart_tasks.pop(sn_str, None)
+            if stored is task or stored is None:
+                self.commands.set_restart_phase(sn_str, None)
 
         task.add_done_callback(_cleanup)
 
+    async def _async_debounced_amp_restart(
+        self,
+        sn: str,
+        delay: float,
+        restart: Callable[[str, float], Awaitable[None]],
+    ) -> None:
+        await asyncio.sleep(AMP_RESTART_DEBOUNCE_S)
+        self._note_amp_restart_phase(sn, "running")
+        await restart(sn, delay)
+
     async def async_restart_after_amp_change(self, sn: str, delay: float) -> None:
         coord = self.coordinator
         sn_str = str(sn)
@@ -798,6 +920,7 @@ class EvseRuntime:
         fast_seconds = max(60, int(delay_s) if delay_s else 60)
         stop_hold = max(90.0, delay_s)
         # The Enphase app applies amp changes by restarting the active session.
+        self._note_amp_restart_phase(sn_str, "stopping")
         try:
             await coord.async_stop_charging(
                 sn_str,
@@ -814,6 +937,7 @@ class EvseRuntime:
                 redact_text(err, site_ids=(coord.site_id,), identifiers=(sn_str,)),
             )
             return
+        self._note_amp_restart_phase(sn_str, "waiting")
         if delay_s:
             try:
                 await asyncio.sleep(delay_s)
@@ -821,6 +945,7 @@ class EvseRuntime:
                 raise
             except Exception:  # noqa: BLE001
                 return
+        self._note_amp_restart_phase(sn_str, "starting")
         try:
             await coord.async_start_charging(sn_str)
         except asyncio.CancelledError:  # pragma: no cover
@@ -1001,6 +1126,21 @@ class EvseRuntime:
                     coord._streaming_until = None
                     coord._schedule_stream_stop(force=True)
 
+    def resolve_pending_charging(
+        self, sn: str, charging: bool, actual_charging: bool
+    ) -> bool:
+        """Return the charging flag to publish while an expectation is pending."""
+
+        pending_charging = self.coordinator._pending_charging
+        pending_expectation = pending_charging.get(sn)
+        if not pending_expectation:
+            return charging
+        target_state, expires_at = pending_expectation
+        if actual_charging == target_state or time.monotonic() > expires_at:
+            pending_charging.pop(sn, None)
+            return charging
+        return target_state
+
     def set_charging_expectation(
         self,
         sn: str,
@@ -1431,17 +1571,24 @@ class EvseRuntime:
         previous_mode: str | None = None,
     ) -> None:
         sn_str = str(sn)
-        try:
-            await self.coordinator.client.set_charge_mode(
-                sn_str,
-                mode,
-                previous_mode=previous_mode,
-            )
-        except SchedulerUnavailable as err:
-            self.coordinator.note_scheduler_unavailable(err)
-            raise
-        self.coordinator.mark_scheduler_available()
-        self.set_charge_mode_cache(sn_str, mode)
+        ticket = self.commands.claim("charge_mode", sn_str)
+        async with self.commands.command(sn_str) as waited:
+            if self.commands.superseded("charge_mode", sn_str, ticket):
+                return
+            if waited:
+                # A queued command may have changed the mode meanwhile.
+                previous_mode = self.cached_charge_mode_preference(sn_str)
+            try:
+                await self.coordinator.client.set_charge_mode(
+                    sn_str,
+                    mode,
+                    previous_mode=previous_mode,
+                )
+            except SchedulerUnavailable as err:
+                self.coordinator.note_scheduler_unavailable(err)
+                raise
+            self.coordinator.mark_scheduler_available()
+            self.set_charge_mode_cache(sn_str, mode)
         await self.coordinator.async_request_refresh()
 
     async def async_set_green_battery_setting(self, sn: str, *, enabled: bool) -> None:
@@ -384,6 +384,23 @@ class EVSETimeseriesManager:
             return None
         return cached[1].get(serial)
 
+    def daily_history_kwh(self) -> dict[str, dict[str, float]]:
+        """Return cached per-day kWh by charger serial, newest payload winning."""
+
+        history: dict[str, dict[str, float]] = {}
+        for _day_key, (_ts, payload) in sorted(self._daily_cache.items()):
+            for serial, entry in payload.items():
+                if not isinstance(entry, dict):
+                    continue
+                day_values = entry.get("day_values_kwh")
+                if not isinstance(day_values, dict):
+                    continue
+                days = history.setdefault(str(serial), {})
+                for day, value in day_values.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        days[str(day)] = float(value)
+        return history
+
     def lifetime_entry(self, serial: str) -> dict[str, object] | None:
         cached = self._lifetime_cache
         if cached is None:
@@ -0,0 +1,277 @@
+"""Refresh optional endpoint families on their own timers."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from functools import partial
+import logging
+import time
+from typing import TYPE_CHECKING
+import zlib
+
+from homeassistant.core import callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+from .coordinator_refresh_metrics import REFRESH_TOTAL_BUDGET_S
+from .log_redaction import redact_site_id, redact_text
+from .refresh_plan import (
+    FOLLOWUP_PLAN,
+    SITE_ONLY_FOLLOWUP_PLAN,
+    RefreshPlan,
+    refresh_plan_endpoint_families,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import EnphaseCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# The status poll waits this long for endpoint families before leaving them to
+# finish in the background and publish their own update.
+FAMILY_REFRESH_INLINE_GRACE_S = 3.0
+FAMILY_REFRESH_MIN_DELAY_S = 1.0
+# Spread families that share a TTL so they do not all come due on one tick.
+FAMILY_REFRESH_JITTER_RATIO = 0.1
+FAMILY_REFRESH_MAX_JITTER_S = 60.0
+
+
+class EndpointFamilyScheduler:
+    """Run follow-up endpoint families outside the coordinator status poll.
+
+    Each family comes due at the retry deadline recorded in its endpoint
+    health, so success TTLs and failure backoff both apply. A timer fires for
+    the earliest future deadline plus a per-family jitter and refreshes the
+    families that are due without polling charger status. Runs that outlive
+    the inline grace period finish in the background with their own phase
+    timings, merge them into the coordinator's last timings and push a
+    partial coordinator update to listeners when they complete.
+    """
+
+    def __init__(self, coordinator: EnphaseCoordinator) -> None:
+        self.coordinator = coordinator
+        self._task: asyncio.Task[None] | None = None
+        self._timer_cancel = None
+        self._next_due: tuple[str, float] | None = None
+        self._inline_runs = 0
+        self._detached_runs = 0
+        self._out_of_band_runs = 0
+        self._skipped_busy = 0
+        self._background_failures = 0
+
+    @property
+    def busy(self) -> bool:
+        """Return True while a family refresh is still running."""
+
+        return self._task is not None and not self._task.done()
+
+    def _families(self) -> frozenset[str]:
+        coord = self.coordinator
+        plan = (
+            SITE_ONLY_FOLLOWUP_PLAN
+            if coord.site_only or not coord.serials
+            else FOLLOWUP_PLAN
+        )
+        return refresh_plan_endpoint_families(plan)
+
+    def jitter_s(self, family: str) -> float:
+        """Return a stable jitter for one family of this site."""
+
+        policy = self.coordinator._endpoint_family_policy(family)
+        ttl = getattr(policy, "success_ttl_s", None)
+        if not isinstance(ttl, (int, float)) or ttl <= 0:
+            return 0.0
+        seed = zlib.crc32(f"{self.coordinator.site_id}:{family}".encode())
+        fraction = (seed % 1000) / 1000
+        return min(
+            float(ttl) * FAMILY_REFRESH_JITTER_RATIO * fraction,
+            FAMILY_REFRESH_MAX_JITTER_S,
+        )
+
+    def family_due_times(self) -> dict[str, float]:
+        """Return jittered monotonic due times for families waiting on a deadline.
+
+        Families already past their deadline are left to the next status poll.
+        """
+
+        coord = self.coordinator
+        now = time.monotonic()
+        due_times: dict[str, float] = {}
+        for family in sorted(self._families()):
+            if coord._endpoint_family_policy(family) is None:
+                continue
+            health = coord._endpoint_family_health.get(family)
+            next_retry = getattr(health, "next_retry_mono", None)
+            if not isinstance(next_retry, (int, float)) or next_retry <= now:
+                continue
+            due_times[family] = float(next_retry) + self.jitter_s(family)
+        return due_times
+
+    def _coordinator_ready(self) -> bool:
+        coord = self.coordinator
+        if not coord._has_successful_refresh or coord._auth_block_active():
+            return False
+        backoff_until = coord._backoff_until
+        return not (backoff_until and time.monotonic() < backoff_until)
+
+    def cancel_timer(self) -> None:
+        if self._timer_cancel is not None:
+            self._timer_cancel()
+            self._timer_cancel = None
+        self._next_due = None
+
+    def cancel(self) -> None:
+        """Cancel the pending timer and any family refresh still running."""
+
+        self.cancel_timer()
+        if self.busy:
+            self._task.cancel()
+        self._task = None
+
+    @callback
+    def async_schedule(self) -> None:
+        """Arm the timer for the earliest family deadline."""
+
+        self.cancel_timer()
+        due_times = self.family_due_times()
+        if not due_times:
+            return
+        family, due = min(due_times.items(), key=lambda item: (item[1], item[0]))
+        self._next_due = (family, due)
+        delay = max(FAMILY_REFRESH_MIN_DELAY_S, due - time.monotonic())
+        self._timer_cancel = async_call_later(
+            self.coordinator.hass, delay, self._handle_timer
+        )
+
+    @callback
+    def _handle_timer(self, _now: datetime) -> None:
+        self._timer_cancel = None
+        self._next_due = None
+        if self.busy:
+            self._skipped_busy += 1
+            return
+        if not self._coordinator_ready():
+            return
+        plan = self.coordinator._build_family_refresh_plan()
+        if not plan.stages:
+            self.async_schedule()
+            return
+        self._out_of_band_runs += 1
+        run_timings: dict[str, float] = {}
+        task = self._start(
+            plan, run_timings, deadline_mono=time.monotonic() + REFRESH_TOTAL_BUDGET_S
+        )
+        task.add_done_callback(partial(self._background_run_done, run_timings))
+
+    def _start(
+        self,
+        plan: RefreshPlan,
+        phase_timings: dict[str, float],
+        *,
+        deadline_mono: float | None = None,
+    ) -> asyncio.Task[None]:
+        self._task = asyncio.create_task(
+            self.coordinator.refresh_runner.async_run_refresh_plan(
+                phase_timings,
+                plan=plan,
+                deadline_mono=deadline_mono,
+            ),
+            name=f"{DOMAIN}_family_refresh",
+        )
+        return self._task
+
+    async def async_run_plan(
+        self,
+        phase_timings: dict[str, float],
+        *,
+        plan: RefreshPlan,
+        deadline_mono: float | None = None,
+    ) -> None:
+        """Run a follow-up plan, detaching it if it outlives the inline grace.
+
+        Failures from a plan that finishes inline propagate to the caller as
+        before. A plan that is still running when the grace expires keeps
+        running and publishes its results when it completes. Its timings are
+        kept apart from ``phase_timings``, which the caller has already
+        reported by then.
+        """
+
+        if self.busy:
+            self._skipped_busy += 1
+            _LOGGER.debug(
+                "Skipping endpoint family refresh for site %s; the previous "
+                "run is still in progress",
+                redact_site_id(self.coordinator.site_id),
+            )
+            return
+        run_timings: dict[str, float] = {}
+        task = self._start(plan, run_timings, deadline_mono=deadline_mono)
+        try:
+            done, _pending = await asyncio.wait(
+                (task,), timeout=FAMILY_REFRESH_INLINE_GRACE_S
+            )
+        except asyncio.CancelledError:
+            task.cancel()
+            self._task = None
+            raise
+        if done:
+            self._task = None
+            self._inline_runs += 1
+            phase_timings.update(run_timings)
+            task.result()
+            return
+        self._detached_runs += 1
+        _LOGGER.debug(
+            "Endpoint family refresh for site %s is still running after %.1fs; "
+            "finishing it in the background",
+            redact_site_id(self.coordinator.site_id),
+            FAMILY_REFRESH_INLINE_GRACE_S,
+        )
+        task.add_done_callback(partial(self._background_run_done, run_timings))
+
+    @callback
+    def _background_run_done(
+        self, phase_timings: dict[str, float], task: asyncio.Task[None]
+    ) -> None:
+        if self._task is task:
+            self._task = None
+        if task.cancelled():
+            return
+        coord = self.coordinator
+        coord._phase_timings.update(phase_timings)
+        err = task.exception()
+        if err is not None:
+            self._background_failures += 1
+            if isinstance(err, ConfigEntryAuthFailed) and coord.config_entry:
+                coord.config_entry.async_start_reauth(coord.hass)
+            _LOGGER.debug(
+                "Background endpoint family refresh failed for site %s: %s",
+                redact_site_id(coord.site_id),
+                redact_text(err, site_ids=(coord.site_id,)),
+            )
+        coord.async_update_listeners()
+        self.async_schedule()
+
+    def diagnostics(self) -> dict[str, object]:
+        """Return timer state, run counters, and per-family due times."""
+
+        now = time.monotonic()
+        next_due = self._next_due
+        return {
+            "running": self.busy,
+            "next_family": next_due[0] if next_due else None,
+            "next_due_in_s": (
+                round(max(0.0, next_due[1] - now), 1) if next_due else None
+            ),
+            "inline_runs": self._inline_runs,
+            "detached_runs": self._detached_runs,
+            "out_of_band_runs": self._out_of_band_runs,
+            "skipped_busy": self._skipped_busy,
+            "background_failures": self._background_failures,
+            "family_due_in_s": {
+                family: round(max(0.0, due - now), 1)
+                for family, due in self.family_due_times().items()
+            },
+        }
@@ -0,0 +1,235 @@
+"""Quarter-hour site energy ingested incrementally from the site today snapshot."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import time
+
+INTRADAY_DEFAULT_INTERVAL_S = 900
+# Two site-local days of quarter hours, with room for a 25-hour DST day.
+INTRADAY_RING_INTERVALS = 2 * 100
+# Enlighten keeps filling the current interval and can still revise the one
+# before it, so these trailing intervals are read again on every ingest.
+INTRADAY_REVISE_INTERVALS = 2
+# Array fields of the today snapshot that are not energy per interval.
+INTRADAY_NON_ENERGY_FIELDS = frozenset({"soc"})
+
+
+@dataclass(slots=True)
+class IntradayInterval:
+    """Energy per payload field for one reporting interval."""
+
+    start_ts: int
+    length_s: int
+    energy_wh: dict[str, float]
+
+    @property
+    def end_ts(self) -> int:
+        return self.start_ts + self.length_s
+
+    def power_w(self, field: str) -> float | None:
+        """Return the average power of ``field`` over this interval."""
+
+        energy_wh = self.energy_wh.get(field)
+        if energy_wh is None:
+            return None
+        return energy_wh * 3600.0 / self.length_s
+
+
+def _coerce_number(value: object) -> float | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        number = float(value)
+    elif isinstance(value, str) and value.strip():
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+    else:
+        return None
+    if number != number or number in (float("inf"), float("-inf")):
+        return None
+    return number
+
+
+class IntradayEnergyEngine:
+    """Keep per-interval site energy in a ring buffer and running day totals.
+
+    Each ingest reads only the intervals that are new since the previous
+    snapshot plus the last ``INTRADAY_REVISE_INTERVALS`` already held, so a
+    refresh costs a handful of intervals rather than the whole day. Intervals
+    that start in the future are ignored; a new ``start_time`` starts a new
+    day while the previous day's intervals stay in the ring until evicted.
+    """
+
+    def __init__(self, *, max_intervals: int = INTRADAY_RING_INTERVALS) -> None:
+        self._ring: deque[IntradayInterval] = deque(maxlen=max_intervals)
+        self.day: str | None = None
+        self.interval_s: int = INTRADAY_DEFAULT_INTERVAL_S
+        self.data_through_utc: datetime | None = None
+        self._day_start_ts: int | None = None
+        self._day_len = 0
+        self._day_totals: dict[str, float] = {}
+        self._day_counts: dict[str, int] = {}
+        self._partial = False
+        self.intervals_read = 0
+
+    @property
+    def day_totals(self) -> dict[str, float]:
+        """Return today's Wh total per payload field."""
+
+        return dict(self._day_totals)
+
+    def day_energy_wh(self, field: str) -> float | None:
+        return self._day_totals.get(field)
+
+    def intervals(self, limit: int | None = None) -> list[IntradayInterval]:
+        """Return held intervals, oldest first, optionally only the last ``limit``."""
+
+        if limit is None:
+            return list(self._ring)
+        if limit <= 0:
+            return []
+        return list(self._ring)[-limit:]
+
+    def latest_interval(self) -> IntradayInterval | None:
+        """Return the most recent interval that has finished reporting."""
+
+        if not self._ring:
+            return None
+        if not self._partial:
+            return self._ring[-1]
+        return self._ring[-2] if len(self._ring) > 1 else None
+
+    def interval_energy_wh(self, field: str) -> float | None:
+        interval = self.latest_interval()
+        return interval.energy_wh.get(field) if interval is not None else None
+
+    def interval_power_w(self, field: str) -> float | None:
+        interval = self.latest_interval()
+        return interval.power_w(field) if interval is not None else None
+
+    def _pop_interval(self) -> None:
+        interval = self._ring.pop()
+        for field, energy_wh in interval.energy_wh.items():
+            count = self._day_counts.get(field, 0) - 1
+            if count <= 0:
+                self._day_counts.pop(field, None)
+                self._day_totals.pop(field, None)
+                continue
+            self._day_counts[field] = count
+            self._day_totals[field] = self._day_totals.get(field, 0.0) - energy_wh
+
+    def _push_interval(self, interval: IntradayInterval) -> None:
+        self._ring.append(interval)
+        for field, energy_wh in interval.energy_wh.items():
+            self._day_counts[field] = self._day_counts.get(field, 0) + 1
+            self._day_totals[field] = self._day_totals.get(field, 0.0) + energy_wh
+
+    def _start_day(self, day: str | None, start_ts: int) -> None:
+        self.day = day
+        self._day_start_ts = start_ts
+        self._day_len = 0
+        self._day_totals = {}
+        self._day_counts = {}
+
+    def ingest(self, payload: object, *, now_ts: float | None = None) -> bool:
+        """Fold a site today payload in and return True when day totals changed."""
+
+        if not isinstance(payload, dict):
+            return False
+        stats = payload.get("stats")
+        stat = (
+            next((item for item in stats if isinstance(item, dict)), None)
+            if isinstance(stats, list)
+            else None
+        )
+        if stat is None:
+            return False
+        start = _coerce_number(stat.get("start_time"))
+        if start is None or start <= 0:
+            return False
+        start_ts = int(start)
+        length = _coerce_number(stat.get("interval_length"))
+        length_s = int(length) if length is not None and length > 0 else 0
+        length_s = length_s or INTRADAY_DEFAULT_INTERVAL_S
+        series = {
+            field: values
+            for field, values in stat.items()
+            if isinstance(values, list) and field not in INTRADAY_NON_ENERGY_FIELDS
+        }
+        if not series:
+            return False
+
+        now_ts = time.time() if now_ts is None else now_ts
+        reported = max(len(values) for values in series.values())
+        started = int((now_ts - start_ts) // length_s) + 1 if now_ts >= start_ts else 0
+        available = max(0, min(reported, started))
+
+        previous_totals = dict(self._day_totals)
+        if start_ts != self._day_start_ts or length_s != self.interval_s:
+            day = payload.get("start_date")
+            self._start_day(str(day) if day is not None else None, start_ts)
+            self.interval_s = length_s
+        first = max(0, min(self._day_len, available) - INTRADAY_REVISE_INTERVALS)
+        for _ in range(self._day_len - first):
+            self._pop_interval()
+        for index in range(first, available):
+            energy_wh: dict[str, float] = {}
+            for field, values in series.items():
+                if index >= len(values):
+                    continue
+                number = _coerce_number(values[index])
+                if number is not None and number >= 0:
+                    energy_wh[field] = number
+            self._push_interval(
+                IntradayInterval(
+                    start_ts=start_ts + index * length_s,
+                    length_s=length_s,
+                    energy_wh=energy_wh,
+                )
+            )
+        self.intervals_read += available - first
+        self._day_len = available
+        through_ts = start_ts + available * length_s
+        self._partial = through_ts > now_ts
+        if available:
+            self.data_through_utc = datetime.fromtimestamp(
+                min(through_ts, now_ts), tz=timezone.utc
+            )
+        return self._day_totals != previous_totals
+
+    def diagnostics(self) -> dict[str, object]:
+        latest = self.latest_interval()
+        return {
+            "day": self.day,
+            "interval_seconds": self.interval_s,
+            "day_intervals": self._day_len,
+            "held_intervals": len(self._ring),
+            "intervals_read": self.intervals_read,
+            "data_through_utc": (
+                self.data_through_utc.isoformat()
+                if self.data_through_utc is not None
+                else None
+            ),
+            "day_totals_wh": {
+                field: round(total, 3) for field, total in self._day_totals.items()
+            },
+            "latest_interval": (
+                {
+                    "start_utc": datetime.fromtimestamp(
+                        latest.start_ts, tz=timezone.utc
+                    ).isoformat(),
+                    "energy_wh": dict(latest.energy_wh),
+                    "power_w": {
+                        field: round(energy_wh * 3600.0 / latest.length_s, 1)
+                        for field, energy_wh in latest.energy_wh.items()
+                    },
+                }
+                if latest is not None
+                else None
+            ),
+        }
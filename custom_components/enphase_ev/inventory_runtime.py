@@ -2232,6 +2232,16 @@ class InventoryRuntime:
             self._coordinator_backed_attr("_inverter_data"),
         )
 
+    async def _async_fetch_inverter_production(
+        self, fetch_production, *, start_date: str, end_date: str
+    ) -> object:
+        ledger = getattr(self.coordinator, "inverter_production_ledger", None)
+        if ledger is None:
+            return await fetch_production(start_date=start_date, end_date=end_date)
+        return await ledger.async_fetch(
+            fetch_production, start_date=start_date, end_date=end_date
+        )
+
     @staticmethod
     def _format_inverter_model_summary(model_counts: dict[str, int]) -> str | None:
         clean: dict[str, int] = {}
@@ -2661,8 +2671,8 @@ class InventoryRuntime:
                 production_payload = dict(cached_production_payload)
             elif coord._endpoint_family_should_run(production_family):
                 try:
-                    fetched_production = await fetch_production(
-                        start_date=start_date, end_date=end_date
+                    fetched_production = await self._async_fetch_inverter_production(
+                        fetch_production, start_date=start_date, end_date=end_date
                     )
                 except Exception as err:  # noqa: BLE001
                     coord._note_endpoint_family_failure(production_family, err)
@@ -0,0 +1,194 @@
+"""Compose inverter lifetime production from a persisted ledger of settled days."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .log_redaction import redact_site_id
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .coordinator import EnphaseCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+INVERTER_PRODUCTION_STORE_VERSION = 1
+INVERTER_PRODUCTION_SAVE_DELAY_S = 30.0
+# Enlighten can still revise the last couple of days, so the open window is
+# today plus these days and is read again on every fetch.
+INVERTER_PRODUCTION_RECONCILE_DAYS = 2
+
+
+def _production_wh(payload: object) -> dict[str, float]:
+    if not isinstance(payload, dict):
+        raise ValueError("Inverter production payload was not a dictionary")
+    raw = payload.get("production")
+    if not isinstance(raw, dict):
+        return {}
+    production: dict[str, float] = {}
+    for key, value in raw.items():
+        try:
+            production[str(key)] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return production
+
+
+def _parse_date(value: object) -> date | None:
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+class InverterProductionLedger:
+    """Keep settled per-inverter production and read only the open window.
+
+    Production through ``settled_through`` is stored per inverter id and
+    persisted, so a fetch asks Enlighten for today and the
+    ``INVERTER_PRODUCTION_RECONCILE_DAYS`` before it, plus the days that
+    settled since the last fetch. Lifetime totals are the settled total plus
+    the open window. The whole range since the start date is requested only
+    to seed the ledger, or when the start date changes.
+    """
+
+    def __init__(self, coordinator: EnphaseCoordinator) -> None:
+        self.coordinator = coordinator
+        entry_id = getattr(coordinator.config_entry, "entry_id", coordinator.site_id)
+        self._store = Store(
+            coordinator.hass,
+            INVERTER_PRODUCTION_STORE_VERSION,
+            f"{DOMAIN}.inverter_production.{entry_id}",
+        )
+        self._loaded = False
+        self.start_date: str | None = None
+        self.settled_through: date | None = None
+        self.settled_wh: dict[str, float] = {}
+        self.seed_fetches = 0
+        self.settle_fetches = 0
+        self.window_fetches = 0
+        self.last_window: tuple[str, str] | None = None
+
+    def capture(self) -> dict[str, object]:
+        return {
+            "site_id": str(self.coordinator.site_id),
+            "start_date": self.start_date,
+            "settled_through": (
+                self.settled_through.isoformat()
+                if self.settled_through is not None
+                else None
+            ),
+            "settled_wh": dict(self.settled_wh),
+        }
+
+    def apply(self, data: object) -> bool:
+        """Apply stored ledger data and return True when it was usable."""
+
+        if not isinstance(data, dict):
+            return False
+        if str(data.get("site_id")) != str(self.coordinator.site_id):
+            return False
+        settled_through = _parse_date(data.get("settled_through"))
+        settled_wh = data.get("settled_wh")
+        if settled_through is None or not isinstance(settled_wh, dict):
+            return False
+        self.start_date = str(data.get("start_date") or "") or None
+        self.settled_through = settled_through
+        self.settled_wh = _production_wh({"production": settled_wh})
+        return True
+
+    async def async_load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            self.apply(await self._store.async_load())
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug(
+                "Failed to load inverter production ledger for site %s",
+                redact_site_id(self.coordinator.site_id),
+                exc_info=True,
+            )
+
+    def _reset(self, start_date: str, start: date) -> None:
+        self.start_date = start_date
+        self.settled_through = start - timedelta(days=1)
+        self.settled_wh = {}
+
+    async def async_fetch(
+        self,
+        fetch_production: Callable[..., Awaitable[object]],
+        *,
+        start_date: str,
+        end_date: str,
+    ) -> dict[str, object]:
+        """Return lifetime production in the ``inverter_production`` shape."""
+
+        start = _parse_date(start_date)
+        today = _parse_date(end_date)
+        if start is None or today is None or start > today:
+            payload = await fetch_production(start_date=start_date, end_date=end_date)
+            _production_wh(payload)
+            return payload
+        await self.async_load()
+        settle_to = today - timedelta(days=INVERTER_PRODUCTION_RECONCILE_DAYS + 1)
+        if (
+            self.start_date != start_date
+            or self.settled_through is None
+            or (self.settled_through > settle_to and self.settled_through >= start)
+        ):
+            self._reset(start_date, start)
+        settled_through = self.settled_through
+        if settled_through is not None and settled_through < settle_to:
+            seeding = settled_through < start
+            settled = _production_wh(
+                await fetch_production(
+                    start_date=(settled_through + timedelta(days=1)).isoformat(),
+                    end_date=settle_to.isoformat(),
+                )
+            )
+            for inverter_id, production_wh in settled.items():
+                self.settled_wh[inverter_id] = (
+                    self.settled_wh.get(inverter_id, 0.0) + production_wh
+                )
+            self.settled_through = settle_to
+            if seeding:
+                self.seed_fetches += 1
+            else:
+                self.settle_fetches += 1
+            self._store.async_delay_save(self.capture, INVERTER_PRODUCTION_SAVE_DELAY_S)
+
+        window_start = max(start, settle_to + timedelta(days=1)).isoformat()
+        window = _production_wh(
+            await fetch_production(start_date=window_start, end_date=end_date)
+        )
+        self.window_fetches += 1
+        self.last_window = (window_start, end_date)
+        production = dict(self.settled_wh)
+        for inverter_id, production_wh in window.items():
+            production[inverter_id] = production.get(inverter_id, 0.0) + production_wh
+        return {
+            "production": production,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+
+    def diagnostics(self) -> dict[str, object]:
+        return {
+            "start_date": self.start_date,
+            "settled_through": (
+                self.settled_through.isoformat()
+                if self.settled_through is not None
+                else None
+            ),
+            "settled_inverters": len(self.settled_wh),
+            "seed_fetches": self.seed_fetches,
+            "settle_fetches": self.settle_fetches,
+            "window_fetches": self.window_fetches,
+            "last_window": list(self.last_window) if self.last_window else None,
+        }
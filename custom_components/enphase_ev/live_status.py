@@ -0,0 +1,596 @@
+"""Stream sub-second site power from the Enlighten Live Status MQTT topic."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone as _tz
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+import uuid
+
+import aiohttp
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .current_power_runtime import CurrentPowerSample
+from .live_status_frame import (
+    LIVE_STATUS_FIELD_PATHS,
+    FrameDecodeError,
+    FrameDecoder,
+)
+from .log_redaction import redact_site_id, redact_text
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .coordinator import EnphaseCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# The authorizer advertises a 900 s stream window; sessions never outlive it
+# and are not renewed automatically once it ends.
+LIVE_STATUS_MAX_DURATION_S = 900
+LIVE_STATUS_CONNECT_TIMEOUT_S = 15.0
+LIVE_STATUS_KEEPALIVE_S = 30
+LIVE_STATUS_MAX_RECONNECTS = 2
+LIVE_STATUS_RECONNECT_DELAY_S = 5.0
+LIVE_STATUS_PUBLISH_INTERVAL_S = 1.0
+LIVE_STATUS_ORIGIN = "https://enlighten.enphaseenergy.com"
+LIVE_STATUS_SOURCE = "live-status:mqtt"
+
+MQTT_CONNECT = 1
+MQTT_CONNACK = 2
+MQTT_PUBLISH = 3
+MQTT_SUBSCRIBE = 8
+MQTT_SUBACK = 9
+MQTT_PINGREQ = 12
+MQTT_PINGRESP = 13
+MQTT_DISCONNECT = 14
+
+_FRAME_DECODER = FrameDecoder(LIVE_STATUS_FIELD_PATHS)
+
+
+class LiveStatusError(Exception):
+    """Raised when the Live Status broker rejects or drops the session."""
+
+
+def _remaining_length(length: int) -> bytes:
+    out = bytearray()
+    while True:
+        digit, length = length % 128, length // 128
+        out.append(digit | 0x80 if length else digit)
+        if not length:
+            return bytes(out)
+
+
+def _mqtt_string(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return len(raw).to_bytes(2, "big") + raw
+
+
+def _mqtt_packet(packet_type: int, flags: int, body: bytes) -> bytes:
+    return bytes([packet_type << 4 | flags]) + _remaining_length(len(body)) + body
+
+
+def mqtt_connect_packet(client_id: str, username: str, keepalive: int) -> bytes:
+    """Return an MQTT 3.1.1 CONNECT with a username, no password, clean session."""
+
+    header = _mqtt_string("MQTT") + bytes([4, 0x82]) + keepalive.to_bytes(2, "big")
+    return _mqtt_packet(
+        MQTT_CONNECT, 0, header + _mqtt_string(client_id) + _mqtt_string(username)
+    )
+
+
+def mqtt_subscribe_packet(packet_id: int, topic: str) -> bytes:
+    """Return an MQTT SUBSCRIBE for one topic at QoS 0."""
+
+    body = packet_id.to_bytes(2, "big") + _mqtt_string(topic) + b"\x00"
+    return _mqtt_packet(MQTT_SUBSCRIBE, 0x2, body)
+
+
+def mqtt_publish_packet(topic: str, payload: bytes) -> bytes:
+    """Return a QoS 0 MQTT PUBLISH; used by broker stand-ins in tests."""
+
+    return _mqtt_packet(MQTT_PUBLISH, 0, _mqtt_string(topic) + payload)
+
+
+MQTT_PINGREQ_PACKET = _mqtt_packet(MQTT_PINGREQ, 0, b"")
+MQTT_DISCONNECT_PACKET = _mqtt_packet(MQTT_DISCONNECT, 0, b"")
+
+
+class MqttPacketReader:
+    """Split a WebSocket byte stream into MQTT control packets.
+
+    MQTT over WebSockets does not align packets with WebSocket messages, so
+    bytes are buffered until a whole packet is available.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> list[tuple[int, int, bytes]]:
+        """Return ``(packet_type, flags, body)`` for every complete packet."""
+
+        self._buffer.extend(data)
+        packets: list[tuple[int, int, bytes]] = []
+        while len(self._buffer) >= 2:
+            length = 0
+            multiplier = 1
+            pos = 1
+            while True:
+                if pos >= len(self._buffer):
+                    return packets
+                digit = self._buffer[pos]
+                length += (digit & 0x7F) * multiplier
+                pos += 1
+                if not digit & 0x80:
+                    break
+                multiplier *= 128
+                if pos > 4:
+                    raise LiveStatusError("Malformed MQTT remaining length")
+            if len(self._buffer) < pos + length:
+                return packets
+            first = self._buffer[0]
+            body = bytes(self._buffer[pos : pos + length])
+            packets.append((first >> 4, first & 0x0F, body))
+            del self._buffer[: pos + length]
+        return packets
+
+
+def parse_publish(flags: int, body: bytes) -> tuple[str, memoryview]:
+    """Return the topic and a zero-copy view of an MQTT PUBLISH payload."""
+
+    topic_length = int.from_bytes(body[:2], "big")
+    topic = body[2 : 2 + topic_length].decode("utf-8", errors="replace")
+    offset = 2 + topic_length
+    if (flags >> 1) & 0x3:
+        offset += 2
+    return topic, memoryview(body)[offset:]
+
+
+@dataclass(slots=True)
+class LiveStatusSample:
+    """Site power flows from one Live Status frame, in watts."""
+
+    solar_w: float | None = None
+    battery_w: float | None = None
+    grid_w: float | None = None
+    home_w: float | None = None
+    evse_w: float | None = None
+    battery_soc: int | None = None
+    received_utc: datetime | None = None
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "solar_w": self.solar_w,
+            "battery_w": self.battery_w,
+            "grid_w": self.grid_w,
+            "home_w": self.home_w,
+            "evse_w": self.evse_w,
+            "battery_soc": self.battery_soc,
+            "received_utc": (
+                self.received_utc.isoformat() if self.received_utc else None
+            ),
+        }
+
+
+def decode_live_status_frame(
+    payload: bytes | memoryview,
+) -> LiveStatusSample | None:
+    """Decode the power fields in ``LIVE_STATUS_FIELD_PATHS`` from a frame.
+
+    Powers are signed micro-kW and are returned in watts.
+    """
+
+    try:
+        values = _FRAME_DECODER.decode(payload)
+    except FrameDecodeError:
+        return None
+    if not values:
+        return None
+
+    def _power_w(name: str) -> float | None:
+        value = values.get(name)
+        return value / 1000.0 if value is not None else None
+
+    return LiveStatusSample(
+        solar_w=_power_w("solar"),
+        battery_w=_power_w("battery"),
+        grid_w=_power_w("grid"),
+        home_w=_power_w("home"),
+        evse_w=_power_w("evse"),
+        battery_soc=values.get("battery_soc"),
+    )
+
+
+@dataclass(slots=True)
+class LiveStatusAuthorizer:
+    """Connection details taken from a live-stream authorizer payload.
+
+    Live Status and Live Vitals (``live_debug=true``) authorizers differ
+    only in the topic and duration keys.
+    """
+
+    url: str
+    topic: str
+    username: str
+    duration_s: float
+    timeout_s: float
+
+    @classmethod
+    def from_payload(
+        cls, payload: object, site_id: object, *, live_debug: bool = False
+    ) -> LiveStatusAuthorizer | None:
+        if not isinstance(payload, dict):
+            return None
+        prefix = "live_debug" if live_debug else "live_stream"
+        endpoint = str(payload.get("aws_iot_endpoint") or "").strip()
+        topic = str(payload.get(f"{prefix}_topic") or "").strip()
+        authorizer = str(payload.get("aws_authorizer") or "").strip()
+        token_key = str(payload.get("aws_token_key") or "").strip()
+        token_value = str(payload.get("aws_token_value") or "").strip()
+        digest = str(payload.get("aws_digest") or "").strip()
+        if not all((endpoint, topic, authorizer, token_key, token_value, digest)):
+            return None
+        username = (
+            f"?x-amz-customauthorizer-name={authorizer}"
+            f"&{token_key}={token_value}&site-id={site_id}"
+            f"&x-amz-customauthorizer-signature={quote(digest, safe='')}"
+            "&env=production"
+        )
+
+        def _seconds(key: str, default: float) -> float:
+            try:
+                value = float(payload.get(key))
+            except (TypeError, ValueError):
+                return default
+            return value if value > 0 else default
+
+        return cls(
+            url=f"wss://{endpoint}/mqtt",
+            topic=topic,
+            username=username,
+            duration_s=min(
+                _seconds(f"{prefix}_duration", LIVE_STATUS_MAX_DURATION_S),
+                LIVE_STATUS_MAX_DURATION_S,
+            ),
+            timeout_s=_seconds("timeout", LIVE_STATUS_CONNECT_TIMEOUT_S),
+        )
+
+
+class LiveMqttStream(ABC):
+    """Hold one bounded MQTT-over-WebSocket live-stream session for a site.
+
+    ``async_start`` fetches the authorizer for the site gateway, connects
+    with MQTT 3.1.1 over ``wss://<endpoint>/mqtt`` and subscribes to the
+    returned topic. Subclasses handle each payload in ``_handle_payload``;
+    listeners are notified at most every ``publish_interval_s``. The
+    session ends at the requested duration, capped by the advertised
+    stream duration. A dropped connection is retried with a fresh
+    authorizer up to ``LIVE_STATUS_MAX_RECONNECTS`` times inside that
+    window; the window itself is never extended.
+    """
+
+    live_debug = False
+    capability_flag = "live_status"
+    task_name = "enphase_ev_live_status"
+    publish_interval_s = LIVE_STATUS_PUBLISH_INTERVAL_S
+
+    def __init__(
+        self,
+        coordinator: EnphaseCoordinator,
+        *,
+        ws_connect: Callable[..., Awaitable[Any]] | None = None,
+    ) -> None:
+        self.coordinator = coordinator
+        self._ws_connect = ws_connect
+        self._task: asyncio.Task | None = None
+        self._listeners: list[Callable[[], None]] = []
+        self._deadline_mono: float | None = None
+        self._last_publish_mono: float | None = None
+        self.sessions = 0
+        self.connects = 0
+        self.reconnects = 0
+        self.frames = 0
+        self.decode_errors = 0
+        self.last_error: str | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return True while a stream session is running."""
+
+        return self._task is not None and not self._task.done()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        self._listeners.append(listener)
+
+        def _unsub() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _unsub
+
+    @callback
+    def _notify_listeners(self) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception:  # noqa: BLE001 - keep other listeners alive
+                _LOGGER.exception("%s listener error", self.task_name)
+
+    @callback
+    def _maybe_notify_listeners(self) -> None:
+        now = time.monotonic()
+        if (
+            self._last_publish_mono is None
+            or now - self._last_publish_mono >= self.publish_interval_s
+        ):
+            self._last_publish_mono = now
+            self._notify_listeners()
+
+    async def _async_capable(self) -> bool:
+        """Return False when ``show_livestream`` reports the stream disabled."""
+
+        fetcher = getattr(self.coordinator.client, "show_livestream", None)
+        if not callable(fetcher):
+            return True
+        try:
+            flags = await fetcher()
+        except Exception:  # noqa: BLE001 - the flags are advisory only
+            return True
+        return not (
+            isinstance(flags, dict) and flags.get(self.capability_flag) is False
+        )
+
+    async def async_start(self, duration_s: float | None = None) -> bool:
+        """Start a bounded stream session and return True when one is running."""
+
+        if self.active:
+            return True
+        coord = self.coordinator
+        fetcher = getattr(coord.client, "live_status_authorizer", None)
+        gateway = coord.battery_runtime.grid_envoy_serial()
+        if not callable(fetcher) or not gateway:
+            self.last_error = "gateway_unavailable"
+            return False
+        if not await self._async_capable():
+            self.last_error = f"{self.capability_flag}_disabled"
+            return False
+        if self.active:
+            return True
+        self.sessions += 1
+        self._task = coord.hass.async_create_background_task(
+            self._async_run(fetcher, gateway, duration_s),
+            self.task_name,
+        )
+        return True
+
+    def cancel(self) -> None:
+        """Cancel the running session without waiting for it to close."""
+
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def async_stop(self) -> None:
+        """Disconnect the running session, if any."""
+
+        task = self._task
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _async_run(
+        self,
+        fetcher: Callable[..., Awaitable[object]],
+        gateway: str,
+        duration_s: float | None,
+    ) -> None:
+        coord = self.coordinator
+        attempts = 0
+        try:
+            while True:
+                try:
+                    authorizer = LiveStatusAuthorizer.from_payload(
+                        await fetcher(gateway, live_debug=self.live_debug),
+                        coord.site_id,
+                        live_debug=self.live_debug,
+                    )
+                    if authorizer is None:
+                        raise LiveStatusError("Invalid live status authorizer")
+                    if self._deadline_mono is None:
+                        window = authorizer.duration_s
+                        if duration_s is not None and duration_s > 0:
+                            window = min(window, float(duration_s))
+                        self._deadline_mono = time.monotonic() + window
+                    await self._async_session(authorizer)
+                    return
+                except (aiohttp.ClientError, TimeoutError, LiveStatusError) as err:
+                    self.last_error = redact_text(err, site_ids=(coord.site_id,))
+                    _LOGGER.debug(
+                        "%s stream for site %s failed: %s",
+                        self.task_name,
+                        redact_site_id(coord.site_id),
+                        self.last_error,
+                    )
+                deadline = self._deadline_mono
+                if (
+                    deadline is None
+                    or attempts >= LIVE_STATUS_MAX_RECONNECTS
+                    or time.monotonic() + LIVE_STATUS_RECONNECT_DELAY_S >= deadline
+                ):
+                    return
+                attempts += 1
+                self.reconnects += 1
+                await asyncio.sleep(LIVE_STATUS_RECONNECT_DELAY_S)
+        finally:
+            self._deadline_mono = None
+            self._reset()
+            self._notify_listeners()
+
+    async def _async_connect(self, authorizer: LiveStatusAuthorizer) -> Any:
+        connect = self._ws_connect
+        if connect is None:
+            connect = async_get_clientsession(self.coordinator.hass).ws_connect
+        async with asyncio.timeout(authorizer.timeout_s):
+            return await connect(
+                authorizer.url,
+                protocols=("mqtt",),
+                headers={"Origin": LIVE_STATUS_ORIGIN},
+            )
+
+    async def _async_receive(
+        self, ws: Any, reader: MqttPacketReader, timeout: float
+    ) -> list[tuple[int, int, bytes]]:
+        msg = await ws.receive(timeout=timeout)
+        if msg.type == aiohttp.WSMsgType.BINARY:
+            return reader.feed(msg.data)
+        if msg.type in (
+            aiohttp.WSMsgType.CLOSE,
+            aiohttp.WSMsgType.CLOSING,
+            aiohttp.WSMsgType.CLOSED,
+            aiohttp.WSMsgType.ERROR,
+        ):
+            raise LiveStatusError("Live status connection closed")
+        return []
+
+    async def _async_handshake(
+        self, ws: Any, reader: MqttPacketReader, authorizer: LiveStatusAuthorizer
+    ) -> None:
+        await ws.send_bytes(
+            mqtt_connect_packet(
+                f"enphase-ev-{uuid.uuid4().hex[:12]}",
+                authorizer.username,
+                LIVE_STATUS_KEEPALIVE_S,
+            )
+        )
+        await ws.send_bytes(mqtt_subscribe_packet(1, authorizer.topic))
+        connected = subscribed = False
+        async with asyncio.timeout(authorizer.timeout_s):
+            while not subscribed:
+                for packet_type, flags, body in await self._async_receive(
+                    ws, reader, authorizer.timeout_s
+                ):
+                    if packet_type == MQTT_CONNACK:
+                        if len(body) < 2 or body[1] != 0:
+                            raise LiveStatusError("Live status connection refused")
+                        connected = True
+                    elif packet_type == MQTT_SUBACK:
+                        if not connected or body[2:3] == b"\x80":
+                            raise LiveStatusError("Live status subscribe refused")
+                        subscribed = True
+                    elif packet_type == MQTT_PUBLISH:
+                        self._handle_publish(flags, body)
+
+    async def _async_session(self, authorizer: LiveStatusAuthorizer) -> None:
+        ws = await self._async_connect(authorizer)
+        reader = MqttPacketReader()
+        try:
+            await self._async_handshake(ws, reader, authorizer)
+            self.connects += 1
+            ping_at = time.monotonic() + LIVE_STATUS_KEEPALIVE_S / 2
+            while True:
+                now = time.monotonic()
+                deadline = self._deadline_mono
+                if deadline is None or now >= deadline:
+                    return
+                if now >= ping_at:
+                    await ws.send_bytes(MQTT_PINGREQ_PACKET)
+                    ping_at = now + LIVE_STATUS_KEEPALIVE_S / 2
+                try:
+                    packets = await self._async_receive(
+                        ws, reader, min(deadline, ping_at) - now
+                    )
+                except TimeoutError:
+                    continue
+                for packet_type, flags, body in packets:
+                    if packet_type == MQTT_PUBLISH:
+                        self._handle_publish(flags, body)
+        finally:
+            if not ws.closed:
+                try:
+                    await ws.send_bytes(MQTT_DISCONNECT_PACKET)
+                except Exception:  # noqa: BLE001
+                    pass
+                await ws.close()
+
+    def _handle_publish(self, flags: int, body: bytes) -> None:
+        _topic, payload = parse_publish(flags, body)
+        if not self._handle_payload(payload):
+            self.decode_errors += 1
+            return
+        self.frames += 1
+        self._maybe_notify_listeners()
+
+    @abstractmethod
+    def _handle_payload(self, payload: memoryview) -> bool:
+        """Apply one payload and return False when it could not be decoded."""
+
+    def _reset(self) -> None:
+        """Drop per-session state once a session ends."""
+
+    def diagnostics(self) -> dict[str, object]:
+        deadline = self._deadline_mono
+        return {
+            "active": self.active,
+            "remaining_s": (
+                round(max(deadline - time.monotonic(), 0.0), 1)
+                if deadline is not None
+                else None
+            ),
+            "sessions": self.sessions,
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "frames": self.frames,
+            "decode_errors": self.decode_errors,
+            "last_error": self.last_error,
+        }
+
+
+class LiveStatusStream(LiveMqttStream):
+    """Stream site power flows from the binary Live Status topic.
+
+    Each frame updates ``sample`` and applies the solar power to the
+    coordinator as a current-power sample.
+    """
+
+    def __init__(
+        self,
+        coordinator: EnphaseCoordinator,
+        *,
+        ws_connect: Callable[..., Awaitable[Any]] | None = None,
+    ) -> None:
+        super().__init__(coordinator, ws_connect=ws_connect)
+        self.sample: LiveStatusSample | None = None
+
+    def _handle_payload(self, payload: memoryview) -> bool:
+        sample = decode_live_status_frame(payload)
+        if sample is None:
+            return False
+        sample.received_utc = datetime.now(tz=_tz.utc)
+        self.sample = sample
+        if sample.solar_w is not None:
+            CurrentPowerSample(
+                w=sample.solar_w,
+                sample_utc=sample.received_utc,
+                reported_units="W",
+                source=LIVE_STATUS_SOURCE,
+            ).apply_to(self.coordinator)
+        return True
+
+    def _reset(self) -> None:
+        self.sample = None
+
+    def diagnostics(self) -> dict[str, object]:
+        return {
+            **super().diagnostics(),
+            "sample": self.sample.as_dict() if self.sample is not None else None,
+        }
@@ -0,0 +1,157 @@
+"""Decode selected fields from protobuf-style Live Status frames."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+WIRE_VARINT = 0
+WIRE_FIXED64 = 1
+WIRE_LENGTH = 2
+WIRE_FIXED32 = 5
+
+_UINT64_MASK = (1 << 64) - 1
+_INT64_SIGN = 1 << 63
+
+# Power groups sit under root field 3. Field 1 of the solar, battery, grid
+# and home groups and field 2 of the home group (EV charger) are signed
+# varints in micro-kW; ``3.6`` is the battery state of charge in percent.
+LIVE_STATUS_FIELD_PATHS: dict[str, tuple[int, ...]] = {
+    "solar": (3, 1, 1),
+    "battery": (3, 2, 1),
+    "grid": (3, 3, 1),
+    "home": (3, 4, 1),
+    "evse": (3, 4, 2),
+    "battery_soc": (3, 6),
+}
+
+type PathTable = dict[int, str | PathTable]
+
+
+class FrameDecodeError(ValueError):
+    """Raised when a frame is truncated or uses an unknown wire type."""
+
+
+def compile_field_paths(paths: Mapping[str, Sequence[int]]) -> PathTable:
+    """Return a nested field-number table for ``name -> field path`` pairs.
+
+    Leaves hold the output name. A path that is a prefix of another would
+    make one field both a scalar and a message, so it is rejected.
+    """
+
+    table: PathTable = {}
+    for name, path in paths.items():
+        if not path or any(
+            not isinstance(number, int) or number < 1 for number in path
+        ):
+            raise ValueError(f"Invalid field path for {name}: {path!r}")
+        node = table
+        for number in path[:-1]:
+            child = node.setdefault(number, {})
+            if not isinstance(child, dict):
+                raise ValueError(f"Field path for {name} crosses a scalar field")
+            node = child
+        if path[-1] in node:
+            raise ValueError(f"Field path for {name} is already mapped")
+        node[path[-1]] = name
+    return table
+
+
+def _read_varint(view: memoryview, pos: int, end: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while pos < end and shift < 70:
+        byte = view[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+    raise FrameDecodeError("Truncated varint")
+
+
+class FrameDecoder:
+    """Extract configured field paths from a frame without copying it.
+
+    The frame is walked once through a ``memoryview``. Only messages on a
+    configured path are descended into; every other field is skipped by its
+    wire type, so unknown fields cost one key read and one bounds step.
+    The first value seen for a path wins, and the walk stops once every
+    path has a value. Varints are read as two's-complement ``int64``.
+    """
+
+    __slots__ = ("_count", "_table")
+
+    def __init__(
+        self, paths: Mapping[str, Sequence[int]] = LIVE_STATUS_FIELD_PATHS
+    ) -> None:
+        self._table = compile_field_paths(paths)
+        self._count = len(paths)
+
+    def decode(self, payload: bytes | bytearray | memoryview) -> dict[str, int]:
+        """Return the raw integer for every configured path found in a frame."""
+
+        view = payload if isinstance(payload, memoryview) else memoryview(payload)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        out: dict[str, int] = {}
+        self._walk(view, 0, len(view), self._table, out)
+        return out
+
+    def _walk(
+        self,
+        view: memoryview,
+        pos: int,
+        end: int,
+        table: PathTable,
+        out: dict[str, int],
+    ) -> bool:
+        count = self._count
+        while pos < end:
+            key = view[pos]
+            if key < 0x80:
+                pos += 1
+            else:
+                key, pos = _read_varint(view, pos, end)
+            wire_type = key & 0x7
+            target = table.get(key >> 3)
+            if wire_type == WIRE_VARINT:
+                if pos < end and view[pos] < 0x80:
+                    value = view[pos]
+                    pos += 1
+                else:
+                    value, pos = _read_varint(view, pos, end)
+                if target.__class__ is str and target not in out:
+                    value &= _UINT64_MASK
+                    out[target] = value - (1 << 64) if value & _INT64_SIGN else value
+                    if len(out) == count:
+                        return True
+                continue
+            if wire_type == WIRE_LENGTH:
+                if pos < end and view[pos] < 0x80:
+                    length = view[pos]
+                    pos += 1
+                else:
+                    length, pos = _read_varint(view, pos, end)
+                stop = pos + length
+                if stop > end:
+                    raise FrameDecodeError("Truncated length-delimited field")
+                if target.__class__ is dict and self._walk(
+                    view, pos, stop, target, out
+                ):
+                    return True
+                pos = stop
+                continue
+            if wire_type == WIRE_FIXED64:
+                size = 8
+            elif wire_type == WIRE_FIXED32:
+                size = 4
+            else:
+                raise FrameDecodeError(f"Unsupported wire type {wire_type}")
+            if pos + size > end:
+                raise FrameDecodeError("Truncated fixed-width field")
+            if target.__class__ is str and target not in out:
+                out[target] = int.from_bytes(view[pos : pos + size], "little")
+                if len(out) == count:
+                    return True
+            pos += size
+        return False
@@ -0,0 +1,246 @@
+"""Aggregate per-device telemetry from the Enlighten Live Vitals MQTT topic."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import json
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from .live_status import LiveMqttStream
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .coordinator import EnphaseCoordinator
+
+LIVE_VITALS_WINDOW_S = 60
+LIVE_VITALS_MIN_WINDOW_S = 10
+LIVE_VITALS_MAX_WINDOW_S = 300
+# Frames arrive about every 5 s; rings are sized for 1 Hz so a faster
+# stream still covers the whole window.
+LIVE_VITALS_SAMPLE_RATE_HZ = 1.0
+LIVE_VITALS_PUBLISH_INTERVAL_S = 15.0
+LIVE_VITALS_MAX_WINDOWS = 256
+LIVE_VITALS_MAX_PAYLOAD_BYTES = 256 * 1024
+
+# device type -> (JSON key, metric, scale) read from each device object.
+LIVE_VITALS_METRICS: dict[str, tuple[tuple[str, str, float], ...]] = {
+    "site": (("agg_soc", "battery_soc", 1.0),),
+    "enpower": (
+        ("grid_ac_l1_v", "grid_voltage", 0.001),
+        ("grid_freq", "grid_frequency", 0.001),
+        ("com_ac_l1_v", "microgrid_voltage", 0.001),
+        ("com_ac_freq", "microgrid_frequency", 0.001),
+    ),
+    "encharge": (("soc", "battery_soc", 1.0),),
+    "pcu": (("ac_power", "ac_power", 1.0),),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class WindowStats:
+    """Minimum, maximum and mean of the samples inside a rolling window."""
+
+    minimum: float
+    maximum: float
+    mean: float
+    samples: int
+
+
+class RollingWindow:
+    """Keep the most recent timestamped samples in a fixed-size ring buffer.
+
+    Storage is two preallocated ``array('d')`` buffers, so adding a sample
+    never allocates. ``stats`` scans the ring once and ignores samples
+    older than the requested start.
+    """
+
+    __slots__ = ("_next", "_size", "_times", "_values")
+
+    def __init__(self, capacity: int) -> None:
+        capacity = max(1, int(capacity))
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._values)
+
+    def add(self, at: float, value: float) -> None:
+        index = self._next
+        self._times[index] = at
+        self._values[index] = value
+        self._next = (index + 1) % len(self._values)
+        if self._size < len(self._values):
+            self._size += 1
+
+    def stats(self, since: float) -> WindowStats | None:
+        """Return stats for samples taken at or after ``since``."""
+
+        minimum = math.inf
+        maximum = -math.inf
+        total = 0.0
+        count = 0
+        capacity = len(self._values)
+        start = (self._next - self._size) % capacity
+        for offset in range(self._size):
+            index = (start + offset) % capacity
+            if self._times[index] < since:
+                continue
+            value = self._values[index]
+            minimum = min(minimum, value)
+            maximum = max(maximum, value)
+            total += value
+            count += 1
+        if not count:
+            return None
+        return WindowStats(
+            minimum=minimum, maximum=maximum, mean=total / count, samples=count
+        )
+
+
+def _metric_value(raw: object, scale: float) -> float | None:
+    if isinstance(raw, bool) or not isinstance(raw, (int, float)):
+        return None
+    value = raw * scale
+    return value if math.isfinite(value) else None
+
+
+def _dicts(value: object) -> list[dict]:
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+def iter_live_vitals_metrics(
+    payload: object,
+) -> list[tuple[str, str, str, float]]:
+    """Return ``(device_type, serial, metric, value)`` for a Live Vitals frame.
+
+    ``serial`` is empty for devices reported without ``serial_num``, such as
+    the site record and the system controller. Battery microinverters are
+    read from each battery's ``pcu`` list.
+    """
+
+    if not isinstance(payload, dict):
+        return []
+    devices = [("site", item) for item in _dicts(payload.get("site"))]
+    for device in _dicts(payload.get("devices")):
+        devices.append((str(device.get("type") or ""), device))
+        devices.extend(("pcu", pcu) for pcu in _dicts(device.get("pcu")))
+    metrics: list[tuple[str, str, str, float]] = []
+    for device_type, device in devices:
+        spec = LIVE_VITALS_METRICS.get(device_type)
+        if not spec:
+            continue
+        serial = str(device.get("serial_num") or "")
+        for key, metric, scale in spec:
+            value = _metric_value(device.get(key), scale)
+            if value is not None:
+                metrics.append((device_type, serial, metric, value))
+    return metrics
+
+
+class LiveVitalsStream(LiveMqttStream):
+    """Aggregate Live Vitals JSON frames into per-device rolling windows.
+
+    Frames are only folded into ``RollingWindow`` rings; entities read
+    ``stats`` when listeners are notified, which happens at most every
+    ``LIVE_VITALS_PUBLISH_INTERVAL_S``. Rings hold ``window_s`` seconds at
+    ``LIVE_VITALS_SAMPLE_RATE_HZ`` and the number of tracked device metrics
+    is capped at ``LIVE_VITALS_MAX_WINDOWS``.
+    """
+
+    live_debug = True
+    capability_flag = "live_vitals"
+    task_name = "enphase_ev_live_vitals"
+    publish_interval_s = LIVE_VITALS_PUBLISH_INTERVAL_S
+
+    def __init__(
+        self,
+        coordinator: EnphaseCoordinator,
+        *,
+        ws_connect: Callable[..., Awaitable[Any]] | None = None,
+    ) -> None:
+        super().__init__(coordinator, ws_connect=ws_connect)
+        self.window_s = LIVE_VITALS_WINDOW_S
+        self._windows: dict[tuple[str, str, str], RollingWindow] = {}
+        self.dropped_metrics = 0
+
+    async def async_start(
+        self, duration_s: float | None = None, window_s: int | None = None
+    ) -> bool:
+        """Start a session that aggregates over ``window_s`` seconds."""
+
+        if not self.active and window_s is not None:
+            self.window_s = min(
+                max(int(window_s), LIVE_VITALS_MIN_WINDOW_S), LIVE_VITALS_MAX_WINDOW_S
+            )
+        return await super().async_start(duration_s)
+
+    def _handle_payload(self, payload: memoryview) -> bool:
+        if len(payload) > LIVE_VITALS_MAX_PAYLOAD_BYTES:
+            return False
+        try:
+            frame = json.loads(bytes(payload))
+        except ValueError:
+            return False
+        metrics = iter_live_vitals_metrics(frame)
+        if not metrics:
+            return False
+        now = time.monotonic()
+        capacity = math.ceil(self.window_s * LIVE_VITALS_SAMPLE_RATE_HZ)
+        for device_type, serial, metric, value in metrics:
+            key = (device_type, serial, metric)
+            window = self._windows.get(key)
+            if window is None:
+                if len(self._windows) >= LIVE_VITALS_MAX_WINDOWS:
+                    self.dropped_metrics += 1
+                    continue
+                window = self._windows[key] = RollingWindow(capacity)
+            window.add(now, value)
+        return True
+
+    def _reset(self) -> None:
+        self._windows.clear()
+
+    def stats(
+        self, device_type: str, metric: str, serial: str | None = None
+    ) -> WindowStats | None:
+        """Return window stats for a device metric.
+
+        Without ``serial`` the first device of ``device_type`` is used, which
+        suits single-instance devices such as the system controller.
+        """
+
+        since = time.monotonic() - self.window_s
+        for key in sorted(self._windows):
+            kind, device_serial, name = key
+            if kind != device_type or name != metric:
+                continue
+            if serial is not None and device_serial != serial:
+                continue
+            return self._windows[key].stats(since)
+        return None
+
+    def diagnostics(self) -> dict[str, object]:
+        since = time.monotonic() - self.window_s
+        summary: dict[str, dict[str, int]] = {}
+        for (device_type, _serial, metric), window in self._windows.items():
+            stats = window.stats(since)
+            counts = summary.setdefault(device_type, {})
+            counts[metric] = counts.get(metric, 0) + (stats.samples if stats else 0)
+        return {
+            **super().diagnostics(),
+            "window_s": self.window_s,
+            "windows": len(self._windows),
+            "dropped_metrics": self.dropped_metrics,
+            "samples_in_window": summary,
+        }
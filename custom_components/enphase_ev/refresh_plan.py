@@ -33,6 +33,10 @@ class RefreshTask:
     log_label: str
     callback_factory: CallbackFactory
     endpoint_family: str | None = None
+    # Timing keys this task waits for within its stage; keys outside the stage
+    # count as satisfied. ``None`` keeps the stage order: parallel tasks start
+    # together and ordered tasks wait for the task before them.
+    depends_on: tuple[str, ...] | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -49,16 +53,55 @@ class BoundRefreshStage:
     ordered_calls: tuple[BoundRefreshCall, ...] = ()
     stage_key: str | None = None
     defer_topology: bool = False
+    dependencies: tuple[tuple[int, ...], ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
 class RefreshPlan:
     stages: tuple[RefreshStage, ...] = ()
+    name: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
 class BoundRefreshPlan:
     stages: tuple[BoundRefreshStage, ...] = ()
+    name: str | None = None
+
+
+def refresh_stage_dependencies(stage: RefreshStage) -> tuple[tuple[int, ...], ...]:
+    tasks = stage.parallel_tasks + stage.ordered_tasks
+    parallel_count = len(stage.parallel_tasks)
+    positions: dict[str, list[int]] = {}
+    for position, task in enumerate(tasks):
+        positions.setdefault(task.timing_key, []).append(position)
+    dependencies: list[tuple[int, ...]] = []
+    for position, task in enumerate(tasks):
+        if task.depends_on is not None:
+            resolved = {
+                index
+                for key in task.depends_on
+                for index in positions.get(key, ())
+                if index != position
+            }
+        elif position < parallel_count:
+            resolved = set()
+        elif position == parallel_count:
+            resolved = set(range(parallel_count))
+        else:
+            resolved = {position - 1}
+        dependencies.append(tuple(sorted(resolved)))
+
+    remaining = {position: set(deps) for position, deps in enumerate(dependencies)}
+    while remaining:
+        ready = [position for position, deps in remaining.items() if not deps]
+        if not ready:
+            keys = sorted(tasks[position].timing_key for position in remaining)
+            raise ValueError(f"Refresh task dependency cycle: {', '.join(keys)}")
+        for position in ready:
+            del remaining[position]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return tuple(dependencies)
 
 
 def method_task(
@@ -67,6 +110,7 @@ def method_task(
     method_name: str,
     /,
     endpoint_family: str | None = None,
+    depends_on: tuple[str, ...] | None = None,
     **kwargs: object,
 ) -> RefreshTask:
     return RefreshTask(
@@ -78,6 +122,7 @@ def method_task(
             if endpoint_family is not None
             else REFRESH_TASK_ENDPOINT_FAMILIES.get(timing_key)
         ),
+        depends_on=depends_on,
     )
 
 
@@ -88,6 +133,7 @@ def object_method_task(
     method_name: str,
     /,
     endpoint_family: str | None = None,
+    depends_on: tuple[str, ...] | None = None,
     **kwargs: object,
 ) -> RefreshTask:
     return RefreshTask(
@@ -101,6 +147,7 @@ def object_method_task(
             if endpoint_family is not None
             else REFRESH_TASK_ENDPOINT_FAMILIES.get(timing_key)
         ),
+        depends_on=depends_on,
     )
 
 
@@ -110,6 +157,7 @@ def callback_task(
     callback_factory: CallbackFactory,
     *,
     endpoint_family: str | None = None,
+    depends_on: tuple[str, ...] | None = None,
 ) -> RefreshTask:
     return RefreshTask(
         timing_key=timing_key,
@@ -120,6 +168,18 @@ def callback_task(
             if endpoint_family is not None
             else REFRESH_TASK_ENDPOINT_FAMILIES.get(timing_key)
         ),
+        depends_on=depends_on,
+    )
+
+
+def refresh_plan_endpoint_families(plan: RefreshPlan) -> frozenset[str]:
+    """Return the endpoint families refreshed by any task in ``plan``."""
+
+    return frozenset(
+        task.endpoint_family
+        for stage in plan.stages
+        for task in stage.parallel_tasks + stage.ordered_tasks
+        if task.endpoint_family is not None
     )
 
 
@@ -143,15 +203,21 @@ def bind_refresh_stage(owner: object, stage: RefreshStage) -> BoundRefreshStage:
         ordered_calls=bind_refresh_tasks(owner, stage.ordered_tasks),
         stage_key=stage.stage_key,
         defer_topology=stage.defer_topology,
+        dependencies=refresh_stage_dependencies(stage),
     )
 
 
 def bind_refresh_plan(owner: object, plan: RefreshPlan) -> BoundRefreshPlan:
     return BoundRefreshPlan(
-        stages=tuple(bind_refresh_stage(owner, stage) for stage in plan.stages)
+        stages=tuple(bind_refresh_stage(owner, stage) for stage in plan.stages),
+        name=plan.name,
     )
 
 
+# Warm-up discovery starts the device inventory alongside the battery site
+# settings. Battery status keeps waiting for the site settings, as it does in
+# the follow-up plans. The AC Battery, HEMS and inverter lookups wait for the
+# inventory, which replaces the type-device buckets they merge into.
 WARMUP_DISCOVERY_STAGE = RefreshStage(
     stage_key="discovery",
     defer_topology=True,
@@ -168,26 +234,35 @@ WARMUP_DISCOVERY_STAGE = RefreshStage(
             "battery status",
             "battery_runtime",
             "async_refresh_battery_status",
+            depends_on=("battery_site_settings_s",),
         ),
         object_method_task(
             "ac_battery_devices_s",
             "AC Battery devices",
             "battery_runtime",
             "async_refresh_ac_battery_devices",
+            depends_on=("devices_inventory_s",),
         ),
         object_method_task(
             "devices_inventory_s",
             "device inventory",
             "inventory_runtime",
             "_async_refresh_devices_inventory",
+            depends_on=(),
         ),
         object_method_task(
             "hems_devices_s",
             "HEMS inventory",
             "inventory_runtime",
             "_async_refresh_hems_devices",
+            depends_on=("devices_inventory_s",),
+        ),
+        method_task(
+            "inverters_s",
+            "inverters",
+            "_async_refresh_inverters",
+            depends_on=("devices_inventory_s",),
         ),
-        method_task("inverters_s", "inverters", "_async_refresh_inverters"),
     ),
 )
 
@@ -378,15 +453,18 @@ HEATPUMP_FOLLOWUP_STAGE = RefreshStage(
 )
 
 
-HEATPUMP_FOLLOWUP_PLAN = RefreshPlan(stages=(HEATPUMP_FOLLOWUP_STAGE,))
+HEATPUMP_FOLLOWUP_PLAN = RefreshPlan(
+    stages=(HEATPUMP_FOLLOWUP_STAGE,), name="heatpump_followup"
+)
 
 
 SITE_ONLY_FOLLOWUP_PLAN = RefreshPlan(
-    stages=(SITE_ONLY_FOLLOWUP_STAGE, HEATPUMP_FOLLOWUP_STAGE)
+    stages=(SITE_ONLY_FOLLOWUP_STAGE, HEATPUMP_FOLLOWUP_STAGE),
+    name="site_only_followup",
 )
 
 
-FOLLOWUP_PLAN = RefreshPlan(stages=(FOLLOWUP_STAGE,))
+FOLLOWUP_PLAN = RefreshPlan(stages=(FOLLOWUP_STAGE,), name="followup")
 
 
 def warmup_energy_stage(working_data: dict[str, dict]) -> RefreshStage:
@@ -431,7 +509,8 @@ def warmup_plan(working_data: dict[str, dict]) -> RefreshPlan:
             WARMUP_STATE_STAGE,
             HEATPUMP_FOLLOWUP_STAGE,
             warmup_energy_stage(working_data),
-        )
+        ),
+        name="warmup",
     )
 
 
@@ -457,16 +536,21 @@ def post_session_followup_stage(day_local_default: object) -> RefreshStage:
 
 
 def post_session_followup_plan(day_local_default: object) -> RefreshPlan:
-    return RefreshPlan(stages=(post_session_followup_stage(day_local_default),))
+    return RefreshPlan(
+        stages=(post_session_followup_stage(day_local_default),),
+        name="post_session_followup",
+    )
 
 
-def _plan_from_stages(*stages: RefreshStage | None) -> RefreshPlan:
+def _plan_from_stages(
+    *stages: RefreshStage | None, name: str | None = None
+) -> RefreshPlan:
     filtered = tuple(
         stage
         for stage in stages
         if stage is not None and (stage.parallel_tasks or stage.ordered_tasks)
     )
-    return RefreshPlan(stages=filtered)
+    return RefreshPlan(stages=filtered, name=name)
 
 
 def _heatpump_power_covers_dependency_refreshes(runtime: object) -> bool:
@@ -522,7 +606,9 @@ def build_heatpump_followup_plan(
                     "_async_refresh_heatpump_power",
                 )
             )
-    return _plan_from_stages(RefreshStage(ordered_tasks=tuple(ordered)))
+    return _plan_from_stages(
+        RefreshStage(ordered_tasks=tuple(ordered)), name=HEATPUMP_FOLLOWUP_PLAN.name
+    )
 
 
 def build_followup_plan(owner: object, *, force_full: bool = False) -> RefreshPlan:
@@ -666,7 +752,8 @@ def build_followup_plan(owner: object, *, force_full: bool = False) -> RefreshPl
             defer_topology=True,
             parallel_tasks=tuple(parallel),
             ordered_tasks=tuple(ordered),
-        )
+        ),
+        name=FOLLOWUP_PLAN.name,
     )
 
 
@@ -710,7 +797,9 @@ def build_site_only_followup_plan(
                 ),
             )
     heatpump = build_heatpump_followup_plan(owner, force_full=False)
-    return _plan_from_stages(*(stages + heatpump.stages))
+    return _plan_from_stages(
+        *(stages + heatpump.stages), name=SITE_ONLY_FOLLOWUP_PLAN.name
+    )
 
 
 def build_post_session_followup_plan(
@@ -751,5 +840,6 @@ def build_post_session_followup_plan(
         RefreshStage(
             defer_topology=True,
             parallel_tasks=tuple(parallel),
-        )
+        ),
+        name="post_session_followup",
     )
@@ -6,6 +6,7 @@ import asyncio
 import inspect
 import logging
 import time
+from contextvars import ContextVar
 from datetime import datetime
 from datetime import timezone as _tz
 from typing import TYPE_CHECKING, Callable
@@ -15,11 +16,16 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.util import dt as dt_util
 
 from .api import (
+    REQUEST_LANE_OPTIONAL,
+    REQUEST_LANE_STATE,
+    EnlightenRequestBudget,
     EnphaseLoginWallUnauthorized,
     InvalidPayloadError,
     OptionalEndpointUnavailable,
+    enlighten_request_lane,
 )
 from .const import DOMAIN, DEFAULT_CHARGE_LEVEL_SETTING, PHASE_SWITCH_CONFIG_SETTING
+from .coordinator_refresh_metrics import REFRESH_DEADLINE_RESERVE_S
 from .log_redaction import redact_site_id, redact_text
 from .refresh_plan import BoundRefreshCall, RefreshPlan, bind_refresh_plan, warmup_plan
 
@@ -37,6 +43,12 @@ _SKIPPABLE_REFRESH_ERRORS = (
     OptionalEndpointUnavailable,
 )
 
+# Monotonic deadline of the refresh plan being run. Child tasks spawned for
+# the plan's stages inherit it.
+_refresh_deadline: ContextVar[float | None] = ContextVar(
+    "enphase_ev_refresh_deadline", default=None
+)
+
 
 class _RefreshCallCancelled(Exception):
     """Signal a child refresh cancellation that should cancel sibling tasks."""
@@ -47,6 +59,32 @@ class RefreshRunner:
 
     def __init__(self, coordinator: EnphaseCoordinator) -> None:
         self._coordinator = coordinator
+        self._critical_paths: dict[str, dict[str, object]] = {}
+        # Optional calls cut by a plan deadline, keyed by timing key. They run
+        # exempt from the deadline on the next cycle so they cannot starve.
+        self._carry_over: dict[str, str | None] = {}
+        self._deadline_skipped = 0
+        self._deadline_cancelled = 0
+
+    def critical_path_diagnostics(self) -> dict[str, dict[str, object]]:
+        """Return the most recent critical path for each refresh plan."""
+
+        return {
+            name: {**path, "tasks": list(path["tasks"])}
+            for name, path in sorted(self._critical_paths.items())
+        }
+
+    def carry_over_diagnostics(self) -> dict[str, object]:
+        """Return optional calls carried over to the next refresh cycle."""
+
+        return {
+            "pending": sorted(self._carry_over),
+            "families": sorted(
+                {family for family in self._carry_over.values() if family}
+            ),
+            "deadline_skipped": self._deadline_skipped,
+            "deadline_cancelled": self._deadline_cancelled,
+        }
 
     def _warmup_site_state_available(self) -> bool:
         coordinator = self._coordinator
@@ -69,6 +107,50 @@ class RefreshRunner:
             )
         )
 
+    def _request_lane_for_family(self, endpoint_family: str | None) -> str | None:
+        if endpoint_family is None:
+            return None
+        policy_getter = getattr(self._coordinator, "_endpoint_family_policy", None)
+        policy = policy_getter(endpoint_family) if callable(policy_getter) else None
+        if policy is None:
+            return None
+        if getattr(policy, "optional", False):
+            return REQUEST_LANE_OPTIONAL
+        return REQUEST_LANE_STATE
+
+    def _request_budget_skips(self, endpoint_family: str | None) -> bool:
+        """Return whether the account request budget skips this family."""
+
+        if self._request_lane_for_family(endpoint_family) != REQUEST_LANE_OPTIONAL:
+            return False
+        coordinator = self._coordinator
+        budget = getattr(getattr(coordinator, "client", None), "request_budget", None)
+        if not isinstance(budget, EnlightenRequestBudget):
+            return False
+        return budget.should_skip(coordinator.site_id, endpoint_family)
+
+    def _carry_over_call(
+        self,
+        timing_key: str,
+        log_label: str,
+        endpoint_family: str | None,
+        *,
+        cancelled: bool,
+    ) -> tuple[str, None]:
+        self._carry_over[timing_key] = endpoint_family
+        if cancelled:
+            self._deadline_cancelled += 1
+        else:
+            self._deadline_skipped += 1
+        _LOGGER.debug(
+            "%s %s refresh for site %s at the refresh deadline; "
+            "carrying it over to the next cycle",
+            "Cancelled" if cancelled else "Skipped",
+            log_label,
+            redact_site_id(self._coordinator.site_id),
+        )
+        return timing_key, None
+
     async def async_run_refresh_call(
         self,
         timing_key: str,
@@ -77,11 +159,35 @@ class RefreshRunner:
         *,
         endpoint_family: str | None = None,
     ) -> tuple[str, float | None]:
+        if self._request_budget_skips(endpoint_family):
+            _LOGGER.debug(
+                "Skipping %s refresh for site %s while the request budget is low",
+                log_label,
+                redact_site_id(self._coordinator.site_id),
+            )
+            return timing_key, None
+        lane = self._request_lane_for_family(endpoint_family)
+        carried_over = timing_key in self._carry_over
+        self._carry_over.pop(timing_key, None)
+        deadline = (
+            _refresh_deadline.get()
+            if lane == REQUEST_LANE_OPTIONAL and not carried_over
+            else None
+        )
         started = time.monotonic()
+        if deadline is not None and started >= deadline - REFRESH_DEADLINE_RESERVE_S:
+            return self._carry_over_call(
+                timing_key, log_label, endpoint_family, cancelled=False
+            )
+        deadline_scope = asyncio.timeout(
+            max(0.0, deadline - started) if deadline is not None else None
+        )
         try:
-            result = callback_factory()
-            if inspect.isawaitable(result):
-                await result
+            async with deadline_scope:
+                with enlighten_request_lane(lane):
+                    result = callback_factory()
+                    if inspect.isawaitable(result):
+                        await result
         except asyncio.CancelledError:
             raise
         except EnphaseLoginWallUnauthorized as err:
@@ -90,16 +196,25 @@ class RefreshRunner:
             raise ConfigEntryAuthFailed from err
         except ConfigEntryAuthFailed:
             raise
-        except _SKIPPABLE_REFRESH_ERRORS as err:
-            if endpoint_family is not None:
-                self._coordinator._note_endpoint_family_failure(endpoint_family, err)
-            _LOGGER.debug(
-                "Skipping %s refresh for site %s: %s",
-                log_label,
-                redact_site_id(self._coordinator.site_id),
-                redact_text(err, site_ids=(self._coordinator.site_id,)),
-            )
         except Exception as err:
+            # Whatever a call raised once the deadline cut it, it is carried
+            # over rather than counted as an endpoint failure.
+            if deadline_scope.expired():
+                return self._carry_over_call(
+                    timing_key, log_label, endpoint_family, cancelled=True
+                )
+            if isinstance(err, _SKIPPABLE_REFRESH_ERRORS):
+                if endpoint_family is not None:
+                    self._coordinator._note_endpoint_family_failure(
+                        endpoint_family, err
+                    )
+                _LOGGER.debug(
+                    "Skipping %s refresh for site %s: %s",
+                    log_label,
+                    redact_site_id(self._coordinator.site_id),
+                    redact_text(err, site_ids=(self._coordinator.site_id,)),
+                )
+                return timing_key, round(time.monotonic() - started, 3)
             self._coordinator.last_failure_utc = dt_util.utcnow()
             self._coordinator.last_failure_status = None
             self._coordinator.last_failure_description = (
@@ -110,6 +225,11 @@ class RefreshRunner:
             self._coordinator.last_failure_source = "refresh_stage"
             self._coordinator.last_failure_endpoint = timing_key
             raise
+        if deadline_scope.expired():
+            # The callback swallowed the deadline cancellation itself.
+            return self._carry_over_call(
+                timing_key, log_label, endpoint_family, cancelled=True
+            )
         return timing_key, round(time.monotonic() - started, 3)
 
     async def _async_run_refresh_call_for_group(
@@ -140,29 +260,49 @@ class RefreshRunner:
         calls: tuple[BoundRefreshCall, ...],
         stage_key: str | None = None,
         defer_topology: bool = False,
-    ) -> None:
+        dependencies: tuple[tuple[int, ...], ...] = (),
+    ) -> list[tuple[str, float]]:
+        """Run calls concurrently, starting each once its dependencies finish.
+
+        ``dependencies`` holds, per call, the indexes of calls that must finish
+        first. Returns the critical path as ``(timing_key, duration)`` pairs.
+        """
+
         if defer_topology:
             self._coordinator._begin_topology_refresh_batch()
 
+        finished = [asyncio.Event() for _call in calls]
+        path_cost = [0.0 for _call in calls]
+        path_parent: list[int | None] = [None for _call in calls]
+
+        async def _run_node(index: int) -> tuple[str, float | None]:
+            parents = dependencies[index] if index < len(dependencies) else ()
+            for parent in parents:
+                await finished[parent].wait()
+            timing_key, log_label, callback_factory, endpoint_family = calls[index]
+            result = await self._async_run_refresh_call_for_group(
+                timing_key,
+                log_label,
+                callback_factory,
+                endpoint_family=endpoint_family,
+            )
+            parent = max(parents, key=path_cost.__getitem__, default=None)
+            path_parent[index] = parent
+            path_cost[index] = (result[1] or 0.0) + (
+                path_cost[parent] if parent is not None else 0.0
+            )
+            finished[index].set()
+            return result
+
         group_started = time.monotonic()
         try:
             async with asyncio.TaskGroup() as task_group:
                 tasks = [
                     task_group.create_task(
-                        self._async_run_refresh_call_for_group(
-                            timing_key,
-                            log_label,
-                            callback_factory,
-                            endpoint_family=endpoint_family,
-                        ),
-                        name=f"{DOMAIN}_refresh_{timing_key}",
+                        _run_node(index),
+                        name=f"{DOMAIN}_refresh_{calls[index][0]}",
                     )
-                    for (
-                        timing_key,
-                        log_label,
-                        callback_factory,
-                        endpoint_family,
-                    ) in calls
+                    for index in range(len(calls))
                 ]
         except* Exception as err_group:
             exceptions = tuple(
@@ -188,6 +328,16 @@ class RefreshRunner:
         if stage_key is not None:
             phase_timings[f"{stage_key}_s"] = round(time.monotonic() - group_started, 3)
 
+        critical_path: list[tuple[str, float]] = []
+        node = max(range(len(calls)), key=path_cost.__getitem__, default=None)
+        while node is not None:
+            timing_key, duration = results[node]
+            if duration is not None:
+                critical_path.append((timing_key, duration))
+            node = path_parent[node]
+        critical_path.reverse()
+        return critical_path
+
     async def async_run_ordered_refresh_calls(
         self,
         phase_timings: dict[str, float],
@@ -195,10 +345,11 @@ class RefreshRunner:
         calls: tuple[BoundRefreshCall, ...],
         stage_key: str | None = None,
         defer_topology: bool = False,
-    ) -> None:
+    ) -> list[tuple[str, float]]:
         if defer_topology:
             self._coordinator._begin_topology_refresh_batch()
 
+        critical_path: list[tuple[str, float]] = []
         group_started = time.monotonic()
         try:
             for timing_key, log_label, callback_factory, endpoint_family in calls:
@@ -210,12 +361,14 @@ class RefreshRunner:
                 )
                 if duration is not None:
                     phase_timings[key] = duration
+                    critical_path.append((key, duration))
         finally:
             if defer_topology:
                 self._coordinator._end_topology_refresh_batch()
 
         if stage_key is not None:
             phase_timings[f"{stage_key}_s"] = round(time.monotonic() - group_started, 3)
+        return critical_path
 
     async def async_run_staged_refresh_calls(
         self,
@@ -225,24 +378,41 @@ class RefreshRunner:
         ordered_calls: tuple[BoundRefreshCall, ...] = (),
         stage_key: str | None = None,
         defer_topology: bool = False,
-    ) -> None:
+        dependencies: tuple[tuple[int, ...], ...] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Run one stage, as a dependency graph when ``dependencies`` is given.
+
+        Without ``dependencies`` the parallel calls run together and the
+        ordered calls then run one at a time.
+        """
+
         if not parallel_calls and not ordered_calls:
             if stage_key is not None:
                 phase_timings[f"{stage_key}_s"] = 0.0
-            return
+            return []
+
+        if dependencies is not None:
+            return await self.async_run_refresh_calls(
+                phase_timings,
+                calls=parallel_calls + ordered_calls,
+                stage_key=stage_key,
+                defer_topology=defer_topology,
+                dependencies=dependencies,
+            )
 
         if defer_topology:
             self._coordinator._begin_topology_refresh_batch()
 
+        critical_path: list[tuple[str, float]] = []
         group_started = time.monotonic()
         try:
             if parallel_calls:
-                await self.async_run_refresh_calls(
+                critical_path += await self.async_run_refresh_calls(
                     phase_timings,
                     calls=parallel_calls,
                 )
             if ordered_calls:
-                await self.async_run_ordered_refresh_calls(
+                critical_path += await self.async_run_ordered_refresh_calls(
                     phase_timings,
                     calls=ordered_calls,
                 )
@@ -252,22 +422,47 @@ class RefreshRunner:
 
         if stage_key is not None:
             phase_timings[f"{stage_key}_s"] = round(time.monotonic() - group_started, 3)
+        return critical_path
 
     async def async_run_refresh_plan(
         self,
         phase_timings: dict[str, float],
         *,
         plan: RefreshPlan,
+        deadline_mono: float | None = None,
     ) -> None:
+        """Run ``plan`` stage by stage.
+
+        With ``deadline_mono``, optional endpoint families are not started once
+        less than ``REFRESH_DEADLINE_RESERVE_S`` remains and are cancelled when
+        the deadline passes. Either way they are carried over to the next cycle,
+        where they run exempt from the deadline.
+        """
+
         bound_plan = bind_refresh_plan(self._coordinator, plan)
-        for stage in bound_plan.stages:
-            await self.async_run_staged_refresh_calls(
-                phase_timings,
-                stage_key=stage.stage_key,
-                defer_topology=stage.defer_topology,
-                parallel_calls=stage.parallel_calls,
-                ordered_calls=stage.ordered_calls,
-            )
+        critical_path: list[tuple[str, float]] = []
+        started = time.monotonic()
+        token = _refresh_deadline.set(deadline_mono)
+        try:
+            for stage in bound_plan.stages:
+                stage_path = await self.async_run_staged_refresh_calls(
+                    phase_timings,
+                    stage_key=stage.stage_key,
+                    defer_topology=stage.defer_topology,
+                    parallel_calls=stage.parallel_calls,
+                    ordered_calls=stage.ordered_calls,
+                    dependencies=stage.dependencies,
+                )
+                critical_path.extend(stage_path or ())
+        finally:
+            _refresh_deadline.reset(token)
+        self._critical_paths[bound_plan.name or "refresh"] = {
+            "tasks": [timing_key for timing_key, _duration in critical_path],
+            "critical_path_s": round(
+                sum(duration for _timing_key, duration in critical_path), 3
+            ),
+            "wall_s": round(time.monotonic() - started, 3),
+        }
 
     async def async_startup_warmup_runner(self) -> None:
         coordinator = self._coordinator
@@ -303,6 +498,7 @@ class RefreshRunner:
             coordinator._warmup_in_progress = False
             coordinator._warmup_phase_timings = warmup_timings
             coordinator.discovery_snapshot.schedule_save()
+            coordinator.state_snapshot.schedule_save()
 
     async def async_start_startup_warmup(self) -> None:
         coordinator = self._coordinator
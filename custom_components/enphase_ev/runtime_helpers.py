@@ -34,6 +34,16 @@ def coerce_int(value: object, *, default: int = 0) -> int:
             return default
 
 
+def coerce_bool(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes", "y")
+    return False
+
+
 def coerce_optional_int(value: object) -> int | None:
     if value is None:
         return None
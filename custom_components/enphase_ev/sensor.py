@@ -7,6 +7,7 @@ entities that surface optional endpoint health without exposing credentials.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import math
@@ -21,7 +22,9 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     UnitOfElectricCurrent,
+    UnitOfElectricPotential,
     UnitOfEnergy,
+    UnitOfFrequency,
     UnitOfLength,
     UnitOfPower,
     UnitOfTime,
@@ -449,6 +452,14 @@ async def async_setup_entry(
                 "system_controller_inventory",
                 EnphaseSystemControllerInventorySensor(coord),
             )
+            _add_site_entity(
+                "live_grid_voltage",
+                EnphaseLiveVitalsSensor(coord, "grid_voltage"),
+            )
+            _add_site_entity(
+                "live_grid_frequency",
+                EnphaseLiveVitalsSensor(coord, "grid_frequency"),
+            )
             dry_contacts_present = _gateway_dry_contact_present()
             if (
                 dry_contacts_present is True
@@ -3760,7 +3771,33 @@ def _gateway_format_counts(counts: dict[str, int]) -> str | None:
     return ", ".join(f"{name} x{count}" for name, count in ordered)
 
 
+def _memoized_site_snapshot(
+    coord: EnphaseCoordinator,
+    key: str,
+    builder: Callable[[EnphaseCoordinator], dict[str, object]],
+) -> dict[str, object]:
+    """Build a site snapshot once per coordinator listener dispatch.
+
+    Outside a dispatch the snapshot is rebuilt on every call, so direct reads
+    always see current coordinator state.
+    """
+
+    memo = getattr(coord, "snapshot_memo", None)
+    if not isinstance(memo, dict):
+        return builder(coord)
+    snapshot = memo.get(key)
+    if snapshot is None:
+        snapshot = memo[key] = builder(coord)
+    return snapshot
+
+
 def _gateway_inventory_snapshot(coord: EnphaseCoordinator) -> dict[str, object]:
+    return _memoized_site_snapshot(
+        coord, "gateway_inventory_snapshot", _build_gateway_inventory_snapshot
+    )
+
+
+def _build_gateway_inventory_snapshot(coord: EnphaseCoordinator) -> dict[str, object]:
     summary_getter = getattr(coord, "gateway_inventory_summary", None)
     if callable(summary_getter):
         try:
@@ -3949,6 +3986,16 @@ def _microinverter_connectivity_state(snapshot: dict[str, object]) -> str | None
 
 
 def _microinverter_inventory_snapshot(coord: EnphaseCoordinator) -> dict[str, object]:
+    return _memoized_site_snapshot(
+        coord,
+        "microinverter_inventory_snapshot",
+        _build_microinverter_inventory_snapshot,
+    )
+
+
+def _build_microinverter_inventory_snapshot(
+    coord: EnphaseCoordinator,
+) -> dict[str, object]:
     summary_getter = getattr(coord, "microinverter_inventory_summary", None)
     if callable(summary_getter):
         try:
@@ -4127,6 +4174,10 @@ def _heatpump_member_last_reported(member: dict[str, object] | None) -> datetime
 
 
 def _heatpump_snapshot(coord: EnphaseCoordinator) -> dict[str, object]:
+    return _memoized_site_snapshot(coord, "heatpump_snapshot", _build_heatpump_snapshot)
+
+
+def _build_heatpump_snapshot(coord: EnphaseCoordinator) -> dict[str, object]:
     summary_getter = getattr(coord, "heatpump_inventory_summary", None)
     if callable(summary_getter):
         try:
@@ -6042,6 +6093,11 @@ class EnphaseCurrentPowerConsumptionSensor(_SiteBaseEntity, RestoreSensor):
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
+        live_status = getattr(self._coord, "live_status", None)
+        if live_status is not None:
+            self.async_on_remove(
+                live_status.async_add_listener(self.async_write_ha_state)
+            )
         last = await self.async_get_last_sensor_data()
         if last is not None:
             try:
@@ -6546,6 +6602,69 @@ class EnphaseSystemControllerInventorySensor(_SiteBaseEntity):
         return attrs
 
 
+class EnphaseLiveVitalsSensor(_SiteBaseEntity):
+    """System controller grid vitals averaged over the Live Vitals window."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = _SiteBaseEntity._unrecorded_attributes.union(
+        {"minimum", "maximum", "samples", "window_s"}
+    )
+    _METRICS: dict[str, tuple[SensorDeviceClass, str, int]] = {
+        "grid_voltage": (
+            SensorDeviceClass.VOLTAGE,
+            UnitOfElectricPotential.VOLT,
+            1,
+        ),
+        "grid_frequency": (SensorDeviceClass.FREQUENCY, UnitOfFrequency.HERTZ, 3),
+    }
+
+    def __init__(self, coord: EnphaseCoordinator, metric: str):
+        super().__init__(coord, f"live_{metric}", f"Live {metric}", type_key="envoy")
+        self._metric = metric
+        self._attr_translation_key = f"live_{metric}"
+        (
+            self._attr_device_class,
+            self._attr_native_unit_of_measurement,
+            self._attr_suggested_display_precision,
+        ) = self._METRICS[metric]
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        live_vitals = getattr(self._coord, "live_vitals", None)
+        if live_vitals is not None:
+            self.async_on_remove(
+                live_vitals.async_add_listener(self.async_write_ha_state)
+            )
+
+    def _stats(self):
+        live_vitals = getattr(self._coord, "live_vitals", None)
+        if live_vitals is None or not live_vitals.active:
+            return None
+        return live_vitals.stats("enpower", self._metric)
+
+    @property
+    def available(self) -> bool:
+        return super().available and self._stats() is not None
+
+    @property
+    def native_value(self):
+        stats = self._stats()
+        return stats.mean if stats is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        stats = self._stats()
+        if stats is None:
+            return {}
+        return {
+            "minimum": stats.minimum,
+            "maximum": stats.maximum,
+            "samples": stats.samples,
+            "window_s": self._coord.live_vitals.window_s,
+        }
+
+
 class EnphaseDryContactsInventorySensor(_SiteBaseEntity):
     _attr_name = "Dry Contacts"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
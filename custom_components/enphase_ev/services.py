@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
-from datetime import date
+from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
 import aiohttp
@@ -15,6 +15,7 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers import service as ha_service
 from homeassistant.helpers import target as ha_target
+from homeassistant.util import dt as dt_util
 
 from .api import (
     OCPP_TRIGGER_MESSAGES,
@@ -38,12 +39,16 @@ from .log_redaction import redact_site_id
 from .parsing_helpers import coerce_optional_bool
 from .runtime_data import EnphaseRuntimeData, iter_coordinators
 from .service_validation import raise_translated_service_validation
+from .live_status import LIVE_STATUS_MAX_DURATION_S
+from .live_vitals import LIVE_VITALS_MAX_WINDOW_S, LIVE_VITALS_MIN_WINDOW_S
+from .session_archive import SESSION_ARCHIVE_RETENTION_DAYS
 
 if TYPE_CHECKING:  # pragma: no cover
     from .coordinator import EnphaseCoordinator
 
 REGISTERED_SERVICES = (
     "force_refresh",
+    "backfill_session_history",
     "start_charging",
     "stop_charging",
     "trigger_message",
@@ -54,6 +59,10 @@ REGISTERED_SERVICES = (
     "try_reauth_now",
     "start_live_stream",
     "stop_live_stream",
+    "start_live_status",
+    "stop_live_status",
+    "start_live_vitals",
+    "stop_live_vitals",
     "sync_schedules",
     "add_schedule",
     "update_schedule",
@@ -331,6 +340,33 @@ def async_setup_services(
             vol.Optional("config_entry_id"): cv.string,
         }
     )
+    BACKFILL_SESSION_HISTORY_SCHEMA = vol.Schema(
+        {
+            vol.Optional("device_id"): DEVICE_ID_LIST,
+            vol.Optional("site_id"): cv.string,
+            vol.Optional("config_entry_id"): cv.string,
+            vol.Required("start_date"): cv.date,
+            vol.Optional("end_date"): cv.date,
+        }
+    )
+    START_LIVE_STATUS_SCHEMA = vol.Schema(
+        {
+            vol.Optional("device_id"): DEVICE_ID_LIST,
+            vol.Optional("site_id"): cv.string,
+            vol.Optional("config_entry_id"): cv.string,
+            vol.Optional("duration"): vol.All(
+                vol.Coerce(int), vol.Range(min=10, max=LIVE_STATUS_MAX_DURATION_S)
+            ),
+        }
+    )
+    START_LIVE_VITALS_SCHEMA = START_LIVE_STATUS_SCHEMA.extend(
+        {
+            vol.Optional("window"): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=LIVE_VITALS_MIN_WINDOW_S, max=LIVE_VITALS_MAX_WINDOW_S),
+            ),
+        }
+    )
     ADD_SCHEDULE_SCHEMA = vol.Schema(
         {
             **ENTRY_SCHEMA,
@@ -1120,6 +1156,44 @@ def async_setup_services(
         coord = await _resolve_single_site_coordinator(call)
         await coord.async_request_refresh()
 
+    async def _svc_backfill_session_history(call: ServiceCall) -> dict[str, object]:
+        coord = await _resolve_single_site_coordinator(call)
+        start_day: date = call.data["start_date"]
+        today = dt_util.now().date()
+        end_day: date = call.data.get("end_date") or today
+        oldest_day = today - timedelta(days=SESSION_ARCHIVE_RETENTION_DAYS - 1)
+        if (
+            end_day < start_day
+            or start_day < oldest_day
+            or (end_day - start_day).days >= SESSION_ARCHIVE_RETENTION_DAYS
+        ):
+            _raise_service_validation(
+                "session_backfill_range_invalid",
+                placeholders={"max_days": SESSION_ARCHIVE_RETENTION_DAYS},
+                message=(
+                    "Session history backfill needs an end date on or after the "
+                    f"start date, at most {SESSION_ARCHIVE_RETENTION_DAYS} days, "
+                    f"starting within the last {SESSION_ARCHIVE_RETENTION_DAYS} "
+                    "days."
+                ),
+            )
+        history = await coord.async_backfill_session_history(start_day, end_day)
+        return {
+            "site_id": coord.site_id,
+            "start_date": start_day.isoformat(),
+            "end_date": end_day.isoformat(),
+            "chargers": {
+                sn: {
+                    day_key: {
+                        "sessions": len(sessions),
+                        "energy_kwh": coord.session_history.sum_energy(sessions),
+                    }
+                    for day_key, sessions in days.items()
+                }
+                for sn, days in history.items()
+            },
+        }
+
     async def _svc_start(call: ServiceCall) -> None:
         connector_id = int(call.data.get("connector_id", 1))
         for _device_id, sn, coord in await _resolve_charger_targets(call):
@@ -1220,6 +1294,32 @@ def async_setup_services(
         await coord.async_stop_streaming(manual=True)
         await coord.async_request_refresh()
 
+    async def _svc_start_live_status(call: ServiceCall) -> None:
+        coord = await _resolve_single_site_coordinator(call)
+        if not await coord.live_status.async_start(call.data.get("duration")):
+            _raise_service_validation(
+                "live_status_unavailable",
+                message="Live status streaming is unavailable for this site.",
+            )
+
+    async def _svc_stop_live_status(call: ServiceCall) -> None:
+        coord = await _resolve_single_site_coordinator(call)
+        await coord.live_status.async_stop()
+
+    async def _svc_start_live_vitals(call: ServiceCall) -> None:
+        coord = await _resolve_single_site_coordinator(call)
+        if not await coord.live_vitals.async_start(
+            call.data.get("duration"), call.data.get("window")
+        ):
+            _raise_service_validation(
+                "live_vitals_unavailable",
+                message="Live vitals streaming is unavailable for this site.",
+            )
+
+    async def _svc_stop_live_vitals(call: ServiceCall) -> None:
+        coord = await _resolve_single_site_coordinator(call)
+        await coord.live_vitals.async_stop()
+
     async def _svc_update_cfg_schedule(call: ServiceCall) -> None:
         coord = await _resolve_single_site_coordinator(call)
         await coord.async_update_cfg_schedule(
@@ -1616,6 +1716,16 @@ def async_setup_services(
     hass.services.async_register(
         DOMAIN, "force_refresh", _svc_force_refresh, schema=FORCE_REFRESH_SCHEMA
     )
+    backfill_register_kwargs: dict[str, object] = {
+        "schema": BACKFILL_SESSION_HISTORY_SCHEMA,
+        "supports_response": supports_response.OPTIONAL,
+    }
+    hass.services.async_register(
+        DOMAIN,
+        "backfill_session_history",
+        _svc_backfill_session_history,
+        **backfill_register_kwargs,
+    )
     hass.services.async_register(
         DOMAIN, "start_charging", _svc_start, schema=START_SCHEMA
     )
@@ -1660,6 +1770,30 @@ def async_setup_services(
     )
     hass.services.async_register(DOMAIN, "start_live_stream", _svc_start_stream)
     hass.services.async_register(DOMAIN, "stop_live_stream", _svc_stop_stream)
+    hass.services.async_register(
+        DOMAIN,
+        "start_live_status",
+        _svc_start_live_status,
+        schema=START_LIVE_STATUS_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "stop_live_status",
+        _svc_stop_live_status,
+        schema=FORCE_REFRESH_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "start_live_vitals",
+        _svc_start_live_vitals,
+        schema=START_LIVE_VITALS_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "stop_live_vitals",
+        _svc_stop_live_vitals,
+        schema=FORCE_REFRESH_SCHEMA,
+    )
     hass.services.async_register(
         DOMAIN, "sync_schedules", _svc_sync_schedules, schema=SYNC_SCHEMA
     )
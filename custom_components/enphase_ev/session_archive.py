@@ -0,0 +1,254 @@
+"""Persist normalised charging-session history per charger and local day."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import accumulate
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .log_redaction import redact_site_id
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .coordinator import EnphaseCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SESSION_ARCHIVE_STORE_VERSION = 1
+SESSION_ARCHIVE_SAVE_DELAY_S = 30.0
+SESSION_ARCHIVE_RETENTION_DAYS = 42
+
+
+@dataclass(slots=True)
+class ArchivedSessionDay:
+    """Sessions stored for one serial/day and whether the day is closed."""
+
+    sessions: list[dict]
+    closed: bool
+
+
+def _session_bounds(session: dict) -> tuple[datetime, datetime] | None:
+    try:
+        start = datetime.fromisoformat(str(session.get("start")))
+        end = datetime.fromisoformat(str(session.get("end")))
+    except ValueError:
+        return None
+    if start.tzinfo is None or end.tzinfo is None or end < start:
+        return None
+    return start, end
+
+
+class SessionIntervalIndex:
+    """Answer time-range queries over one charger's archived sessions.
+
+    Sessions are kept sorted by start together with a running maximum of
+    their ends. A query bisects the starts for the last candidate and the
+    running maximum for the first one, so it costs O(log n + k) for the
+    non-overlapping sessions of a single charger. Sessions that straddle
+    midnight are archived under both days and indexed once.
+    """
+
+    def __init__(self, days: dict[str, ArchivedSessionDay]) -> None:
+        intervals: dict[str, tuple[datetime, datetime, dict]] = {}
+        for day_key in sorted(days):
+            for session in days[day_key].sessions:
+                bounds = _session_bounds(session)
+                if bounds is None:
+                    continue
+                key = str(session.get("session_id") or "") or str(bounds)
+                intervals[key] = (*bounds, session)
+        ordered = sorted(intervals.values(), key=lambda item: item[:2])
+        self._starts = [start for start, _end, _session in ordered]
+        self._ends = [end for _start, end, _session in ordered]
+        self._sessions = [session for _start, _end, session in ordered]
+        self._max_ends = list(accumulate(self._ends, max))
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def overlapping(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime, dict]]:
+        """Return sessions that overlap ``[start, end)`` ordered by start."""
+
+        first = bisect_right(self._max_ends, start)
+        last = bisect_left(self._starts, end)
+        return [
+            (self._starts[index], self._ends[index], self._sessions[index])
+            for index in range(first, last)
+            if self._ends[index] > start
+        ]
+
+
+class SessionHistoryArchive:
+    """Keep session history on disk so restarts reuse closed days.
+
+    A day is closed once it was fetched after it ended locally; closed days
+    are never overwritten or fetched again. The current day stays open and
+    is replaced on every refresh. Days older than
+    ``SESSION_ARCHIVE_RETENTION_DAYS`` are dropped.
+    """
+
+    def __init__(self, coordinator: EnphaseCoordinator) -> None:
+        self.coordinator = coordinator
+        entry_id = getattr(coordinator.config_entry, "entry_id", coordinator.site_id)
+        self._store = Store(
+            coordinator.hass,
+            SESSION_ARCHIVE_STORE_VERSION,
+            f"{DOMAIN}.session_history.{entry_id}",
+        )
+        self._loaded = False
+        self._days: dict[str, dict[str, ArchivedSessionDay]] = {}
+        self._indexes: dict[str, SessionIntervalIndex] = {}
+        self.hits = 0
+        self.index_builds = 0
+        self.writes = 0
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once stored history was read."""
+
+        return self._loaded
+
+    @staticmethod
+    def _oldest_day_key() -> str:
+        oldest = dt_util.now().date() - timedelta(
+            days=SESSION_ARCHIVE_RETENTION_DAYS - 1
+        )
+        return oldest.isoformat()
+
+    def capture(self) -> dict[str, object]:
+        return {
+            "site_id": str(self.coordinator.site_id),
+            "days": {
+                serial: {
+                    day_key: {"closed": day.closed, "sessions": day.sessions}
+                    for day_key, day in days.items()
+                }
+                for serial, days in self._days.items()
+            },
+        }
+
+    def apply(self, data: object) -> bool:
+        """Apply stored archive data and return True when it was usable."""
+
+        if not isinstance(data, dict):
+            return False
+        if str(data.get("site_id")) != str(self.coordinator.site_id):
+            return False
+        stored = data.get("days")
+        if not isinstance(stored, dict):
+            return False
+        restored: dict[str, dict[str, ArchivedSessionDay]] = {}
+        for serial, days in stored.items():
+            if not isinstance(days, dict):
+                continue
+            for day_key, item in days.items():
+                if not isinstance(item, dict):
+                    continue
+                sessions = item.get("sessions")
+                if not isinstance(sessions, list):
+                    continue
+                entries = [entry for entry in sessions if isinstance(entry, dict)]
+                restored.setdefault(str(serial), {})[str(day_key)] = ArchivedSessionDay(
+                    sessions=entries, closed=bool(item.get("closed"))
+                )
+        self._days = restored
+        self._indexes.clear()
+        self.prune()
+        return True
+
+    async def async_load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            self.apply(await self._store.async_load())
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug(
+                "Failed to load session history archive for site %s",
+                redact_site_id(self.coordinator.site_id),
+                exc_info=True,
+            )
+
+    def get(self, serial: str, day_key: str) -> ArchivedSessionDay | None:
+        """Return the archived sessions for a serial/day pair."""
+
+        day = self._days.get(serial, {}).get(day_key)
+        if day is not None:
+            self.hits += 1
+        return day
+
+    def put(
+        self,
+        serial: str,
+        day_key: str,
+        sessions: list[dict],
+        *,
+        closed: bool,
+    ) -> None:
+        """Archive sessions for a serial/day pair unless the day is closed."""
+
+        if day_key < self._oldest_day_key():
+            return
+        days = self._days.setdefault(serial, {})
+        current = days.get(day_key)
+        if current is not None and (
+            current.closed or (current.sessions == sessions and not closed)
+        ):
+            return
+        days[day_key] = ArchivedSessionDay(sessions=list(sessions), closed=closed)
+        self._indexes.pop(serial, None)
+        self.writes += 1
+        self.prune()
+        self._store.async_delay_save(self.capture, SESSION_ARCHIVE_SAVE_DELAY_S)
+
+    def prune(self) -> None:
+        """Drop days that fell out of the retention window."""
+
+        oldest = self._oldest_day_key()
+        for serial in list(self._days):
+            days = {
+                day_key: day
+                for day_key, day in self._days[serial].items()
+                if day_key >= oldest
+            }
+            if len(days) != len(self._days[serial]):
+                self._indexes.pop(serial, None)
+            if days:
+                self._days[serial] = days
+            else:
+                self._days.pop(serial)
+
+    def index(self, serial: str) -> SessionIntervalIndex:
+        """Return the interval index for a serial, rebuilt after changes."""
+
+        index = self._indexes.get(serial)
+        if index is None:
+            index = SessionIntervalIndex(self._days.get(serial, {}))
+            self._indexes[serial] = index
+            self.index_builds += 1
+        return index
+
+    def diagnostics(self) -> dict[str, object]:
+        day_keys = [day_key for days in self._days.values() for day_key in days]
+        return {
+            "loaded": self._loaded,
+            "retention_days": SESSION_ARCHIVE_RETENTION_DAYS,
+            "serials": len(self._days),
+            "days": len(day_keys),
+            "closed_days": sum(
+                1 for days in self._days.values() for day in days.values() if day.closed
+            ),
+            "oldest_day": min(day_keys) if day_keys else None,
+            "hits": self.hits,
+            "writes": self.writes,
+            "indexed_serials": len(self._indexes),
+            "index_builds": self.index_builds,
+        }
@@ -7,8 +7,8 @@ import logging
 import time
 import uuid
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone as _tz
-from typing import Any, Awaitable, Callable, Iterable
+from datetime import date, datetime, timedelta, timezone as _tz
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable
 
 import aiohttp
 from homeassistant.core import HomeAssistant
@@ -17,12 +17,35 @@ from homeassistant.util import dt as dt_util
 from .api import InvalidPayloadError, SessionHistoryUnavailable, Unauthorized
 from .log_redaction import redact_identifier, redact_text
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .session_archive import SessionHistoryArchive
+
 _LOGGER = logging.getLogger(__name__)
 
 MIN_SESSION_HISTORY_CACHE_TTL = 60  # seconds
 SESSION_HISTORY_FAILURE_BACKOFF_S = 15 * 60
 SESSION_HISTORY_CONCURRENCY = 3
 SESSION_HISTORY_CACHE_DAY_RETENTION = 3
+SESSION_HISTORY_PAGE_LIMIT = 50
+SESSION_HISTORY_PAGE_LIMIT_MAX = 100
+# Pages requested at once after the first page reports more results.
+SESSION_HISTORY_PAGE_FANOUT = 3
+# Guard against a server that keeps reporting more results forever.
+SESSION_HISTORY_MAX_SESSIONS = 2000
+# Days covered by one ranged request when backfilling a date window.
+SESSION_HISTORY_BACKFILL_CHUNK_DAYS = 31
+# Time after a local day ends before a fetch of it may be archived as closed.
+SESSION_HISTORY_CLOSE_GRACE_S = 3 * 60 * 60
+
+
+def _session_fingerprint(item: dict) -> tuple | None:
+    """Return a hashable key for a flat raw session row, or None when nested."""
+    try:
+        fingerprint = tuple(sorted(item.items()))
+        hash(fingerprint)
+    except TypeError:
+        return None
+    return fingerprint
 
 
 @dataclass(slots=True)
@@ -52,6 +75,7 @@ class SessionCacheEntry:
     state: str
     last_error: str | None
     has_valid_cache: bool
+    closed: bool = False
 
 
 class SessionHistoryManager:
@@ -70,6 +94,7 @@ class SessionHistoryManager:
         publish_callback: Callable[[dict[str, dict]], None] | None = None,
         site_id_getter: Callable[[], object] | None = None,
         logger: logging.Logger | None = None,
+        archive: SessionHistoryArchive | None = None,
     ) -> None:
         self._hass = hass
         self._client_getter = client_getter
@@ -83,6 +108,10 @@ class SessionHistoryManager:
             tuple[str, str], SessionCacheEntry | tuple[float, list[dict]]
         ] = {}
         self._block_until: dict[str, float] = {}
+        self._session_counts: dict[str, int] = {}
+        self._normalised_sessions: dict[tuple[str, str], dict[tuple, dict | None]] = {}
+        self._sessions_normalised = 0
+        self._sessions_reused = 0
         self._refresh_in_progress: set[str] = set()
         self._criteria_checked_mono: float | None = None
         self._criteria_lock = asyncio.Lock()
@@ -91,6 +120,7 @@ class SessionHistoryManager:
         self._publish_callback = publish_callback
         self._site_id_getter = site_id_getter
         self._logger = logger or _LOGGER
+        self._archive = archive
         self._fetch_override: (
             Callable[[str, datetime | None], Awaitable[list[dict]]] | None
         ) = None
@@ -151,6 +181,17 @@ class SessionHistoryManager:
             counts[entry.state] = counts.get(entry.state, 0) + 1
         return counts
 
+    @property
+    def normalise_stats(self) -> dict[str, int]:
+        """Return counts of sessions normalised and reused from the memo."""
+        return {
+            "normalised": self._sessions_normalised,
+            "reused": self._sessions_reused,
+            "memo_entries": sum(
+                len(entries) for entries in self._normalised_sessions.values()
+            ),
+        }
+
     @property
     def in_progress(self) -> int:
         """Return the number of serials going through enrichment."""
@@ -268,12 +309,43 @@ class SessionHistoryManager:
             )
         return None
 
-    def _get_cache_entry(self, cache_key: tuple[str, str]) -> SessionCacheEntry | None:
+    def _get_cache_entry(
+        self,
+        cache_key: tuple[str, str],
+        now_mono: float | None = None,
+    ) -> SessionCacheEntry | None:
         cached = self._coerce_cache_entry(self._cache.get(cache_key))
+        if cached is None:
+            cached = self._archived_cache_entry(cache_key, now_mono)
         if cached is not None:
             self._cache[cache_key] = cached
         return cached
 
+    def _archived_cache_entry(
+        self, cache_key: tuple[str, str], now_mono: float | None
+    ) -> SessionCacheEntry | None:
+        """Seed a cache entry from the on-disk archive after a restart.
+
+        Closed days are final. The open day is returned already expired so it
+        is served while the refresh that replaces it is pending.
+        """
+        archive = self._archive
+        if archive is None or not archive.loaded:
+            return None
+        archived = archive.get(*cache_key)
+        if archived is None:
+            return None
+        if now_mono is None:
+            now_mono = time.monotonic()
+        return SessionCacheEntry(
+            cached_at_mono=now_mono if archived.closed else now_mono - self._cache_ttl,
+            sessions=list(archived.sessions),
+            state=SESSION_CACHE_STATE_VALID,
+            last_error=None,
+            has_valid_cache=True,
+            closed=archived.closed,
+        )
+
     def _set_unavailable_entry(
         self,
         serial: str,
@@ -321,7 +393,7 @@ class SessionHistoryManager:
         """Return the cache state for a serial/day pair."""
         now = now_mono or time.monotonic()
         cache_key = (serial, day_key)
-        cached = self._get_cache_entry(cache_key)
+        cached = self._get_cache_entry(cache_key, now)
         sessions: list[dict] = []
         cache_age: float | None = None
         if cached:
@@ -330,7 +402,7 @@ class SessionHistoryManager:
             sessions = cached.sessions if cached.has_valid_cache else []
         has_valid_cache = bool(cached and cached.has_valid_cache)
         needs_refresh = not has_valid_cache or (
-            cache_age is not None and cache_age >= self._cache_ttl
+            cache_age is not None and cache_age >= self._cache_ttl and not cached.closed
         )
         block_until = self._block_until.get(serial)
         blocked = (
@@ -551,7 +623,11 @@ class SessionHistoryManager:
         if active_serials is not None:
             active_serials.add(sn)
         self.prune(active_serials=active_serials, keep_day_keys={day_key})
-        cached = self._get_cache_entry(cache_key)
+        if self._archive is not None:
+            await self._archive.async_load()
+        cached = self._get_cache_entry(cache_key, now_mono)
+        if cached is not None and cached.closed:
+            return cached.sessions
         refresh_after = self._cache_ttl
         if max_cache_age is not None:
             try:
@@ -630,34 +706,12 @@ class SessionHistoryManager:
                 self._set_unavailable_entry(sn, day_key, now_mono, err)
                 return []
 
-        async def _fetch_page(offset: int, limit: int) -> tuple[list[dict], bool]:
-            payload = await client.session_history(
-                sn,
-                start_date=api_day,
-                end_date=api_day,
-                offset=offset,
-                limit=limit,
-                timezone=timezone_name,
-                request_id=str(uuid.uuid4()),
-            )
-            data = payload.get("data") if isinstance(payload, dict) else None
-            items = data.get("result") if isinstance(data, dict) else None
-            has_more = bool(data.get("hasMore")) if isinstance(data, dict) else False
-            if not isinstance(items, list):
-                return [], False
-            return items, has_more
-
-        results: list[dict] = []
-        offset = 0
-        limit = 50
         try:
-            for _ in range(5):
-                page, has_more = await _fetch_page(offset, limit)
-                if page:
-                    results.extend(page)
-                if not has_more or len(page) < limit:
-                    break
-                offset += limit
+            results = await self._async_fetch_pages(
+                self._page_fetcher(client, sn, api_day, api_day, timezone_name),
+                self._page_limit(sn),
+                self._session_counts.get(sn),
+            )
         except SessionHistoryUnavailable as err:
             self._logger.debug(
                 "Session history unavailable for %s on %s: %s",
@@ -707,9 +761,15 @@ class SessionHistoryManager:
             self._set_unavailable_entry(sn, day_key, now_mono, err)
             return []
 
-        sessions = self._normalise_sessions_for_day(local_dt=local_dt, results=results)
+        sessions = self._normalise_sessions_for_day(
+            local_dt=local_dt, results=results, memo_key=sn
+        )
         self._mark_service_available()
         self._block_until.pop(sn, None)
+        self._session_counts[sn] = len(results)
+        closed = self._day_is_final(
+            local_dt.date(), results, dt_util.as_local(dt_util.now())
+        )
         self._set_cache_entry(
             sn,
             day_key,
@@ -719,10 +779,247 @@ class SessionHistoryManager:
                 state=SESSION_CACHE_STATE_VALID,
                 last_error=None,
                 has_valid_cache=True,
+                closed=closed,
             ),
         )
+        if self._archive is not None:
+            self._archive.put(sn, day_key, sessions, closed=closed)
         return sessions
 
+    @staticmethod
+    def _page_fetcher(
+        client: Any,
+        sn: str,
+        start_date: str,
+        end_date: str,
+        timezone_name: str | None,
+    ) -> Callable[[int, int], Awaitable[tuple[list[dict], bool]]]:
+        async def _fetch_page(offset: int, limit: int) -> tuple[list[dict], bool]:
+            payload = await client.session_history(
+                sn,
+                start_date=start_date,
+                end_date=end_date,
+                offset=offset,
+                limit=limit,
+                timezone=timezone_name,
+                request_id=str(uuid.uuid4()),
+            )
+            data = payload.get("data") if isinstance(payload, dict) else None
+            items = data.get("result") if isinstance(data, dict) else None
+            has_more = bool(data.get("hasMore")) if isinstance(data, dict) else False
+            if not isinstance(items, list):
+                return [], False
+            return items, has_more
+
+        return _fetch_page
+
+    async def async_backfill(
+        self,
+        serials: Iterable[str],
+        start_day: date,
+        end_day: date,
+    ) -> dict[str, dict[str, list[dict]]]:
+        """Fetch a window of site-local days for each serial with ranged requests.
+
+        Days already closed in the archive are reused. The remaining days are
+        requested ``SESSION_HISTORY_BACKFILL_CHUNK_DAYS`` at a time and split
+        into per-day cache and archive entries. The first error cancels the
+        other serials' requests and is raised to the caller.
+        """
+        serial_list = [sn for sn in dict.fromkeys(serials) if sn]
+        client = self._client_getter()
+        now_local = dt_util.as_local(dt_util.now())
+        today = now_local.date()
+        end_day = min(end_day, today)
+        if not serial_list or client is None or end_day < start_day:
+            return {}
+        if self._archive is not None:
+            await self._archive.async_load()
+        criteria_fetcher = getattr(client, "session_history_filter_criteria", None)
+        if callable(criteria_fetcher):
+            await self._async_refresh_filter_criteria(criteria_fetcher)
+        timezone_name = self._history_timezone()
+        days = [
+            start_day + timedelta(days=offset)
+            for offset in range((end_day - start_day).days + 1)
+        ]
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _backfill(sn: str) -> tuple[str, dict[str, list[dict]]]:
+            by_day: dict[str, list[dict]] = {}
+            runs: list[list[date]] = []
+            for day in days:
+                day_key = day.isoformat()
+                cached = self._get_cache_entry((sn, day_key))
+                if cached is not None and cached.closed:
+                    by_day[day_key] = cached.sessions
+                    continue
+                if (
+                    runs
+                    and runs[-1][-1] + timedelta(days=1) == day
+                    and len(runs[-1]) < SESSION_HISTORY_BACKFILL_CHUNK_DAYS
+                ):
+                    runs[-1].append(day)
+                else:
+                    runs.append([day])
+            async with semaphore:
+                for run in runs:
+                    results = await self._async_fetch_pages(
+                        self._page_fetcher(
+                            client,
+                            sn,
+                            run[0].strftime("%d-%m-%Y"),
+                            run[-1].strftime("%d-%m-%Y"),
+                            timezone_name,
+                        ),
+                        SESSION_HISTORY_PAGE_LIMIT_MAX,
+                        None,
+                    )
+                    for day in run:
+                        by_day[day.isoformat()] = self._store_backfilled_day(
+                            sn,
+                            day,
+                            results,
+                            now_local=now_local,
+                        )
+            return sn, {day_key: by_day[day_key] for day_key in sorted(by_day)}
+
+        tasks: list[asyncio.Task[tuple[str, dict[str, list[dict]]]]] = []
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for sn in serial_list:
+                    tasks.append(
+                        task_group.create_task(
+                            _backfill(sn),
+                            name=f"enphase_ev_session_backfill_{redact_identifier(sn)}",
+                        )
+                    )
+        except ExceptionGroup as err:
+            raise err.exceptions[0] from err
+        self._mark_service_available()
+        return dict(task.result() for task in tasks)
+
+    def _store_backfilled_day(
+        self,
+        sn: str,
+        day: date,
+        results: list[dict],
+        *,
+        now_local: datetime,
+    ) -> list[dict]:
+        local_dt = (
+            now_local if day == now_local.date() else dt_util.start_of_local_day(day)
+        )
+        sessions = self._normalise_sessions_for_day(
+            local_dt=local_dt, results=results, memo_key=sn
+        )
+        closed = self._day_is_final(day, results, now_local)
+        self._set_cache_entry(
+            sn,
+            day.isoformat(),
+            SessionCacheEntry(
+                cached_at_mono=time.monotonic(),
+                sessions=list(sessions),
+                state=SESSION_CACHE_STATE_VALID,
+                last_error=None,
+                has_valid_cache=True,
+                closed=closed,
+            ),
+        )
+        if self._archive is not None:
+            self._archive.put(sn, day.isoformat(), sessions, closed=closed)
+        return sessions
+
+    def _day_is_final(
+        self, day: date, results: list[dict], now_local: datetime
+    ) -> bool:
+        """Return True when a fetched day can be archived as closed.
+
+        The fetch must run ``SESSION_HISTORY_CLOSE_GRACE_S`` past the local end
+        of the day, and every returned session must carry an ``endTime``.
+        """
+        if self._archive is None:
+            return False
+        day_end = dt_util.start_of_local_day(day + timedelta(days=1))
+        if now_local < day_end + timedelta(seconds=SESSION_HISTORY_CLOSE_GRACE_S):
+            return False
+        return all(
+            item.get("endTime") is not None
+            for item in results
+            if isinstance(item, dict)
+        )
+
+    def _page_limit(self, sn: str) -> int:
+        """Size the first page to fit the last day seen for the charger."""
+        expected = self._session_counts.get(sn)
+        if not expected:
+            return SESSION_HISTORY_PAGE_LIMIT
+        padded = -(-(expected + 10) // 10) * 10
+        return max(
+            SESSION_HISTORY_PAGE_LIMIT, min(SESSION_HISTORY_PAGE_LIMIT_MAX, padded)
+        )
+
+    async def _async_fetch_pages(
+        self,
+        fetch_page: Callable[[int, int], Awaitable[tuple[list[dict], bool]]],
+        limit: int,
+        expected: int | None,
+    ) -> list[dict]:
+        """Fetch every page for a day, requesting offsets concurrently.
+
+        Each round requests as many offsets as the last observed count for the
+        charger needs, so a day of known size takes one round trip. With no
+        count yet, the first page is fetched alone and later rounds request
+        ``SESSION_HISTORY_PAGE_FANOUT`` offsets until a page reports the end.
+        """
+
+        def _wave(offset: int) -> int:
+            if expected is None:
+                wave = 1 if offset == 0 else SESSION_HISTORY_PAGE_FANOUT
+            else:
+                wave = -(-(expected + 1 - offset) // limit)
+            remaining = -(-(SESSION_HISTORY_MAX_SESSIONS - offset) // limit)
+            return max(1, min(wave, SESSION_HISTORY_PAGE_FANOUT, remaining))
+
+        pages: list[list[dict]] = []
+        offset = 0
+        while True:
+            offsets = [offset + index * limit for index in range(_wave(offset))]
+            responses = await asyncio.gather(
+                *(fetch_page(page_offset, limit) for page_offset in offsets)
+            )
+            finished = False
+            for page, has_more in responses:
+                pages.append(page)
+                if not has_more or len(page) < limit:
+                    finished = True
+                    break
+            if finished:
+                break
+            offset = offsets[-1] + limit
+            if offset >= SESSION_HISTORY_MAX_SESSIONS:
+                self._logger.debug(
+                    "Session history paging stopped after %s results", offset
+                )
+                break
+
+        # Sessions can shift between offsets while pages are in flight.
+        results: list[dict] = []
+        seen: set[str] = set()
+        for page in pages:
+            for item in page:
+                session_id = (
+                    item.get("sessionId") or item.get("id")
+                    if isinstance(item, dict)
+                    else None
+                )
+                if session_id is not None:
+                    if str(session_id) in seen:
+                        continue
+                    seen.add(str(session_id))
+                results.append(item)
+        return results
+
     @staticmethod
     def _normalize_serials(serials: Iterable[str] | None) -> set[str] | None:
         if serials is None:
@@ -792,11 +1089,21 @@ class SessionHistoryManager:
                 for (sn, day_key), cache in self._cache.items()
                 if day_key in retained_days and (active_set is None or sn in active_set)
             }
+        if self._normalised_sessions:
+            self._normalised_sessions = {
+                (sn, day_key): memo
+                for (sn, day_key), memo in self._normalised_sessions.items()
+                if day_key in retained_days and (active_set is None or sn in active_set)
+            }
 
         now_mono = time.monotonic()
         for sn, until in list(self._block_until.items()):
             if until <= now_mono or (active_set is not None and sn not in active_set):
                 self._block_until.pop(sn, None)
+        if active_set is not None:
+            for sn in list(self._session_counts):
+                if sn not in active_set:
+                    self._session_counts.pop(sn, None)
 
         if active_set is not None:
             self._refresh_in_progress.intersection_update(active_set)
@@ -808,6 +1115,8 @@ class SessionHistoryManager:
         self._enrichment_tasks.clear()
         self._cache.clear()
         self._block_until.clear()
+        self._session_counts.clear()
+        self._normalised_sessions.clear()
         self._criteria_checked_mono = None
         self._refresh_in_progress.clear()
 
@@ -823,8 +1132,13 @@ class SessionHistoryManager:
         *,
         local_dt: datetime,
         results: list[dict],
+        memo_key: str | None = None,
     ) -> list[dict]:
-        """Trim and normalise raw session history entries for a given local day."""
+        """Trim and normalise raw session history entries for a given local day.
+
+        With a ``memo_key``, finished rows identical to the previous call for
+        the same key and day reuse the session dicts built then.
+        """
 
         try:
             now_local = dt_util.as_local(local_dt)
@@ -890,15 +1204,12 @@ class SessionHistoryManager:
                 return val.strip().lower() in ("true", "1", "yes", "y")
             return False
 
-        sessions: list[dict] = []
-        for item in results:
-            if not isinstance(item, dict):
-                continue
+        def _normalise_item(item: dict) -> dict | None:
             start_dt = _parse_ts(item.get("startTime"))
             end_dt = _parse_ts(item.get("endTime"))
 
             if start_dt is None and end_dt is None:
-                continue
+                return None
 
             if start_dt is None:
                 start_dt = end_dt
@@ -912,7 +1223,7 @@ class SessionHistoryManager:
                 window_end = window_start
 
             if not (window_start < day_end and window_end >= day_start):
-                continue
+                return None
 
             energy_total_kwh = _as_float(item.get("aggEnergyValue"), precision=3)
             if energy_total_kwh is None:
@@ -950,31 +1261,59 @@ class SessionHistoryManager:
                 int(overlap_seconds) if overlap_seconds and overlap_seconds > 0 else 0
             )
 
-            sessions.append(
-                {
-                    "session_id": str(item.get("sessionId") or item.get("id") or ""),
-                    "start": start_dt.isoformat() if start_dt else None,
-                    "end": end_dt.isoformat() if end_dt else None,
-                    "auth_type": item.get("authType"),
-                    "auth_identifier": item.get("authIdentifier"),
-                    "auth_token": item.get("authToken"),
-                    "active_charge_time_s": active_charge_seconds_raw,
-                    "active_charge_time_overlap_s": overlap_active_seconds,
-                    "energy_kwh_total": energy_total_kwh,
-                    "energy_kwh": energy_window_kwh,
-                    "miles_added": _as_float(item.get("milesAdded"), precision=3),
-                    "session_cost": _as_float(item.get("sessionCost"), precision=3),
-                    "avg_cost_per_kwh": _as_float(
-                        item.get("avgCostPerUnitEnergy"), precision=3
-                    ),
-                    "cost_calculated": _as_bool(item.get("costCalculated")),
-                    "manual_override": _as_bool(item.get("manualOverridden")),
-                    "session_cost_state": item.get("sessionCostState"),
-                    "charge_profile_stack_level": _as_int(
-                        item.get("chargeProfileStackLevel")
-                    ),
-                }
+            return {
+                "session_id": str(item.get("sessionId") or item.get("id") or ""),
+                "start": start_dt.isoformat() if start_dt else None,
+                "end": end_dt.isoformat() if end_dt else None,
+                "auth_type": item.get("authType"),
+                "auth_identifier": item.get("authIdentifier"),
+                "auth_token": item.get("authToken"),
+                "active_charge_time_s": active_charge_seconds_raw,
+                "active_charge_time_overlap_s": overlap_active_seconds,
+                "energy_kwh_total": energy_total_kwh,
+                "energy_kwh": energy_window_kwh,
+                "miles_added": _as_float(item.get("milesAdded"), precision=3),
+                "session_cost": _as_float(item.get("sessionCost"), precision=3),
+                "avg_cost_per_kwh": _as_float(
+                    item.get("avgCostPerUnitEnergy"), precision=3
+                ),
+                "cost_calculated": _as_bool(item.get("costCalculated")),
+                "manual_override": _as_bool(item.get("manualOverridden")),
+                "session_cost_state": item.get("sessionCostState"),
+                "charge_profile_stack_level": _as_int(
+                    item.get("chargeProfileStackLevel")
+                ),
+            }
+
+        day_key = day_start.strftime("%Y-%m-%d")
+        memo = (
+            self._normalised_sessions.get((memo_key, day_key), {})
+            if memo_key is not None
+            else {}
+        )
+        seen: dict[tuple, dict | None] = {}
+        sessions: list[dict] = []
+        for item in results:
+            if not isinstance(item, dict):
+                continue
+            # Open sessions end at "now", so only finished rows are reusable.
+            fingerprint = (
+                _session_fingerprint(item)
+                if memo_key is not None and item.get("endTime") is not None
+                else None
             )
+            if fingerprint is not None and fingerprint in memo:
+                session = memo[fingerprint]
+                self._sessions_reused += 1
+            else:
+                session = _normalise_item(item)
+                self._sessions_normalised += 1
+            if fingerprint is not None:
+                seen[fingerprint] = session
+            if session is not None:
+                sessions.append(session)
+        if memo_key is not None:
+            self._normalised_sessions[(memo_key, day_key)] = seen
 
         sessions.sort(
             key=lambda entry: (
@@ -0,0 +1,352 @@
+"""Persist normalized coordinator state so restarts can warm-start entities."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .energy import SiteEnergyFlow
+from .log_redaction import redact_site_id
+from .state_models import BatteryControlCapability, BatteryState, EndpointFamilyHealth
+from .tariff import TariffBillingSnapshot, TariffRateSnapshot
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .coordinator import EnphaseCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_SNAPSHOT_STORE_VERSION = 1
+STATE_SNAPSHOT_SAVE_DELAY_S = 30.0
+STATE_SNAPSHOT_MAX_AGE = timedelta(days=7)
+
+_DATETIME_TAG = "__datetime__"
+_DATACLASS_TAG = "__dataclass__"
+_SNAPSHOT_DATACLASSES: dict[str, type] = {
+    cls.__name__: cls
+    for cls in (
+        BatteryControlCapability,
+        SiteEnergyFlow,
+        TariffBillingSnapshot,
+        TariffRateSnapshot,
+    )
+}
+_TARIFF_ATTRS = (
+    "tariff_billing",
+    "tariff_import_rate",
+    "tariff_export_rate",
+    "tariff_last_refresh_utc",
+    "tariff_rates_last_refresh_utc",
+)
+# Battery fields that only make sense within one run: monotonic deadlines,
+# write locks and tasks, in-flight write confirmation, and raw payload copies.
+_BATTERY_TRANSIENT_SUFFIXES = (
+    "_mono",
+    "_cache_until",
+    "_lock",
+    "_task",
+    "_failures",
+    "_issue_reported",
+    "_payload",
+    "_payloads",
+)
+_BATTERY_TRANSIENT_PREFIXES = (
+    "_battery_pending_",
+    "_battery_optimistic_",
+    "_battery_cfg_pending_",
+    "_battery_backend_",
+    "_storm_guard_pending_",
+    "_ac_battery_control_pending",
+    "_ac_battery_last_command",
+)
+_BATTERY_TRANSIENT_FIELDS = frozenset({"_battery_profile_authoritative_seen"})
+
+
+class _Unsupported:
+    """Marker for values the snapshot cannot round-trip."""
+
+
+_UNSUPPORTED = _Unsupported()
+
+
+def _battery_state_fields() -> tuple[str, ...]:
+    return tuple(
+        field.name
+        for field in fields(BatteryState)
+        if field.name not in _BATTERY_TRANSIENT_FIELDS
+        and not field.name.endswith(_BATTERY_TRANSIENT_SUFFIXES)
+        and not field.name.startswith(_BATTERY_TRANSIENT_PREFIXES)
+    )
+
+
+_BATTERY_STATE_FIELDS = _battery_state_fields()
+
+
+def _encode(value: object) -> object:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if is_dataclass(value) and not isinstance(value, type):
+        name = type(value).__name__
+        if _SNAPSHOT_DATACLASSES.get(name) is not type(value):
+            return _UNSUPPORTED
+        return {
+            _DATACLASS_TAG: name,
+            "fields": _encode(
+                {field.name: getattr(value, field.name) for field in fields(value)}
+            ),
+        }
+    if isinstance(value, dict):
+        out: dict[str, object] = {}
+        for key, item in value.items():
+            encoded = _encode(item)
+            if encoded is not _UNSUPPORTED:
+                out[str(key)] = encoded
+        return out
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [
+            encoded
+            for encoded in (_encode(item) for item in value)
+            if encoded is not _UNSUPPORTED
+        ]
+    return _UNSUPPORTED
+
+
+def _decode(value: object) -> object:
+    if isinstance(value, list):
+        return [
+            decoded
+            for decoded in (_decode(item) for item in value)
+            if decoded is not _UNSUPPORTED
+        ]
+    if not isinstance(value, dict):
+        return value
+    if set(value) == {_DATETIME_TAG}:
+        parsed = dt_util.parse_datetime(str(value[_DATETIME_TAG]))
+        return parsed if parsed is not None else _UNSUPPORTED
+    if _DATACLASS_TAG in value:
+        cls = _SNAPSHOT_DATACLASSES.get(str(value[_DATACLASS_TAG]))
+        kwargs = _decode(value.get("fields"))
+        if cls is None or not isinstance(kwargs, dict):
+            return _UNSUPPORTED
+        for field in fields(cls):
+            item = kwargs.get(field.name)
+            if isinstance(item, list) and str(field.type).startswith("tuple"):
+                kwargs[field.name] = tuple(item)
+        try:
+            return cls(**kwargs)
+        except TypeError:
+            return _UNSUPPORTED
+    out: dict[str, object] = {}
+    for key, item in value.items():
+        decoded = _decode(item)
+        if decoded is not _UNSUPPORTED:
+            out[key] = decoded
+    return out
+
+
+class CoordinatorStateSnapshotManager:
+    """Persist and restore the last known normalized coordinator state.
+
+    The snapshot holds per-charger data, battery, tariff and site energy state,
+    and endpoint family health. It is restored before the first refresh and
+    reported stale until a refresh returns live data. Saves go through
+    ``Store.async_delay_save`` so repeated refreshes coalesce into one write.
+    """
+
+    def __init__(self, coordinator: EnphaseCoordinator) -> None:
+        self.coordinator = coordinator
+        entry_id = getattr(coordinator.config_entry, "entry_id", coordinator.site_id)
+        self._store = Store(
+            coordinator.hass,
+            STATE_SNAPSHOT_STORE_VERSION,
+            f"{DOMAIN}.state_snapshot.{entry_id}",
+        )
+        self._loaded = False
+        self.stale = False
+        self.restored_saved_utc: datetime | None = None
+
+    def capture(self) -> dict[str, object]:
+        coord = self.coordinator
+        energy = getattr(coord, "energy", None)
+        data = coord.data if isinstance(coord.data, dict) else {}
+        return {
+            "site_id": str(coord.site_id),
+            "saved_utc": dt_util.utcnow().isoformat(),
+            "charger_data": _encode(data),
+            "battery": _encode(
+                {name: getattr(coord, name, None) for name in _BATTERY_STATE_FIELDS}
+            ),
+            "tariff": _encode(
+                {name: getattr(coord, name, None) for name in _TARIFF_ATTRS}
+            ),
+            "site_energy": _encode(
+                {
+                    "flows": getattr(energy, "site_energy", None) or {},
+                    "meta": getattr(energy, "_site_energy_meta", None) or {},
+                }
+            ),
+            "endpoint_family_health": _encode(
+                {
+                    family: {
+                        field.name: getattr(health, field.name)
+                        for field in fields(health)
+                        if not field.name.endswith("_mono")
+                    }
+                    for family, health in dict(
+                        getattr(coord, "_endpoint_family_health", {}) or {}
+                    ).items()
+                }
+            ),
+        }
+
+    def apply(self, snapshot: object) -> bool:
+        """Apply a stored snapshot and return True when state was restored."""
+
+        if not isinstance(snapshot, dict):
+            return False
+        coord = self.coordinator
+        if str(snapshot.get("site_id")) != str(coord.site_id):
+            return False
+        saved_utc = dt_util.parse_datetime(str(snapshot.get("saved_utc") or ""))
+        if saved_utc is None or dt_util.utcnow() - saved_utc > STATE_SNAPSHOT_MAX_AGE:
+            return False
+
+        charger_data = _decode(snapshot.get("charger_data"))
+        if isinstance(charger_data, dict) and not coord.data:
+            serials = set(coord.iter_serials())
+            restored = {
+                sn: payload
+                for sn, payload in charger_data.items()
+                if sn in serials and isinstance(payload, dict)
+            }
+            if restored:
+                coord.data = restored
+
+        battery = _decode(snapshot.get("battery"))
+        if isinstance(battery, dict):
+            for name in _BATTERY_STATE_FIELDS:
+                if name in battery:
+                    setattr(coord, name, battery[name])
+
+        tariff = _decode(snapshot.get("tariff"))
+        if isinstance(tariff, dict):
+            for name in _TARIFF_ATTRS:
+                if getattr(coord, name, None) is None and name in tariff:
+                    setattr(coord, name, tariff[name])
+
+        site_energy = _decode(snapshot.get("site_energy"))
+        energy = getattr(coord, "energy", None)
+        if isinstance(site_energy, dict) and energy is not None:
+            flows = site_energy.get("flows")
+            if isinstance(flows, dict) and not energy.site_energy:
+                energy.site_energy = {
+                    key: flow
+                    for key, flow in flows.items()
+                    if isinstance(flow, SiteEnergyFlow)
+                }
+                meta = site_energy.get("meta")
+                if isinstance(meta, dict):
+                    energy._site_energy_meta = meta
+
+        health_map = _decode(snapshot.get("endpoint_family_health"))
+        if isinstance(health_map, dict):
+            self._apply_endpoint_family_health(health_map)
+
+        self.stale = True
+        self.restored_saved_utc = saved_utc
+        return True
+
+    def _apply_endpoint_family_health(self, health_map: dict[str, object]) -> None:
+        """Restore family health, re-arming failure cooldowns by wall clock.
+
+        Success TTLs are not carried across a restart, so restored optional
+        data is refreshed by the first cycles rather than served until expiry.
+        """
+
+        coord = self.coordinator
+        now_utc = dt_util.utcnow()
+        now_mono = time.monotonic()
+        known = {field.name for field in fields(EndpointFamilyHealth)}
+        for family, values in health_map.items():
+            if not isinstance(values, dict):
+                continue
+            if coord._endpoint_family_policy(family) is None:
+                continue
+            try:
+                health = EndpointFamilyHealth(
+                    **{key: value for key, value in values.items() if key in known}
+                )
+            except TypeError:
+                continue
+            retry_utc = health.next_retry_utc
+            if (
+                health.cooldown_active
+                and isinstance(retry_utc, datetime)
+                and retry_utc > now_utc
+            ):
+                remaining_s = (retry_utc - now_utc).total_seconds()
+                health.next_retry_mono = now_mono + remaining_s
+            else:
+                health.cooldown_active = False
+                health.next_retry_utc = None
+            coord._endpoint_family_health[family] = health
+
+    async def async_restore_state(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            snapshot = await self._store.async_load()
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug(
+                "Failed to load state snapshot for site %s",
+                redact_site_id(self.coordinator.site_id),
+                exc_info=True,
+            )
+            return
+        try:
+            restored = self.apply(snapshot)
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug(
+                "Failed to apply state snapshot for site %s",
+                redact_site_id(self.coordinator.site_id),
+                exc_info=True,
+            )
+            return
+        if restored:
+            _LOGGER.debug(
+                "Restored state snapshot for site %s saved at %s",
+                redact_site_id(self.coordinator.site_id),
+                self.restored_saved_utc,
+            )
+
+    def mark_live(self) -> None:
+        """Record that coordinator state now comes from a live refresh."""
+
+        self.stale = False
+
+    def schedule_save(self) -> None:
+        """Queue a debounced save once coordinator state is live."""
+
+        if self.stale:
+            return
+        self._store.async_delay_save(self.capture, STATE_SNAPSHOT_SAVE_DELAY_S)
+
+    def diagnostics(self) -> dict[str, object]:
+        return {
+            "restored": self.restored_saved_utc is not None,
+            "stale": self.stale,
+            "restored_saved_utc": (
+                self.restored_saved_utc.isoformat()
+                if self.restored_saved_utc is not None
+                else None
+            ),
+        }
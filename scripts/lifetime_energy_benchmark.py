@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Benchmark list and array sums over a synthetic lifetime energy payload."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from pathlib import Path
+import random
+import sys
+import time
+from typing import Sequence
+
+LIFETIME_CHANNELS: tuple[str, ...] = (
+    "production",
+    "consumption",
+    "solar_home",
+    "solar_grid",
+    "grid_home",
+    "import",
+    "export",
+    "charge",
+    "discharge",
+    "solar_battery",
+    "battery_home",
+    "battery_grid",
+    "grid_battery",
+    "evse",
+    "heatpump",
+    "water_heater",
+)
+
+
+def build_payload(
+    *, years: int, channels: int, seed: int = 0
+) -> dict[str, list[float | None]]:
+    """Return daily buckets with occasional gaps, like a normalized payload."""
+
+    rng = random.Random(seed)
+    days = years * 365
+    payload: dict[str, list[float | None]] = {}
+    for index in range(channels):
+        name = (
+            LIFETIME_CHANNELS[index]
+            if index < len(LIFETIME_CHANNELS)
+            else f"channel_{index}"
+        )
+        payload[name] = [
+            None if rng.random() < 0.01 else round(rng.uniform(0, 40_000), 1)
+            for _ in range(days)
+        ]
+    return payload
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(*, years: int, channels: int, repeat: int) -> dict[str, object]:
+    """Time both summing paths and report the memory held by each form.
+
+    The array path pays for converting the payload once per lifetime fetch, so
+    its conversion is timed and reported next to the per-refresh sums.
+    """
+
+    from custom_components.enphase_ev.energy import EnergyManager
+    from custom_components.enphase_ev.energy_buckets import (
+        bucket_sum,
+        compact_lifetime_payload,
+    )
+
+    manager = EnergyManager(
+        client_provider=lambda: None,
+        site_id="benchmark",
+        logger=logging.getLogger(__name__),
+    )
+    payload = build_payload(years=years, channels=channels)
+    coerce = manager._coerce_energy_value  # noqa: SLF001
+    compact = compact_lifetime_payload(payload, coerce)
+
+    def _list_sum() -> dict[str, tuple[float, int]]:
+        return {
+            name: manager._sum_energy_buckets(values, None)  # noqa: SLF001
+            for name, values in payload.items()
+        }
+
+    def _array_convert() -> dict[str, object]:
+        return compact_lifetime_payload(payload, coerce)
+
+    def _array_sum() -> dict[str, tuple[float, int]]:
+        return {name: bucket_sum(values) for name, values in compact.items()}
+
+    list_totals = _list_sum()
+    array_totals = _array_sum()
+    mismatched = [
+        name
+        for name, (total, count) in list_totals.items()
+        if count != array_totals[name][1]
+        or abs(total - array_totals[name][0]) > 1e-6 * max(1.0, abs(total))
+    ]
+    list_bytes = sum(
+        sys.getsizeof(values)
+        + sum(sys.getsizeof(value) for value in values if value is not None)
+        for values in payload.values()
+    )
+    array_bytes = sum(sys.getsizeof(values) for values in compact.values())
+    list_sum_s = _best_of(repeat, _list_sum)
+    array_convert_s = _best_of(repeat, _array_convert)
+    array_sum_s = _best_of(repeat, _array_sum)
+    return {
+        "years": years,
+        "channels": channels,
+        "buckets": sum(len(values) for values in payload.values()),
+        "numpy_loaded": "numpy" in sys.modules,
+        "list_sum_s": list_sum_s,
+        "array_convert_s": array_convert_s,
+        "array_sum_s": array_sum_s,
+        "array_convert_and_sum_s": array_convert_s + array_sum_s,
+        "list_bytes": list_bytes,
+        "array_bytes": array_bytes,
+        "mismatched_channels": mismatched,
+    }
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the list and array('d') lifetime energy bucket sums on a "
+            "synthetic payload."
+        )
+    )
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=Path(__file__).resolve().parents[1],
+        help="Repository root to import the integration from.",
+    )
+    parser.add_argument("--years", type=int, default=10, help="Years of buckets.")
+    parser.add_argument("--channels", type=int, default=16, help="Channel count.")
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Runs per path; the best is kept."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    root = str(args.repo_root.resolve())
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    report = run_benchmark(years=args.years, channels=args.channels, repeat=args.repeat)
+    print(json.dumps(report, indent=2))
+    return 1 if report["mismatched_channels"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Benchmark the Live Status frame decoder over synthetic recorded frames."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import time
+from typing import Sequence
+
+FRAME_BYTES = 168
+
+
+def _varint(value: int) -> bytes:
+    value &= (1 << 64) - 1
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _field(number: int, value: int | bytes) -> bytes:
+    if isinstance(value, bytes):
+        return _varint(number << 3 | 2) + _varint(len(value)) + value
+    return _varint(number << 3) + _varint(value)
+
+
+def build_frames(*, count: int, seed: int = 0) -> list[bytes]:
+    """Return frames shaped like Live Status samples, padded to 168 bytes.
+
+    Each power group carries the documented value plus unrelated fields,
+    and a trailing unknown field pads the frame to ``FRAME_BYTES``.
+    """
+
+    rng = random.Random(seed)
+    frames: list[bytes] = []
+    for index in range(count):
+        solar = rng.randint(0, 12_000_000_000)
+        battery = rng.randint(-5_000_000_000, 5_000_000_000)
+        grid = rng.randint(-10_000_000_000, 10_000_000_000)
+        evse = rng.choice((0, rng.randint(1_000_000_000, 11_000_000_000)))
+
+        def _group(*values: int) -> bytes:
+            return b"".join(
+                _field(number, value) for number, value in enumerate(values, 1)
+            ) + _field(9, rng.getrandbits(48))
+
+        status = (
+            _field(1, _group(solar, rng.getrandbits(32)))
+            + _field(2, _group(battery))
+            + _field(3, _group(grid))
+            + _field(4, _group(solar + battery + grid, evse))
+            + _field(5, rng.randint(0, 3))
+            + _field(6, rng.randint(0, 100))
+        )
+        head = _field(1, 1_700_000_000 + index) + _field(2, rng.randbytes(8))
+        frame = head + _field(3, status)
+        padding = FRAME_BYTES - len(frame) - 2
+        frames.append(frame + _field(15, rng.randbytes(max(padding, 0))))
+    return frames
+
+
+def _message_fields(data: bytes) -> dict[int, list[int | bytes]]:
+    """Decode one message level into copies, like a generic parser would."""
+
+    def _read(pos: int) -> tuple[int, int]:
+        value = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, pos
+            shift += 7
+
+    fields: dict[int, list[int | bytes]] = {}
+    pos = 0
+    while pos < len(data):
+        key, pos = _read(pos)
+        value: int | bytes
+        if key & 0x7 == 0:
+            value, pos = _read(pos)
+            if value >= 1 << 63:
+                value -= 1 << 64
+        else:
+            length, pos = _read(pos)
+            value, pos = data[pos : pos + length], pos + length
+        fields.setdefault(key >> 3, []).append(value)
+    return fields
+
+
+def baseline_decode(frame: bytes, paths: dict[str, tuple[int, ...]]) -> dict:
+    """Resolve paths by fully decoding each message level they pass through."""
+
+    levels: dict[tuple[int, ...], dict[int, list[int | bytes]] | None] = {
+        (): _message_fields(frame)
+    }
+    out: dict[str, int] = {}
+    for name, path in paths.items():
+        level = levels[()]
+        for depth in range(1, len(path)):
+            prefix = path[:depth]
+            if prefix not in levels:
+                nested = next(
+                    (v for v in level.get(path[depth - 1], ()) if isinstance(v, bytes)),
+                    None,
+                )
+                levels[prefix] = None if nested is None else _message_fields(nested)
+            level = levels[prefix]
+            if level is None:
+                break
+        else:
+            value = next(
+                (v for v in level.get(path[-1], ()) if isinstance(v, int)), None
+            )
+            if value is not None:
+                out[name] = value
+    return out
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(*, frames: int, repeat: int) -> dict[str, object]:
+    """Time the path-table decoder against a full decode of the same frames."""
+
+    from custom_components.enphase_ev.live_status_frame import (
+        LIVE_STATUS_FIELD_PATHS,
+        FrameDecoder,
+    )
+
+    payloads = build_frames(count=frames)
+    decoder = FrameDecoder(LIVE_STATUS_FIELD_PATHS)
+    mismatched = sum(
+        1
+        for payload in payloads
+        if decoder.decode(payload) != baseline_decode(payload, LIVE_STATUS_FIELD_PATHS)
+    )
+    decoder_s = _best_of(repeat, lambda: [decoder.decode(p) for p in payloads])
+    baseline_s = _best_of(
+        repeat,
+        lambda: [baseline_decode(p, LIVE_STATUS_FIELD_PATHS) for p in payloads],
+    )
+    return {
+        "frames": frames,
+        "frame_bytes": round(sum(map(len, payloads)) / max(frames, 1), 1),
+        "decoder_us_per_frame": decoder_s / max(frames, 1) * 1e6,
+        "baseline_us_per_frame": baseline_s / max(frames, 1) * 1e6,
+        "mismatched_frames": mismatched,
+    }
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the Live Status path-table frame decoder with a full "
+            "message decode on synthetic frames."
+        )
+    )
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=Path(__file__).resolve().parents[1],
+        help="Repository root to import the integration from.",
+    )
+    parser.add_argument("--frames", type=int, default=5000, help="Frame count.")
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Runs per path; the best is kept."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    root = str(args.repo_root.resolve())
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    report = run_benchmark(frames=args.frames, repeat=args.repeat)
+    print(json.dumps(report, indent=2))
+    return 1 if report["mismatched_frames"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
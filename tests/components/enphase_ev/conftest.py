@@ -320,6 +320,14 @@ def mock_issue_registry(monkeypatch) -> SimpleNamespace:
     return SimpleNamespace(created=created, deleted=deleted)
 
 
+@pytest.fixture(autouse=True)
+def reset_enlighten_request_budgets(monkeypatch):
+    """Give each test fresh account request budgets."""
+    from custom_components.enphase_ev import api
+
+    monkeypatch.setattr(api, "_enlighten_request_budgets", {})
+
+
 @pytest.fixture(autouse=True)
 def mock_clientsession(monkeypatch):
     """Stub out aiohttp client session factory used by the integration."""
@@ -340,6 +348,8 @@ def mock_clientsession(monkeypatch):
 def coordinator_factory(hass, mock_clientsession, mock_issue_registry, monkeypatch):
     """Return a factory that builds a patched EnphaseCoordinator instance."""
     from custom_components.enphase_ev import coordinator as coord_mod
+    from custom_components.enphase_ev import evse_fast_lane as evse_fast_lane_mod
+    from custom_components.enphase_ev import family_scheduler as family_scheduler_mod
     from custom_components.enphase_ev.const import (
         CONF_COOKIE,
         CONF_EAUTH,
@@ -354,6 +364,16 @@ def coordinator_factory(hass, mock_clientsession, mock_issue_registry, monkeypat
         "async_call_later",
         lambda *_args, **_kwargs: (lambda: None),
     )
+    monkeypatch.setattr(
+        family_scheduler_mod,
+        "async_call_later",
+        lambda *_args, **_kwargs: (lambda: None),
+    )
+    monkeypatch.setattr(
+        evse_fast_lane_mod,
+        "async_call_later",
+        lambda *_args, **_kwargs: (lambda: None),
+    )
 
     def _factory(
         *,
@@ -443,6 +463,12 @@ def setup_integration(
                     new=AsyncMock(return_value=None),
                 )
             )
+            stack.enter_context(
+                patch(
+                    "custom_components.enphase_ev.state_snapshot.CoordinatorStateSnapshotManager.async_restore_state",
+                    new=AsyncMock(return_value=None),
+                )
+            )
             stack.enter_context(
                 patch(
                     "custom_components.enphase_ev.refresh_runner.CoordinatorRefreshRunner.async_start_startup_warmup",
@@ -1803,6 +1803,7 @@ async def test_evse_feature_flags_uses_endpoint_and_optional_country() -> None:
         "GET",
         f"{api.BASE_URL}/service/evse_management/api/v1/config/feature-flags?site_id=SITE&country=DE",
         headers=client._today_headers(),
+        conditional_family="evse_feature_flags",
     )
 
 
@@ -2336,6 +2337,7 @@ async def test_devices_inventory_uses_devices_json_endpoint() -> None:
         "GET",
         f"{api.BASE_URL}/app-api/SITE/devices.json",
         headers=client._history_headers(),
+        conditional_family="devices_inventory",
     )
 
 
@@ -2361,6 +2363,7 @@ async def test_devices_tree_uses_system_dashboard_endpoint_and_headers() -> None
         "GET",
         f"{api.BASE_URL}/service/system_dashboard/api_internal/dashboard/sites/SITE/devices-tree",
         headers=client._system_dashboard_headers(),
+        conditional_family="devices_tree",
     )
 
 
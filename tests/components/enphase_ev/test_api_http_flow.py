@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
+from collections import deque
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -110,6 +112,524 @@ def test_should_limit_enlighten_read_request_handles_bad_string_casts() -> None:
     assert api._should_limit_enlighten_read_request("GET", BadUrl()) is False
 
 
+def test_enlighten_request_lane_classifies_requests() -> None:
+    status_url = f"{api.BASE_URL}/service/evse_controller/1/ev_chargers/status"
+
+    assert api._enlighten_request_lane("GET", "https://other.test/x") is None
+    assert api._enlighten_request_lane("POST", "https://other.test/x") is None
+    assert api._enlighten_request_lane("GET", status_url) == "evse_status"
+    assert api._enlighten_request_lane("GET", f"{api.BASE_URL}/x") == "state"
+    assert api._enlighten_request_lane("PUT", f"{api.BASE_URL}/x") == "control"
+    with api.enlighten_request_lane("optional"):
+        assert api._enlighten_request_lane("GET", status_url) == "optional"
+    with api.enlighten_request_lane("unknown"):
+        assert api._enlighten_request_lane("GET", f"{api.BASE_URL}/x") == "state"
+
+    class BadUrl:
+        def __str__(self) -> str:
+            raise RuntimeError("boom")
+
+    assert api._enlighten_request_lane("POST", BadUrl()) is None
+
+
+@pytest.mark.asyncio
+async def test_request_scheduler_round_robins_sites_within_lane() -> None:
+    scheduler = api.EnlightenRequestScheduler(concurrency=1)
+    order: list[str] = []
+
+    await scheduler.acquire("busy", "state")
+
+    async def _request(site: str) -> None:
+        async with scheduler.slot(site, "state"):
+            order.append(site)
+
+    tasks = [asyncio.create_task(_request("busy")) for _ in range(3)]
+    tasks.append(asyncio.create_task(_request("quiet")))
+    await asyncio.sleep(0)
+    assert scheduler.diagnostics()["queued"]["state"] == 4
+
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["busy", "quiet", "busy", "busy"]
+    assert scheduler.in_flight == 0
+    quiet = scheduler.diagnostics("quiet")["state"]
+    assert quiet["granted"] == 1
+    assert quiet["queued"] == 0
+    assert quiet["max_wait_s"] >= 0
+    assert scheduler.diagnostics("missing") == {}
+
+
+@pytest.mark.asyncio
+async def test_request_scheduler_prioritises_lanes_and_admits_control() -> None:
+    scheduler = api.EnlightenRequestScheduler(concurrency=1)
+    order: list[str] = []
+
+    await scheduler.acquire("site", "state")
+
+    async def _request(lane: str) -> None:
+        async with scheduler.slot("site", lane):
+            order.append(lane)
+
+    tasks = [
+        asyncio.create_task(_request(lane))
+        for lane in ("optional", "state", "evse_status", "bogus")
+    ]
+    await asyncio.sleep(0)
+
+    assert await scheduler.acquire("site", "control") == 0.0
+    assert scheduler.in_flight == 2
+    scheduler.release()
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["evse_status", "state", "bogus", "optional"]
+    assert scheduler.diagnostics("site")["control"]["granted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_request_scheduler_handles_cancelled_waiters() -> None:
+    scheduler = api.EnlightenRequestScheduler(concurrency=1)
+    await scheduler.acquire(None, "state")
+
+    waiter = asyncio.create_task(scheduler.acquire("site", "optional"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert scheduler.diagnostics()["queued"]["optional"] == 0
+
+    granted = asyncio.create_task(scheduler.acquire("site", "state"))
+    await asyncio.sleep(0)
+    scheduler.release()
+    granted.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await granted
+    assert scheduler.in_flight == 0
+
+    scheduler._discard_waiter("site", "state", asyncio.Future())
+    scheduler._queues["state"]["site"] = deque([asyncio.Future()])
+    scheduler._discard_waiter("site", "state", asyncio.Future())
+    scheduler._drop_site("site", "state")
+    scheduler._drop_site("site", "state")
+    assert scheduler.diagnostics()["site_count"] == 2
+
+    class BadSite:
+        def __str__(self) -> str:
+            raise RuntimeError("boom")
+
+    assert scheduler._site_key(BadSite()) == "_global"
+
+
+@pytest.mark.asyncio
+async def test_request_scheduler_skips_waiters_finished_elsewhere() -> None:
+    scheduler = api.EnlightenRequestScheduler(concurrency=1)
+    stale: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    stale.cancel()
+    scheduler._queues["state"]["site"] = deque([stale])
+    scheduler._rings["state"].append("site")
+
+    scheduler._dispatch()
+
+    assert scheduler.in_flight == 0
+    assert scheduler.diagnostics()["queued"]["state"] == 0
+
+
+@pytest.mark.asyncio
+async def test_enlighten_request_guard_uses_site_scheduler(monkeypatch) -> None:
+    scheduler = api.EnlightenRequestScheduler(concurrency=1)
+    monkeypatch.setattr(api, "_enlighten_request_scheduler", scheduler)
+    client = api.EnphaseEVClient(
+        FakeSession([FakeResponse(json_body={"ok": True})]), "SITE", None, None
+    )
+
+    assert await client._json("GET", f"{api.BASE_URL}/data") == {"ok": True}
+    async with api._enlighten_read_request_guard("GET", "https://other.test"):
+        assert scheduler.in_flight == 0
+
+    diagnostics = client.request_scheduler_diagnostics()
+    assert diagnostics["concurrency"] == 1
+    assert diagnostics["lanes"]["state"]["granted"] == 1
+    assert api._get_enlighten_request_scheduler() is scheduler
+    monkeypatch.setattr(api, "_enlighten_request_scheduler", None)
+    assert isinstance(
+        api._get_enlighten_request_scheduler(), api.EnlightenRequestScheduler
+    )
+
+
+@pytest.mark.asyncio
+async def test_json_conditional_get_revalidates_with_etag() -> None:
+    session = FakeSession(
+        [
+            FakeResponse(
+                headers={"Content-Type": "application/json", "ETag": '"v1"'},
+                json_body={"devices": [1]},
+            ),
+            FakeResponse(status=304, headers={"ETag": '"v2"'}),
+            FakeResponse(status=304, headers={}),
+        ]
+    )
+    client = api.EnphaseEVClient(session, "SITE", None, "COOKIE")
+    url = f"{api.BASE_URL}/app-api/SITE/devices.json"
+
+    first = await client._json("GET", url, conditional_family="devices_inventory")
+    first["devices"].append(2)
+    second = await client._json("GET", url, conditional_family="devices_inventory")
+    third = await client._json("GET", url, conditional_family="devices_inventory")
+
+    assert second == {"devices": [1]}
+    assert third == {"devices": [1]}
+    assert "If-None-Match" not in session.calls[0][2]["headers"]
+    assert session.calls[1][2]["headers"]["If-None-Match"] == '"v1"'
+    assert session.calls[2][2]["headers"]["If-None-Match"] == '"v2"'
+    assert client.conditional_get_diagnostics() == {
+        "entries": 1,
+        "families": {"devices_inventory": {"hits": 0, "not_modified": 2, "misses": 1}},
+    }
+    client.clear_conditional_get_cache()
+    assert client.conditional_get_diagnostics()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_json_conditional_get_serves_fresh_entries_without_request() -> None:
+    session = FakeSession(
+        [
+            FakeResponse(
+                headers={
+                    "Cache-Control": "private, max-age=300",
+                    "Last-Modified": "Tue, 01 Jul 2025 00:00:00 GMT",
+                },
+                json_body={"tariff": 1},
+            ),
+            FakeResponse(
+                status=304, headers={"Cache-Control": "max-age=60"}, json_body=None
+            ),
+        ]
+    )
+    client = api.EnphaseEVClient(session, "SITE", None, "COOKIE")
+    url = f"{api.BASE_URL}/tariff"
+    params = {"include-site-details": "true"}
+
+    await client._json("GET", url, params=params, conditional_family="site_tariff")
+    assert await client._json(
+        "GET", url, params=params, conditional_family="site_tariff"
+    ) == {"tariff": 1}
+    assert len(session.calls) == 1
+
+    entry = next(iter(client._conditional_get_cache.values()))
+    entry.fresh_until_mono = 0.0
+    assert await client._json(
+        "GET", url, params=params, conditional_family="site_tariff"
+    ) == {"tariff": 1}
+    assert (
+        session.calls[1][2]["headers"]["If-Modified-Since"]
+        == "Tue, 01 Jul 2025 00:00:00 GMT"
+    )
+    assert entry.fresh()
+    assert client.conditional_get_diagnostics()["families"]["site_tariff"] == {
+        "hits": 1,
+        "not_modified": 1,
+        "misses": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_json_conditional_get_respects_cache_control_and_scope() -> None:
+    session = FakeSession(
+        [
+            FakeResponse(
+                headers={"ETag": '"a"', "Cache-Control": "no-store"},
+                json_body={"n": 1},
+            ),
+            FakeResponse(headers={"Cache-Control": "max-age=0"}, json_body={"n": 2}),
+            FakeResponse(
+                headers={"ETag": '"b"', "Cache-Control": "no-cache, max-age=30"},
+                json_body={"n": 3},
+            ),
+            FakeResponse(headers={"ETag": '"c"'}, json_body={"n": 4}),
+            FakeResponse(headers={"ETag": '"d"'}, json_body={"n": 5}),
+        ]
+    )
+    client = api.EnphaseEVClient(session, "SITE", None, "COOKIE")
+    url = f"{api.BASE_URL}/flags"
+
+    await client._json("GET", url, conditional_family="evse_feature_flags")
+    await client._json("GET", url, conditional_family="evse_feature_flags")
+    assert client._conditional_get_cache == {}
+    await client._json("GET", url, conditional_family="evse_feature_flags")
+    entry = next(iter(client._conditional_get_cache.values()))
+    assert entry.fresh_until_mono is None
+    assert not entry.fresh()
+
+    client.update_credentials(cookie="OTHER")
+    await client._json("GET", url, conditional_family="evse_feature_flags")
+    assert "If-None-Match" not in session.calls[3][2]["headers"]
+    assert len(client._conditional_get_cache) == 2
+
+    await client._json("POST", url, conditional_family="evse_feature_flags")
+    assert "If-None-Match" not in session.calls[4][2]["headers"]
+    assert len(client._conditional_get_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_json_conditional_get_cache_is_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(api, "_CONDITIONAL_GET_CACHE_LIMIT", 2)
+    session = FakeSession(
+        [
+            FakeResponse(headers={"ETag": f'"{idx}"'}, json_body={"idx": idx})
+            for idx in range(3)
+        ]
+    )
+    client = api.EnphaseEVClient(session, "SITE", None, None)
+
+    for idx in range(3):
+        await client._json(
+            "GET", f"{api.BASE_URL}/tree/{idx}", conditional_family="devices_tree"
+        )
+
+    assert [key[1] for key in client._conditional_get_cache] == [
+        f"{api.BASE_URL}/tree/1",
+        f"{api.BASE_URL}/tree/2",
+    ]
+
+
+class GatedSession(FakeSession):
+    """FakeSession whose responses wait on an event before resolving."""
+
+    def __init__(self, responses: list[FakeResponse]) -> None:
+        super().__init__(responses)
+        self.gate = asyncio.Event()
+        self.started = asyncio.Event()
+
+    def request(self, method: str, url: str, allow_redirects: bool = True, **kwargs):
+        resp = super().request(method, url, allow_redirects, **kwargs)
+        session = self
+
+        class _Gated:
+            async def __aenter__(self):
+                session.started.set()
+                await session.gate.wait()
+                return resp
+
+            async def __aexit__(self, exc_type, exc, tb) -> bool:
+                return False
+
+        return _Gated()
+
+
+@pytest.mark.asyncio
+async def test_json_single_flight_coalesces_identical_gets() -> None:
+    session = GatedSession([FakeResponse(json_body={"items": [1]})])
+    client = api.EnphaseEVClient(session, "SITE", None, "COOKIE")
+    url = f"{api.BASE_URL}/pv/settings/SITE/battery"
+
+    tasks = [
+        asyncio.create_task(
+            client._json("GET", url, params={"a": 1}, headers={"X": "1"})
+        )
+        for _ in range(3)
+    ]
+    await session.started.wait()
+    await asyncio.sleep(0)
+    assert client.single_flight_diagnostics() == {
+        "in_flight": 1,
+        "waiting": 2,
+        "leaders": 1,
+        "coalesced_waiters": 2,
+        "max_waiters": 2,
+    }
+    session.gate.set()
+    results = await asyncio.gather(*tasks)
+
+    assert len(session.calls) == 1
+    assert results == [{"items": [1]}] * 3
+    results[1]["items"].append(2)
+    assert results[0] == {"items": [1]}
+    assert client.single_flight_diagnostics()["in_flight"] == 0
+    assert client.single_flight_diagnostics()["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_json_single_flight_isolates_waiters_from_leader_mutation() -> None:
+    session = GatedSession([FakeResponse(json_body={"items": [1]})])
+    client = api.EnphaseEVClient(session, "SITE", None, "COOKIE")
+    url = f"{api.BASE_URL}/pv/settings/SITE/battery"
+
+    async def _leader() -> dict:
+        payload = await client._json("GET", url)
+        payload["items"].append(99)
+        return payload
+
+    leader = asyncio.create_task(_leader())
+    await session.started.wait()
+    waiter = asyncio.create_task(client._json("GET", url))
+    await asyncio.sleep(0)
+    session.gate.set()
+
+    assert await leader == {"items": [1, 99]}
+    assert await waiter == {"items": [1]}
+    assert len(session.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_json_single_flight_shares_errors_and_bypasses_writes() -> None:
+    session = GatedSession(
+        [
+            FakeResponse(status=500, headers={}),
+            FakeResponse(json_body={"ok": 1}),
+            FakeResponse(json_body={"ok": 2}),
+            FakeResponse(json_body={"ok": 3}),
+        ]
+    )
+    client = api.EnphaseEVClient(session, "SITE", None, "COOKIE")
+    url = f"{api.BASE_URL}/data"
+
+    tasks = [asyncio.create_task(client._json("GET", url)) for _ in range(2)]
+    await session.started.wait()
+    session.gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(err, aiohttp.ClientResponseError) for err in results)
+    assert len(session.calls) == 1
+
+    await asyncio.gather(
+        client._json("POST", url, json={"a": 1}),
+        client._json("GET", url, params="raw"),
+        client._json("GET", url, data="body"),
+    )
+    assert len(session.calls) == 4
+    assert client.single_flight_diagnostics()["leaders"] == 1
+
+
+@pytest.mark.asyncio
+async def test_json_single_flight_waiter_takes_over_cancelled_leader() -> None:
+    session = GatedSession(
+        [FakeResponse(json_body={"n": 1}), FakeResponse(json_body={"n": 2})]
+    )
+    client = api.EnphaseEVClient(session, "SITE", None, "COOKIE")
+    url = f"{api.BASE_URL}/data"
+
+    leader = asyncio.create_task(
+        client._json("GET", url, headers=lambda: {"X-Attempt": "1"})
+    )
+    await session.started.wait()
+    waiter = asyncio.create_task(
+        client._json("GET", url, headers=lambda: {"X-Attempt": "1"})
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    session.gate.set()
+
+    assert await waiter == {"n": 2}
+    assert len(session.calls) == 2
+    assert client.single_flight_diagnostics()["leaders"] == 2
+
+
+@pytest.mark.asyncio
+async def test_json_single_flight_cancelled_waiter_leaves_leader_running() -> None:
+    session = GatedSession([FakeResponse(json_body={"n": 1})])
+    client = api.EnphaseEVClient(session, "SITE", None, "COOKIE")
+    url = f"{api.BASE_URL}/data"
+
+    leader = asyncio.create_task(client._json("GET", url))
+    await session.started.wait()
+    waiter = asyncio.create_task(client._json("GET", url))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    session.gate.set()
+
+    assert await leader == {"n": 1}
+    assert client.single_flight_diagnostics()["waiting"] == 0
+
+
+def test_conditional_get_header_helpers_ignore_unusable_headers() -> None:
+    class _BadHeaders:
+        def get(self, _name):
+            raise RuntimeError("boom")
+
+    assert api._response_header_text(None, "ETag") is None
+    assert api._response_header_text(_BadHeaders(), "ETag") is None
+    assert api._response_header_text({"ETag": 1}, "ETag") is None
+    assert api._response_header_text({"ETag": "  "}, "ETag") is None
+    assert api._conditional_get_freshness({}) == (True, None)
+    assert api._conditional_get_freshness({"Cache-Control": "max-age=5"}) == (
+        True,
+        5.0,
+    )
+
+
+def test_request_budget_refills_and_projects_recovery() -> None:
+    now = [0.0]
+    budget = api.EnlightenRequestBudget(
+        360, burst=3, optional_reserve=2, clock=lambda: now[0]
+    )
+
+    for _ in range(4):
+        budget.consume()
+    assert budget.tokens == 0.0
+    assert budget.seconds_until(2) == 20.0
+    assert budget.should_skip("SITE", "hems") is True
+    now[0] = 5.0
+    assert budget.should_skip("SITE", "hems") is True
+
+    diagnostics = budget.diagnostics()
+    assert diagnostics["consumed"] == 4
+    assert diagnostics["overdrafts"] == 1
+    assert diagnostics["requests_last_hour"] == 4
+    assert diagnostics["optional_recovery_s"] == 15.0
+    assert diagnostics["full_recovery_s"] == 25.0
+    assert diagnostics["skipped_families"] == {
+        "hems": {"count": 2, "skipped_for_s": 5.0}
+    }
+    assert budget.diagnostics("OTHER")["skipped_families"] == {}
+
+    now[0] = 3600.0
+    assert budget.should_skip("SITE", "hems") is False
+    assert budget.tokens == 3.0
+    assert budget.diagnostics()["requests_last_hour"] == 0
+    assert budget.seconds_until(10) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_request_budget_is_shared_per_account_and_meters_requests(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(api, "_enlighten_request_budgets", {})
+    text_response = FakeResponse(headers={"Content-Type": "text/plain"}, text_body="ok")
+    text_response.url = f"{api.BASE_URL}/page"
+    session = FakeSession([FakeResponse(json_body={"ok": True}), text_response])
+    first = api.EnphaseEVClient(
+        session, "SITE", None, None, request_budget_account=" User@Example.com "
+    )
+    second = api.EnphaseEVClient(
+        session, "OTHER", None, None, request_budget_account="user@example.com"
+    )
+    third = api.EnphaseEVClient(session, "THIRD", None, None)
+    assert first.request_budget is second.request_budget
+    assert third.request_budget is not first.request_budget
+    assert list(api._enlighten_request_budgets) == [
+        api._request_budget_account_key("user@example.com"),
+    ]
+
+    await first._json("GET", f"{api.BASE_URL}/data")
+    await second._text_response("GET", f"{api.BASE_URL}/page")
+
+    diagnostics = first.request_budget_diagnostics()
+    assert diagnostics["consumed"] == 2
+    assert diagnostics["per_hour"] == api.REQUEST_BUDGET_PER_HOUR
+
+    first.release_request_budget()
+    third.release_request_budget()
+    assert list(api._enlighten_request_budgets) == [
+        api._request_budget_account_key("user@example.com"),
+    ]
+    second.release_request_budget()
+    assert api._enlighten_request_budgets == {}
+
+
 def test_cookie_header_from_map_empty() -> None:
     assert api._cookie_header_from_map(None) == ""
     assert api._cookie_header_from_map({}) == ""
@@ -3,11 +3,13 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
+from homeassistant.util import dt as dt_util
 import pytest
 
 from custom_components.enphase_ev import DOMAIN
 from custom_components.enphase_ev.calendar import (
     BackupHistoryCalendarEntity,
+    ChargingSessionsCalendarEntity,
     async_setup_entry,
 )
 from custom_components.enphase_ev.runtime_data import EnphaseRuntimeData
@@ -364,3 +366,51 @@ async def test_backup_history_calendar_get_events_accepts_naive_range(
         datetime(2026, 2, 2, 0, 0),
     )
     assert len(events) == 1
+
+
+@pytest.mark.asyncio
+async def test_charging_sessions_calendar_reads_archive_index(
+    hass, config_entry, coordinator_factory
+) -> None:
+    coord = coordinator_factory()
+    config_entry.runtime_data = EnphaseRuntimeData(coordinator=coord)
+    added = []
+
+    def _capture(entities, update_before_add=False):
+        added.extend(entities)
+
+    await async_setup_entry(hass, config_entry, _capture)
+    entities = [ent for ent in added if isinstance(ent, ChargingSessionsCalendarEntity)]
+    assert [ent.unique_id for ent in entities] == [
+        f"{DOMAIN}_{sn}_charging_sessions" for sn in coord.iter_serials()
+    ]
+    entity = entities[0]
+    sn = entity._sn  # noqa: SLF001
+
+    start = datetime(2026, 2, 1, 22, 0, tzinfo=timezone.utc)
+    coord.session_archive._loaded = True  # noqa: SLF001
+    coord.session_archive.put(
+        sn,
+        dt_util.now().strftime("%Y-%m-%d"),
+        [
+            {
+                "session_id": "s1",
+                "start": start.isoformat(),
+                "end": (start + timedelta(hours=3)).isoformat(),
+                "energy_kwh_total": 7.25,
+            }
+        ],
+        closed=False,
+    )
+
+    events = await entity.async_get_events(
+        hass, datetime(2026, 2, 2, 0, 0), datetime(2026, 2, 3, 0, 0)
+    )
+    assert [(event.uid, event.description) for event in events] == [("s1", "7.250 kWh")]
+    assert (
+        await entity.async_get_events(
+            hass, start - timedelta(hours=2), start - timedelta(hours=1)
+        )
+        == []
+    )
+    assert entity.event is None
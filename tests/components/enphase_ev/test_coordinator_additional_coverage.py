@@ -65,6 +65,7 @@ from custom_components.enphase_ev.evse_runtime import (
     FAST_TOGGLE_POLL_HOLD_S,
     GREEN_BATTERY_CACHE_TTL,
     STREAMING_DEFAULT_DURATION_S,
+    SUSPENDED_EVSE_STATUS,
     EvseRuntime,
 )
 from custom_components.enphase_ev.session_history import MIN_SESSION_HISTORY_CACHE_TTL
@@ -1258,9 +1259,11 @@ def test_cleanup_runtime_state_clears_session_history(coordinator_factory):
     coord._streaming_until = 123.0  # noqa: SLF001
     coord._streaming_manual = True  # noqa: SLF001
     coord._streaming_targets = {"EV1": True}  # noqa: SLF001
+    coord.client.release_request_budget = MagicMock()
 
     coord.cleanup_runtime_state()
 
+    coord.client.release_request_budget.assert_called_once_with()
     warmup_task.cancel.assert_called_once()
     stream_stop_task.cancel.assert_called_once()
     amp_restart_task.cancel.assert_called_once()
@@ -1822,7 +1825,7 @@ def test_sync_desired_charging_schedules_auto_resume(coordinator_factory, monkey
             "sn": sn,
             "charging": False,
             "plugged": True,
-            "connector_status": coord_mod.SUSPENDED_EVSE_STATUS,
+            "connector_status": SUSPENDED_EVSE_STATUS,
         }
     }
     created = []
@@ -1959,7 +1962,7 @@ async def test_async_update_data_success_enriches_payload(
                 },
                 "connectors": [
                     {
-                        "connectorStatusType": coord_mod.SUSPENDED_EVSE_STATUS,
+                        "connectorStatusType": SUSPENDED_EVSE_STATUS,
                         "commissioned": "true",
                     }
                 ],
@@ -2061,7 +2064,7 @@ async def test_async_update_data_preserves_known_charge_preference_when_status_o
                     "name": "Garage EV",
                     "connectors": [
                         {
-                            "connectorStatusType": coord_mod.SUSPENDED_EVSE_STATUS,
+                            "connectorStatusType": SUSPENDED_EVSE_STATUS,
                             "connectorStatusReason": "INSUFFICIENT_SOLAR",
                         }
                     ],
@@ -2141,7 +2144,7 @@ async def test_async_update_data_uses_cached_charge_preference_when_status_only_
                     "name": "Garage EV",
                     "connectors": [
                         {
-                            "connectorStatusType": coord_mod.SUSPENDED_EVSE_STATUS,
+                            "connectorStatusType": SUSPENDED_EVSE_STATUS,
                             "connectorStatusReason": "INSUFFICIENT_SOLAR",
                         }
                     ],
@@ -2223,7 +2226,7 @@ async def test_async_update_data_uses_status_mode_for_effective_charge_mode(
                     "mode": 0,
                     "connectors": [
                         {
-                            "connectorStatusType": coord_mod.SUSPENDED_EVSE_STATUS,
+                            "connectorStatusType": SUSPENDED_EVSE_STATUS,
                             "connectorStatusReason": "INSUFFICIENT_SOLAR",
                         }
                     ],
@@ -2306,7 +2309,7 @@ async def test_async_update_data_drops_expired_cached_charge_preference_when_sta
                     "name": "Garage EV",
                     "connectors": [
                         {
-                            "connectorStatusType": coord_mod.SUSPENDED_EVSE_STATUS,
+                            "connectorStatusType": SUSPENDED_EVSE_STATUS,
                             "connectorStatusReason": "INSUFFICIENT_SOLAR",
                         }
                     ],
@@ -2390,7 +2393,7 @@ async def test_async_update_data_uses_battery_profile_charge_mode_when_scheduler
                     "name": "Garage EV",
                     "connectors": [
                         {
-                            "connectorStatusType": coord_mod.SUSPENDED_EVSE_STATUS,
+                            "connectorStatusType": SUSPENDED_EVSE_STATUS,
                             "connectorStatusReason": "INSUFFICIENT_SOLAR",
                         }
                     ],
@@ -2466,7 +2469,7 @@ async def test_async_update_data_uses_green_schedule_type_when_scheduler_pref_mi
                     "name": "Garage EV",
                     "connectors": [
                         {
-                            "connectorStatusType": coord_mod.SUSPENDED_EVSE_STATUS,
+                            "connectorStatusType": SUSPENDED_EVSE_STATUS,
                             "connectorStatusReason": "INSUFFICIENT_SOLAR",
                         }
                     ],
@@ -2533,9 +2536,7 @@ async def test_async_update_data_handles_numeric_ts(
                 "charging": True,
                 "pluggedIn": True,
                 "faulted": False,
-                "connectors": [
-                    {"connectorStatusType": coord_mod.SUSPENDED_EVSE_STATUS}
-                ],
+                "connectors": [{"connectorStatusType": SUSPENDED_EVSE_STATUS}],
                 "sch_d": {"status": "enabled", "info": [{}]},
                 "session_d": {"start_time": 1700000000, "plg_in_at": None},
             }
@@ -2592,6 +2593,27 @@ def test_determine_polling_state_handles_options(hass):
     assert state["slow"] == 75
 
 
+def test_determine_polling_state_moves_charging_serials_to_fast_lane(hass):
+    coord = _attach_evse_runtime(EnphaseCoordinator.__new__(EnphaseCoordinator))
+    coord._fast_until = None
+    coord._streaming = False
+    coord._streaming_until = None
+    coord.config_entry = SimpleNamespace(options={})
+    data = {"B": {"charging": True}, "A": {"charging": True}, "C": {}}
+
+    state = coord._determine_polling_state(data)
+    assert state["charging_now"] is True
+    assert state["want_fast"] is False
+    assert state["fast_lane_serials"] == ("A", "B")
+    assert state["target"] == state["slow"]
+
+    coord._fast_until = coord_mod.time.monotonic() + 5
+    state = coord._determine_polling_state(data)
+    assert state["want_fast"] is True
+    assert state["fast_lane_serials"] == ()
+    assert state["target"] == state["fast"]
+
+
 def test_determine_polling_state_clamps_low_intervals(coordinator_factory):
     coord = coordinator_factory()
     coord.config_entry = SimpleNamespace(
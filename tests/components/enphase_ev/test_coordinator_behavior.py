@@ -31,6 +31,7 @@ from custom_components.enphase_ev.const import (
     OPT_NOMINAL_VOLTAGE,
     OPT_SESSION_HISTORY_INTERVAL,
 )
+from custom_components.enphase_ev import evse_runtime as evse_runtime_mod
 from custom_components.enphase_ev.evse_runtime import (
     FAST_TOGGLE_POLL_HOLD_S,
     ChargeModeResolution,
@@ -2514,6 +2515,7 @@ async def test_async_start_charging_green_mode_omits_amp_payload(hass, monkeypat
 @pytest.mark.asyncio
 async def test_schedule_amp_restart_cancels_existing_task(hass, monkeypatch):
     coord = _make_coordinator(hass, monkeypatch)
+    monkeypatch.setattr(evse_runtime_mod, "AMP_RESTART_DEBOUNCE_S", 0.0)
     pending = asyncio.Future()
     coord._amp_restart_tasks[RANDOM_SERIAL] = pending
 
@@ -2545,6 +2547,7 @@ async def test_schedule_amp_restart_cancels_existing_task(hass, monkeypatch):
 @pytest.mark.asyncio
 async def test_schedule_amp_restart_handles_typeerror(hass, monkeypatch):
     coord = _make_coordinator(hass, monkeypatch)
+    monkeypatch.setattr(evse_runtime_mod, "AMP_RESTART_DEBOUNCE_S", 0.0)
 
     calls: list[tuple[str, float]] = []
 
@@ -4620,7 +4623,8 @@ async def test_dynamic_poll_switch(hass, monkeypatch):
         async def status(self):
             return self._payload
 
-    # Charging -> fast
+    # Charging alone keeps the full refresh slow and moves the charger to the
+    # fast lane
     payload_charging = {
         "evChargerData": [
             {
@@ -4633,7 +4637,8 @@ async def test_dynamic_poll_switch(hass, monkeypatch):
     }
     coord.client = StubClient(payload_charging)
     coord.data = await coord._async_update_data()
-    assert int(coord.update_interval.total_seconds()) == MIN_FAST_POLL_INTERVAL
+    assert int(coord.update_interval.total_seconds()) == MIN_SLOW_POLL_INTERVAL
+    assert coord.evse_fast_lane.serials == (RANDOM_SERIAL,)
 
     # Idle -> temporarily stay fast due to recent toggle
     payload_idle = {
@@ -4876,7 +4881,7 @@ async def test_charging_expectation_hold(monkeypatch, hass):
 
 
 @pytest.mark.asyncio
-async def test_default_fast_interval_used_when_charging(hass, monkeypatch):
+async def test_fast_lane_uses_default_fast_interval_when_charging(hass, monkeypatch):
     from custom_components.enphase_ev.const import (
         CONF_COOKIE,
         CONF_EAUTH,
@@ -4935,12 +4940,18 @@ async def test_default_fast_interval_used_when_charging(hass, monkeypatch):
         ]
     }
     coord.client = StubClient(payload)
-    await coord._async_update_data()
-    assert int(coord.update_interval.total_seconds()) == DEFAULT_FAST_POLL_INTERVAL
+    data = await coord._async_update_data()
+    polling_state = coord._determine_polling_state(data)
+    assert polling_state["want_fast"] is False
+    assert polling_state["fast_lane_serials"] == (RANDOM_SERIAL,)
+    assert int(coord.update_interval.total_seconds()) == polling_state["slow"]
+    assert coord.evse_fast_lane.diagnostics()["interval_s"] == float(
+        DEFAULT_FAST_POLL_INTERVAL
+    )
 
 
 @pytest.mark.asyncio
-async def test_summary_refresh_speed_up_when_charging(hass, monkeypatch):
+async def test_summary_refresh_speed_up_in_fast_lane(hass, monkeypatch):
     from custom_components.enphase_ev.const import (
         CONF_COOKIE,
         CONF_EAUTH,
@@ -5014,19 +5025,24 @@ async def test_summary_refresh_speed_up_when_charging(hass, monkeypatch):
     stub = StubClient()
     coord.client = stub
 
-    await coord._async_update_data()
+    coord.data = await coord._async_update_data()
     assert stub.summary_calls == 1
 
-    current["value"] += 15.0
-    await coord._async_update_data()
+    # Full refreshes keep the idle summary TTL while only charging is active.
+    current["value"] += 100.0
+    coord.data = await coord._async_update_data()
     assert stub.summary_calls == 1
 
+    # The fast lane refreshes lifetime counters at the fast interval.
+    await coord.evse_fast_lane.async_tick()
+    assert stub.summary_calls == 2
+
     current["value"] += 15.0
-    await coord._async_update_data()
+    await coord.evse_fast_lane.async_tick()
     assert stub.summary_calls == 2
 
-    current["value"] += 70.0
-    await coord._async_update_data()
+    current["value"] += 30.0
+    await coord.evse_fast_lane.async_tick()
     assert stub.summary_calls == 3
 
 
@@ -11,19 +11,28 @@ import aiohttp
 import pytest
 from homeassistant.exceptions import ConfigEntryAuthFailed
 
+from custom_components.enphase_ev import refresh_runner as refresh_runner_mod
+from custom_components.enphase_ev.coordinator_refresh_metrics import (
+    REFRESH_DEADLINE_RESERVE_S,
+)
 from custom_components.enphase_ev.evse_runtime import ChargeModeResolution
 from custom_components.enphase_ev.refresh_plan import (
     FOLLOWUP_STAGE,
     FOLLOWUP_PLAN,
     HEATPUMP_FOLLOWUP_PLAN,
     SITE_ONLY_FOLLOWUP_PLAN,
+    WARMUP_DISCOVERY_STAGE,
+    RefreshPlan,
+    RefreshStage,
     bind_refresh_stage,
     bind_refresh_plan,
     build_followup_plan,
     build_heatpump_followup_plan,
     build_post_session_followup_plan,
     build_site_only_followup_plan,
+    callback_task,
     post_session_followup_plan,
+    refresh_stage_dependencies,
     warmup_plan,
 )
 from custom_components.enphase_ev.refresh_runner import RefreshRunner
@@ -494,6 +503,263 @@ def test_refresh_plans_bind_dynamic_followup_and_warmup_calls() -> None:
     assert bound_post.stages[0].parallel_calls[2][2]() == "inverters"
 
 
+def test_refresh_stage_dependencies_resolve_explicit_and_implicit_edges() -> None:
+    tasks = [
+        task.timing_key
+        for task in WARMUP_DISCOVERY_STAGE.parallel_tasks
+        + WARMUP_DISCOVERY_STAGE.ordered_tasks
+    ]
+    dependencies = dict(
+        zip(tasks, refresh_stage_dependencies(WARMUP_DISCOVERY_STAGE), strict=True)
+    )
+    inventory = tasks.index("devices_inventory_s")
+
+    assert dependencies == {
+        "battery_site_settings_s": (),
+        "battery_status_s": (tasks.index("battery_site_settings_s"),),
+        "ac_battery_devices_s": (inventory,),
+        "devices_inventory_s": (),
+        "hems_devices_s": (inventory,),
+        "inverters_s": (inventory,),
+    }
+    assert refresh_stage_dependencies(HEATPUMP_FOLLOWUP_PLAN.stages[0]) == (
+        (),
+        (0,),
+        (1,),
+    )
+    site_only = SITE_ONLY_FOLLOWUP_PLAN.stages[0]
+    parallel_count = len(site_only.parallel_tasks)
+    site_only_dependencies = refresh_stage_dependencies(site_only)
+    assert site_only_dependencies[parallel_count] == tuple(range(parallel_count))
+    assert site_only_dependencies[parallel_count + 1 :] == tuple(
+        (position,)
+        for position in range(
+            parallel_count, parallel_count + len(site_only.ordered_tasks) - 1
+        )
+    )
+
+    def _task(key: str, depends_on=None):
+        return callback_task(key, key, lambda owner: None, depends_on=depends_on)
+
+    mixed = RefreshStage(
+        parallel_tasks=(_task("a_s"), _task("b_s")),
+        ordered_tasks=(_task("c_s"), _task("d_s", ("missing_s", "d_s")), _task("e_s")),
+    )
+    assert refresh_stage_dependencies(mixed) == ((), (), (0, 1), (), (3,))
+
+    cyclic = RefreshStage(
+        parallel_tasks=(_task("a_s", ("b_s",)), _task("b_s", ("a_s",))),
+    )
+    with pytest.raises(ValueError, match="a_s, b_s"):
+        refresh_stage_dependencies(cyclic)
+
+
+@pytest.mark.asyncio
+async def test_refresh_runner_runs_stage_graph_and_reports_critical_path() -> None:
+    coord = SimpleNamespace(site_id="site")
+    runner = RefreshRunner(coord)
+    durations = {"a_s": 1.0, "b_s": 3.0, "c_s": 2.0, "d_s": 1.0, "skip_s": None}
+    events: list[str] = []
+    both_started = asyncio.Event()
+
+    async def _run_call(timing_key, log_label, callback_factory, *, endpoint_family):
+        events.append(f"start:{timing_key}")
+        if timing_key in ("b_s", "c_s"):
+            if {"start:b_s", "start:c_s"} <= set(events):
+                both_started.set()
+            await both_started.wait()
+        events.append(f"end:{timing_key}")
+        return timing_key, durations[timing_key]
+
+    runner.async_run_refresh_call = _run_call  # type: ignore[method-assign]
+
+    def _task(key: str, depends_on=()):
+        return callback_task(key, key, lambda owner: None, depends_on=depends_on)
+
+    plan = RefreshPlan(
+        stages=(
+            RefreshStage(
+                stage_key="graph",
+                parallel_tasks=(_task("a_s"), _task("skip_s")),
+                ordered_tasks=(
+                    _task("d_s", ("b_s", "c_s")),
+                    _task("b_s", ("a_s",)),
+                    _task("c_s", ("a_s",)),
+                ),
+            ),
+        ),
+        name="test",
+    )
+    phase_timings: dict[str, float] = {}
+
+    await runner.async_run_refresh_plan(phase_timings, plan=plan)
+
+    assert events.index("start:c_s") < events.index("end:b_s")
+    assert events.index("end:b_s") < events.index("start:d_s")
+    assert events.index("end:c_s") < events.index("start:d_s")
+    assert phase_timings["b_s"] == 3.0
+    assert "skip_s" not in phase_timings
+    assert "graph_s" in phase_timings
+    paths = runner.critical_path_diagnostics()
+    assert paths["test"]["tasks"] == ["a_s", "b_s", "d_s"]
+    assert paths["test"]["critical_path_s"] == 5.0
+
+    await runner.async_run_refresh_plan(
+        {}, plan=RefreshPlan(stages=(RefreshStage(ordered_tasks=(_task("a_s"),)),))
+    )
+    assert runner.critical_path_diagnostics()["refresh"]["tasks"] == ["a_s"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_runner_staged_calls_without_graph_report_sequential_path() -> (
+    None
+):
+    batches: list[str] = []
+    runner = RefreshRunner(
+        SimpleNamespace(
+            site_id="site",
+            _begin_topology_refresh_batch=lambda: batches.append("begin"),
+            _end_topology_refresh_batch=lambda: batches.append("end"),
+        )
+    )
+    durations = {"a_s": 1.0, "b_s": 2.0, "c_s": 0.5, "d_s": None}
+
+    async def _run_call(timing_key, log_label, callback_factory, *, endpoint_family):
+        return timing_key, durations[timing_key]
+
+    runner.async_run_refresh_call = _run_call  # type: ignore[method-assign]
+
+    timings: dict[str, float] = {}
+    path = await runner.async_run_staged_refresh_calls(
+        timings,
+        parallel_calls=(
+            ("a_s", "a", lambda: None, None),
+            ("b_s", "b", lambda: None, None),
+        ),
+        ordered_calls=(
+            ("c_s", "c", lambda: None, None),
+            ("d_s", "d", lambda: None, None),
+        ),
+        stage_key="legacy",
+        defer_topology=True,
+    )
+
+    assert path == [("b_s", 2.0), ("c_s", 0.5)]
+    assert batches == ["begin", "end"]
+    assert "legacy_s" in timings
+    assert await runner.async_run_staged_refresh_calls({}) == []
+
+
+def _deadline_runner() -> RefreshRunner:
+    policies = {
+        "tariff": SimpleNamespace(optional=True),
+        "battery_status": SimpleNamespace(optional=False),
+    }
+    return RefreshRunner(
+        SimpleNamespace(
+            site_id="site",
+            _endpoint_family_policy=policies.get,
+            _note_endpoint_family_failure=MagicMock(),
+        )
+    )
+
+
+def _deadline_plan(record: list[str], *, hang: str | None = None) -> RefreshPlan:
+    async def _refresh(key: str) -> None:
+        record.append(key)
+        if hang is None or key != "tariff_s":
+            return
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            if hang == "swallow":
+                return
+            if hang == "raise":
+                raise RuntimeError("cut off") from None
+            raise
+
+    return RefreshPlan(
+        stages=(
+            RefreshStage(
+                parallel_tasks=(
+                    callback_task(
+                        "battery_status_s",
+                        "battery status",
+                        lambda owner: _refresh("battery_status_s"),
+                        endpoint_family="battery_status",
+                    ),
+                    callback_task(
+                        "tariff_s",
+                        "tariff",
+                        lambda owner: _refresh("tariff_s"),
+                        endpoint_family="tariff",
+                    ),
+                ),
+            ),
+        ),
+        name="followup",
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_runner_carries_over_optional_calls_near_deadline() -> None:
+    record: list[str] = []
+    runner = _deadline_runner()
+    timings: dict[str, float] = {}
+
+    await runner.async_run_refresh_plan(
+        timings,
+        plan=_deadline_plan(record),
+        deadline_mono=time.monotonic() + REFRESH_DEADLINE_RESERVE_S - 1,
+    )
+
+    assert record == ["battery_status_s"]
+    assert "tariff_s" not in timings
+    assert runner.carry_over_diagnostics() == {
+        "pending": ["tariff_s"],
+        "families": ["tariff"],
+        "deadline_skipped": 1,
+        "deadline_cancelled": 0,
+    }
+
+    record.clear()
+    await runner.async_run_refresh_plan(
+        timings,
+        plan=_deadline_plan(record),
+        deadline_mono=time.monotonic(),
+    )
+
+    assert sorted(record) == ["battery_status_s", "tariff_s"]
+    assert "tariff_s" in timings
+    assert runner.carry_over_diagnostics()["pending"] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("hang", ["wait", "swallow", "raise"])
+async def test_refresh_runner_cancels_optional_calls_at_deadline(
+    monkeypatch, hang
+) -> None:
+    monkeypatch.setattr(refresh_runner_mod, "REFRESH_DEADLINE_RESERVE_S", 0.0)
+    record: list[str] = []
+    runner = _deadline_runner()
+
+    await runner.async_run_refresh_plan(
+        {},
+        plan=_deadline_plan(record, hang=hang),
+        deadline_mono=time.monotonic() + 0.05,
+    )
+
+    assert sorted(record) == ["battery_status_s", "tariff_s"]
+    assert runner.carry_over_diagnostics()["pending"] == ["tariff_s"]
+    assert runner.carry_over_diagnostics()["deadline_cancelled"] == 1
+    runner._coordinator._note_endpoint_family_failure.assert_not_called()
+
+    record.clear()
+    await runner.async_run_refresh_plan({}, plan=_deadline_plan(record))
+
+    assert runner.carry_over_diagnostics()["pending"] == []
+
+
 def test_dynamic_followup_plan_skips_up_to_date_tasks() -> None:
     owner = _RefreshOwner()
     owner.battery_runtime.battery_site_settings_refresh_due = lambda: False
@@ -728,6 +994,7 @@ async def test_coordinator_refresh_plan_runner_executes_each_stage(
         ordered_calls,
         stage_key=None,
         defer_topology=False,
+        dependencies=None,
     ) -> None:
         seen.append(
             (
@@ -737,6 +1004,7 @@ async def test_coordinator_refresh_plan_runner_executes_each_stage(
                 len(ordered_calls),
             )
         )
+        assert len(dependencies) == len(parallel_calls) + len(ordered_calls)
 
     coord.refresh_runner.async_run_staged_refresh_calls = _run_stage  # type: ignore[method-assign]
 
@@ -986,6 +1254,142 @@ async def test_refresh_runner_staged_calls_track_empty_stage_timing(
     assert phase_timings == {"empty_s": 0.0}
 
 
+@pytest.mark.asyncio
+async def test_refresh_runner_assigns_request_lane_from_family_policy() -> None:
+    from custom_components.enphase_ev import api
+
+    policies = {
+        "optional_family": SimpleNamespace(optional=True),
+        "state_family": SimpleNamespace(optional=False),
+    }
+    coord = SimpleNamespace(site_id="site", _endpoint_family_policy=policies.get)
+    runner = RefreshRunner(coord)
+    lanes: list[str | None] = []
+
+    async def _capture() -> None:
+        lanes.append(api._request_lane.get())
+
+    for family in ("optional_family", "state_family", "unknown", None):
+        await runner.async_run_refresh_call(
+            "k", "label", _capture, endpoint_family=family
+        )
+
+    assert lanes == ["optional", "state", None, None]
+    assert api._request_lane.get() is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_runner_skips_optional_families_on_low_request_budget() -> None:
+    from custom_components.enphase_ev import api
+
+    now = [0.0]
+    budget = api.EnlightenRequestBudget(
+        burst=4, optional_reserve=2, clock=lambda: now[0]
+    )
+    policies = {
+        "optional_family": SimpleNamespace(optional=True),
+        "state_family": SimpleNamespace(optional=False),
+    }
+    coord = SimpleNamespace(
+        site_id="site",
+        _endpoint_family_policy=policies.get,
+        client=SimpleNamespace(request_budget=budget),
+    )
+    runner = RefreshRunner(coord)
+    calls: list[str] = []
+
+    async def _run(family: str) -> tuple[str, float | None]:
+        return await runner.async_run_refresh_call(
+            family, family, lambda: calls.append(family), endpoint_family=family
+        )
+
+    for _ in range(3):
+        budget.consume()
+    assert (await _run("optional_family"))[1] is None
+    assert (await _run("state_family"))[1] is not None
+    assert calls == ["state_family"]
+    assert budget.diagnostics("site")["skipped_families"] == {
+        "optional_family": {"count": 1, "skipped_for_s": 0.0}
+    }
+
+    now[0] = 60.0
+    assert (await _run("optional_family"))[1] is not None
+    assert calls == ["state_family", "optional_family"]
+    assert budget.diagnostics()["skipped_families"] == {}
+
+    coord.client = SimpleNamespace(request_budget=MagicMock())
+    await _run("optional_family")
+    assert calls[-1] == "optional_family"
+
+
+@pytest.mark.parametrize(
+    ("metric", "expected"),
+    [
+        ("request_scheduler", {"concurrency": 2}),
+        ("conditional_get_cache", {"entries": 0, "families": {}}),
+        ("request_budget", {"per_hour": 600, "skipped_families": {}}),
+        (
+            "single_flight",
+            {
+                "in_flight": 0,
+                "waiting": 0,
+                "leaders": 0,
+                "coalesced_waiters": 0,
+                "max_waiters": 0,
+            },
+        ),
+        (
+            "family_scheduler",
+            {
+                "running": False,
+                "next_family": None,
+                "inline_runs": 0,
+                "detached_runs": 0,
+            },
+        ),
+        ("refresh_critical_paths", {}),
+        (
+            "refresh_carry_over",
+            {
+                "pending": [],
+                "families": [],
+                "deadline_skipped": 0,
+                "deadline_cancelled": 0,
+            },
+        ),
+        (
+            "evse_fast_lane",
+            {"serial_count": 0, "scheduled": False, "ticks": 0, "failures": 0},
+        ),
+        (
+            "evse_command_queue",
+            {"queue_depth": 0, "pending_amp_restarts": 0, "dropped_commands": 0},
+        ),
+    ],
+)
+def test_coordinator_site_metrics_include_runtime_diagnostics(
+    coordinator_factory, metric, expected
+) -> None:
+    metrics = coordinator_factory().collect_site_metrics()[metric]
+
+    assert metrics.items() >= expected.items()
+
+
+def test_coordinator_site_metrics_tolerate_missing_client_diagnostics(
+    coordinator_factory,
+) -> None:
+    coord = coordinator_factory()
+    coord.client.request_scheduler_diagnostics = MagicMock(
+        side_effect=RuntimeError("boom")
+    )
+    coord.client.conditional_get_diagnostics = None
+
+    metrics = coord.collect_site_metrics()
+
+    assert metrics["request_scheduler"] is None
+    assert metrics["conditional_get_cache"] is None
+
+
 def test_coordinator_lazily_creates_refresh_runner() -> None:
     from custom_components.enphase_ev.coordinator import EnphaseCoordinator
 
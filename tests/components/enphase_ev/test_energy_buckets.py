@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from array import array
+import math
+import sys
+
+from custom_components.enphase_ev.api_parsers import coerce_lifetime_energy_value
+from custom_components.enphase_ev.energy_buckets import (
+    NUMPY_MIN_BUCKETS,
+    bucket_array,
+    bucket_span_key,
+    bucket_sum,
+    compact_lifetime_payload,
+)
+
+
+def test_bucket_array_marks_missing_samples_with_nan() -> None:
+    values = bucket_array([1000, None, "2.5", "bad", -5], coerce_lifetime_energy_value)
+
+    assert isinstance(values, array)
+    assert values.typecode == "d"
+    assert values[0] == 1000.0
+    assert math.isnan(values[1])
+    assert values[2] == 2.5
+    assert math.isnan(values[3])
+    assert values[4] == -5.0
+    assert bucket_array(values, coerce_lifetime_energy_value) is values
+    assert bucket_array(None, coerce_lifetime_energy_value) is None
+    assert bucket_array("bad", coerce_lifetime_energy_value) is None
+
+
+def test_compact_lifetime_payload_converts_bucket_lists_only() -> None:
+    payload = {
+        "production": [1000, None],
+        "start_date": "2024-01-01",
+        "_hems_device_channels": ["evse"],
+    }
+
+    compact = compact_lifetime_payload(
+        payload, coerce_lifetime_energy_value, skip=("_hems_device_channels",)
+    )
+
+    assert isinstance(compact["production"], array)
+    assert compact["production"][0] == 1000.0
+    assert math.isnan(compact["production"][1])
+    assert compact["start_date"] == "2024-01-01"
+    assert compact["_hems_device_channels"] == ["evse"]
+    assert payload["production"] == [1000, None]
+
+
+def test_bucket_sum_skips_missing_and_negative_buckets() -> None:
+    values = bucket_array([1000, None, 2000, -5, 0], coerce_lifetime_energy_value)
+
+    assert bucket_sum(values) == (3000.0, 3)
+    assert bucket_sum(values, 1, 3) == (2000.0, 1)
+    assert bucket_sum(values, 4, 2) == (0.0, 0)
+    assert bucket_sum(array("d")) == (0.0, 0)
+
+
+def test_bucket_sum_uses_loaded_numpy_for_long_spans(monkeypatch) -> None:
+    class FakeWindow:
+        def __init__(self, items: list[float]) -> None:
+            self.items = items
+
+        def __getitem__(self, key):
+            if isinstance(key, slice):
+                return FakeWindow(self.items[key])
+            return FakeWindow([item for item, keep in zip(self.items, key) if keep])
+
+        def __ge__(self, other: float) -> list[bool]:
+            return [item >= other for item in self.items]
+
+        def sum(self) -> float:
+            return sum(self.items)
+
+        @property
+        def size(self) -> int:
+            return len(self.items)
+
+    class FakeNumpy:
+        float64 = "float64"
+
+        @staticmethod
+        def frombuffer(values, dtype):
+            assert dtype == "float64"
+            return FakeWindow(list(values))
+
+    values = array("d", [1.0, math.nan, -1.0] * NUMPY_MIN_BUCKETS)
+    monkeypatch.setitem(sys.modules, "numpy", FakeNumpy)
+
+    assert bucket_sum(values) == (float(NUMPY_MIN_BUCKETS), NUMPY_MIN_BUCKETS)
+    assert bucket_sum(values, 0, 3) == (1.0, 1)
+
+
+def test_bucket_span_key_treats_nan_as_equal() -> None:
+    first = bucket_array([1, None, 3], coerce_lifetime_energy_value)
+    second = bucket_array([1, "bad", 3], coerce_lifetime_energy_value)
+    changed = bucket_array([1, None, 4], coerce_lifetime_energy_value)
+
+    assert bucket_span_key(first, 0, 3) == bucket_span_key(second, 0, 3)
+    assert bucket_span_key(first, -2, 2) == bucket_span_key(second, 0, 2)
+    assert bucket_span_key(first, 0, 3) != bucket_span_key(changed, 0, 3)
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.enphase_ev import energy_statistics as energy_statistics_mod
+from custom_components.enphase_ev.const import DOMAIN
+from custom_components.enphase_ev.energy import EnergyManager
+from custom_components.enphase_ev.energy_statistics import (
+    EnergyStatisticsImporter,
+    evse_daily_series,
+    site_flow_series,
+)
+
+LAST_COMPLETE_DAY = date(2026, 3, 4)
+
+
+def _local_midnight_utc(day: date, zone: str = "UTC") -> datetime:
+    return dt_util.as_utc(datetime.combine(day, time.min, tzinfo=ZoneInfo(zone)))
+
+
+class _Recorder:
+    """Recorder stand-in that keeps the external rows it was given."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, list[dict]] = {}
+        self.calls = 0
+        self.lookups = 0
+
+    async def async_add_executor_job(self, func, *args):
+        return func(*args)
+
+    def get_last_statistics(self, hass, count, statistic_id, convert, types):
+        self.lookups += 1
+        rows = self.rows.get(statistic_id)
+        if not rows:
+            return {}
+        row = rows[-1]
+        return {statistic_id: [{"start": row["start"].timestamp(), "sum": row["sum"]}]}
+
+    def async_add_external_statistics(self, hass, metadata, rows):
+        self.calls += 1
+        self.rows.setdefault(metadata["statistic_id"], []).extend(rows)
+
+
+def _coordinator(
+    payload: dict | None,
+    history: dict | None = None,
+    *,
+    site_timezone: str | None = None,
+):
+    energy = EnergyManager(
+        client_provider=lambda: None,
+        site_id="site",
+        logger=MagicMock(),
+    )
+    if payload is not None:
+        parsed = energy._aggregate_site_energy(payload)  # noqa: SLF001
+        assert parsed is not None
+        energy.site_energy, energy._site_energy_meta = parsed  # noqa: SLF001
+        energy._site_energy_payload = payload  # noqa: SLF001
+    return SimpleNamespace(
+        site_id="site",
+        hass=SimpleNamespace(config=SimpleNamespace(components={"recorder"})),
+        energy=energy,
+        evse_timeseries=SimpleNamespace(daily_history_kwh=lambda: history or {}),
+        _battery_timezone=site_timezone,
+    )
+
+
+@pytest.fixture
+def recorder(monkeypatch) -> _Recorder:
+    fake = _Recorder()
+    monkeypatch.setattr(energy_statistics_mod, "_recorder_statistics", lambda: fake)
+    monkeypatch.setattr(energy_statistics_mod, "_recorder_instance", lambda hass: fake)
+    monkeypatch.setattr(
+        EnergyStatisticsImporter,
+        "_last_complete_day",
+        staticmethod(lambda: LAST_COMPLETE_DAY),
+    )
+    return fake
+
+
+def test_site_flow_series_rebuilds_derived_grid_import() -> None:
+    payload = {
+        "start_date": "2026-03-01",
+        "interval_minutes": 1440,
+        "consumption": [5000, 4000, 3000],
+        "solar_home": [1000, 2500, None],
+        "battery_home": [500, 0, 1000],
+    }
+    energy = EnergyManager(
+        client_provider=lambda: None, site_id="site", logger=MagicMock()
+    )
+    parsed = energy._aggregate_site_energy(payload)  # noqa: SLF001
+    assert parsed is not None
+    _flows, meta = parsed
+
+    series = {
+        item.statistic_id: item
+        for item in site_flow_series(
+            "site",
+            payload,
+            meta["flow_fields"],
+            energy._coerce_energy_value,  # noqa: SLF001
+        )
+    }
+
+    grid_import = series[f"{DOMAIN}:site_site_grid_import"]
+    assert grid_import.first_day == date(2026, 3, 1)
+    assert grid_import.length == 3
+    values = [grid_import.value_kwh(index) for index in range(3)]
+    assert values == pytest.approx([3.5, 1.5, 2.0])
+    assert sum(values) == pytest.approx(_flows["grid_import"].value_kwh)
+
+
+def test_evse_daily_series_skips_unparsable_days() -> None:
+    (series,) = evse_daily_series(
+        {"EV 1": {"2026-03-02": 4.0, "bad": 9.0, "2026-03-04": 1.5}}
+    )
+
+    assert series.statistic_id == f"{DOMAIN}:evse_ev_1_charging"
+    assert series.first_day == date(2026, 3, 2)
+    assert series.last_day == date(2026, 3, 4)
+    assert [series.value_kwh(index) for index in range(3)] == [4.0, None, 1.5]
+
+
+async def test_import_resumes_from_last_row_and_skips_today(
+    recorder, monkeypatch
+) -> None:
+    monkeypatch.setattr(energy_statistics_mod, "STATISTICS_IMPORT_CHUNK_DAYS", 2)
+    payload = {
+        "start_date": "2026-03-01",
+        "interval_minutes": 1440,
+        "production": [1000, 2000, 3000, 4000, 5000],
+    }
+    coord = _coordinator(payload, {"EV1": {"2026-03-03": 2.0, "2026-03-05": 9.0}})
+    importer = EnergyStatisticsImporter(coord)
+
+    await importer.async_import()
+
+    production = recorder.rows[f"{DOMAIN}:site_site_solar_production"]
+    assert [row["sum"] for row in production] == [1.0, 3.0, 6.0, 10.0]
+    assert production[0]["start"] == _local_midnight_utc(date(2026, 3, 1))
+    assert recorder.rows[f"{DOMAIN}:evse_ev1_charging"] == [
+        {
+            "start": _local_midnight_utc(date(2026, 3, 3)),
+            "state": 2.0,
+            "sum": 2.0,
+        }
+    ]
+    assert recorder.calls == 3
+
+    calls = recorder.calls
+    await importer.async_import()
+    assert recorder.calls == calls
+
+    fresh = EnergyStatisticsImporter(
+        _coordinator({**payload, "production": [*payload["production"], 6000]})
+    )
+    monkeypatch.setattr(
+        EnergyStatisticsImporter,
+        "_last_complete_day",
+        staticmethod(lambda: date(2026, 3, 5)),
+    )
+    await fresh.async_import()
+    assert [row["sum"] for row in production] == [1.0, 3.0, 6.0, 10.0, 15.0]
+    assert fresh.diagnostics()["imported_through"] == {
+        f"{DOMAIN}:site_site_solar_production": "2026-03-05"
+    }
+
+
+@pytest.mark.parametrize("zone", ["Asia/Kolkata", "Australia/Adelaide"])
+async def test_resume_maps_half_hour_zone_rows_back_to_their_day(
+    recorder, zone
+) -> None:
+    payload = {
+        "start_date": "2026-03-01",
+        "interval_minutes": 1440,
+        "production": [1000, 2000, 3000, 4000, 5000],
+    }
+    await EnergyStatisticsImporter(
+        _coordinator(payload, site_timezone=zone)
+    ).async_import()
+    production = recorder.rows[f"{DOMAIN}:site_site_solar_production"]
+    assert production[0]["start"].minute == 0
+    assert production[0]["start"] < _local_midnight_utc(date(2026, 3, 1), zone)
+
+    fresh = EnergyStatisticsImporter(_coordinator(payload, site_timezone=zone))
+    await fresh.async_import()
+
+    assert [row["sum"] for row in production] == [1.0, 3.0, 6.0, 10.0]
+    assert fresh.diagnostics()["imported_through"] == {
+        f"{DOMAIN}:site_site_solar_production": "2026-03-04"
+    }
+
+
+async def test_schedule_requires_recorder_and_new_days(recorder) -> None:
+    payload = {
+        "start_date": "2026-03-01",
+        "interval_minutes": 1440,
+        "production": [1000, 2000],
+    }
+    coord = _coordinator(payload)
+    coord.hass.config.components = set()
+    importer = EnergyStatisticsImporter(coord)
+
+    importer.async_schedule()
+    assert importer.busy is False
+
+    coord.hass.config.components = {"recorder"}
+    importer.async_schedule()
+    assert importer.busy is True
+    await importer._task  # noqa: SLF001
+    assert importer.diagnostics()["rows_imported"] == 2
+
+    importer.async_schedule()
+    assert importer.busy is False
+    importer.cancel()
+
+
+async def test_import_failure_is_recorded(recorder, monkeypatch) -> None:
+    def _boom(*_args):
+        raise RuntimeError("recorder down")
+
+    monkeypatch.setattr(recorder, "get_last_statistics", _boom)
+    coord = _coordinator(
+        {"start_date": "2026-03-01", "interval_minutes": 1440, "production": [1]}
+    )
+    importer = EnergyStatisticsImporter(coord)
+
+    importer.async_schedule()
+    task = importer._task  # noqa: SLF001
+    with pytest.raises(RuntimeError):
+        await task
+
+    diagnostics = importer.diagnostics()
+    assert diagnostics["failures"] == 1
+    assert "recorder down" in diagnostics["last_error"]
+
+
+async def test_import_uses_site_timezone_not_home_assistant_zone(
+    recorder,
+) -> None:
+    payload = {
+        "start_date": "2026-03-01",
+        "interval_minutes": 1440,
+        "production": [1000, 2000],
+    }
+    original_zone = dt_util.DEFAULT_TIME_ZONE
+    dt_util.set_default_time_zone(dt_util.get_time_zone("America/New_York"))
+    try:
+        await EnergyStatisticsImporter(
+            _coordinator(payload, site_timezone="Australia/Sydney")
+        ).async_import()
+    finally:
+        dt_util.set_default_time_zone(original_zone)
+
+    production = recorder.rows[f"{DOMAIN}:site_site_solar_production"]
+    assert [row["start"] for row in production] == [
+        _local_midnight_utc(date(2026, 3, 1), "Australia/Sydney"),
+        _local_midnight_utc(date(2026, 3, 2), "Australia/Sydney"),
+    ]
+
+
+def test_last_complete_day_follows_site_local_date() -> None:
+    coord = _coordinator(None, site_timezone="Pacific/Auckland")
+    coord._devices_inventory_payload = {"curr_date_site": "2026-03-05"}  # noqa: SLF001
+    importer = EnergyStatisticsImporter(coord)
+
+    assert importer._last_complete_day() == date(2026, 3, 4)  # noqa: SLF001
+
+    coord._devices_inventory_payload = None  # noqa: SLF001
+    site_today = datetime.now(ZoneInfo("Pacific/Auckland")).date()
+    last_day = importer._last_complete_day()  # noqa: SLF001
+    assert last_day == site_today - timedelta(days=1)
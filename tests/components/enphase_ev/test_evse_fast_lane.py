@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from custom_components.enphase_ev import evse_fast_lane as evse_fast_lane_mod
+from custom_components.enphase_ev.evse_fast_lane import (
+    EvseFastLane,
+    fast_lane_status_fields,
+)
+from custom_components.enphase_ev.evse_runtime import EvseRuntime
+
+
+def _record(sn: str, *, status: str = "CHARGING", e_c: float = 4200.0) -> dict:
+    return {
+        "sn": sn,
+        "charging": status == "CHARGING",
+        "pluggedIn": True,
+        "connected": True,
+        "lst_rpt_at": "2026-10-16T10:00:00Z",
+        "connectors": [{"connectorStatusType": status}],
+        "session_d": {"e_c": e_c},
+    }
+
+
+def _coordinator(records: list[dict], **overrides) -> SimpleNamespace:
+    summary = SimpleNamespace(
+        prepare_refresh=MagicMock(return_value=True),
+        async_fetch=AsyncMock(
+            return_value=[{"serialNumber": "EV1", "lifeTimeConsumption": 1234.5}]
+        ),
+    )
+    coord = SimpleNamespace(
+        site_id="site",
+        hass=object(),
+        _listeners={object(): (lambda: None, None)},
+        _has_successful_refresh=True,
+        _backoff_until=None,
+        _auth_block_active=lambda: False,
+        _pending_charging={},
+        client=SimpleNamespace(
+            status=AsyncMock(return_value={"evChargerData": records, "ts": 1})
+        ),
+        summary=summary,
+        energy=SimpleNamespace(
+            _apply_lifetime_guard=lambda _sn, raw, _prev: round(float(raw), 3)
+        ),
+        evse_state=SimpleNamespace(_evse_power_snapshots={}),
+        nominal_voltage=240,
+        data={
+            "EV1": {"sn": "EV1", "charging": True, "charge_mode": "MANUAL"},
+            "EV2": {"sn": "EV2", "charging": False, "session_kwh": 1.0},
+        },
+        _record_actual_charging=MagicMock(),
+        async_update_listeners=MagicMock(),
+        async_request_refresh=AsyncMock(),
+    )
+    coord.evse_runtime = EvseRuntime(coord)
+    for key, value in overrides.items():
+        setattr(coord, key, value)
+    return coord
+
+
+@pytest.fixture
+def timer_calls(monkeypatch) -> list[tuple[float, object]]:
+    calls: list[tuple[float, object]] = []
+
+    def _call_later(_hass, delay, action):
+        calls.append((delay, action))
+        return lambda: None
+
+    monkeypatch.setattr(evse_fast_lane_mod, "async_call_later", _call_later)
+    return calls
+
+
+def test_fast_lane_status_fields_reads_dynamic_fields() -> None:
+    fields = fast_lane_status_fields(_record("EV1"), None)
+
+    assert fields["charging"] is True
+    assert fields["actual_charging"] is True
+    assert fields["session_energy_wh"] == 4200.0
+    assert fields["session_kwh"] == 4.2
+    assert fields["last_reported_at"] == "2026-10-16T10:00:00Z"
+    assert fields["sampled_at_utc"] == "2026-10-16T10:00:00+00:00"
+
+    suspended = {
+        "charging": True,
+        "connectors": [{"connectorStatusType": "SUSPENDED_EVSE"}],
+    }
+    fields = fast_lane_status_fields(suspended, "1760608800")
+    assert fields["charging"] is False
+    assert fields["suspended_by_evse"] is True
+    assert "session_kwh" not in fields
+    assert fields["sampled_at_ts"] == 1760608800.0
+    assert fields["last_reported_at"] == "2025-10-16T10:00:00+00:00"
+
+
+def test_fast_lane_arms_only_with_serials_and_listeners(timer_calls) -> None:
+    coord = _coordinator([])
+    lane = EvseFastLane(coord)
+
+    lane.async_update({"fast_lane_serials": (), "fast": 30})
+    assert timer_calls == []
+
+    lane.async_update({"fast_lane_serials": ("EV1",), "fast": 45})
+    assert lane.serials == ("EV1",)
+    assert timer_calls[-1][0] == 45.0
+
+    coord._listeners = {}
+    lane.async_update({"fast_lane_serials": ("EV1",), "fast": 45})
+    assert len(timer_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_tick_updates_only_lane_serials(timer_calls) -> None:
+    coord = _coordinator([_record("EV1"), _record("EV2")])
+    lane = EvseFastLane(coord)
+    lane.async_update({"fast_lane_serials": ("EV1",), "fast": 30})
+    previous = coord.data
+
+    await lane.async_tick()
+
+    entry = coord.data["EV1"]
+    assert coord.data is not previous
+    assert entry["charge_mode"] == "MANUAL"
+    assert entry["session_kwh"] == 4.2
+    assert entry["lifetime_kwh"] == 1234.5
+    assert entry["derived_power_method"] == "seeded"
+    assert "fetched_at_utc" in entry
+    assert coord.data["EV2"] is previous["EV2"]
+    assert coord.evse_state._evse_power_snapshots["EV1"]["derived_last_lifetime_kwh"]
+    coord.summary.prepare_refresh.assert_called_once_with(
+        want_fast=True, target_interval=30.0
+    )
+    coord.summary.async_fetch.assert_awaited_once_with(force=True)
+    coord._record_actual_charging.assert_called_once_with("EV1", True)
+    coord.async_update_listeners.assert_called_once()
+    coord.async_request_refresh.assert_not_awaited()
+    assert len(timer_calls) == 2
+    assert lane.diagnostics()["ticks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_hands_stopped_chargers_to_full_refresh(timer_calls) -> None:
+    coord = _coordinator([_record("EV1", status="AVAILABLE")])
+    lane = EvseFastLane(coord)
+    lane.async_update({"fast_lane_serials": ("EV1",), "fast": 30})
+
+    await lane.async_tick()
+
+    assert coord.data["EV1"]["charging"] is False
+    assert lane.serials == ()
+    coord.async_request_refresh.assert_awaited_once()
+    assert len(timer_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_holds_pending_charging_expectation(timer_calls) -> None:
+    coord = _coordinator([_record("EV1", status="AVAILABLE")])
+    coord._pending_charging["EV1"] = (True, time.monotonic() + 60)
+    lane = EvseFastLane(coord)
+    lane.async_update({"fast_lane_serials": ("EV1",), "fast": 30})
+
+    await lane.async_tick()
+
+    assert coord.data["EV1"]["charging"] is True
+    assert coord.data["EV1"]["actual_charging"] is False
+    assert lane.serials == ("EV1",)
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_stops_on_status_failure(timer_calls) -> None:
+    coord = _coordinator([])
+    coord.client.status.side_effect = aiohttp.ClientError("boom")
+    lane = EvseFastLane(coord)
+    lane.async_update({"fast_lane_serials": ("EV1",), "fast": 30})
+    data = coord.data
+
+    await lane.async_tick()
+
+    assert lane.serials == ()
+    assert coord.data is data
+    coord.summary.async_fetch.assert_not_awaited()
+    diagnostics = lane.diagnostics()
+    assert diagnostics["failures"] == 1
+    assert diagnostics["last_error"] == "boom"
+
+
+def test_fast_lane_timer_skips_during_backoff(timer_calls, monkeypatch) -> None:
+    coord = _coordinator([], _backoff_until=time.monotonic() + 60)
+    lane = EvseFastLane(coord)
+    lane.async_update({"fast_lane_serials": ("EV1",), "fast": 30})
+    create_task = MagicMock()
+    monkeypatch.setattr(evse_fast_lane_mod.asyncio, "create_task", create_task)
+
+    timer_calls[-1][1](None)
+
+    create_task.assert_not_called()
+    assert lane.diagnostics()["skipped"] == 1
+
+    lane.cancel()
+    assert lane.serials == ()
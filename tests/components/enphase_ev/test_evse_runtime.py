@@ -11,6 +11,7 @@ import pytest
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.util import dt as dt_util
 
+from custom_components.enphase_ev import evse_runtime as evse_runtime_mod
 from custom_components.enphase_ev.api import SchedulerUnavailable
 from custom_components.enphase_ev.evse_runtime import (
     EVSE_LOOKUP_CONCURRENCY,
@@ -19,6 +20,8 @@ from custom_components.enphase_ev.evse_runtime import (
     ChargeModeStartPreferences,
     EvseRuntime,
     evse_power_is_actively_charging,
+    evse_status_charging_flags,
+    session_energy_kwh,
 )
 
 
@@ -585,6 +588,7 @@ async def test_evse_runtime_schedule_amp_restart_uses_coordinator_override(
 ) -> None:
     coord = coordinator_factory()
     runtime = coord.evse_runtime
+    monkeypatch.setattr(evse_runtime_mod, "AMP_RESTART_DEBOUNCE_S", 0.0)
     pending = asyncio.Future()
     coord._amp_restart_tasks["EV1"] = pending  # noqa: SLF001
     calls: list[tuple[str, float]] = []
@@ -639,6 +643,15 @@ def test_evse_power_is_actively_charging_coerces_numeric_flags() -> None:
     assert evse_power_is_actively_charging(None, 0) is False
 
 
+def test_evse_status_charging_flags_and_session_energy() -> None:
+    assert evse_status_charging_flags(" suspended_ev ", False) == (True, False, False)
+    assert evse_status_charging_flags("SUSPENDED_EVSE", True) == (False, False, True)
+    assert evse_status_charging_flags("CHARGING", False) == (True, True, False)
+    assert evse_status_charging_flags(None, True) == (True, True, False)
+    assert session_energy_kwh(4321.0) == 4.32
+    assert session_energy_kwh(12.5) == 12.5
+
+
 def test_evse_runtime_require_plugged_and_desired_state(coordinator_factory) -> None:
     coord = coordinator_factory()
     runtime = coord.evse_runtime
@@ -713,3 +726,148 @@ def test_coordinator_evse_runtime_wrapper_delegation(coordinator_factory) -> Non
     runtime.cached_charge_mode_preference.assert_called_once_with("EV1", now=None)
     runtime.normalize_effective_charge_mode.assert_called_once_with("idle")
     runtime.charge_mode_start_preferences.assert_called_once_with("EV1")
+
+
+def _control_coordinator(**overrides) -> SimpleNamespace:
+    coord = SimpleNamespace(
+        site_id="site",
+        data={"EV1": {"plugged": True}},
+        hass=SimpleNamespace(
+            async_create_task=lambda coro, name=None: asyncio.create_task(coro)
+        ),
+        client=SimpleNamespace(
+            start_charging=AsyncMock(return_value={"status": "ok"}),
+            stop_charging=AsyncMock(return_value={"status": "ok"}),
+            set_charge_mode=AsyncMock(),
+        ),
+        _amp_restart_tasks={},
+        _charge_mode_cache={},
+        _charge_mode_start_preferences=lambda _sn: ChargeModeStartPreferences(),
+        require_plugged=MagicMock(),
+        pick_start_amps=MagicMock(return_value=24),
+        set_last_set_amps=MagicMock(),
+        set_desired_charging=MagicMock(),
+        set_charging_expectation=MagicMock(),
+        kick_fast=MagicMock(),
+        async_start_streaming=AsyncMock(),
+        async_request_refresh=AsyncMock(),
+        note_scheduler_unavailable=MagicMock(),
+        mark_scheduler_available=MagicMock(),
+    )
+    coord.evse_runtime = EvseRuntime(coord)
+    for key, value in overrides.items():
+        setattr(coord, key, value)
+    return coord
+
+
+@pytest.mark.asyncio
+async def test_evse_command_queue_serializes_start_and_stop() -> None:
+    coord = _control_coordinator()
+    runtime = coord.evse_runtime
+    release = asyncio.Event()
+
+    async def _slow_start(*_args, **_kwargs):
+        await release.wait()
+        return {"status": "ok"}
+
+    coord.client.start_charging.side_effect = _slow_start
+    start = asyncio.create_task(runtime.async_start_charging("EV1"))
+    await asyncio.sleep(0)
+    stop = asyncio.create_task(runtime.async_stop_charging("EV1"))
+    await asyncio.sleep(0)
+
+    assert runtime.commands.depth("EV1") == 2
+    coord.client.stop_charging.assert_not_awaited()
+
+    release.set()
+    await asyncio.gather(start, stop)
+
+    coord.client.stop_charging.assert_awaited_once_with("EV1")
+    assert coord.set_desired_charging.call_args_list == [
+        call("EV1", True),
+        call("EV1", False),
+    ]
+    diagnostics = runtime.commands.diagnostics()
+    assert diagnostics["queue_depth"] == 0
+    assert diagnostics["max_queue_depth"] == 2
+    assert diagnostics["commands"] == 2
+    assert diagnostics["dropped_commands"] == 0
+
+
+@pytest.mark.asyncio
+async def test_evse_command_queue_drops_superseded_charge_modes() -> None:
+    coord = _control_coordinator()
+    runtime = coord.evse_runtime
+    release = asyncio.Event()
+
+    async def _slow_mode(*_args, **_kwargs):
+        if not release.is_set():
+            await release.wait()
+
+    coord.client.set_charge_mode.side_effect = _slow_mode
+    calls = [
+        asyncio.create_task(
+            runtime.async_set_charge_mode("EV1", mode, previous_mode="MANUAL_CHARGING")
+        )
+        for mode in ("GREEN_CHARGING", "SCHEDULED_CHARGING", "SMART_CHARGING")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*calls)
+
+    assert coord.client.set_charge_mode.await_args_list == [
+        call("EV1", "GREEN_CHARGING", previous_mode="MANUAL_CHARGING"),
+        call("EV1", "SMART_CHARGING", previous_mode="GREEN_CHARGING"),
+    ]
+    assert coord._charge_mode_cache["EV1"][0] == "SMART_CHARGING"
+    assert coord.async_request_refresh.await_count == 2
+    assert runtime.commands.diagnostics()["dropped_by_kind"] == {"charge_mode": 1}
+
+
+@pytest.mark.asyncio
+async def test_evse_runtime_amp_restart_collapses_new_setpoints(monkeypatch) -> None:
+    monkeypatch.setattr(evse_runtime_mod, "AMP_RESTART_DEBOUNCE_S", 0.0)
+    coord = _control_coordinator(
+        async_stop_charging=AsyncMock(), async_start_charging=AsyncMock()
+    )
+    runtime = coord.evse_runtime
+
+    runtime.schedule_amp_restart("EV1", delay=0.05)
+    superseded = coord._amp_restart_tasks["EV1"]  # noqa: SLF001
+    runtime.schedule_amp_restart("EV1", delay=0.05)
+    task = coord._amp_restart_tasks["EV1"]  # noqa: SLF001
+    await asyncio.sleep(0.01)
+
+    assert superseded.cancelled()
+    assert runtime.commands.restart_phase("EV1") == "waiting"
+    runtime.schedule_amp_restart("EV1", delay=0.05)
+    assert coord._amp_restart_tasks["EV1"] is task  # noqa: SLF001
+
+    await task
+    await asyncio.sleep(0)
+
+    coord.async_stop_charging.assert_awaited_once()
+    coord.async_start_charging.assert_awaited_once_with("EV1")
+    diagnostics = runtime.commands.diagnostics()
+    assert diagnostics["pending_amp_restarts"] == 0
+    assert diagnostics["dropped_by_kind"] == {"amp_restart": 2}
+
+
+@pytest.mark.asyncio
+async def test_evse_runtime_explicit_stop_cancels_pending_amp_restart() -> None:
+    coord = _control_coordinator()
+    runtime = coord.evse_runtime
+
+    runtime.schedule_amp_restart("EV1", delay=30)
+    restart = coord._amp_restart_tasks["EV1"]  # noqa: SLF001
+    assert runtime.commands.restart_phase("EV1") == "pending"
+
+    await runtime.async_stop_charging("EV1")
+    await asyncio.sleep(0)
+
+    assert restart.cancelled()
+    assert coord._amp_restart_tasks == {}  # noqa: SLF001
+    coord.client.stop_charging.assert_awaited_once_with("EV1")
+    diagnostics = runtime.commands.diagnostics()
+    assert diagnostics["pending_amp_restarts"] == 0
+    assert diagnostics["dropped_by_kind"] == {"amp_restart": 1}
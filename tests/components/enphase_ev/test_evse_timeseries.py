@@ -222,6 +222,27 @@ def test_evse_timeseries_refresh_due_defaults_day_and_skips_when_caches_are_fres
     assert manager.refresh_due(day_local=None) is False
 
 
+def test_evse_timeseries_daily_history_merges_cached_days(hass) -> None:
+    manager = EVSETimeseriesManager(hass, lambda: None)
+    manager._daily_cache = {  # noqa: SLF001
+        "2026-03-11": (
+            1.0,
+            {"EV-1": {"day_values_kwh": {"2026-03-10": 3.0, "2026-03-11": 1.0}}},
+        ),
+        "2026-03-12": (
+            2.0,
+            {
+                "EV-1": {"day_values_kwh": {"2026-03-11": 4.5, "2026-03-12": True}},
+                "EV-2": {"energy_kwh": 2.0},
+            },
+        ),
+    }
+
+    assert manager.daily_history_kwh() == {
+        "EV-1": {"2026-03-10": 3.0, "2026-03-11": 4.5}
+    }
+
+
 def _request_info() -> aiohttp.RequestInfo:
     return aiohttp.RequestInfo(
         url=aiohttp.client.URL("https://example.com/evse"),
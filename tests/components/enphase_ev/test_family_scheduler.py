@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.exceptions import ConfigEntryAuthFailed
+
+from custom_components.enphase_ev import family_scheduler as family_scheduler_mod
+from custom_components.enphase_ev.family_scheduler import (
+    FAMILY_REFRESH_MAX_JITTER_S,
+    FAMILY_REFRESH_MIN_DELAY_S,
+    EndpointFamilyScheduler,
+)
+from custom_components.enphase_ev.refresh_plan import (
+    FOLLOWUP_PLAN,
+    SITE_ONLY_FOLLOWUP_PLAN,
+    RefreshPlan,
+    RefreshStage,
+    callback_task,
+    refresh_plan_endpoint_families,
+)
+
+
+def _policy(ttl: float | None = 300.0) -> SimpleNamespace:
+    return SimpleNamespace(success_ttl_s=ttl)
+
+
+def _coordinator(**overrides) -> SimpleNamespace:
+    policies = {
+        "tariff": _policy(3600.0),
+        "storm_alert": _policy(300.0),
+        "hems_devices": _policy(None),
+    }
+    coord = SimpleNamespace(
+        site_id="site",
+        site_only=False,
+        serials={"EV1"},
+        hass=object(),
+        config_entry=None,
+        _has_successful_refresh=True,
+        _backoff_until=None,
+        _auth_block_active=lambda: False,
+        _endpoint_family_health={},
+        _endpoint_family_policy=policies.get,
+        _build_family_refresh_plan=lambda: RefreshPlan(),
+        async_update_listeners=MagicMock(),
+        refresh_runner=SimpleNamespace(),
+        _phase_timings={"total_s": 1.0},
+    )
+    for key, value in overrides.items():
+        setattr(coord, key, value)
+    return coord
+
+
+def _plan() -> RefreshPlan:
+    return RefreshPlan(
+        stages=(
+            RefreshStage(
+                parallel_tasks=(
+                    callback_task(
+                        "tariff_s",
+                        "tariff",
+                        lambda owner: None,
+                        endpoint_family="tariff",
+                    ),
+                ),
+            ),
+        ),
+        name="followup",
+    )
+
+
+@pytest.fixture
+def timer_calls(monkeypatch) -> list[tuple[float, object]]:
+    calls: list[tuple[float, object]] = []
+
+    def _call_later(_hass, delay, action):
+        calls.append((delay, action))
+        return lambda: None
+
+    monkeypatch.setattr(family_scheduler_mod, "async_call_later", _call_later)
+    return calls
+
+
+def test_refresh_plan_endpoint_families_collects_task_families() -> None:
+    families = refresh_plan_endpoint_families(FOLLOWUP_PLAN)
+
+    assert {"tariff", "storm_alert", "battery_status"} <= families
+    assert None not in families
+    assert "inverter_inventory" not in families
+    assert "inverter_inventory" in refresh_plan_endpoint_families(
+        SITE_ONLY_FOLLOWUP_PLAN
+    )
+    assert refresh_plan_endpoint_families(RefreshPlan()) == frozenset()
+
+
+def test_family_scheduler_jitter_is_stable_and_bounded() -> None:
+    scheduler = EndpointFamilyScheduler(_coordinator())
+
+    tariff = scheduler.jitter_s("tariff")
+
+    assert tariff == scheduler.jitter_s("tariff")
+    assert 0.0 <= tariff <= FAMILY_REFRESH_MAX_JITTER_S
+    assert 0.0 <= scheduler.jitter_s("storm_alert") <= 30.0
+    assert scheduler.jitter_s("hems_devices") == 0.0
+    assert scheduler.jitter_s("unknown") == 0.0
+
+
+def test_family_scheduler_due_times_use_future_retry_deadlines() -> None:
+    now = time.monotonic()
+    coord = _coordinator()
+    coord._endpoint_family_health = {
+        "tariff": SimpleNamespace(next_retry_mono=now + 600),
+        "storm_alert": SimpleNamespace(next_retry_mono=now - 5),
+        "battery_status": SimpleNamespace(next_retry_mono=now + 30),
+        "hems_devices": SimpleNamespace(next_retry_mono=None),
+    }
+    scheduler = EndpointFamilyScheduler(coord)
+
+    due = scheduler.family_due_times()
+
+    assert list(due) == ["tariff"]
+    assert due["tariff"] == pytest.approx(now + 600 + scheduler.jitter_s("tariff"))
+
+
+def test_family_scheduler_site_only_limits_families() -> None:
+    now = time.monotonic()
+    coord = _coordinator(site_only=True)
+    coord._endpoint_family_health = {
+        "tariff": SimpleNamespace(next_retry_mono=now + 600),
+    }
+
+    assert "tariff" in EndpointFamilyScheduler(coord).family_due_times()
+    assert EndpointFamilyScheduler(coord)._families() == (
+        refresh_plan_endpoint_families(SITE_ONLY_FOLLOWUP_PLAN)
+    )
+
+
+def test_family_scheduler_arms_timer_for_earliest_family(timer_calls) -> None:
+    now = time.monotonic()
+    coord = _coordinator()
+    coord._endpoint_family_health = {
+        "tariff": SimpleNamespace(next_retry_mono=now + 600),
+        "storm_alert": SimpleNamespace(next_retry_mono=now + 0.1),
+    }
+    scheduler = EndpointFamilyScheduler(coord)
+
+    scheduler.async_schedule()
+
+    assert len(timer_calls) == 1
+    assert timer_calls[0][0] >= FAMILY_REFRESH_MIN_DELAY_S
+    diagnostics = scheduler.diagnostics()
+    assert diagnostics["next_family"] == "storm_alert"
+    assert set(diagnostics["family_due_in_s"]) == {"tariff", "storm_alert"}
+
+    coord._endpoint_family_health = {}
+    scheduler.async_schedule()
+
+    assert len(timer_calls) == 1
+    assert scheduler.diagnostics()["next_family"] is None
+
+
+@pytest.mark.asyncio
+async def test_family_scheduler_runs_fast_plan_inline() -> None:
+    coord = _coordinator()
+    calls: list[RefreshPlan] = []
+
+    async def _run(phase_timings, *, plan, **_kwargs):
+        calls.append(plan)
+        phase_timings["tariff_s"] = 0.1
+
+    coord.refresh_runner.async_run_refresh_plan = _run
+    scheduler = EndpointFamilyScheduler(coord)
+    timings: dict[str, float] = {}
+    plan = _plan()
+
+    await scheduler.async_run_plan(timings, plan=plan)
+
+    assert calls == [plan]
+    assert timings == {"tariff_s": 0.1}
+    assert scheduler.busy is False
+    assert scheduler.diagnostics()["inline_runs"] == 1
+    coord.async_update_listeners.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_family_scheduler_propagates_inline_failures() -> None:
+    coord = _coordinator()
+
+    async def _run(phase_timings, *, plan, **_kwargs):
+        raise ConfigEntryAuthFailed("expired")
+
+    coord.refresh_runner.async_run_refresh_plan = _run
+    scheduler = EndpointFamilyScheduler(coord)
+
+    with pytest.raises(ConfigEntryAuthFailed):
+        await scheduler.async_run_plan({}, plan=_plan())
+
+    assert scheduler.busy is False
+
+
+@pytest.mark.asyncio
+async def test_family_scheduler_detaches_slow_plan_and_publishes(
+    monkeypatch, timer_calls
+) -> None:
+    monkeypatch.setattr(family_scheduler_mod, "FAMILY_REFRESH_INLINE_GRACE_S", 0.01)
+    coord = _coordinator()
+    release = asyncio.Event()
+
+    async def _run(phase_timings, *, plan, **_kwargs):
+        await release.wait()
+        phase_timings["tariff_s"] = 5.0
+
+    coord.refresh_runner.async_run_refresh_plan = _run
+    scheduler = EndpointFamilyScheduler(coord)
+    timings: dict[str, float] = {}
+
+    await scheduler.async_run_plan(timings, plan=_plan())
+
+    assert scheduler.busy is True
+    assert scheduler.diagnostics()["detached_runs"] == 1
+    coord.async_update_listeners.assert_not_called()
+
+    await scheduler.async_run_plan({}, plan=_plan())
+    scheduler._handle_timer(None)
+    assert scheduler.diagnostics()["skipped_busy"] == 2
+
+    release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert scheduler.busy is False
+    assert timings == {}
+    assert coord._phase_timings == {"total_s": 1.0, "tariff_s": 5.0}
+    coord.async_update_listeners.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_family_scheduler_background_auth_failure_starts_reauth(
+    monkeypatch, timer_calls
+) -> None:
+    monkeypatch.setattr(family_scheduler_mod, "FAMILY_REFRESH_INLINE_GRACE_S", 0.01)
+    entry = MagicMock()
+    coord = _coordinator(config_entry=entry)
+    release = asyncio.Event()
+
+    async def _run(phase_timings, *, plan, **_kwargs):
+        await release.wait()
+        raise ConfigEntryAuthFailed("expired")
+
+    coord.refresh_runner.async_run_refresh_plan = _run
+    scheduler = EndpointFamilyScheduler(coord)
+
+    await scheduler.async_run_plan({}, plan=_plan())
+    release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    entry.async_start_reauth.assert_called_once_with(coord.hass)
+    assert scheduler.diagnostics()["background_failures"] == 1
+    coord.async_update_listeners.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_family_scheduler_timer_runs_due_families_out_of_band(
+    timer_calls,
+) -> None:
+    coord = _coordinator()
+    plan = _plan()
+    coord._build_family_refresh_plan = lambda: plan
+    ran = asyncio.Event()
+
+    async def _run(phase_timings, *, plan, **_kwargs):
+        ran.set()
+
+    coord.refresh_runner.async_run_refresh_plan = _run
+    scheduler = EndpointFamilyScheduler(coord)
+
+    scheduler._handle_timer(None)
+    await ran.wait()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert scheduler.diagnostics()["out_of_band_runs"] == 1
+    coord.async_update_listeners.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_family_scheduler_timer_skips_when_coordinator_not_ready(
+    timer_calls,
+) -> None:
+    coord = _coordinator(_backoff_until=time.monotonic() + 60)
+    coord.refresh_runner.async_run_refresh_plan = MagicMock()
+    scheduler = EndpointFamilyScheduler(coord)
+
+    scheduler._handle_timer(None)
+    coord._backoff_until = None
+    coord._auth_block_active = lambda: True
+    scheduler._handle_timer(None)
+    coord._auth_block_active = lambda: False
+    scheduler._handle_timer(None)
+
+    coord.refresh_runner.async_run_refresh_plan.assert_not_called()
+    assert scheduler.diagnostics()["out_of_band_runs"] == 0
+
+
+@pytest.mark.asyncio
+async def test_family_scheduler_cancel_stops_running_refresh(monkeypatch) -> None:
+    monkeypatch.setattr(family_scheduler_mod, "FAMILY_REFRESH_INLINE_GRACE_S", 0.01)
+    coord = _coordinator()
+
+    async def _run(phase_timings, *, plan, **_kwargs):
+        await asyncio.Event().wait()
+
+    coord.refresh_runner.async_run_refresh_plan = _run
+    scheduler = EndpointFamilyScheduler(coord)
+    await scheduler.async_run_plan({}, plan=_plan())
+    task = scheduler._task
+
+    scheduler.cancel()
+    await asyncio.sleep(0)
+
+    assert task.cancelled()
+    assert scheduler.busy is False
+    coord.async_update_listeners.assert_not_called()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
@@ -745,6 +746,101 @@ async def test_async_setup_entry_uses_background_task_for_startup_warmup(
     forward.assert_awaited_once()
 
 
+def _deferred_refresh_coordinator(site_id: str, *, stale: bool = True):
+    class DummyCoordinator:
+        def __init__(self) -> None:
+            self.site_id = site_id
+            self.last_update_success = True
+            self.state_snapshot = SimpleNamespace(stale=stale)
+            self.refresh_runner = SimpleNamespace(
+                async_start_startup_warmup=AsyncMock()
+            )
+            self.async_refresh = AsyncMock()
+            self.async_config_entry_first_refresh = AsyncMock()
+
+        def _auth_block_active(self) -> bool:
+            return False
+
+        def iter_serials(self) -> list[str]:
+            return []
+
+        def iter_type_keys(self) -> list[str]:
+            return []
+
+    return _with_inventory_view(DummyCoordinator())
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_defers_first_refresh_with_restored_state(
+    hass: HomeAssistant, config_entry, monkeypatch
+) -> None:
+    dummy_coord = _deferred_refresh_coordinator(config_entry.data[CONF_SITE_ID])
+    monkeypatch.setattr(
+        "custom_components.enphase_ev.coordinator.EnphaseCoordinator",
+        lambda hass_, entry_data, config_entry=None: dummy_coord,
+    )
+    forward = AsyncMock()
+    monkeypatch.setattr(hass.config_entries, "async_forward_entry_setups", forward)
+    background_tasks: dict[str, object] = {}
+
+    def _capture_background_task(
+        hass_arg: HomeAssistant, target, name: str, eager_start: bool = True
+    ) -> None:
+        background_tasks[name] = target
+
+    monkeypatch.setattr(
+        config_entry, "async_create_background_task", _capture_background_task
+    )
+
+    assert await async_setup_entry(hass, config_entry)
+
+    forward.assert_awaited_once()
+    dummy_coord.async_config_entry_first_refresh.assert_not_awaited()
+    dummy_coord.async_refresh.assert_not_awaited()
+    assert list(background_tasks) == ["enphase_ev_first_refresh"]
+
+    await background_tasks["enphase_ev_first_refresh"]
+
+    dummy_coord.async_refresh.assert_awaited_once_with()
+    dummy_coord.refresh_runner.async_start_startup_warmup.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_deferred_first_refresh_skips_warmup_after_failure_or_timeout(
+    monkeypatch,
+) -> None:
+    dummy_coord = _deferred_refresh_coordinator("site")
+    warmup = AsyncMock()
+
+    async def _failed_refresh() -> None:
+        dummy_coord.last_update_success = False
+
+    dummy_coord.async_refresh = AsyncMock(side_effect=_failed_refresh)
+    await enphase_init._async_deferred_first_refresh(dummy_coord, "site", warmup)
+    warmup.assert_not_awaited()
+
+    async def _slow_refresh() -> None:
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(enphase_init, "DEFERRED_FIRST_REFRESH_TIMEOUT_S", 0.01)
+    dummy_coord.last_update_success = True
+    dummy_coord.async_refresh = AsyncMock(side_effect=_slow_refresh)
+    await enphase_init._async_deferred_first_refresh(dummy_coord, "site", warmup)
+    warmup.assert_not_awaited()
+
+
+def test_first_refresh_deferrable_requires_stale_snapshot_without_auth_block() -> None:
+    assert enphase_init._first_refresh_deferrable(_deferred_refresh_coordinator("site"))
+    assert not enphase_init._first_refresh_deferrable(
+        _deferred_refresh_coordinator("site", stale=False)
+    )
+    assert not enphase_init._first_refresh_deferrable(SimpleNamespace())
+
+    blocked = _deferred_refresh_coordinator("site")
+    blocked._auth_block_active = lambda: True
+    assert not enphase_init._first_refresh_deferrable(blocked)
+
+
 @pytest.mark.asyncio
 async def test_async_setup_entry_records_startup_migration_version(
     hass: HomeAssistant, config_entry, monkeypatch
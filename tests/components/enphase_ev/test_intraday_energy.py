@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.enphase_ev.intraday_energy import (
+    INTRADAY_REVISE_INTERVALS,
+    IntradayEnergyEngine,
+)
+
+DAY_START = 1_774_652_400
+
+
+def _today_payload(
+    *, start: int = DAY_START, day: str = "2026-03-28", **series: list
+) -> dict[str, object]:
+    return {
+        "start_date": day,
+        "stats": [
+            {
+                "start_time": start,
+                "interval_length": 900,
+                "soc": [50] * 96,
+                **series,
+            }
+        ],
+    }
+
+
+def test_ingest_skips_future_intervals_and_sums_day() -> None:
+    engine = IntradayEnergyEngine()
+    payload = _today_payload(
+        consumption=[100, 200, "300", None, -5] + [0] * 91,
+        solar_home=[0, 50, 75],
+    )
+
+    assert engine.ingest(payload, now_ts=DAY_START + 4 * 900 + 10) is True
+
+    assert engine.day == "2026-03-28"
+    assert engine.day_energy_wh("consumption") == pytest.approx(600.0)
+    assert engine.day_energy_wh("solar_home") == pytest.approx(125.0)
+    assert engine.day_energy_wh("soc") is None
+    assert len(engine.intervals()) == 5
+    latest = engine.latest_interval()
+    assert latest is not None
+    assert latest.start_ts == DAY_START + 3 * 900
+    assert engine.interval_power_w("solar_home") is None
+    assert engine.intervals(limit=3)[0].power_w("consumption") == pytest.approx(1200.0)
+
+
+def test_ingest_reads_only_new_and_revised_intervals() -> None:
+    engine = IntradayEnergyEngine()
+    values = [10.0] * 96
+    engine.ingest(_today_payload(consumption=values), now_ts=DAY_START + 40 * 900 - 1)
+    first_read = engine.intervals_read
+
+    revised = list(values)
+    revised[39] = 30.0
+    changed = engine.ingest(
+        _today_payload(consumption=revised), now_ts=DAY_START + 42 * 900 - 1
+    )
+
+    assert changed is True
+    assert first_read == 40
+    assert engine.intervals_read - first_read == 2 + INTRADAY_REVISE_INTERVALS
+    assert engine.day_energy_wh("consumption") == pytest.approx(42 * 10.0 + 20.0)
+    unchanged = engine.ingest(
+        _today_payload(consumption=revised), now_ts=DAY_START + 42 * 900 - 1
+    )
+    assert unchanged is False
+
+
+def test_new_day_resets_totals_and_keeps_ring_bounded() -> None:
+    engine = IntradayEnergyEngine(max_intervals=120)
+    engine.ingest(_today_payload(consumption=[5.0] * 96), now_ts=DAY_START + 96 * 900)
+    next_start = DAY_START + 96 * 900
+
+    engine.ingest(
+        _today_payload(start=next_start, day="2026-03-29", consumption=[7.0] * 96),
+        now_ts=next_start + 30 * 900 - 1,
+    )
+
+    assert engine.day == "2026-03-29"
+    assert engine.day_energy_wh("consumption") == pytest.approx(30 * 7.0)
+    held = engine.intervals()
+    assert len(held) == 120
+    assert held[0].start_ts == DAY_START + 6 * 900
+    diagnostics = engine.diagnostics()
+    assert diagnostics["day_intervals"] == 30
+    assert diagnostics["latest_interval"]["power_w"] == {"consumption": 28.0}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [None, {}, {"stats": []}, {"stats": [{"start_time": None}]}, _today_payload()],
+)
+def test_ingest_ignores_unusable_payloads(payload) -> None:
+    engine = IntradayEnergyEngine()
+
+    assert engine.ingest(payload, now_ts=DAY_START + 900) is False
+    assert engine.latest_interval() is None
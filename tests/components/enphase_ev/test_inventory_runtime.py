@@ -316,7 +316,10 @@ async def test_inventory_runtime_refresh_inverters_preserves_previous_lifetime_o
     )
     coord.client.inverter_status = AsyncMock(return_value={})
     coord.client.inverter_production = AsyncMock(
-        return_value={"production": {"1001": 1_000_000}}
+        side_effect=[
+            {"production": {"1001": 600_000}},
+            {"production": {"1001": 400_000}},
+        ]
     )
 
     await runtime._async_refresh_inverters()  # noqa: SLF001
@@ -1150,11 +1153,10 @@ async def test_inventory_runtime_refresh_inverters_paths(coordinator_factory) ->
         }
     )
     coord.client.inverter_production = AsyncMock(
-        return_value={
-            "production": {"1001": 1_000_000, "1002": "2_000_000"},
-            "start_date": "2022-08-10",
-            "end_date": "2026-02-09",
-        }
+        side_effect=[
+            {"production": {"1001": 990_000, "1002": "1_990_000"}},
+            {"production": {"1001": 10_000, "1002": "10_000"}},
+        ]
     )
 
     await runtime._async_refresh_inverters()  # noqa: SLF001
@@ -2560,18 +2562,21 @@ async def test_inventory_runtime_refresh_inverters_uses_success_cache_ttls(
         }
     )
     coord.client.inverter_production = AsyncMock(
-        return_value={
-            "production": {"1001": 456.0},
-            "start_date": "2022-08-10",
-            "end_date": "2026-02-09",
-        }
+        side_effect=[
+            {"production": {"1001": 450.0}},
+            {
+                "production": {"1001": 6.0},
+                "start_date": "2026-02-07",
+                "end_date": "2026-02-09",
+            },
+        ]
     )
 
     await runtime._async_refresh_inverters()  # noqa: SLF001
 
     assert coord.client.inverters_inventory.await_count == 1
     assert coord.client.inverter_status.await_count == 1
-    assert coord.client.inverter_production.await_count == 1
+    assert coord.client.inverter_production.await_count == 2
     assert coord._inverters_inventory_cache_until is not None  # noqa: SLF001
     assert coord._inverter_status_cache_until is not None  # noqa: SLF001
     assert coord._inverter_production_cache_until is not None  # noqa: SLF001
@@ -2580,7 +2585,7 @@ async def test_inventory_runtime_refresh_inverters_uses_success_cache_ttls(
 
     assert coord.client.inverters_inventory.await_count == 1
     assert coord.client.inverter_status.await_count == 1
-    assert coord.client.inverter_production.await_count == 1
+    assert coord.client.inverter_production.await_count == 2
     assert coord.inverter_data("INV-A")["lifetime_production_wh"] == 456.0
 
 
@@ -2613,16 +2618,9 @@ async def test_inventory_runtime_refresh_inverters_refetches_production_after_tt
     )
     coord.client.inverter_production = AsyncMock(
         side_effect=[
-            {
-                "production": {"1001": 456.0},
-                "start_date": "2022-08-10",
-                "end_date": "2026-02-09",
-            },
-            {
-                "production": {"1001": 789.0},
-                "start_date": "2022-08-10",
-                "end_date": "2026-02-09",
-            },
+            {"production": {"1001": 450.0}},
+            {"production": {"1001": 6.0}},
+            {"production": {"1001": 339.0}},
         ]
     )
 
@@ -2642,7 +2640,11 @@ async def test_inventory_runtime_refresh_inverters_refetches_production_after_tt
 
     await runtime._async_refresh_inverters()  # noqa: SLF001
 
-    assert coord.client.inverter_production.await_count == 2
+    assert coord.client.inverter_production.await_count == 3
+    assert coord.client.inverter_production.await_args.kwargs == {
+        "start_date": "2026-02-07",
+        "end_date": "2026-02-09",
+    }
     assert coord.inverter_data("INV-A")["lifetime_production_wh"] == 789.0
 
 
@@ -2736,16 +2738,19 @@ async def test_inventory_runtime_refresh_inverters_manual_bypass_refetches_same_
         }
     )
     coord.client.inverter_production = AsyncMock(
-        return_value={
-            "production": {"1001": 456.0},
-            "start_date": "2022-08-10",
-            "end_date": "2026-02-09",
-        }
+        side_effect=[
+            {"production": {"1001": 450.0}},
+            {
+                "production": {"1001": 6.0},
+                "start_date": "2026-02-07",
+                "end_date": "2026-02-09",
+            },
+        ]
     )
 
     await runtime._async_refresh_inverters()  # noqa: SLF001
 
-    coord.client.inverter_production.assert_awaited_once()
+    assert coord.client.inverter_production.await_count == 2
     assert coord.inverter_data("INV-A")["lifetime_production_wh"] == 456.0
     assert (
         coord._endpoint_family_state("inverter_production").next_retry_utc is not None
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.enphase_ev.inverter_production import (
+    InverterProductionLedger,
+)
+
+
+def _ledger(hass, site_id: str = "site") -> InverterProductionLedger:
+    return InverterProductionLedger(
+        SimpleNamespace(hass=hass, site_id=site_id, config_entry=None)
+    )
+
+
+def _ranges(fetch: AsyncMock) -> list[tuple[str, str]]:
+    return [
+        (call.kwargs["start_date"], call.kwargs["end_date"])
+        for call in fetch.await_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ledger_seeds_once_then_reads_open_window(hass) -> None:
+    ledger = _ledger(hass)
+    fetch = AsyncMock(
+        side_effect=[
+            {"production": {"1001": 1000.0, "1002": "500"}},
+            {"production": {"1001": 30.0}},
+            {"production": {"1001": 45.0, "1003": 5.0}},
+        ]
+    )
+
+    first = await ledger.async_fetch(
+        fetch, start_date="2022-08-10", end_date="2026-02-09"
+    )
+    second = await ledger.async_fetch(
+        fetch, start_date="2022-08-10", end_date="2026-02-09"
+    )
+
+    assert _ranges(fetch) == [
+        ("2022-08-10", "2026-02-06"),
+        ("2026-02-07", "2026-02-09"),
+        ("2026-02-07", "2026-02-09"),
+    ]
+    assert first == {
+        "production": {"1001": 1030.0, "1002": 500.0},
+        "start_date": "2022-08-10",
+        "end_date": "2026-02-09",
+    }
+    assert second["production"] == {"1001": 1045.0, "1002": 500.0, "1003": 5.0}
+    assert ledger.diagnostics()["seed_fetches"] == 1
+    assert ledger.diagnostics()["window_fetches"] == 2
+
+
+@pytest.mark.asyncio
+async def test_ledger_settles_new_days_and_reseeds_on_start_change(hass) -> None:
+    ledger = _ledger(hass)
+    fetch = AsyncMock(
+        side_effect=[
+            {"production": {"1001": 1000.0}},
+            {"production": {"1001": 30.0}},
+            {"production": {"1001": 10.0}},
+            {"production": {"1001": 25.0}},
+            {"production": {"1001": 2000.0}},
+            {"production": {"1001": 25.0}},
+        ]
+    )
+
+    await ledger.async_fetch(fetch, start_date="2022-08-10", end_date="2026-02-09")
+    next_day = await ledger.async_fetch(
+        fetch, start_date="2022-08-10", end_date="2026-02-10"
+    )
+    reseeded = await ledger.async_fetch(
+        fetch, start_date="2021-01-01", end_date="2026-02-10"
+    )
+
+    assert _ranges(fetch)[2:] == [
+        ("2026-02-07", "2026-02-07"),
+        ("2026-02-08", "2026-02-10"),
+        ("2021-01-01", "2026-02-07"),
+        ("2026-02-08", "2026-02-10"),
+    ]
+    assert next_day["production"] == {"1001": 1035.0}
+    assert reseeded["production"] == {"1001": 2025.0}
+    diagnostics = ledger.diagnostics()
+    assert diagnostics["settle_fetches"] == 1
+    assert diagnostics["seed_fetches"] == 2
+    assert diagnostics["settled_through"] == "2026-02-07"
+
+
+@pytest.mark.asyncio
+async def test_ledger_short_history_and_bad_payloads(hass) -> None:
+    ledger = _ledger(hass)
+    fetch = AsyncMock(return_value={"production": {"1001": 12.0}})
+
+    young = await ledger.async_fetch(
+        fetch, start_date="2026-02-08", end_date="2026-02-09"
+    )
+
+    assert _ranges(fetch) == [("2026-02-08", "2026-02-09")]
+    assert young["production"] == {"1001": 12.0}
+
+    fetch = AsyncMock(return_value="bad")
+    with pytest.raises(ValueError):
+        await ledger.async_fetch(fetch, start_date="2026-02-08", end_date="2026-02-09")
+    with pytest.raises(ValueError):
+        await ledger.async_fetch(fetch, start_date="bad", end_date="2026-02-09")
+
+
+@pytest.mark.asyncio
+async def test_ledger_restores_settled_totals_from_store(hass, hass_storage) -> None:
+    hass_storage["enphase_ev.inverter_production.site"] = {
+        "version": 1,
+        "key": "enphase_ev.inverter_production.site",
+        "data": {
+            "site_id": "site",
+            "start_date": "2022-08-10",
+            "settled_through": "2026-02-06",
+            "settled_wh": {"1001": 1000.0, "1002": "bad"},
+        },
+    }
+    ledger = _ledger(hass)
+    fetch = AsyncMock(return_value={"production": {"1001": 30.0}})
+
+    result = await ledger.async_fetch(
+        fetch, start_date="2022-08-10", end_date="2026-02-09"
+    )
+
+    assert _ranges(fetch) == [("2026-02-07", "2026-02-09")]
+    assert result["production"] == {"1001": 1030.0}
+    assert ledger.apply({"site_id": "other"}) is False
+    assert ledger.capture()["settled_wh"] == {"1001": 1000.0}
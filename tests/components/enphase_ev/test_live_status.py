@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+
+from custom_components.enphase_ev import live_status as live_status_mod
+from custom_components.enphase_ev.live_status import (
+    MQTT_CONNACK,
+    MQTT_CONNECT,
+    MQTT_DISCONNECT,
+    MQTT_SUBACK,
+    MQTT_SUBSCRIBE,
+    LiveStatusStream,
+    MqttPacketReader,
+    _mqtt_packet,
+    decode_live_status_frame,
+    mqtt_publish_packet,
+)
+from custom_components.enphase_ev.live_vitals import (
+    LiveVitalsStream,
+    RollingWindow,
+    iter_live_vitals_metrics,
+)
+
+TOPIC = "v1/live-stream/stream"
+
+
+def _varint(value: int) -> bytes:
+    value &= (1 << 64) - 1
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _field(number: int, value: int | bytes) -> bytes:
+    if isinstance(value, bytes):
+        return _varint(number << 3 | 2) + _varint(len(value)) + value
+    return _varint(number << 3) + _varint(value)
+
+
+def _frame(solar_kw: float, grid_kw: float, evse_kw: float, soc: int) -> bytes:
+    def _group(*values: float) -> bytes:
+        return b"".join(
+            _field(index, round(value * 1_000_000))
+            for index, value in enumerate(values, start=1)
+        )
+
+    status = (
+        _field(1, _group(solar_kw, 0.1))
+        + _field(2, _group(0.5))
+        + _field(3, _group(grid_kw))
+        + _field(4, _group(solar_kw + 0.5 + grid_kw, evse_kw))
+        + _field(5, 2)
+        + _field(6, soc)
+    )
+    return _field(1, 7) + _field(2, b"\x01\x02") + _field(3, status)
+
+
+class _Broker:
+    """WebSocket stand-in that speaks just enough MQTT for one session."""
+
+    def __init__(self, frames: list[bytes], *, drop: bool = False) -> None:
+        self.frames = frames
+        self.drop = drop
+        self.sent: list[tuple[int, int, bytes]] = []
+        self.closed = False
+        self._reader = MqttPacketReader()
+        self._outbox: asyncio.Queue[bytes] = asyncio.Queue()
+
+    async def send_bytes(self, data: bytes) -> None:
+        for packet in self._reader.feed(data):
+            self.sent.append(packet)
+            if packet[0] == MQTT_CONNECT:
+                self._outbox.put_nowait(_mqtt_packet(MQTT_CONNACK, 0, b"\x00\x00"))
+            elif packet[0] == MQTT_SUBSCRIBE:
+                suback = _mqtt_packet(MQTT_SUBACK, 0, packet[2][:2] + b"\x00")
+                published = b"".join(
+                    mqtt_publish_packet(TOPIC, frame) for frame in self.frames
+                )
+                # Split across messages like a real WebSocket transport may.
+                self._outbox.put_nowait(suback + published[:5])
+                self._outbox.put_nowait(published[5:])
+
+    async def receive(self, timeout: float | None = None):
+        if self._outbox.empty():
+            if self.drop:
+                return SimpleNamespace(type=aiohttp.WSMsgType.CLOSED, data=None)
+            await asyncio.sleep(timeout or 0)
+            raise TimeoutError
+        return SimpleNamespace(
+            type=aiohttp.WSMsgType.BINARY, data=self._outbox.get_nowait()
+        )
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _authorizer() -> dict[str, object]:
+    return {
+        "live_stream_duration": 900,
+        "live_stream_topic": TOPIC,
+        "live_debug_duration": 900,
+        "live_debug_topic": TOPIC,
+        "timeout": 5,
+        "aws_iot_endpoint": "broker.example",
+        "aws_authorizer": "authoriser",
+        "aws_token_key": "enph_token",
+        "aws_token_value": "token",
+        "aws_digest": "a/b+c=",
+    }
+
+
+def _stream(
+    hass, brokers: list[_Broker], stream_cls=LiveStatusStream, **client
+) -> tuple[LiveStatusStream, SimpleNamespace]:
+    coord = SimpleNamespace(
+        hass=hass,
+        site_id="site",
+        client=SimpleNamespace(
+            live_status_authorizer=AsyncMock(return_value=_authorizer()), **client
+        ),
+        battery_runtime=SimpleNamespace(grid_envoy_serial=lambda: "GW1"),
+    )
+    connect = AsyncMock(side_effect=brokers)
+    stream = stream_cls(coord, ws_connect=connect)
+    return stream, coord
+
+
+def test_decode_live_status_frame_reads_documented_paths() -> None:
+    sample = decode_live_status_frame(_frame(3.2, -1.25, 7.1, 97))
+
+    assert sample is not None
+    assert sample.solar_w == pytest.approx(3200.0)
+    assert sample.battery_w == pytest.approx(500.0)
+    assert sample.grid_w == pytest.approx(-1250.0)
+    assert sample.home_w == pytest.approx(2450.0)
+    assert sample.evse_w == pytest.approx(7100.0)
+    assert sample.battery_soc == 97
+    assert decode_live_status_frame(b"\x1a\x05\x01") is None
+    assert decode_live_status_frame(_field(1, 1)) is None
+
+
+@pytest.mark.asyncio
+async def test_stream_pushes_frames_and_disconnects_at_deadline(hass) -> None:
+    broker = _Broker([_frame(3.2, -1.0, 0.0, 90), _frame(3.4, -1.2, 0.0, 91)])
+    stream, coord = _stream(hass, [broker])
+    notified: list[float | None] = []
+    stream.async_add_listener(
+        lambda: notified.append(stream.sample.solar_w if stream.sample else None)
+    )
+
+    assert await stream.async_start(0.2) is True
+    assert stream.active is True
+    await stream._task  # noqa: SLF001
+
+    connect_kwargs = stream._ws_connect.await_args  # noqa: SLF001
+    assert connect_kwargs.args == ("wss://broker.example/mqtt",)
+    assert connect_kwargs.kwargs["protocols"] == ("mqtt",)
+    coord.client.live_status_authorizer.assert_awaited_once_with(
+        "GW1", live_debug=False
+    )
+    connect_packet = broker.sent[0][2]
+    assert b"site-id=site" in connect_packet
+    assert b"x-amz-customauthorizer-signature=a%2Fb%2Bc%3D" in connect_packet
+    assert broker.sent[1][0] == MQTT_SUBSCRIBE
+    assert broker.sent[-1][0] == MQTT_DISCONNECT
+    assert broker.closed is True
+
+    assert coord._current_power_consumption_w == pytest.approx(3400.0)  # noqa: SLF001
+    assert coord._current_power_consumption_source == "live-status:mqtt"  # noqa: SLF001
+    assert notified == [pytest.approx(3200.0), None]
+    diagnostics = stream.diagnostics()
+    assert diagnostics["frames"] == 2
+    assert diagnostics["active"] is False
+    assert diagnostics["sample"] is None
+
+
+@pytest.mark.asyncio
+async def test_stream_reconnects_within_window_then_gives_up(hass, monkeypatch) -> None:
+    monkeypatch.setattr(live_status_mod, "LIVE_STATUS_RECONNECT_DELAY_S", 0.0)
+    brokers = [_Broker([], drop=True) for _ in range(3)]
+    stream, coord = _stream(hass, brokers)
+
+    await stream.async_start(30)
+    await stream._task  # noqa: SLF001
+
+    assert stream.reconnects == live_status_mod.LIVE_STATUS_MAX_RECONNECTS
+    assert coord.client.live_status_authorizer.await_count == 3
+    assert all(broker.closed for broker in brokers)
+    assert stream.diagnostics()["last_error"] == "Live status connection closed"
+
+    coord.battery_runtime.grid_envoy_serial = lambda: None
+    assert await stream.async_start() is False
+
+
+def _vitals_frame(voltage_mv: int, freq_mhz: int, pcu_w: int) -> bytes:
+    return json.dumps(
+        {
+            "data_ingest_type": "new",
+            "site": [{"timestamp": 1770000000, "agg_soc": 97}],
+            "devices": [
+                {
+                    "type": "enpower",
+                    "grid_ac_l1_v": voltage_mv,
+                    "grid_freq": freq_mhz,
+                    "comm_state": "Communicating",
+                },
+                {
+                    "type": "encharge",
+                    "serial_num": "BAT1",
+                    "soc": 96,
+                    "pcu": [
+                        {"type": "pcu", "serial_num": "P1", "ac_power": pcu_w},
+                        {"type": "pcu", "serial_num": "P2", "ac_power": True},
+                    ],
+                },
+                "bad",
+            ],
+        }
+    ).encode()
+
+
+def test_rolling_window_keeps_capacity_and_honours_window_start() -> None:
+    window = RollingWindow(3)
+    assert window.stats(0.0) is None
+
+    for at, value in enumerate((5.0, 1.0, 9.0, 4.0)):
+        window.add(float(at), value)
+
+    assert len(window) == window.capacity == 3
+    stats = window.stats(0.0)
+    assert (stats.minimum, stats.maximum, stats.samples) == (1.0, 9.0, 3)
+    assert stats.mean == pytest.approx(14.0 / 3)
+    assert window.stats(2.5).mean == 4.0
+    assert window.stats(10.0) is None
+
+
+def test_iter_live_vitals_metrics_reads_documented_paths() -> None:
+    metrics = iter_live_vitals_metrics(json.loads(_vitals_frame(236218, 49960, -3)))
+
+    assert metrics == [
+        ("site", "", "battery_soc", 97.0),
+        ("enpower", "", "grid_voltage", pytest.approx(236.218)),
+        ("enpower", "", "grid_frequency", pytest.approx(49.96)),
+        ("encharge", "BAT1", "battery_soc", 96.0),
+        ("pcu", "P1", "ac_power", -3.0),
+    ]
+    assert iter_live_vitals_metrics({"site": 5, "devices": {"type": "x"}}) == []
+    assert iter_live_vitals_metrics([]) == []
+
+
+@pytest.mark.asyncio
+async def test_live_vitals_aggregates_frames_and_throttles_listeners(hass) -> None:
+    broker = _Broker(
+        [
+            _vitals_frame(236000, 49950, 100),
+            b"not json",
+            _vitals_frame(240000, 50050, 300),
+        ]
+    )
+    stream, coord = _stream(
+        hass,
+        [broker],
+        LiveVitalsStream,
+        show_livestream=AsyncMock(return_value={"live_vitals": True}),
+    )
+    snapshots: list[object] = []
+    stream.async_add_listener(
+        lambda: snapshots.append(stream.stats("enpower", "grid_voltage"))
+    )
+
+    assert await stream.async_start(0.2, window_s=5) is True
+    assert stream.window_s == 10
+    await stream._task  # noqa: SLF001
+
+    coord.client.live_status_authorizer.assert_awaited_once_with("GW1", live_debug=True)
+    first, final = snapshots
+    assert first.mean == pytest.approx(236.0)
+    assert final is None
+    diagnostics = stream.diagnostics()
+    assert diagnostics["frames"] == 2
+    assert diagnostics["decode_errors"] == 1
+    assert diagnostics["windows"] == 0
+    assert "BAT1" not in json.dumps(diagnostics)
+
+
+@pytest.mark.asyncio
+async def test_live_vitals_windows_hold_every_device(hass) -> None:
+    stream, _coord = _stream(hass, [], LiveVitalsStream)
+
+    assert stream._handle_payload(  # noqa: SLF001
+        memoryview(_vitals_frame(236000, 49950, 100))
+    )
+    assert stream._handle_payload(  # noqa: SLF001
+        memoryview(_vitals_frame(240000, 50050, 300))
+    )
+
+    voltage = stream.stats("enpower", "grid_voltage")
+    assert (voltage.minimum, voltage.maximum) == (236.0, 240.0)
+    assert voltage.mean == pytest.approx(238.0)
+    assert stream.stats("pcu", "ac_power", serial="P1").mean == 200.0
+    assert stream.stats("pcu", "ac_power", serial="P2") is None
+    assert stream.diagnostics()["samples_in_window"]["enpower"] == {
+        "grid_voltage": 2,
+        "grid_frequency": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_live_vitals_respects_capability_flag(hass) -> None:
+    stream, coord = _stream(
+        hass,
+        [],
+        LiveVitalsStream,
+        show_livestream=AsyncMock(return_value={"live_vitals": False}),
+    )
+
+    assert await stream.async_start() is False
+    assert stream.last_error == "live_vitals_disabled"
+    coord.client.live_status_authorizer.assert_not_awaited()
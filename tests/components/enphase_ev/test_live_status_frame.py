@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from custom_components.enphase_ev.live_status_frame import (
+    LIVE_STATUS_FIELD_PATHS,
+    FrameDecodeError,
+    FrameDecoder,
+    compile_field_paths,
+)
+
+
+def _varint(value: int) -> bytes:
+    value &= (1 << 64) - 1
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _key(number: int, wire_type: int) -> bytes:
+    return _varint(number << 3 | wire_type)
+
+
+def _message(rng: random.Random, depth: int) -> tuple[bytes, list]:
+    """Return an encoded random message and its decoded field list."""
+
+    encoded = bytearray()
+    fields: list[tuple[int, int, object]] = []
+    for _ in range(rng.randint(0, 6)):
+        number = rng.randint(1, 7)
+        wire_type = rng.choice((0, 0, 1, 2, 2, 5) if depth < 3 else (0, 1, 5))
+        if wire_type == 0:
+            value = rng.choice(
+                (rng.randint(0, 127), rng.randint(-(2**40), 2**40), -1, 2**63 - 1)
+            )
+            encoded += _key(number, 0) + _varint(value)
+        elif wire_type == 1:
+            value = rng.getrandbits(64)
+            encoded += _key(number, 1) + value.to_bytes(8, "little")
+        elif wire_type == 5:
+            value = rng.getrandbits(32)
+            encoded += _key(number, 5) + value.to_bytes(4, "little")
+        else:
+            body, value = _message(rng, depth + 1)
+            encoded += _key(number, 2) + _varint(len(body)) + body
+        fields.append((number, wire_type, value))
+    return bytes(encoded), fields
+
+
+def _reference(fields: list, paths: dict[str, tuple[int, ...]]) -> dict[str, int]:
+    """Resolve paths over decoded fields; the first match in frame order wins."""
+
+    def _lookup(items: list, path: tuple[int, ...]) -> int | None:
+        for number, wire_type, value in items:
+            if number != path[0]:
+                continue
+            if len(path) == 1 and wire_type != 2:
+                return value
+            if len(path) > 1 and wire_type == 2:
+                found = _lookup(value, path[1:])
+                if found is not None:
+                    return found
+        return None
+
+    result = {}
+    for name, path in paths.items():
+        value = _lookup(fields, path)
+        if value is not None:
+            result[name] = value
+    return result
+
+
+PATHS = {"a": (1,), "b": (2, 3), "c": (2, 4, 1), "d": (5, 5, 5)}
+
+
+def test_decoder_matches_reference_on_random_messages() -> None:
+    rng = random.Random(1234)
+    decoder = FrameDecoder(PATHS)
+
+    for _ in range(2000):
+        encoded, fields = _message(rng, 0)
+        assert decoder.decode(encoded) == _reference(fields, PATHS)
+
+
+def test_decoder_only_raises_decode_errors_on_corrupt_frames() -> None:
+    rng = random.Random(99)
+    decoder = FrameDecoder(LIVE_STATUS_FIELD_PATHS)
+    seeds = [_message(rng, 0)[0] for _ in range(200)]
+
+    for seed in seeds:
+        candidates = [seed[:cut] for cut in range(len(seed))]
+        if seed:
+            mutated = bytearray(seed)
+            for _ in range(rng.randint(1, 4)):
+                mutated[rng.randrange(len(mutated))] = rng.getrandbits(8)
+            candidates.append(bytes(mutated))
+        candidates.append(rng.randbytes(rng.randint(1, 64)))
+        for candidate in candidates:
+            try:
+                values = decoder.decode(candidate)
+            except FrameDecodeError:
+                continue
+            assert set(values) <= set(LIVE_STATUS_FIELD_PATHS)
+            assert all(-(2**63) <= value < 2**64 for value in values.values())
+
+
+def test_decoder_reads_views_in_place_and_skips_unknown_fields() -> None:
+    status = (
+        _key(9, 2)
+        + _varint(3)
+        + b"\xff\xff\xff"
+        + _key(1, 2)
+        + _varint(2)
+        + _key(1, 0)
+        + b"\x05"
+        + _key(6, 0)
+        + _varint(-3)
+    )
+    frame = _key(15, 1) + bytes(8) + _key(3, 2) + _varint(len(status)) + status
+    buffer = bytearray(b"\x00\x00" + frame + b"\xff")
+    decoder = FrameDecoder(LIVE_STATUS_FIELD_PATHS)
+
+    assert decoder.decode(memoryview(buffer)[2:-1]) == {"solar": 5, "battery_soc": -3}
+    assert decoder.decode(bytes(frame)) == {"solar": 5, "battery_soc": -3}
+    with pytest.raises(FrameDecodeError):
+        decoder.decode(_key(1, 3))
+    with pytest.raises(FrameDecodeError):
+        decoder.decode(b"\xff" * 11)
+
+
+@pytest.mark.parametrize(
+    "paths",
+    [{"a": ()}, {"a": (0,)}, {"a": (1,), "b": (1, 2)}, {"a": (1, 2), "b": (1,)}],
+)
+def test_compile_field_paths_rejects_ambiguous_tables(paths) -> None:
+    with pytest.raises(ValueError):
+        compile_field_paths(paths)
@@ -1820,6 +1820,39 @@ def test_microinverter_snapshot_clamps_unknown_overflow(
     assert snapshot["connectivity_state"] == "offline"
 
 
+def test_site_snapshots_are_built_once_per_listener_dispatch(
+    coordinator_factory,
+) -> None:
+    coord = coordinator_factory(serials=[RANDOM_SERIAL])
+    summary_calls: list[str] = []
+
+    def _summary() -> dict[str, object]:
+        summary_calls.append("micro")
+        return {"total_inverters": 2, "reporting_inverters": 1}
+
+    coord.microinverter_inventory_summary = _summary  # type: ignore[assignment]
+    seen: list[dict[str, object]] = []
+
+    def _listener() -> None:
+        seen.append(sensor_mod._microinverter_inventory_snapshot(coord))
+        seen.append(sensor_mod._microinverter_inventory_snapshot(coord))
+
+    unsub = coord.async_add_listener(_listener)
+    coord.async_update_listeners()
+
+    assert summary_calls == ["micro"]
+    assert seen[0] is seen[1]
+    assert coord.snapshot_memo is None
+
+    coord.async_update_listeners()
+    unsub()
+    assert summary_calls == ["micro", "micro"]
+
+    sensor_mod._microinverter_inventory_snapshot(coord)
+    sensor_mod._microinverter_inventory_snapshot(coord)
+    assert len(summary_calls) == 4
+
+
 def test_microinverter_snapshot_fallback_covers_summary_error_and_zero_status_paths() -> (
     None
 ):
@@ -3597,6 +3630,46 @@ def test_system_controller_inventory_sensor_missing_member_unavailable(
     assert sensor.available is False
 
 
+def test_live_vitals_sensor_reports_window_stats_while_streaming(
+    coordinator_factory,
+) -> None:
+    from custom_components.enphase_ev.live_vitals import WindowStats
+    from custom_components.enphase_ev.sensor import EnphaseLiveVitalsSensor
+
+    coord = coordinator_factory(serials=[RANDOM_SERIAL])
+    coord.inventory_runtime._set_type_device_buckets(  # noqa: SLF001
+        {"envoy": {"type_key": "envoy", "type_label": "Gateway", "count": 1}},
+        ["envoy"],
+    )
+    coord.last_success_utc = datetime.now(timezone.utc)
+    requested: list[tuple[str, str]] = []
+
+    def _stats(device_type: str, metric: str):
+        requested.append((device_type, metric))
+        return WindowStats(minimum=49.9, maximum=50.1, mean=50.0, samples=12)
+
+    coord.live_vitals = SimpleNamespace(active=False, window_s=60, stats=_stats)
+    sensor = EnphaseLiveVitalsSensor(coord, "grid_frequency")
+
+    assert sensor.unique_id.endswith("_live_grid_frequency")
+    assert sensor.translation_key == "live_grid_frequency"
+    assert sensor.native_unit_of_measurement == "Hz"
+    assert sensor.available is False
+    assert sensor.native_value is None
+    assert sensor.extra_state_attributes == {}
+
+    coord.live_vitals.active = True
+    assert sensor.available is True
+    assert sensor.native_value == 50.0
+    assert sensor.extra_state_attributes == {
+        "minimum": 49.9,
+        "maximum": 50.1,
+        "samples": 12,
+        "window_s": 60,
+    }
+    assert set(requested) == {("enpower", "grid_frequency")}
+
+
 def test_dry_contacts_inventory_sensor_state_and_attributes(
     coordinator_factory,
 ) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -13,6 +14,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
 from custom_components.enphase_ev.api import (
     OCPP_TRIGGER_MESSAGES,
@@ -21,6 +23,7 @@ from custom_components.enphase_ev.api import (
 from custom_components.enphase_ev.const import CONF_SITE_ID, CONF_SITE_ONLY, DOMAIN
 from custom_components.enphase_ev.runtime_data import EnphaseRuntimeData
 from custom_components.enphase_ev.services import async_setup_services
+from custom_components.enphase_ev.session_archive import SESSION_ARCHIVE_RETENTION_DAYS
 
 SERVICES_YAML = Path(__file__).parents[3] / "custom_components/enphase_ev/services.yaml"
 
@@ -713,6 +716,72 @@ async def test_clear_hems_auth_backoff_targets_selected_site(
     coord.async_try_reauth_now.assert_not_awaited()
 
 
+async def test_backfill_session_history_summarizes_days_per_charger(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Session backfill should validate the window and summarize each day."""
+
+    handlers = _register_service_handlers(hass, monkeypatch)
+    coord = _fake_service_coordinator(site_id="evse-site", serials={"EVSE123"})
+    coord.async_backfill_session_history = AsyncMock(
+        return_value={
+            "EVSE123": {
+                "2026-05-01": [{"energy_kwh": 1.25}, {"energy_kwh": 2.0}],
+                "2026-05-02": [],
+            }
+        }
+    )
+    coord.session_history = SimpleNamespace(
+        sum_energy=lambda sessions: sum(item["energy_kwh"] for item in sessions)
+    )
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_SITE_ID: "evse-site", CONF_SITE_ONLY: False},
+        title="EVSE Site",
+        unique_id="evse-site",
+    )
+    entry.add_to_hass(hass)
+    entry.runtime_data = EnphaseRuntimeData(coordinator=coord)
+    handler = handlers[(DOMAIN, "backfill_session_history")]
+    today = dt_util.now().date()
+    oldest = today - timedelta(days=SESSION_ARCHIVE_RETENTION_DAYS - 1)
+
+    result = await handler(
+        SimpleNamespace(
+            data={
+                "site_id": "evse-site",
+                "start_date": oldest,
+                "end_date": oldest + timedelta(days=1),
+            }
+        )
+    )
+
+    coord.async_backfill_session_history.assert_awaited_once_with(
+        oldest, oldest + timedelta(days=1)
+    )
+    assert result["chargers"] == {
+        "EVSE123": {
+            "2026-05-01": {"sessions": 2, "energy_kwh": 3.25},
+            "2026-05-02": {"sessions": 0, "energy_kwh": 0},
+        }
+    }
+    for start_date, end_date in (
+        (today, today - timedelta(days=1)),
+        (oldest, today + timedelta(days=1)),
+        (oldest - timedelta(days=1), oldest + timedelta(days=1)),
+    ):
+        with pytest.raises(ServiceValidationError):
+            await handler(
+                SimpleNamespace(
+                    data={
+                        "site_id": "evse-site",
+                        "start_date": start_date,
+                        "end_date": end_date,
+                    }
+                )
+            )
+
+
 @pytest.mark.asyncio
 async def test_update_tariff_accepts_rate_entities(
     hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.enphase_ev import session_history as session_history_mod
+from custom_components.enphase_ev.session_archive import (
+    SESSION_ARCHIVE_RETENTION_DAYS,
+    SessionHistoryArchive,
+)
+from custom_components.enphase_ev.session_history import SessionHistoryManager
+
+STORE_KEY = "enphase_ev.session_history.site"
+
+
+def _archive(hass) -> SessionHistoryArchive:
+    return SessionHistoryArchive(
+        SimpleNamespace(hass=hass, site_id="site", config_entry=None)
+    )
+
+
+def _client(*session_ids: str) -> SimpleNamespace:
+    midnight = dt_util.start_of_local_day()
+    result = [
+        {
+            "sessionId": session_id,
+            "startTime": (midnight - timedelta(minutes=30)).isoformat(),
+            "endTime": (midnight + timedelta(minutes=30)).isoformat(),
+            "aggEnergyValue": 1.5,
+        }
+        for session_id in session_ids
+    ]
+    return SimpleNamespace(
+        session_history_filter_criteria=AsyncMock(return_value={}),
+        session_history=AsyncMock(
+            return_value={"data": {"result": result, "hasMore": False}}
+        ),
+    )
+
+
+def _manager(hass, client, archive: SessionHistoryArchive) -> SessionHistoryManager:
+    return SessionHistoryManager(hass, lambda: client, cache_ttl=300, archive=archive)
+
+
+@pytest.mark.asyncio
+async def test_closed_days_are_reused_after_restart(
+    hass, hass_storage, monkeypatch
+) -> None:
+    monkeypatch.setattr(session_history_mod, "SESSION_HISTORY_CLOSE_GRACE_S", 0)
+    today = dt_util.now()
+    yesterday = today - timedelta(days=1)
+    yesterday_key = yesterday.strftime("%Y-%m-%d")
+    today_key = today.strftime("%Y-%m-%d")
+    archive = _archive(hass)
+    client = _client("s1")
+    manager = _manager(hass, client, archive)
+
+    await manager._async_fetch_sessions_today("EV1", day_local=yesterday)
+    await manager._async_fetch_sessions_today("EV1", day_local=today)
+    assert client.session_history.await_count == 2
+    assert archive.diagnostics()["closed_days"] == 1
+
+    hass_storage[STORE_KEY] = {
+        "version": 1,
+        "key": STORE_KEY,
+        "data": archive.capture(),
+    }
+    restarted = _archive(hass)
+    client = _client("s2")
+    manager = _manager(hass, client, restarted)
+
+    closed = await manager._async_fetch_sessions_today("EV1", day_local=yesterday)
+    assert client.session_history.await_count == 0
+    assert [session["session_id"] for session in closed] == ["s1"]
+    view = manager.get_cache_view("EV1", yesterday_key)
+    assert view.needs_refresh is False
+
+    stale = manager.get_cache_view("EV1", today_key)
+    assert stale.has_valid_cache is True
+    assert stale.needs_refresh is True
+    assert [session["session_id"] for session in stale.sessions] == ["s1"]
+
+    hot = await manager._async_fetch_sessions_today("EV1", day_local=today)
+    assert client.session_history.await_count == 1
+    assert [session["session_id"] for session in hot] == ["s2"]
+    assert restarted.get("EV1", today_key).sessions == hot
+
+
+@pytest.mark.asyncio
+async def test_days_stay_open_within_grace_or_with_open_sessions(
+    hass, hass_storage, monkeypatch
+) -> None:
+    yesterday = dt_util.now() - timedelta(days=1)
+    yesterday_key = yesterday.strftime("%Y-%m-%d")
+    monkeypatch.setattr(
+        session_history_mod, "SESSION_HISTORY_CLOSE_GRACE_S", 2 * 24 * 60 * 60
+    )
+    archive = _archive(hass)
+    await _manager(hass, _client("s1"), archive)._async_fetch_sessions_today(
+        "EV1", day_local=yesterday
+    )
+    assert archive.get("EV1", yesterday_key).closed is False
+
+    monkeypatch.setattr(session_history_mod, "SESSION_HISTORY_CLOSE_GRACE_S", 0)
+    client = _client("s1", "s2")
+    del client.session_history.return_value["data"]["result"][1]["endTime"]
+    archive = _archive(hass)
+    manager = _manager(hass, client, archive)
+    sessions = await manager._async_fetch_sessions_today("EV1", day_local=yesterday)
+    assert [session["session_id"] for session in sessions] == ["s1", "s2"]
+    assert archive.get("EV1", yesterday_key).closed is False
+    assert archive.diagnostics()["closed_days"] == 0
+
+
+@pytest.mark.asyncio
+async def test_archive_keeps_closed_days_and_prunes_retention(
+    hass, hass_storage
+) -> None:
+    today = dt_util.now().date()
+    expired = (today - timedelta(days=SESSION_ARCHIVE_RETENTION_DAYS)).isoformat()
+    kept = (today - timedelta(days=SESSION_ARCHIVE_RETENTION_DAYS - 1)).isoformat()
+    hass_storage[STORE_KEY] = {
+        "version": 1,
+        "key": STORE_KEY,
+        "data": {
+            "site_id": "site",
+            "days": {
+                "EV1": {
+                    expired: {"closed": True, "sessions": [{"session_id": "old"}]},
+                    kept: {"closed": True, "sessions": [{"session_id": "a"}, 1]},
+                },
+                "EV2": {expired: {"closed": True, "sessions": []}},
+                "EV3": "bad",
+            },
+        },
+    }
+    archive = _archive(hass)
+    await archive.async_load()
+
+    assert archive.get("EV1", expired) is None
+    assert archive.get("EV1", kept).sessions == [{"session_id": "a"}]
+    archive.put("EV1", kept, [{"session_id": "b"}], closed=True)
+    assert archive.get("EV1", kept).sessions == [{"session_id": "a"}]
+    archive.put("EV1", expired, [], closed=True)
+    assert archive.diagnostics()["serials"] == 1
+    assert archive.diagnostics()["oldest_day"] == kept
+    assert archive.writes == 0
+    assert archive.apply({"site_id": "other", "days": {}}) is False
+
+
+@pytest.mark.asyncio
+async def test_backfill_requests_ranges_and_reuses_closed_days(
+    hass, hass_storage
+) -> None:
+    today = dt_util.now().date()
+    closed_key = (today - timedelta(days=3)).isoformat()
+    hass_storage[STORE_KEY] = {
+        "version": 1,
+        "key": STORE_KEY,
+        "data": {
+            "site_id": "site",
+            "days": {
+                "EV1": {
+                    closed_key: {"closed": True, "sessions": [{"session_id": "kept"}]}
+                }
+            },
+        },
+    }
+
+    def _noon(days_ago: int) -> str:
+        day = today - timedelta(days=days_ago)
+        return (dt_util.start_of_local_day(day) + timedelta(hours=12)).isoformat()
+
+    result = [
+        {"sessionId": "a", "startTime": _noon(5), "endTime": _noon(5)},
+        {"sessionId": "b", "startTime": _noon(2), "endTime": _noon(2)},
+    ]
+    client = SimpleNamespace(
+        session_history_filter_criteria=AsyncMock(return_value={}),
+        session_history=AsyncMock(
+            return_value={"data": {"result": result, "hasMore": False}}
+        ),
+    )
+    archive = _archive(hass)
+    manager = _manager(hass, client, archive)
+
+    backfilled = await manager.async_backfill(
+        ["EV1"], today - timedelta(days=5), today + timedelta(days=2)
+    )
+
+    def _api_day(days_ago: int) -> str:
+        return (today - timedelta(days=days_ago)).strftime("%d-%m-%Y")
+
+    assert [
+        (call.kwargs["start_date"], call.kwargs["end_date"])
+        for call in client.session_history.await_args_list
+    ] == [(_api_day(5), _api_day(4)), (_api_day(2), _api_day(0))]
+    days = backfilled["EV1"]
+    assert len(days) == 6
+    assert [item["session_id"] for item in days[closed_key]] == ["kept"]
+    first_day = str(today - timedelta(days=5))
+    assert [item["session_id"] for item in days[first_day]] == ["a"]
+    assert days[str(today - timedelta(days=4))] == []
+    assert archive.get("EV1", str(today - timedelta(days=2))).closed is True
+    assert archive.get("EV1", str(today)).closed is False
+
+
+@pytest.mark.asyncio
+async def test_backfill_failure_cancels_other_serials(hass, hass_storage) -> None:
+    today = dt_util.now().date()
+    cancelled: list[str] = []
+
+    async def _session_history(sn, **_kwargs):
+        if sn == "EV1":
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(sn)
+            raise
+
+    client = SimpleNamespace(
+        session_history_filter_criteria=AsyncMock(return_value={}),
+        session_history=AsyncMock(side_effect=_session_history),
+    )
+    manager = SessionHistoryManager(
+        hass, lambda: client, cache_ttl=300, archive=_archive(hass), concurrency=2
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await manager.async_backfill(["EV1", "EV2"], today, today)
+
+    assert cancelled == ["EV2"]
+
+
+def test_interval_index_answers_ranges_and_rebuilds_after_put(hass) -> None:
+    archive = _archive(hass)
+    today = dt_util.start_of_local_day()
+    yesterday_key = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+    today_key = today.strftime("%Y-%m-%d")
+
+    def _session(session_id: str, start_h: float, end_h: float) -> dict:
+        return {
+            "session_id": session_id,
+            "start": (today + timedelta(hours=start_h)).isoformat(),
+            "end": (today + timedelta(hours=end_h)).isoformat(),
+        }
+
+    overnight = _session("night", -2, 3)
+    archive.put(
+        "EV1",
+        yesterday_key,
+        [_session("morning", -15, -14), overnight, {"session_id": "bad"}],
+        closed=True,
+    )
+    archive.put("EV1", today_key, [overnight, _session("noon", 12, 13)], closed=False)
+
+    index = archive.index("EV1")
+    assert len(index) == 3
+    assert archive.index("EV1") is index
+
+    def _ids(start_h: float, end_h: float) -> list[str]:
+        return [
+            session["session_id"]
+            for _start, _end, session in index.overlapping(
+                today + timedelta(hours=start_h), today + timedelta(hours=end_h)
+            )
+        ]
+
+    assert _ids(-24, 24) == ["morning", "night", "noon"]
+    assert _ids(1, 12) == ["night"]
+    assert _ids(3, 12) == []
+    assert _ids(12.5, 12.6) == ["noon"]
+
+    archive.put("EV1", today_key, [overnight], closed=False)
+    assert archive.index("EV1") is not index
+    assert len(archive.index("EV1")) == 2
+    assert len(archive.index("EV2")) == 0
+    assert archive.diagnostics()["index_builds"] == 3
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 import logging
 import time
@@ -168,6 +169,110 @@ async def test_fetch_sessions_handles_paging(monkeypatch):
     assert sessions
 
 
+@pytest.mark.asyncio
+async def test_fetch_sessions_fans_out_pages_without_truncation(monkeypatch):
+    hass = _make_hass()
+    items = [
+        {
+            "sessionId": index,
+            "startTime": "2025-01-01T00:00:00Z",
+            "endTime": "2025-01-01T00:10:00Z",
+            "aggEnergyValue": 0.1,
+        }
+        for index in range(300)
+    ]
+    active = {"now": 0, "peak": 0}
+
+    async def fake_history(sn, start_date, end_date, offset, limit, **_kwargs):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0)
+        active["now"] -= 1
+        # Repeat one session across pages to check de-duplication.
+        page = items[offset : offset + limit]
+        if offset:
+            page = [items[offset - 1], *page[1:]]
+        return {"data": {"result": page, "hasMore": offset + limit < len(items)}}
+
+    client = SimpleNamespace(session_history=AsyncMock(side_effect=fake_history))
+    manager = sh_mod.SessionHistoryManager(
+        hass,
+        client_getter=lambda: client,
+        cache_ttl=60,
+    )
+    day = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr(sh_mod.dt_util, "now", lambda: day)
+    monkeypatch.setattr(sh_mod.dt_util, "as_local", lambda value: value)
+
+    sessions = await manager._async_fetch_sessions_today("SN", day_local=day)
+    assert client.session_history.await_count == 7
+    assert active["peak"] == sh_mod.SESSION_HISTORY_PAGE_FANOUT
+    assert len(sessions) == 300 - 5
+    assert manager._session_counts["SN"] == 295  # noqa: SLF001
+
+    manager._cache.clear()  # noqa: SLF001
+    client.session_history.reset_mock()
+    await manager._async_fetch_sessions_today("SN", day_local=day)
+    limits = {call.kwargs["limit"] for call in client.session_history.await_args_list}
+    assert limits == {sh_mod.SESSION_HISTORY_PAGE_LIMIT_MAX}
+    assert [
+        call.kwargs["offset"] for call in client.session_history.await_args_list
+    ] == [0, 100, 200]
+
+
+@pytest.mark.asyncio
+async def test_fetch_sessions_reuses_normalised_finished_rows(monkeypatch):
+    hass = _make_hass()
+    rows = [
+        {
+            "sessionId": "done",
+            "startTime": "2025-01-01T01:00:00Z",
+            "endTime": "2025-01-01T02:00:00Z",
+            "aggEnergyValue": 4.0,
+        },
+        {
+            "sessionId": "open",
+            "startTime": "2025-01-01T10:00:00Z",
+            "endTime": None,
+            "aggEnergyValue": 1.0,
+        },
+        {"sessionId": "nested", "endTime": "2025-01-01T03:00:00Z", "meta": {}},
+    ]
+
+    async def fake_history(*_args, **_kwargs):
+        return {"data": {"result": [dict(row) for row in rows], "hasMore": False}}
+
+    client = SimpleNamespace(session_history=AsyncMock(side_effect=fake_history))
+    manager = sh_mod.SessionHistoryManager(
+        hass,
+        client_getter=lambda: client,
+        cache_ttl=60,
+    )
+    day = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+    monkeypatch.setattr(sh_mod.dt_util, "now", lambda: day)
+    monkeypatch.setattr(sh_mod.dt_util, "as_local", lambda value: value)
+
+    first = await manager._async_fetch_sessions_today("SN", day_local=day)
+    manager._cache.clear()  # noqa: SLF001
+    second = await manager._async_fetch_sessions_today("SN", day_local=day)
+
+    assert second[0] is first[0]
+    assert second[1] is not first[1]
+    assert manager.normalise_stats == {
+        "normalised": 5,
+        "reused": 1,
+        "memo_entries": 1,
+    }
+
+    manager._cache.clear()  # noqa: SLF001
+    rows[0]["aggEnergyValue"] = 5.0
+    third = await manager._async_fetch_sessions_today("SN", day_local=day)
+    assert third[0]["energy_kwh_total"] == 5.0
+    assert manager.normalise_stats["reused"] == 1
+    manager.clear()
+    assert manager.normalise_stats["memo_entries"] == 0
+
+
 @pytest.mark.asyncio
 async def test_fetch_sessions_criteria_unavailable(monkeypatch, caplog):
     hass = _make_hass()
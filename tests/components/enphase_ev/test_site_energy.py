@@ -906,6 +906,148 @@ def test_site_energy_guard_confirms_reset(coordinator_factory) -> None:
     assert flows_reset["solar_production"].last_reset_at is not None
 
 
+def _long_lifetime_payload(days: int) -> dict[str, object]:
+    return {
+        "production": [1000.0 + (day % 7) for day in range(days)],
+        "consumption": [800.0 + (day % 5) for day in range(days)],
+        "solar_home": [300.0] * days,
+        "battery_home": [100.0] * days,
+        "charge": [200.0] * days,
+        "solar_battery": [150.0] * days,
+        "start_date": "2016-01-01",
+        "interval_minutes": 1440,
+    }
+
+
+def test_site_energy_index_folds_only_new_settled_buckets(
+    coordinator_factory,
+) -> None:
+    coord = coordinator_factory()
+    energy = coord.energy
+    payload = _long_lifetime_payload(3650)
+    flows, _meta = energy._aggregate_site_energy(payload)  # noqa: SLF001
+    expected_production = round(sum(payload["production"]) / 1000.0, 3)
+    assert flows["solar_production"].value_kwh == pytest.approx(expected_production)
+    stats = energy.site_energy_index_stats
+    rebuilds = stats["rebuilds"]
+    assert stats["folded_buckets"] > 0
+
+    summed: list[int] = []
+    original_sum = energy._sum_energy_buckets  # noqa: SLF001
+
+    def _counting_sum(values, interval_hours):
+        summed.append(len(values))
+        return original_sum(values, interval_hours)
+
+    energy._sum_energy_buckets = _counting_sum  # noqa: SLF001
+    payload["production"].append(1234.0)
+    payload["consumption"].append(999.0)
+    flows, _meta = energy._aggregate_site_energy(payload)  # noqa: SLF001
+
+    assert flows["solar_production"].value_kwh == pytest.approx(
+        round(sum(payload["production"]) / 1000.0, 3)
+    )
+    assert flows["grid_import"].value_kwh == pytest.approx(
+        round(
+            (sum(payload["consumption"]) - 400.0 * 3650 + 50.0 * 3650) / 1000.0,
+            3,
+        )
+    )
+    assert energy.site_energy_index_stats["rebuilds"] == rebuilds
+    assert max(summed) <= energy_mod.SITE_ENERGY_INDEX_TAIL_BUCKETS + 1
+
+
+def test_site_energy_index_rebuilds_when_prefix_changes(coordinator_factory) -> None:
+    coord = coordinator_factory()
+    energy = coord.energy
+    payload = _long_lifetime_payload(400)
+    energy._aggregate_site_energy(payload)  # noqa: SLF001
+    rebuilds = energy.site_energy_index_stats["rebuilds"]
+
+    boundary = 400 - energy_mod.SITE_ENERGY_INDEX_TAIL_BUCKETS - 1
+    payload["production"][boundary] += 500.0
+    flows, _meta = energy._aggregate_site_energy(payload)  # noqa: SLF001
+    assert flows["solar_production"].value_kwh == pytest.approx(
+        round(sum(payload["production"]) / 1000.0, 3)
+    )
+    assert energy.site_energy_index_stats["rebuilds"] == rebuilds + 1
+
+    payload["start_date"] = "2017-01-01"
+    energy._aggregate_site_energy(payload)  # noqa: SLF001
+    assert energy.site_energy_index_stats["rebuilds"] > rebuilds + 1
+
+
+def test_site_energy_sums_each_field_once_per_aggregation(
+    coordinator_factory, monkeypatch
+) -> None:
+    coord = coordinator_factory()
+    energy = coord.energy
+    calls: list[str] = []
+    original = energy._indexed_energy_sum  # noqa: SLF001
+
+    def _counting(field, values, start_date):
+        calls.append(field)
+        return original(field, values, start_date)
+
+    monkeypatch.setattr(energy, "_indexed_energy_sum", _counting)
+    energy._aggregate_site_energy(_long_lifetime_payload(10))  # noqa: SLF001
+
+    assert calls.count("consumption") == 1
+    assert calls.count("charge") == 1
+    assert calls.count("solar_battery") == 1
+    assert energy._site_energy_field_sums is None  # noqa: SLF001
+    assert energy._diff_energy_fields(  # noqa: SLF001
+        {"charge": [300], "solar_battery": [100]}, "charge", "solar_battery", None
+    ) == (200.0, 1, ["charge", "solar_battery"])
+
+
+def test_site_energy_index_matches_lists_on_compact_payload(
+    coordinator_factory,
+) -> None:
+    payload = _long_lifetime_payload(400)
+    payload["production"][100] = None
+    payload["production"][360] = None
+    reference = coordinator_factory().energy
+    expected, _meta = reference._aggregate_site_energy(payload)  # noqa: SLF001
+    energy = coordinator_factory().energy
+    compact = energy_mod.compact_lifetime_payload(
+        payload, energy._coerce_energy_value  # noqa: SLF001
+    )
+
+    flows, meta = energy._aggregate_site_energy(compact)  # noqa: SLF001
+    rebuilds = energy.site_energy_index_stats["rebuilds"]
+    flows_again, _meta = energy._aggregate_site_energy(compact)  # noqa: SLF001
+
+    for flow, entry in expected.items():
+        assert flows[flow].value_kwh == pytest.approx(entry.value_kwh)
+        assert flows[flow].bucket_count == entry.bucket_count
+    assert flows_again["solar_production"].value_kwh == pytest.approx(
+        expected["solar_production"].value_kwh
+    )
+    assert energy.site_energy_index_stats["rebuilds"] == rebuilds
+    assert meta["raw_bucket_lengths"]["production"] == 400
+    assert energy._coerce_energy_value(float("nan")) is None  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_site_energy_fetch_caches_compact_buckets(coordinator_factory) -> None:
+    coord = coordinator_factory()
+    coord.client.lifetime_energy = AsyncMock(
+        return_value={
+            "production": [500.0, None, 250.0],
+            "start_date": "2024-01-01",
+            "interval_minutes": 1440,
+        }
+    )
+
+    await coord.energy._async_refresh_site_energy()  # noqa: SLF001
+
+    cached = coord.energy.lifetime_payload
+    assert isinstance(cached["production"], energy_mod.array)
+    assert cached["start_date"] == "2024-01-01"
+    assert coord.energy.site_energy["solar_production"].value_kwh == pytest.approx(0.75)
+
+
 @pytest.mark.asyncio
 async def test_site_energy_cache_respects_ttl(monkeypatch, coordinator_factory):
     coord = coordinator_factory()
@@ -936,6 +1078,114 @@ async def test_site_energy_cache_respects_ttl(monkeypatch, coordinator_factory):
     assert coord.client.lifetime_energy.call_count == 3
 
 
+def _site_today_payload(day: str, **series: list[float]) -> dict[str, object]:
+    # Eleven quarter hours have started, the last one still reporting.
+    start = int(time.time()) - 10 * 900 - 5
+    return {
+        "start_date": day,
+        "stats": [{"start_time": start, "interval_length": 900, **series}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_site_energy_intraday_snapshot_replaces_current_day_bucket(
+    monkeypatch, coordinator_factory
+) -> None:
+    coord = coordinator_factory()
+    energy = coord.energy
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(energy_mod.time, "monotonic", lambda: clock["now"])
+    coord.client.lifetime_energy = AsyncMock(
+        return_value={
+            "production": [1000, 2000, 500],
+            "consumption": [700, 800, 900],
+            "start_date": "2026-03-26",
+            "last_report_date": 1_774_600_000,
+            "interval_minutes": 1440,
+        }
+    )
+    coord.client.pv_system_today = AsyncMock(
+        return_value=_site_today_payload(
+            "2026-03-28", production=[100.0] * 11, consumption=[50.0] * 11
+        )
+    )
+
+    await energy._async_refresh_site_energy()  # noqa: SLF001
+    assert energy.site_energy["solar_production"].value_kwh == pytest.approx(3.5)
+    assert coord.client.pv_system_today.await_count == 0
+
+    clock["now"] += 60
+    assert energy.site_energy_refresh_due() is True
+    await energy._async_refresh_site_energy()  # noqa: SLF001
+
+    production = energy.site_energy["solar_production"]
+    assert production.value_kwh == pytest.approx(4.1)
+    assert production.bucket_count == 3
+    assert production.last_report_date == energy.intraday.data_through_utc
+    # The lifetime bucket is larger than the quarter-hour total, so it stays.
+    assert energy.site_energy["consumption"].value_kwh == pytest.approx(2.4)
+    assert energy.intraday.interval_power_w("production") == pytest.approx(400.0)
+
+    clock["now"] += energy._site_energy_cache_ttl + 1  # noqa: SLF001
+    await energy._async_refresh_site_energy()  # noqa: SLF001
+    assert coord.client.lifetime_energy.await_count == 1
+    assert coord.client.pv_system_today.await_count == 2
+
+    clock["now"] += energy_mod.SITE_ENERGY_INTRADAY_LIFETIME_TTL_S
+    await energy._async_refresh_site_energy()  # noqa: SLF001
+    assert coord.client.lifetime_energy.await_count == 2
+    assert energy.site_energy["solar_production"].value_kwh == pytest.approx(4.1)
+
+
+def test_site_energy_intraday_total_appends_when_lifetime_ends_yesterday(
+    coordinator_factory,
+) -> None:
+    energy = coordinator_factory().energy
+    energy.intraday.ingest(
+        _site_today_payload("2026-03-28", production=[100.0] * 11, evse=[5.0] * 11)
+    )
+    payload = {
+        "production": [1000, 2000],
+        "start_date": "2026-03-26",
+        "interval_minutes": 1440,
+    }
+
+    flows, _meta = energy._aggregate_site_energy(payload)  # noqa: SLF001
+
+    assert flows["solar_production"].value_kwh == pytest.approx(4.1)
+    assert flows["solar_production"].bucket_count == 3
+    assert "evse_charging" not in flows
+    payload["start_date"] = "2026-03-20"
+    flows, _meta = energy._aggregate_site_energy(payload)  # noqa: SLF001
+    assert flows["solar_production"].bucket_count == 2
+    assert energy._site_energy_overlay is None  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_site_energy_intraday_unavailable_backs_off(
+    monkeypatch, coordinator_factory
+) -> None:
+    coord = coordinator_factory()
+    energy = coord.energy
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(energy_mod.time, "monotonic", lambda: clock["now"])
+    coord.client.lifetime_energy = AsyncMock(
+        return_value={"production": [500], "start_date": "2026-03-28"}
+    )
+    coord.client.pv_system_today = AsyncMock(return_value=None)
+
+    await energy._async_refresh_site_energy()  # noqa: SLF001
+    clock["now"] += 60
+    await energy._async_refresh_site_energy()  # noqa: SLF001
+    clock["now"] += 60
+
+    assert coord.client.pv_system_today.await_count == 1
+    assert energy.site_energy_refresh_due() is False
+    clock["now"] += energy._site_energy_cache_ttl  # noqa: SLF001
+    await energy._async_refresh_site_energy()  # noqa: SLF001
+    assert coord.client.lifetime_energy.await_count == 2
+
+
 @pytest.mark.asyncio
 async def test_site_energy_sensor_attributes(hass, coordinator_factory):
     coord = coordinator_factory()
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.enphase_ev.energy import SiteEnergyFlow
+from custom_components.enphase_ev.state_models import (
+    BatteryControlCapability,
+    EndpointFamilyHealth,
+)
+from custom_components.enphase_ev.state_snapshot import (
+    STATE_SNAPSHOT_MAX_AGE,
+    STATE_SNAPSHOT_SAVE_DELAY_S,
+)
+from custom_components.enphase_ev.tariff import (
+    TariffBillingSnapshot,
+    TariffRateSnapshot,
+)
+
+from .random_ids import RANDOM_SERIAL
+
+
+def _seed_state(coord) -> None:
+    now = dt_util.utcnow()
+    coord.data = {
+        RANDOM_SERIAL: {
+            "sn": RANDOM_SERIAL,
+            "name": "Garage EV",
+            "charging": True,
+            "session_start": now,
+            "lifetime_kwh": 123.4,
+        }
+    }
+    coord.tariff_billing = TariffBillingSnapshot(
+        start_date="2026-01-01",
+        billing_frequency="MONTH",
+        billing_interval_value=1,
+        billing_cycle="Monthly",
+    )
+    coord.tariff_import_rate = TariffRateSnapshot(
+        state="0.30",
+        rate_structure="flat",
+        variation_type="single",
+        source="manual",
+        currency="AUD",
+        export_plan=None,
+        seasons=({"id": "default", "days": [1, 2, 3]},),
+        branch_key="purchase",
+    )
+    coord.tariff_last_refresh_utc = now
+    coord._battery_profile = "self-consumption"  # noqa: SLF001
+    coord._battery_backup_percentage = 20  # noqa: SLF001
+    coord._battery_pending_profile = "backup_only"  # noqa: SLF001
+    coord._battery_dtg_control = BatteryControlCapability(  # noqa: SLF001
+        show=True, enabled=False
+    )
+    coord.energy.site_energy = {
+        "solar_production": SiteEnergyFlow(
+            value_kwh=1000.5,
+            bucket_count=12,
+            fields_used=["production"],
+            start_date="2024-01-01",
+            last_report_date=now,
+            update_pending=False,
+        )
+    }
+    coord._endpoint_family_health["tariff"] = EndpointFamilyHealth(  # noqa: SLF001
+        consecutive_failures=2,
+        last_failure_utc=now,
+        last_status=503,
+        cooldown_active=True,
+        next_retry_mono=time.monotonic() + 600,
+        next_retry_utc=now + timedelta(seconds=600),
+        support_state="supported",
+    )
+    coord._endpoint_family_health["storm_alert"] = EndpointFamilyHealth(  # noqa: SLF001
+        last_success_utc=now,
+        last_success_mono=time.monotonic(),
+        next_retry_mono=time.monotonic() + 300,
+        next_retry_utc=now + timedelta(seconds=300),
+    )
+
+
+def test_state_snapshot_round_trips_normalized_state(coordinator_factory) -> None:
+    source = coordinator_factory()
+    _seed_state(source)
+    snapshot = source.state_snapshot.capture()
+
+    target = coordinator_factory()
+    target.data = {}
+
+    assert target.state_snapshot.apply(snapshot) is True
+
+    assert target.data[RANDOM_SERIAL]["charging"] is True
+    assert target.data[RANDOM_SERIAL]["session_start"] == (
+        source.data[RANDOM_SERIAL]["session_start"]
+    )
+    assert target.tariff_billing == source.tariff_billing
+    assert target.tariff_import_rate == source.tariff_import_rate
+    assert isinstance(target.tariff_import_rate.seasons, tuple)
+    assert target.tariff_last_refresh_utc == source.tariff_last_refresh_utc
+    assert target._battery_profile == "self-consumption"  # noqa: SLF001
+    assert target._battery_backup_percentage == 20  # noqa: SLF001
+    assert target._battery_pending_profile is None  # noqa: SLF001
+    assert target._battery_dtg_control == BatteryControlCapability(  # noqa: SLF001
+        show=True, enabled=False
+    )
+    flow = target.energy.site_energy["solar_production"]
+    assert flow == source.energy.site_energy["solar_production"]
+    assert target.energy._site_energy_cache_ts is None  # noqa: SLF001
+
+    tariff_health = target._endpoint_family_health["tariff"]  # noqa: SLF001
+    assert tariff_health.consecutive_failures == 2
+    assert tariff_health.cooldown_active is True
+    assert tariff_health.next_retry_mono == pytest.approx(time.monotonic() + 600, abs=5)
+    assert target._endpoint_family_wait_active("tariff") is True  # noqa: SLF001
+
+    storm_health = target._endpoint_family_health["storm_alert"]  # noqa: SLF001
+    assert storm_health.last_success_utc is not None
+    assert storm_health.last_success_mono is None
+    assert storm_health.next_retry_mono is None
+    assert target._endpoint_family_should_run("storm_alert") is True  # noqa: SLF001
+
+    assert target.state_snapshot.stale is True
+    metrics = target.collect_site_metrics()["state_snapshot"]
+    assert metrics["restored"] is True
+    assert metrics["stale"] is True
+
+
+def test_state_snapshot_drops_unknown_serials_and_live_data(
+    coordinator_factory,
+) -> None:
+    source = coordinator_factory()
+    _seed_state(source)
+    source.data["UNKNOWN"] = {"sn": "UNKNOWN"}
+    snapshot = source.state_snapshot.capture()
+
+    target = coordinator_factory()
+    target.data = {}
+    target.state_snapshot.apply(snapshot)
+    assert set(target.data) == {RANDOM_SERIAL}
+
+    live = coordinator_factory()
+    live_data = dict(live.data)
+    live.state_snapshot.apply(snapshot)
+    assert live.data == live_data
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda snapshot: snapshot.update(site_id="other-site"),
+        lambda snapshot: snapshot.update(
+            saved_utc=(
+                dt_util.utcnow() - STATE_SNAPSHOT_MAX_AGE - timedelta(minutes=1)
+            ).isoformat()
+        ),
+        lambda snapshot: snapshot.update(saved_utc=None),
+    ],
+)
+def test_state_snapshot_rejects_foreign_or_expired_snapshots(
+    coordinator_factory, mutate
+) -> None:
+    source = coordinator_factory()
+    _seed_state(source)
+    snapshot = source.state_snapshot.capture()
+    mutate(snapshot)
+
+    target = coordinator_factory()
+    target.data = {}
+
+    assert target.state_snapshot.apply(snapshot) is False
+    assert target.data == {}
+    assert target.state_snapshot.stale is False
+    assert target.state_snapshot.apply(None) is False
+
+
+@pytest.mark.asyncio
+async def test_state_snapshot_restore_loads_store_once(coordinator_factory) -> None:
+    source = coordinator_factory()
+    _seed_state(source)
+    target = coordinator_factory()
+    target.data = {}
+    target.state_snapshot._store = MagicMock(  # noqa: SLF001
+        async_load=AsyncMock(return_value=source.state_snapshot.capture())
+    )
+
+    await target.state_snapshot.async_restore_state()
+    await target.state_snapshot.async_restore_state()
+
+    target.state_snapshot._store.async_load.assert_awaited_once()  # noqa: SLF001
+    assert RANDOM_SERIAL in target.data
+
+
+@pytest.mark.asyncio
+async def test_state_snapshot_restore_ignores_store_errors(coordinator_factory) -> None:
+    coord = coordinator_factory()
+    coord.state_snapshot._store = MagicMock(  # noqa: SLF001
+        async_load=AsyncMock(side_effect=OSError("disk"))
+    )
+
+    await coord.state_snapshot.async_restore_state()
+
+    assert coord.state_snapshot.stale is False
+
+
+def test_state_snapshot_saves_only_live_state(coordinator_factory) -> None:
+    coord = coordinator_factory()
+    store = MagicMock()
+    coord.state_snapshot._store = store  # noqa: SLF001
+    coord.state_snapshot.stale = True
+
+    coord.state_snapshot.schedule_save()
+    store.async_delay_save.assert_not_called()
+
+    coord.state_snapshot.mark_live()
+    coord.state_snapshot.schedule_save()
+
+    store.async_delay_save.assert_called_once_with(
+        coord.state_snapshot.capture, STATE_SNAPSHOT_SAVE_DELAY_S
+    )
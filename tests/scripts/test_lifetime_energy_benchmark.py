@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+
+
+def _load_module():
+    root = Path(__file__).resolve().parents[2]
+    module_path = root / "scripts" / "lifetime_energy_benchmark.py"
+    spec = importlib.util.spec_from_file_location(
+        "lifetime_energy_benchmark", module_path
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+lifetime_energy_benchmark = _load_module()
+
+
+def test_build_payload_shapes_channels_and_days() -> None:
+    payload = lifetime_energy_benchmark.build_payload(years=1, channels=18)
+
+    assert len(payload) == 18
+    assert "production" in payload
+    assert "channel_17" in payload
+    assert all(len(values) == 365 for values in payload.values())
+    assert payload == lifetime_energy_benchmark.build_payload(years=1, channels=18)
+
+
+def test_run_benchmark_reports_matching_totals() -> None:
+    report = lifetime_energy_benchmark.run_benchmark(years=1, channels=3, repeat=1)
+
+    assert report["buckets"] == 3 * 365
+    assert report["mismatched_channels"] == []
+    assert report["array_bytes"] < report["list_bytes"]
+    assert report["list_sum_s"] >= 0
+    assert report["array_sum_s"] >= 0
+    assert report["array_convert_and_sum_s"] == (
+        report["array_convert_s"] + report["array_sum_s"]
+    )
+
+
+def test_main_prints_report(capsys) -> None:
+    assert (
+        lifetime_energy_benchmark.main(
+            ["--years", "1", "--channels", "2", "--repeat", "1"]
+        )
+        == 0
+    )
+
+    assert '"mismatched_channels": []' in capsys.readouterr().out
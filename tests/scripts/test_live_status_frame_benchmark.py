@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+
+
+def _load_module():
+    root = Path(__file__).resolve().parents[2]
+    module_path = root / "scripts" / "live_status_frame_benchmark.py"
+    spec = importlib.util.spec_from_file_location(
+        "live_status_frame_benchmark", module_path
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+live_status_frame_benchmark = _load_module()
+
+
+def test_build_frames_are_recorded_size_and_repeatable() -> None:
+    frames = live_status_frame_benchmark.build_frames(count=20)
+
+    assert len(frames) == 20
+    assert {len(frame) for frame in frames} == {live_status_frame_benchmark.FRAME_BYTES}
+    assert frames == live_status_frame_benchmark.build_frames(count=20)
+
+
+def test_run_benchmark_matches_full_decode() -> None:
+    report = live_status_frame_benchmark.run_benchmark(frames=50, repeat=1)
+
+    assert report["frames"] == 50
+    assert report["mismatched_frames"] == 0
+    assert report["decoder_us_per_frame"] >= 0
+    assert report["baseline_us_per_frame"] >= 0
+
+
+def test_main_prints_report(capsys) -> None:
+    assert live_status_frame_benchmark.main(["--frames", "5", "--repeat", "1"]) == 0
+
+    assert '"mismatched_frames": 0' in capsys.readouterr().out